@@ -16,33 +16,88 @@
 
 """Craft a project from several parts."""
 
-from . import plugins
-from .actions import Action, ActionProperties, ActionType
-from .dirs import ProjectDirs
-from .errors import PartsError
-from .executor import expand_environment
-from .features import Features
-from .infos import PartInfo, ProjectInfo, ProjectVar, ProjectVarInfo, StepInfo
-from .lifecycle_manager import LifecycleManager
-from .parts import (
-    Part,
-    part_has_chisel_as_build_snap,
-    part_has_slices,
-    part_has_overlay,
-    validate_part,
-)
-from .steps import Step
-
-
-try:
-    from ._version import __version__
-except ImportError:  # pragma: no cover
-    from importlib.metadata import version, PackageNotFoundError
+import importlib
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from . import plugins
+    from .actions import Action, ActionProperties, ActionType
+    from .dirs import ProjectDirs
+    from .errors import PartsError
+    from .executor import expand_environment
+    from .features import Features
+    from .infos import PartInfo, ProjectInfo, ProjectVar, ProjectVarInfo, StepInfo
+    from .instrumentation import Instrumentation
+    from .lifecycle_manager import LifecycleManager
+    from .parts import (
+        Part,
+        part_has_chisel_as_build_snap,
+        part_has_slices,
+        part_has_overlay,
+        validate_part,
+    )
+    from .steps import Step
+
+    __version__: str
+
+
+# Public names and the submodules defining them. Submodules are imported when
+# one of their names is first accessed, so that tools using only a small part
+# of the package (such as craftctl) don't pay for importing all of it.
+_LAZY_ATTRIBUTES = {
+    "plugins": ".plugins",
+    "Action": ".actions",
+    "ActionProperties": ".actions",
+    "ActionType": ".actions",
+    "ProjectDirs": ".dirs",
+    "PartsError": ".errors",
+    "expand_environment": ".executor",
+    "Features": ".features",
+    "PartInfo": ".infos",
+    "ProjectInfo": ".infos",
+    "ProjectVar": ".infos",
+    "ProjectVarInfo": ".infos",
+    "StepInfo": ".infos",
+    "Instrumentation": ".instrumentation",
+    "LifecycleManager": ".lifecycle_manager",
+    "Part": ".parts",
+    "part_has_chisel_as_build_snap": ".parts",
+    "part_has_slices": ".parts",
+    "part_has_overlay": ".parts",
+    "validate_part": ".parts",
+    "Step": ".steps",
+}
+
+
+def _get_version() -> str:
     try:
-        __version__ = version("craft_parts")
-    except PackageNotFoundError:
-        __version__ = "dev"
+        from ._version import __version__  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+        try:
+            return version("craft_parts")
+        except PackageNotFoundError:
+            return "dev"
+
+    return __version__
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name == "__version__":
+        value: Any = _get_version()
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = module if name == "plugins" else getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
 
 __all__ = [
@@ -58,6 +113,7 @@ __all__ = [
     "ProjectVar",
     "ProjectVarInfo",
     "StepInfo",
+    "Instrumentation",
     "LifecycleManager",
     "Part",
     "Step",
@@ -24,6 +24,10 @@ import sys
 
 logger = logging.getLogger(__name__)
 
+# Sent by clients at the start of a connection to request framed replies, which
+# allow several commands to be sent over the same connection.
+PROTOCOL_HEADER = b"CRAFTCTL/2\n"
+
 
 class CraftCtl:
     """Client for the craft-parts ctl protocol.
@@ -41,28 +45,51 @@ class CraftCtl:
 
         :raises RuntimeError: If the command is not handled.
         """
-        if cmd in ["default", "set"]:
-            _client(cmd, args)
-            return None
+        return cls.run_batch([(cmd, args)])[0]
+
+    @classmethod
+    def run_batch(cls, commands: list[tuple[str, list[str]]]) -> list[str | None]:
+        """Handle several craftctl commands using a single connection.
+
+        Commands are executed in order. Execution stops at the first command
+        that fails.
 
-        if cmd in "get":
-            return _client(cmd, args)
+        :param commands: A list of commands and their arguments.
 
-        raise RuntimeError(f"invalid command {cmd!r}")
+        :returns: The value returned by each command.
 
+        :raises RuntimeError: If a command is not handled.
+        """
+        for cmd, _ in commands:
+            if cmd not in ["default", "set", "get"]:
+                raise RuntimeError(f"invalid command {cmd!r}")
+
+        retvals = _client(commands)
+        return [
+            retval if cmd == "get" else None
+            for (cmd, _), retval in zip(commands, retvals, strict=True)
+        ]
 
-def _client(cmd: str, args: list[str]) -> str | None:
-    """Execute a command in the running step processor.
+
+def _client(commands: list[tuple[str, list[str]]]) -> list[str]:
+    """Execute commands in the running step processor.
 
     The control protocol client allows a user scriptlet to execute
     the default handler for a step in the running application context,
     or set the value of a custom variable previously passed as an
     argument to :class:`craft_parts.LifecycleManager`.
 
-    :param cmd: The command to execute in the step processor.
-    :param args: Optional arguments.
+    Each command is sent as a JSON message terminated by a newline. The server
+    replies to each command with a ``<status> <length>`` line followed by a
+    message of the given length in bytes, where ``<status>`` can be either
+    "OK" or "ERR".
+
+    :param commands: The commands to execute in the step processor, along
+        with their arguments.
 
-    :raise RuntimeError: If the command is invalid.
+    :returns: The message replied to each command.
+
+    :raise RuntimeError: If a command fails.
     """
     try:
         ctl_socket_path = os.environ["PARTS_CTL_SOCKET"]
@@ -74,31 +101,60 @@ def _client(cmd: str, args: list[str]) -> str | None:
 
     logger.debug(f"ctl socket: {ctl_socket_path}")
 
-    data = {"function": cmd, "args": args}
-    ctl_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    ctl_socket.connect(ctl_socket_path)
-    ctl_socket.send(bytes(json.dumps(data), encoding="utf8"))
-    feedback = ctl_socket.recv(1024).decode("utf8").split(" ", 1)
-
-    # response from server is in the form "<status> <message>" where
-    # <status> can be either "OK" or "ERR".  Previous server versions
-    # used an empty response as success, anything else was an error
-    # message.
-
-    status = feedback[0]
-    message = feedback[1].strip() if len(feedback) > 1 else ""
-    retval = None
+    request = PROTOCOL_HEADER + b"".join(
+        json.dumps({"function": cmd, "args": args}).encode() + b"\n"
+        for cmd, args in commands
+    )
 
-    logger.debug(f"status: {status}")
-
-    if status == "OK":
-        # command has succeeded
-        retval = message
-    elif status == "ERR":
-        # command has failed
-        raise RuntimeError(message)
-
-    return retval
+    ctl_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        ctl_socket.connect(ctl_socket_path)
+        ctl_socket.sendall(request)
+        reply = _Reply(ctl_socket)
+
+        retvals: list[str] = []
+        for _ in commands:
+            status, _, length = reply.readline().decode().partition(" ")
+            message = reply.read(int(length or "0")).decode().strip()
+
+            logger.debug(f"status: {status}")
+
+            if status != "OK":
+                # command has failed
+                raise RuntimeError(message)
+            retvals.append(message)
+    finally:
+        ctl_socket.close()
+
+    return retvals
+
+
+class _Reply:
+    """Buffered reader for the replies received from the ctl server."""
+
+    def __init__(self, ctl_socket: socket.socket) -> None:
+        self._socket = ctl_socket
+        self._buffer = b""
+
+    def _fill(self) -> None:
+        data = self._socket.recv(65536)
+        if not data:
+            raise RuntimeError("connection closed by the step processor")
+        self._buffer += data
+
+    def readline(self) -> bytes:
+        """Read up to and excluding the next newline."""
+        while b"\n" not in self._buffer:
+            self._fill()
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    def read(self, size: int) -> bytes:
+        """Read the given number of bytes."""
+        while len(self._buffer) < size:
+            self._fill()
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
 
 
 def main() -> None:
@@ -38,6 +38,7 @@ class ProjectDirs:
     :ivar overlay_work_dir: The work directory for the overlay filesystem.
     :ivar stage_dir: The staging area containing installed files from all parts.
     :ivar prime_dir: The primed tree containing the final artifacts to deploy.
+    :ivar trash_dir: The directory holding removed trees until they are deleted.
     """
 
     def __init__(
@@ -57,6 +58,7 @@ class ProjectDirs:
         self.stage_dir = self.work_dir / "stage"
         self.backstage_dir = self.work_dir / "backstage"
         self.prime_dir = self.work_dir / "prime"
+        self.trash_dir = self.work_dir / ".trash"
         if partitions:
             self._partitions: Sequence[str] | None = partitions
             self.partition_dir: Path | None = self.work_dir / "partitions"
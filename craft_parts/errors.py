@@ -151,6 +151,20 @@ class InvalidArchitecture(PartsError):  # noqa: N818
         super().__init__(brief=brief, resolution=resolution)
 
 
+class InvalidCompilerCache(PartsError):  # noqa: N818
+    """The compiler cache launcher is not supported.
+
+    :param compiler_cache: The unsupported compiler cache launcher.
+    """
+
+    def __init__(self, compiler_cache: str) -> None:
+        self.compiler_cache = compiler_cache
+        brief = f"Compiler cache {compiler_cache!r} is not supported."
+        resolution = "Use either 'ccache' or 'sccache'."
+
+        super().__init__(brief=brief, resolution=resolution)
+
+
 class PartSpecificationError(PartsError):
     """A part was not correctly specified.
 
@@ -0,0 +1,230 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Content-addressed cache of part build outputs.
+
+Build outputs are stored under a key computed from all inputs of the build
+step, so that a part built before with identical inputs can have its outputs
+restored instead of being built again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import tempfile
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from craft_parts import instrumentation
+from craft_parts.sources.cache import DirectoryCache
+from craft_parts.utils import file_utils
+
+logger = logging.getLogger(__name__)
+
+BUILD_CACHE_MAX_SIZE = 10 * 2**30
+
+_METADATA_FILE = ".metadata.json"
+
+
+@dataclass
+class BuildCacheStats:
+    """Build cache usage in the current execution.
+
+    :param hits: The number of builds restored from the cache.
+    :param misses: The number of cacheable builds not found in the cache.
+    :param stored: The number of builds added to the cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+
+
+def _remove_path(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+class BuildCache:
+    """Store and restore part build outputs.
+
+    Each entry contains copies of the paths produced by a build (such as the
+    part install and export directories), named by the caller. Entries are
+    evicted in least recently used order.
+
+    :param cache_dir: The directory to store the cache in.
+    :param max_size: The maximum size of the cache, in bytes.
+    """
+
+    def __init__(
+        self, cache_dir: Path, *, max_size: int = BUILD_CACHE_MAX_SIZE
+    ) -> None:
+        self._cache = DirectoryCache(cache_dir, namespace="builds")
+        self._max_size = max_size
+        self.stats = BuildCacheStats()
+
+    def restore(
+        self,
+        *,
+        key: str,
+        paths: Mapping[str, Path],
+        remove_function: Callable[[Path], None] = _remove_path,
+    ) -> dict[str, Any] | None:
+        """Restore cached build outputs.
+
+        If the build outputs are found in the cache, existing files and
+        directories at the given paths are removed before restoring them.
+        Nothing is changed if the build outputs are not found.
+
+        :param key: The build key.
+        :param paths: A mapping of entry names to the paths they should be
+            restored to. Paths not present in the entry are not created.
+        :param remove_function: The function used to remove existing paths.
+
+        :return: The metadata stored with the build outputs, or None if the
+            build outputs were not found in the cache.
+        """
+        entry = self._cache.get(key=key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        for path in paths.values():
+            if path.exists() or path.is_symlink():
+                remove_function(path)
+
+        for name, path in paths.items():
+            cached_path = entry / name
+            if cached_path.is_dir():
+                file_utils.link_or_copy_tree(
+                    str(cached_path), str(path), copy_function=file_utils.copy
+                )
+            elif cached_path.is_file():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                file_utils.copy(str(cached_path), str(path))
+
+        self.stats.hits += 1
+        instrumentation.count("build cache hits")
+        metadata_file = entry / _METADATA_FILE
+        if not metadata_file.is_file():
+            return {}
+        return cast(dict[str, Any], json.loads(metadata_file.read_text()))
+
+    def store(
+        self,
+        *,
+        key: str,
+        paths: Mapping[str, Path],
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Add build outputs to the cache.
+
+        The outputs are copied, so later changes to them don't affect the cache.
+
+        :param key: The build key.
+        :param paths: A mapping of entry names to the paths to store. Paths that
+            don't exist are ignored.
+        :param metadata: Additional build information to store with the outputs.
+        """
+        self._cache.tree_cache.mkdir(parents=True, exist_ok=True)
+        tree = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self._cache.tree_cache))
+        try:
+            for name, path in paths.items():
+                if path.is_dir():
+                    file_utils.link_or_copy_tree(
+                        str(path), str(tree / name), copy_function=file_utils.copy
+                    )
+                elif path.is_file():
+                    file_utils.copy(str(path), str(tree / name))
+
+            if metadata:
+                (tree / _METADATA_FILE).write_text(json.dumps(metadata))
+
+            if self._cache.cache(tree=tree, key=key):
+                self.stats.stored += 1
+        finally:
+            shutil.rmtree(tree, ignore_errors=True)
+
+    def evict(self) -> list[str]:
+        """Remove least recently used entries exceeding the maximum cache size.
+
+        :return: The keys of the removed entries.
+        """
+        return self._cache.evict(max_size=self._max_size)
+
+    def report(self) -> None:
+        """Log the build cache usage statistics."""
+        if not (self.stats.hits or self.stats.misses):
+            return
+
+        logger.info(
+            "Build cache: %d hits, %d misses, %d stored, %.1f MiB in use",
+            self.stats.hits,
+            self.stats.misses,
+            self.stats.stored,
+            self._cache.size() / 2**20,
+        )
+
+
+def get_build_key(**inputs: Any) -> str:
+    """Compute the cache key for a build with the given inputs.
+
+    :param inputs: The build inputs. Values must be serializable to JSON.
+
+    :return: The build key.
+    """
+    data = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def get_tree_digest(path: Path) -> str:
+    """Compute a digest of the contents of a directory tree.
+
+    The digest covers the relative path, type and permission bits of each entry,
+    the contents of regular files and the targets of symbolic links. Timestamps
+    and ownership are not considered.
+
+    :param path: The directory tree to digest.
+
+    :return: The tree digest, or an empty string if the path doesn't exist.
+    """
+    if not path.is_dir():
+        return ""
+
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in [*dirs, *sorted(files)]:
+            entry = os.path.join(root, name)  # noqa: PTH118
+            entry_stat = os.lstat(entry)
+            relpath = os.path.relpath(entry, path)
+            digest.update(f"{relpath}\0{entry_stat.st_mode:o}\0".encode())
+            if stat.S_ISLNK(entry_stat.st_mode):
+                digest.update(os.readlink(entry).encode())  # noqa: PTH115
+            elif stat.S_ISREG(entry_stat.st_mode):
+                digest.update(
+                    file_utils.calculate_hash(Path(entry), algorithm="sha256").encode()
+                )
+            digest.update(b"\0")
+
+    return digest.hexdigest()
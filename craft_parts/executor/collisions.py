@@ -19,17 +19,22 @@
 import filecmp
 import os
 import pathlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from craft_parts import errors, overlays, permissions
+from craft_parts import errors, instrumentation, overlays
 from craft_parts.features import Features
 from craft_parts.overlays import overlay_fs
 from craft_parts.parts import Part
-from craft_parts.permissions import Permissions, permissions_are_compatible
+from craft_parts.permissions import (
+    Permissions,
+    PermissionsTable,
+    permissions_are_compatible,
+)
 
 from . import filesets
 
 
+@instrumentation.timed("collision check")
 def check_for_stage_collisions(
     part_list: list[Part], partitions: list[str] | None
 ) -> None:
@@ -75,6 +80,11 @@ class StageCandidate:
     permissions: list[Permissions]
     # Whether this set comes from a part's overlay (used for error reporting)
     is_overlay: bool
+    # The compiled ``permissions``, used to find the definitions for each item
+    permissions_table: PermissionsTable = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.permissions_table = PermissionsTable(self.permissions)
 
 
 def _get_candidate_from_install_dir(
@@ -211,13 +221,8 @@ def _check_for_stage_collisions_per_partition(
                 this = os.path.join(candidate.source_dir, item)  # noqa: PTH118
                 other = os.path.join(other_candidate.source_dir, item)  # noqa: PTH118
 
-                permissions_this = permissions.filter_permissions(
-                    item, candidate.permissions
-                )
-
-                permissions_other = permissions.filter_permissions(
-                    item, other_candidate.permissions
-                )
+                permissions_this = candidate.permissions_table.filter(item)
+                permissions_other = other_candidate.permissions_table.filter(item)
 
                 if paths_collide(
                     this,
@@ -16,24 +16,36 @@
 
 """Definitions and helpers for the action executor."""
 
+import contextlib
 import logging
-import shutil
 from pathlib import Path
 
 from typing_extensions import Self
 
-from craft_parts import callbacks, overlays, packages, parts, plugins
+from craft_parts import (
+    callbacks,
+    instrumentation,
+    overlays,
+    packages,
+    parts,
+    plugins,
+    sources,
+)
 from craft_parts.actions import Action, ActionType
 from craft_parts.infos import PartInfo, ProjectInfo, StepInfo
+from craft_parts.instrumentation import Instrumentation
 from craft_parts.overlays import LayerHash, OverlayManager
 from craft_parts.parts import Part, sort_parts
+from craft_parts.state_manager import StateCache
 from craft_parts.steps import Step
 from craft_parts.utils import os_utils
 
+from .build_cache import BuildCache
 from .collisions import check_for_stage_collisions
 from .environment import generate_step_environment
 from .part_handler import PartHandler
 from .step_handler import Stream
+from .trash import Trash
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +65,12 @@ class Executor:
     :param extra_build_packages: Additional packages to install on the host system.
     :param extra_build_snaps: Additional snaps to install on the host system.
     :param ignore_patterns: File patterns to ignore when pulling local sources.
+    :param use_build_cache: Restore part build outputs from the build cache when
+        the build inputs didn't change, and add new build outputs to the cache.
+    :param state_cache: The cache to load states from when cleaning parts.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         part_list: list[Part],
@@ -66,6 +81,8 @@ class Executor:
         ignore_patterns: list[str] | None = None,
         base_layer_dir: Path | None = None,
         base_layer_hash: LayerHash | None = None,
+        use_build_cache: bool = False,
+        state_cache: StateCache | None = None,
     ) -> None:
         self._part_list = sort_parts(part_list)
         self._project_info = project_info
@@ -75,6 +92,12 @@ class Executor:
         self._base_layer_hash = base_layer_hash
         self._handler: dict[str, PartHandler] = {}
         self._ignore_patterns = ignore_patterns
+        self._state_cache = state_cache or StateCache()
+        self._trash = Trash(project_info.dirs.trash_dir)
+        self._in_execution = False
+        self._build_cache = (
+            BuildCache(project_info.cache_dir) if use_build_cache else None
+        )
 
         # The cache layer level is set to the first part that doesn't organize
         # to the overlay coming after a part that organizes to the overlay.
@@ -95,11 +118,16 @@ class Executor:
             cache_level=cache_level,
         )
 
+    @instrumentation.timed("prologue", category="lifecycle")
     def prologue(self) -> None:
         """Prepare the execution environment.
 
         This method is called before executing lifecycle actions.
         """
+        self._in_execution = True
+        self._trash.empty()
+        sources.git_source.reset_mirror_updates()
+
         self._install_build_packages()
         self._install_build_snaps()
 
@@ -126,14 +154,37 @@ class Executor:
             callbacks.get_stage_packages_filters(self._project_info)
         )
 
+        # Keep overlay layer stacks mounted between steps, they are unmounted
+        # in the epilogue.
+        self._overlay_manager.start_session()
+
+    @instrumentation.timed("epilogue", category="lifecycle")
     def epilogue(self) -> None:
         """Finish and clean the execution environment.
 
         This method is called after executing lifecycle actions.
         """
         self._project_info.execution_finished = True
+        self._overlay_manager.end_session()
+
+        # Parts sharing build services have the same epilogue commands, which
+        # only need to run once.
+        executed: set[tuple[str, ...]] = set()
+        for handler in self._handler.values():
+            commands = tuple(handler.epilogue_commands)
+            if commands and commands not in executed:
+                executed.add(commands)
+                handler.run_epilogue()
+
         callbacks.run_epilogue(self._project_info)
 
+        if self._build_cache:
+            self._build_cache.evict()
+            self._build_cache.report()
+
+        self._trash.wait()
+        self._in_execution = False
+
     def execute(
         self,
         actions: Action | list[Action],
@@ -164,6 +215,8 @@ class Executor:
             will be removed.
         """
         selected_parts = parts.part_list_by_name(part_names, self._part_list)
+        self._trash.empty()
+        self._overlay_manager.release()
 
         selected_steps = [initial_step, *initial_step.next_steps()]
         selected_steps.reverse()
@@ -178,7 +231,7 @@ class Executor:
             # also remove toplevel directories if part names are not specified
             for prime_dir in self._project_info.prime_dirs.values():
                 if prime_dir.exists():
-                    shutil.rmtree(prime_dir)
+                    self._trash.discard(prime_dir)
             # remove default partition alias symlink
             prime_alias_symlink = self._project_info.prime_alias_symlink
             if prime_alias_symlink:
@@ -187,9 +240,9 @@ class Executor:
             if initial_step <= Step.STAGE:
                 for stage_dir in self._project_info.stage_dirs.values():
                     if stage_dir.exists():
-                        shutil.rmtree(stage_dir)
+                        self._trash.discard(stage_dir)
                 if self._project_info.backstage_dir.exists():
-                    shutil.rmtree(self._project_info.backstage_dir)
+                    self._trash.discard(self._project_info.backstage_dir)
                 # remove default partition alias symlink
                 stage_alias_symlink = self._project_info.stage_alias_symlink
                 if stage_alias_symlink:
@@ -197,7 +250,7 @@ class Executor:
 
             if initial_step <= Step.PULL:
                 if self._project_info.parts_dir.exists():
-                    shutil.rmtree(self._project_info.parts_dir)
+                    self._trash.discard(self._project_info.parts_dir)
                 # remove default partition alias symlink
                 parts_alias_symlink = self._project_info.parts_alias_symlink
                 if parts_alias_symlink:
@@ -208,12 +261,17 @@ class Executor:
                 and self._project_info.partition_dir
                 and self._project_info.partition_dir.exists()
             ):
-                shutil.rmtree(self._project_info.partition_dir)
+                self._trash.discard(self._project_info.partition_dir)
 
             if initial_step <= Step.OVERLAY:
                 for overlay in self._project_info.dirs.overlay_dirs.values():
                     if overlay.exists():
-                        shutil.rmtree(overlay)
+                        self._trash.discard(overlay)
+
+        # Deletions started outside of an execution are not awaited by the
+        # epilogue.
+        if not self._in_execution:
+            self._trash.wait()
 
     def _run_action(
         self,
@@ -239,13 +297,20 @@ class Executor:
                 )
             return
 
-        if action.step == Step.STAGE:
-            check_for_stage_collisions(
-                part_list=self._part_list, partitions=self._project_info.partitions
-            )
+        with instrumentation.span(
+            action.step.name.lower(),
+            category="action",
+            part=part.name,
+            action_type=action.action_type.name.lower(),
+        ):
+            if action.step == Step.STAGE:
+                check_for_stage_collisions(
+                    part_list=self._part_list,
+                    partitions=self._project_info.partitions,
+                )
 
-        handler = self._create_part_handler(part)
-        handler.run_action(action, stdout=stdout, stderr=stderr)
+            handler = self._create_part_handler(part)
+            handler.run_action(action, stdout=stdout, stderr=stderr)
 
     def _create_part_handler(
         self,
@@ -263,6 +328,9 @@ class Executor:
             overlay_manager=self._overlay_manager,
             ignore_patterns=self._ignore_patterns,
             base_layer_hash=self._base_layer_hash,
+            build_cache=self._build_cache,
+            state_cache=self._state_cache,
+            trash=self._trash,
         )
         self._handler[part.name] = handler
 
@@ -322,21 +390,38 @@ class Executor:
 
 
 class ExecutionContext:
-    """A context manager to handle lifecycle action executions."""
+    """A context manager to handle lifecycle action executions.
+
+    :param executor: The executor running the actions.
+    :param instrumentation: The instrumentation recording the execution
+        timings, if any.
+    """
 
     def __init__(
         self,
         *,
         executor: Executor,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         self._executor = executor
+        self._instrumentation = instrumentation
+        self._exit_stack = contextlib.ExitStack()
 
     def __enter__(self) -> Self:
-        self._executor.prologue()
+        if self._instrumentation:
+            self._exit_stack.enter_context(self._instrumentation.activate())
+        try:
+            self._executor.prologue()
+        except BaseException:
+            self._exit_stack.close()
+            raise
         return self
 
     def __exit__(self, *exc: object) -> None:
-        self._executor.epilogue()
+        try:
+            self._executor.epilogue()
+        finally:
+            self._exit_stack.close()
 
     def execute(
         self,
@@ -21,15 +21,20 @@ import os
 from collections.abc import Callable
 from pathlib import Path
 
-from craft_parts import overlays
-from craft_parts.permissions import Permissions, filter_permissions
-from craft_parts.state_manager.stage_state import StageState
-from craft_parts.state_manager.states import MigrationState, StepState
+from craft_parts import instrumentation, overlays
+from craft_parts.permissions import (
+    EffectivePermissions,
+    Permissions,
+    PermissionsTable,
+    apply_effective_permissions,
+)
+from craft_parts.state_manager.state_cache import MigrationIndex
 from craft_parts.utils import file_utils
 
 logger = logging.getLogger(__name__)
 
 
+@instrumentation.timed("migrate")
 def migrate_files(  # noqa: PLR0913
     *,
     files: set[str],
@@ -41,6 +46,7 @@ def migrate_files(  # noqa: PLR0913
     oci_translation: bool = False,
     fixup_func: Callable[..., None] = lambda *_args: None,
     permissions: list[Permissions] | None = None,
+    skip_unchanged: bool = False,
 ) -> tuple[set[str], set[str]]:
     """Copy or link files from a directory to another.
 
@@ -58,79 +64,149 @@ def migrate_files(  # noqa: PLR0913
     :param fixup_func: A function to run on each migrated file.
     :param permissions: A list of permissions definitions to take into
         account when migrating the files (the original files are not modified).
+        Permissions are applied after all entries have been migrated.
+    :param skip_unchanged: Leave files that are still linked to their source
+        in place instead of migrating them again.
 
     :returns: A tuple containing sets of migrated files and directories.
     """
     migrated_files: set[str] = set()
     migrated_dirs: set[str] = set()
-    permissions = permissions or []
+    permissions_table = PermissionsTable(permissions)
+    pending_permissions: dict[str, EffectivePermissions] = {}
 
     for dirname in sorted(dirs):
-        src = srcdir / dirname
-        dst = destdir / dirname
-
-        # If migrating a whited out directory from stage (OCI) using layer (overlayfs)
-        # as reference, use the OCI whiteout file names.
-        if not src.exists() and overlays.oci_whiteout(src).exists():
-            src = overlays.oci_whiteout(src)
-            dst = overlays.oci_whiteout(dst)
-
-        file_utils.create_similar_directory(
-            str(src), str(dst), filter_permissions(dirname, permissions)
+        oci_opaque_marker = _migrate_dir(
+            dirname, srcdir=srcdir, destdir=destdir, oci_translation=oci_translation
         )
+        if permissions_table and permissions_table.filter(dirname):
+            pending_permissions[dirname] = permissions_table.squash(dirname)
         migrated_dirs.add(dirname)
 
-        # If source is an opaque dir (overlayfs or OCI), create an OCI opaque
-        # directory marker file in destination and add it to the list of migrated
-        # files so it can be removed when cleaning.
-        if oci_translation and _is_opaque_dir(src):
-            oci_opaque_marker = overlays.oci_opaque_dir(Path(dirname))
-            oci_dst = Path(destdir, oci_opaque_marker)
-            logger.debug("create OCI opaque dir marker '%s'", str(oci_dst))
-            oci_dst.touch()
-            migrated_files.add(str(oci_opaque_marker))
+        # Add the OCI opaque directory marker to the list of migrated files so
+        # it can be removed when cleaning.
+        if oci_opaque_marker:
+            migrated_files.add(oci_opaque_marker)
 
     for filename in sorted(files):
-        src = srcdir / filename
-        dst = destdir / filename
+        migrated_file = _migrate_file(
+            filename,
+            srcdir=srcdir,
+            destdir=destdir,
+            missing_ok=missing_ok,
+            follow_symlinks=follow_symlinks,
+            oci_translation=oci_translation,
+            fixup_func=fixup_func,
+            permissions_table=permissions_table,
+            pending_permissions=pending_permissions,
+            skip_unchanged=skip_unchanged,
+        )
+        if migrated_file:
+            migrated_files.add(migrated_file)
 
-        if not src.exists():
-            # If migrating a whited out file from stage (OCI) using layer (overlayfs)
-            # as reference, use the OCI whiteout file names.
-            if overlays.oci_whiteout(src).exists():
-                src = overlays.oci_whiteout(src)
-                dst = overlays.oci_whiteout(dst)
-            elif missing_ok:
-                continue
-
-        # If the file is already here and it's a symlink, leave it alone.
-        if dst.is_symlink():
-            continue
+    apply_effective_permissions(destdir, pending_permissions)
 
-        # Otherwise, remove and re-link it.
-        if dst.exists():
-            dst.unlink()
+    return migrated_files, migrated_dirs
 
-        # If source is a whiteout file (overlayfs or OCI), create an OCI whiteout file
-        # in destination and add it to the list of migrated files so it can be removed
-        # when cleaning.
-        if oci_translation and _is_whiteout_file(src):
-            oci_whiteout = overlays.oci_whiteout(Path(filename))
-            oci_dst = Path(destdir, oci_whiteout)
-            logger.debug("create OCI whiteout file '%s'", str(oci_dst))
-            oci_dst.touch()
-            migrated_files.add(str(oci_whiteout))
-        else:
-            file_utils.link_or_copy(
-                str(src),
-                str(dst),
-                follow_symlinks=follow_symlinks,
-                permissions=filter_permissions(filename, permissions),
-            )
-            fixup_func(str(dst))
-            migrated_files.add(str(filename))
 
-    return migrated_files, migrated_dirs
+def _migrate_dir(
+    dirname: str, *, srcdir: Path, destdir: Path, oci_translation: bool
+) -> str | None:
+    """Create a directory similar to the source directory in the destination.
+
+    :returns: The name of the OCI opaque directory marker file created in the
+        destination, if any.
+    """
+    src = srcdir / dirname
+    dst = destdir / dirname
+
+    # If migrating a whited out directory from stage (OCI) using layer (overlayfs)
+    # as reference, use the OCI whiteout file names.
+    if not src.exists() and overlays.oci_whiteout(src).exists():
+        src = overlays.oci_whiteout(src)
+        dst = overlays.oci_whiteout(dst)
+
+    file_utils.create_similar_directory(str(src), str(dst))
+
+    # If source is an opaque dir (overlayfs or OCI), create an OCI opaque
+    # directory marker file in destination.
+    if oci_translation and _is_opaque_dir(src):
+        oci_opaque_marker = overlays.oci_opaque_dir(Path(dirname))
+        oci_dst = Path(destdir, oci_opaque_marker)
+        logger.debug("create OCI opaque dir marker '%s'", str(oci_dst))
+        oci_dst.touch()
+        return str(oci_opaque_marker)
+
+    return None
+
+
+def _migrate_file(  # noqa: PLR0913
+    filename: str,
+    *,
+    srcdir: Path,
+    destdir: Path,
+    missing_ok: bool,
+    follow_symlinks: bool,
+    oci_translation: bool,
+    fixup_func: Callable[..., None],
+    permissions_table: PermissionsTable,
+    pending_permissions: dict[str, EffectivePermissions],
+    skip_unchanged: bool,
+) -> str | None:
+    """Copy or link a file from a directory to another.
+
+    Permissions for files copied because of the permissions table are added to
+    ``pending_permissions``, to be applied after all entries are migrated.
+
+    :returns: The name of the file migrated to the destination, if any.
+    """
+    src = srcdir / filename
+    dst = destdir / filename
+
+    if not src.exists():
+        # If migrating a whited out file from stage (OCI) using layer (overlayfs)
+        # as reference, use the OCI whiteout file names.
+        if overlays.oci_whiteout(src).exists():
+            src = overlays.oci_whiteout(src)
+            dst = overlays.oci_whiteout(dst)
+        elif missing_ok:
+            return None
+
+    # If updating and the file was not changed, leave it alone.
+    if skip_unchanged and _is_migrated_from(src, dst):
+        instrumentation.count("files unchanged")
+        return filename
+
+    # If the file is already here and it's a symlink, leave it alone.
+    if dst.is_symlink():
+        return None
+
+    # Otherwise, remove and re-link it.
+    if dst.exists():
+        dst.unlink()
+
+    # If source is a whiteout file (overlayfs or OCI), create an OCI whiteout file
+    # in destination and return its name so it can be removed when cleaning.
+    if oci_translation and _is_whiteout_file(src):
+        oci_whiteout = overlays.oci_whiteout(Path(filename))
+        oci_dst = Path(destdir, oci_whiteout)
+        logger.debug("create OCI whiteout file '%s'", str(oci_dst))
+        oci_dst.touch()
+        return str(oci_whiteout)
+
+    if permissions_table and permissions_table.filter(filename):
+        # Files with permissions are always copied so that the original
+        # files are not modified.
+        file_utils.copy(str(src), str(dst))
+        pending_permissions[filename] = permissions_table.squash(filename)
+    else:
+        file_utils.link_or_copy(
+            str(src),
+            str(dst),
+            follow_symlinks=follow_symlinks,
+        )
+    fixup_func(str(dst))
+    return filename
 
 
 def _is_whiteout_file(path: Path) -> bool:
@@ -141,120 +217,103 @@ def _is_opaque_dir(path: Path) -> bool:
     return overlays.is_opaque_dir(path) or overlays.is_oci_opaque_dir(path)
 
 
-def clean_shared_area(
-    *,
-    part_name: str,
-    shared_dir: Path,
-    part_states: dict[str, StepState],
-    overlay_migration_state: MigrationState | None,
-    partition: str | None,
-) -> None:
-    """Clean files added by a part to a shared directory.
+def _is_migrated_from(src: Path, dst: Path) -> bool:
+    """Verify if a migrated file is still linked to its source."""
+    try:
+        src_stat = src.lstat()
+        dst_stat = dst.lstat()
+    except FileNotFoundError:
+        return False
 
-    :param part_name: The name of the part that added the files.
-    :param shared_dir: The shared directory to remove files from.
-    :param part_states: A dictionary mapping each part to the part's state for
-        the step corresponding to the area being cleaned.
-    :param overlay_migration_state: The state of the overlay migration to step.
-    """
-    # no state defined for this part, we won't remove files
-    if part_name not in part_states:
-        return
+    if src.is_symlink():
+        return dst.is_symlink() and os.readlink(src) == os.readlink(dst)  # noqa: PTH115
 
-    state = part_states[part_name]
-    files: set[str] = set()
-    directories: set[str] = set()
+    return (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino)
 
-    partition_contents = state.contents(partition=partition)
 
-    if partition_contents:
-        files, directories = partition_contents
+def can_update_files(*, dirs: set[str], srcdir: Path) -> bool:
+    """Verify if previously migrated entries can be updated in place.
 
-    # We want to make sure we don't remove a file or directory that's
-    # being used by another part. So we'll examine the state for all parts
-    # in the project and leave any files or directories found to be in
-    # common.
-    for other_name, other_state in part_states.items():
-        other_partition_contents = other_state.contents(partition=partition)
-
-        if other_state and other_name != part_name and other_partition_contents:
-            other_files, other_directories = other_partition_contents
-            files -= other_files
-            directories -= other_directories
-
-    # If overlay has been migrated, also take overlay files into account
-    if overlay_migration_state:
-        overlay_contents = overlay_migration_state.contents(partition=partition)
-        if overlay_migration_state and overlay_contents:
-            overlay_files, overlay_directories = overlay_contents
-            files -= overlay_files
-            directories -= overlay_directories
-
-    # Finally, clean the files and directories that are specific to this
-    # part.
-    _clean_migrated_files(files, directories, shared_dir)
+    This is not possible if a migrated directory is no longer a directory
+    in the source.
 
+    :param dirs: The set of previously migrated directories.
+    :param srcdir: The directory entries were migrated from.
 
-def clean_backstage(
-    *, part_name: str, shared_dir: Path, part_states: dict[str, StageState]
-) -> None:
-    """Clean files added by a part to the backstage directory."""
-    if part_name not in part_states:
-        return
+    :returns: Whether the migrated entries can be updated.
+    """
+    for dirname in dirs:
+        src = srcdir / dirname
+        if src.is_symlink() or (src.exists() and not src.is_dir()):
+            return False
 
-    files = part_states[part_name].backstage_files
-    directories = part_states[part_name].backstage_directories
+    return True
 
-    # We want to make sure we don't remove a file or directory that's
-    # being used by another part. So we'll examine the state for all parts
-    # in the project and leave any files or directories found to be in
-    # common.
-    for other_name, other_state in part_states.items():
-        if other_state and other_name != part_name:
-            files -= other_state.backstage_files
-            directories -= other_state.backstage_directories
 
-    _clean_migrated_files(files, directories, shared_dir)
+def remove_outdated_files(*, files: set[str], srcdir: Path, destdir: Path) -> None:
+    """Remove migrated files that no longer match their source.
 
+    Files whose source was removed are left in place, they must be cleaned
+    after the new set of files is migrated.
 
-def clean_shared_overlay(
+    :param files: The set of previously migrated files.
+    :param srcdir: The directory files were migrated from.
+    :param destdir: The directory files were migrated to.
+    """
+    for filename in files:
+        src = srcdir / filename
+        dst = destdir / filename
+        if not src.is_symlink() and not src.exists():
+            continue
+        if (dst.is_symlink() or dst.exists()) and not _is_migrated_from(src, dst):
+            dst.unlink()
+
+
+def remove_stale_files(
     *,
+    files: set[str],
+    dirs: set[str],
+    migrated_files: set[str],
+    migrated_dirs: set[str],
     shared_dir: Path,
-    part_states: dict[str, StepState],
-    overlay_migration_state: MigrationState | None,
-    partition: str | None,
 ) -> None:
-    """Remove migrated overlay files from a shared directory.
+    """Remove previously migrated entries that were not migrated again.
 
-    :param state_file: The migration state file.
-    :param shared_dir: The shared directory to remove files from.
-    :param part_states: A dictionary mapping each part to the part's state for
-        the step corresponding to the area being cleaned.
+    :param files: The set of previously migrated files.
+    :param dirs: The set of previously migrated directories.
+    :param migrated_files: The set of files migrated in the update.
+    :param migrated_dirs: The set of directories migrated in the update.
+    :param shared_dir: The shared directory to remove entries from.
     """
-    # no overlay staging state defined, we won't remove files
-    if not overlay_migration_state:
-        return
+    _clean_migrated_files(files - migrated_files, dirs - migrated_dirs, shared_dir)
 
-    files: set[str] = set()
-    directories: set[str] = set()
 
-    # This overlay migration state is coming from a partition, so content
-    # is recorded in top-level files/directories keys, not in partition_contents key
-    overlay_contents = overlay_migration_state.contents(partition=None)
+def clean_shared_area(
+    *, part_name: str, shared_dir: Path, index: MigrationIndex
+) -> None:
+    """Clean files added by a part to a shared directory.
+
+    :param part_name: The name of the part that added the files.
+    :param shared_dir: The shared directory to remove files from.
+    :param index: The index of the entries migrated to the shared directory by
+        all parts and by the overlay.
+    """
+    # We want to make sure we don't remove a file or directory that's
+    # being used by another part or by the overlay, so only entries
+    # referenced by this part alone are removed.
+    files, directories = index.get_exclusive_contents(part_name)
+    _clean_migrated_files(files, directories, shared_dir)
+
 
-    if overlay_contents:
-        files, directories = overlay_contents
+def clean_shared_overlay(*, shared_dir: Path, index: MigrationIndex) -> None:
+    """Remove migrated overlay files from a shared directory.
 
+    :param shared_dir: The shared directory to remove files from.
+    :param index: The index of the entries migrated to the shared directory by
+        all parts and by the overlay.
+    """
     # Don't remove entries that also belong to a part in this partition
-    for other_state in part_states.values():
-        if not other_state:
-            continue
-        other_contents = other_state.contents(partition=partition)
-        if other_contents:
-            other_part_files, other_part_directories = other_contents
-            files -= other_part_files
-            directories -= other_part_directories
-
+    files, directories = index.get_exclusive_contents(None)
     _clean_migrated_files(files, directories, shared_dir)
 
 
@@ -30,7 +30,7 @@ import shutil
 from glob import iglob
 from typing import TYPE_CHECKING
 
-from craft_parts import errors
+from craft_parts import errors, instrumentation
 from craft_parts.utils import file_utils, path_utils
 from craft_parts.utils.partition_utils import DEFAULT_PARTITION
 
@@ -39,6 +39,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+@instrumentation.timed("organize")
 def organize_files(  # noqa: PLR0912
     *,
     part_name: str,
@@ -16,6 +16,8 @@
 
 """Definitions and helpers for part handlers."""
 
+import dataclasses
+import functools
 import logging
 import os
 import os.path
@@ -28,32 +30,50 @@ from typing import Any, cast
 
 from typing_extensions import Protocol
 
-from craft_parts import callbacks, errors, overlays, packages, plugins, sources
+from craft_parts import (
+    __version__,
+    callbacks,
+    errors,
+    instrumentation,
+    overlays,
+    packages,
+    plugins,
+    sources,
+)
 from craft_parts.actions import Action, ActionType
 from craft_parts.filesystem_mounts import FilesystemMount
-from craft_parts.infos import PartInfo, StepInfo
+from craft_parts.infos import PartInfo, ProjectVarInfo, StepInfo
 from craft_parts.overlays import LayerHash, OverlayManager
 from craft_parts.packages import errors as packages_errors
-from craft_parts.packages.base import read_origin_stage_package
+from craft_parts.packages.base import (
+    STAGE_PACKAGES_INDEX_FILE,
+    StagePackagesIndex,
+    get_pkg_name_parts,
+    read_origin_stage_package,
+)
 from craft_parts.packages.platform import is_deb_based
 from craft_parts.parts import (
     Part,
     get_parts_with_overlay,
     has_overlay_visibility,
+    part_dependencies,
 )
 from craft_parts.plugins import Plugin
 from craft_parts.state_manager import (
     MigrationContents,
     MigrationState,
+    StateCache,
     StepState,
     states,
 )
 from craft_parts.state_manager.stage_state import StageState
 from craft_parts.steps import Step
 from craft_parts.utils import file_utils, os_utils
-from craft_parts.utils.partition_utils import DEFAULT_PARTITION
+from craft_parts.utils.partition_utils import DEFAULT_PARTITION, OVERLAY_PARTITION
+from craft_parts.utils.process import ProcessError
 
 from . import filesets, migration
+from .build_cache import BuildCache, get_build_key, get_tree_digest
 from .environment import generate_step_environment
 from .errors import EnvironmentChangedError
 from .organize import organize_files
@@ -64,6 +84,7 @@ from .step_handler import (
     StepPartitionContents,
     Stream,
 )
+from .trash import Trash
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +92,25 @@ logger = logging.getLogger(__name__)
 # pylint: disable=too-many-lines
 
 
+@dataclasses.dataclass(frozen=True)
+class _SharedArea:
+    """Entries migrated only by a part to a shared directory."""
+
+    srcdir: Path
+    shared_dir: Path
+    files: set[str]
+    dirs: set[str]
+    partition: str | None = None
+    backstage: bool = False
+
+    def migrated_contents(self, state: StepState) -> tuple[set[str], set[str]]:
+        """Return the entries migrated to this directory in the given state."""
+        if self.backstage:
+            stage_state = cast(StageState, state)
+            return stage_state.backstage_files, stage_state.backstage_directories
+        return state.contents(partition=self.partition) or (set(), set())
+
+
 class _RunHandler(Protocol):
     def __call__(
         self,
@@ -219,9 +259,13 @@ class PartHandler:
     :param part: The part being processed.
     :param part_info: Information about the part being processed.
     :param part_list: A list containing all parts.
+    :param build_cache: The cache to restore and store build outputs, if enabled.
+    :param state_cache: The cache of states shared by all parts in the lifecycle.
+    :param trash: The trash to delete removed directories in the background. If
+        not set, directories are deleted immediately.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         part: Part,
         *,
@@ -231,6 +275,9 @@ class PartHandler:
         overlay_manager: OverlayManager,
         ignore_patterns: list[str] | None = None,
         base_layer_hash: LayerHash | None = None,
+        build_cache: BuildCache | None = None,
+        state_cache: StateCache | None = None,
+        trash: Trash | None = None,
     ) -> None:
         self._part = part
         self._part_info = part_info
@@ -238,7 +285,11 @@ class PartHandler:
         self._track_stage_packages = track_stage_packages
         self._overlay_manager = overlay_manager
         self._base_layer_hash = base_layer_hash
+        self._build_cache = build_cache
+        self._state_cache = state_cache or StateCache()
+        self._trash = trash
         self._app_environment: dict[str, str] = {}
+        self._built = False
 
         self._plugin = plugins.get_plugin(
             part=part,
@@ -256,11 +307,45 @@ class PartHandler:
             part=part,
             project_dirs=part_info.dirs,
             ignore_patterns=ignore_patterns,
+            use_git_mirrors=part_info.use_git_mirrors,
         )
 
         self.build_packages = _get_build_packages(part=self._part, plugin=self._plugin)
         self.build_snaps = _get_build_snaps(part=self._part, plugin=self._plugin)
 
+    @property
+    def epilogue_commands(self) -> list[str]:
+        """The plugin epilogue commands, if the part was built in this execution."""
+        if not self._built:
+            return []
+        return self._plugin.get_epilogue_commands()
+
+    def run_epilogue(self, *, stdout: Stream = None, stderr: Stream = None) -> None:
+        """Run the plugin epilogue commands if the part was built in this execution.
+
+        Failures are logged and don't interrupt the execution epilogue.
+        """
+        if not self.epilogue_commands:
+            return
+
+        step_info = StepInfo(self._part_info, Step.BUILD)
+        step_handler = StepHandler(
+            self._part,
+            step_info=step_info,
+            plugin=self._plugin,
+            source_handler=self._source_handler,
+            env=generate_step_environment(
+                part=self._part, plugin=self._plugin, step_info=step_info
+            ),
+            stdout=stdout,
+            stderr=stderr,
+            partitions=self._part_info.partitions,
+        )
+        try:
+            step_handler.run_epilogue()
+        except (OSError, ProcessError) as err:
+            logger.warning("Epilogue of part %r failed: %s", self._part.name, err)
+
     def run_action(
         self,
         action: Action,
@@ -329,7 +414,7 @@ class PartHandler:
 
         :return: The pull step state.
         """
-        _remove(self._part.part_src_dir)
+        _remove(self._part.part_src_dir, trash=self._trash)
         self._make_dirs()
 
         fetched_packages = self._fetch_stage_packages(step_info=step_info)
@@ -402,7 +487,8 @@ class PartHandler:
                         stderr=stderr,
                     )
 
-            # apply overlay filter
+            # apply overlay filter, the layer can't be changed while mounted
+            self._overlay_manager.release()
             overlay_fileset = filesets.Fileset(
                 self._part.spec.overlay_files, name="overlay"
             )
@@ -453,11 +539,71 @@ class PartHandler:
         :return: The build step state.
         """
         self._make_dirs()
+
+        assets = {
+            "build-packages": self.build_packages,
+            "build-snaps": self.build_snaps,
+        }
+        assets.update(_get_machine_manifest())
+
+        needs_overlay = (
+            has_overlay_visibility(self._part, part_list=self._part_list)
+            or self._part.organizes_to_overlay
+        )
+
+        # Builds that can see the overlay, and build updates, depend on more than
+        # the inputs tracked by the build cache, so they can't be cached.
+        build_key: str | None = None
+        if self._build_cache and not update and not needs_overlay:
+            build_key = self._get_build_key(step_info, assets=assets)
+
+        if build_key and self._restore_build(build_key):
+            logger.info("Restored build output of part %r from cache", self._part.name)
+            if not self._plugin.get_out_of_source_build():
+                _remove(self._part.part_build_dir, trash=self._trash)
+                shutil.copytree(
+                    self._part.part_src_dir, self._part.part_build_dir, symlinks=True
+                )
+        else:
+            self._build(
+                step_info,
+                stdout=stdout,
+                stderr=stderr,
+                update=update,
+                needs_overlay=needs_overlay,
+            )
+            if build_key:
+                self._store_build(build_key)
+
+        # Overlay integrity is checked based by the hash of its last (topmost) layer,
+        # so we compute it for all parts. The overlay hash is added to the build state
+        # to ensure proper build step invalidation of parts that can see the overlay
+        # filesystem if overlay contents change.
+        overlay_hash = self._compute_layer_hash(all_parts=True)
+
+        return states.BuildState(
+            part_properties=self._part_properties,
+            project_options=step_info.project_options,
+            assets=assets,
+            overlay_hash=overlay_hash.hex(),
+        )
+
+    def _build(
+        self,
+        step_info: StepInfo,
+        *,
+        stdout: Stream,
+        stderr: Stream,
+        update: bool,
+        needs_overlay: bool,
+    ) -> None:
+        """Unpack stage packages and snaps, run the build and organize files."""
+        self._built = True
         self._unpack_stage_packages()
         self._unpack_stage_snaps()
 
         if not update and not self._plugin.get_out_of_source_build():
-            _remove(self._part.part_build_dir)
+            _remove(self._part.part_build_dir, trash=self._trash)
 
             # Copy source from the part source dir to the part build dir
             shutil.copytree(
@@ -465,10 +611,6 @@ class PartHandler:
             )
 
         # Perform the build step
-        needs_overlay = (
-            has_overlay_visibility(self._part, part_list=self._part_list)
-            or self._part.organizes_to_overlay
-        )
         with _conditional_layer_mount(
             self._overlay_manager, top_part=self._part, condition=needs_overlay
         ):
@@ -506,23 +648,111 @@ class PartHandler:
                 default_partition=step_info.default_partition,
             )
 
-        assets = {
-            "build-packages": self.build_packages,
-            "build-snaps": self.build_snaps,
-        }
-        assets.update(_get_machine_manifest())
+        self._update_stage_packages_index()
 
-        # Overlay integrity is checked based by the hash of its last (topmost) layer,
-        # so we compute it for all parts. The overlay hash is added to the build state
-        # to ensure proper build step invalidation of parts that can see the overlay
-        # filesystem if overlay contents change.
-        overlay_hash = self._compute_layer_hash(all_parts=True)
+    def _get_build_key(self, step_info: StepInfo, *, assets: dict[str, Any]) -> str:
+        """Compute the build cache key for this part.
 
-        return states.BuildState(
+        The key covers the pulled sources and packages, the part and project
+        properties, the versions of build packages and snaps, and the build
+        outputs and properties of the parts this part depends on, directly or
+        indirectly.
+        """
+        build_packages = {
+            pkg
+            for pkg in assets.get("installed-packages", [])
+            if get_pkg_name_parts(pkg)[0] in self.build_packages
+        }
+        build_snaps = {
+            snap
+            for snap in assets.get("installed-snaps", [])
+            if snap.split("=")[0] in {s.split("/")[0] for s in self.build_snaps}
+        }
+        # The staged contents of a dependency are determined by its build
+        # outputs and the properties applied when staging them (such as stage
+        # filters), and dependencies are staged recursively.
+        dependencies = {
+            dep.name: {
+                "properties": dep.spec.marshal(),
+                "install": {
+                    str(partition): get_tree_digest(install_dir)
+                    for partition, install_dir in dep.part_install_dirs.items()
+                    if partition != OVERLAY_PARTITION
+                },
+            }
+            for dep in part_dependencies(
+                self._part, part_list=self._part_list, recursive=True
+            )
+        }
+        stage_packages = sorted(
+            str(path.name)
+            for path in self._part.part_packages_dir.glob("*")
+            if path.name != STAGE_PACKAGES_INDEX_FILE
+        )
+
+        return get_build_key(
+            version=__version__,
+            source=get_tree_digest(self._part.part_src_dir),
+            stage_packages=stage_packages,
+            stage_snaps=get_tree_digest(self._part.part_snaps_dir),
             part_properties=self._part_properties,
             project_options=step_info.project_options,
-            assets=assets,
-            overlay_hash=overlay_hash.hex(),
+            build_packages=sorted(build_packages),
+            build_snaps=sorted(build_snaps),
+            dependencies=dependencies,
+        )
+
+    def _get_build_cache_paths(self) -> dict[str, Path]:
+        """Get the paths of the build outputs to cache, by entry name."""
+        paths = {
+            "export": self._part.part_export_dir,
+            "stage_packages_index": self._part.part_packages_dir
+            / STAGE_PACKAGES_INDEX_FILE,
+        }
+        for partition, install_dir in self._part.part_install_dirs.items():
+            if partition != OVERLAY_PARTITION:
+                paths[f"install-{partition}" if partition else "install"] = install_dir
+        return paths
+
+    def _restore_build(self, build_key: str) -> bool:
+        """Restore the build outputs of this part from the build cache.
+
+        :return: Whether the build outputs were found in the cache.
+        """
+        if not self._build_cache:
+            return False
+
+        paths = self._get_build_cache_paths()
+        metadata = self._build_cache.restore(
+            key=build_key,
+            paths=paths,
+            remove_function=functools.partial(_remove, trash=self._trash),
+        )
+        if metadata is None:
+            return False
+
+        # Restored files are copies, so the index must point to their new inodes.
+        index = self._load_stage_packages_index()
+        if index is not None:
+            index.refresh()
+            index.write(paths["stage_packages_index"])
+
+        # Set the project variables assigned when building the cached outputs.
+        if "project-vars" in metadata:
+            project_vars = ProjectVarInfo.unmarshal(metadata["project-vars"])
+            self._part_info.project_vars.update_from(project_vars, self._part.name)
+
+        return True
+
+    def _store_build(self, build_key: str) -> None:
+        """Add the build outputs of this part to the build cache."""
+        if not self._build_cache:
+            return
+
+        self._build_cache.store(
+            key=build_key,
+            paths=self._get_build_cache_paths(),
+            metadata={"project-vars": self._part_info.project_vars.marshal()},
         )
 
     def _run_stage(
@@ -531,6 +761,7 @@ class PartHandler:
         *,
         stdout: Stream,
         stderr: Stream,
+        update: bool = False,
     ) -> StepState:
         """Execute the stage step for this part.
 
@@ -546,6 +777,7 @@ class PartHandler:
             work_dir=self._part.stage_dir,
             stdout=stdout,
             stderr=stderr,
+            update=update,
         )
 
         self._migrate_overlay_files_to_stage()
@@ -588,6 +820,7 @@ class PartHandler:
         *,
         stdout: Stream,
         stderr: Stream,
+        update: bool = False,
     ) -> StepState:
         """Execute the prime step for this part.
 
@@ -603,6 +836,7 @@ class PartHandler:
             work_dir=self._part.prime_dir,
             stdout=stdout,
             stderr=stderr,
+            update=update,
         )
 
         self._migrate_overlay_files_to_prime()
@@ -614,11 +848,18 @@ class PartHandler:
             and self._track_stage_packages
             and is_deb_based()
         ):
-            prime_dirs = list(self._part.prime_dirs.values())
-            primed_stage_packages = _get_primed_stage_packages(
-                contents.partitions_contents[default_partition].files,
-                prime_dirs=prime_dirs,
-            )
+            primed_files = contents.partitions_contents[default_partition].files
+            index = self._load_stage_packages_index()
+            if index is not None:
+                primed_stage_packages = index.get_stage_packages(primed_files)
+            else:
+                # Fall back to origin information stored in extended attributes,
+                # for parts built without a stage packages index.
+                prime_dirs = list(self._part.prime_dirs.values())
+                primed_stage_packages = _get_primed_stage_packages(
+                    primed_files,
+                    prime_dirs=prime_dirs,
+                )
         else:
             primed_stage_packages = set()
 
@@ -646,12 +887,15 @@ class PartHandler:
         work_dir: Path,
         stdout: Stream,
         stderr: Stream,
+        update: bool = False,
     ) -> StepContents:
         """Run the scriptlet if overriding, otherwise run the built-in handler.
 
         :param step_info: Information about the step to execute.
         :param scriptlet_name: The name of this step's scriptlet.
         :param work_dir: The path to run the scriptlet on.
+        :param update: Whether the built-in handler should only migrate
+            entries that changed since the step last ran.
 
         :return: If step is Stage or Prime, return a tuple of sets containing
             the step's file and directory artifacts.
@@ -681,6 +925,7 @@ class PartHandler:
             stdout=stdout,
             stderr=stderr,
             partitions=self._part_info.partitions,
+            update=update,
         )
 
         scriptlet = self._part.spec.get_scriptlet(step_info.step)
@@ -739,6 +984,10 @@ class PartHandler:
         elif action.step == Step.BUILD:
             handler = self._update_build
             self._plugin.set_action_properties(action.properties)
+        elif action.step == Step.STAGE:
+            handler = self._update_stage
+        elif action.step == Step.PRIME:
+            handler = self._update_prime
         else:
             step_name = action.step.name.lower()
             raise errors.InvalidAction(
@@ -753,19 +1002,39 @@ class PartHandler:
         if action.step == Step.PULL:
             state = states.load_step_state(self._part, action.step)
             if state:
+                outdated_files, outdated_dirs = self._get_updated_source_files(action)
                 new_state = states.PullState(
                     part_properties=state.part_properties,
                     project_options=state.project_options,
                     assets=cast(states.PullState, state).assets,
-                    outdated_files=action.properties.changed_files,
-                    outdated_dirs=action.properties.changed_dirs,
+                    outdated_files=outdated_files,
+                    outdated_dirs=outdated_dirs,
                 )
                 new_state.write(state_file)
-        else:
+        elif action.step not in (Step.STAGE, Step.PRIME):
             state_file.touch()
 
         callbacks.run_post_step(step_info)
 
+    def _get_updated_source_files(
+        self, action: Action
+    ) -> tuple[list[str] | None, list[str] | None]:
+        """Obtain the files and directories changed by a pull update.
+
+        Some sources only determine the changed files when updating, otherwise
+        the changes found when planning the action are used.
+        """
+        if self._source_handler and not self._part.spec.override_pull:
+            try:
+                files, dirs = self._source_handler.get_outdated_files()
+            except sources.errors.SourceUpdateUnsupported:
+                pass
+            else:
+                if files or dirs:
+                    return files, dirs
+
+        return action.properties.changed_files, action.properties.changed_dirs
+
     def _update_pull(
         self, step_info: StepInfo, *, stdout: Stream, stderr: Stream
     ) -> None:
@@ -841,10 +1110,145 @@ class PartHandler:
             source.check_if_outdated(str(state_file))  # required by source.update()
             source.update()
 
-        _remove(self._part.part_install_dir)
+        _remove(self._part.part_install_dir, trash=self._trash)
 
         self._run_build(step_info, stdout=stdout, stderr=stderr, update=True)
 
+    def _update_stage(
+        self, step_info: StepInfo, *, stdout: Stream, stderr: Stream
+    ) -> None:
+        """Handle update action for the stage step.
+
+        This handler is called if the stage step is outdated. In this case,
+        migrate only the entries that changed since the part was last staged,
+        and remove entries that are no longer staged.
+
+        :param step_info: The step information.
+        """
+        self._update_shared(
+            step_info, handler=self._run_stage, stdout=stdout, stderr=stderr
+        )
+
+    def _update_prime(
+        self, step_info: StepInfo, *, stdout: Stream, stderr: Stream
+    ) -> None:
+        """Handle update action for the prime step.
+
+        This handler is called if the prime step is outdated. In this case,
+        migrate only the entries that changed since the part was last primed,
+        and remove entries that are no longer primed.
+
+        :param step_info: The step information.
+        """
+        self._update_shared(
+            step_info, handler=self._run_prime, stdout=stdout, stderr=stderr
+        )
+
+    def _update_shared(
+        self,
+        step_info: StepInfo,
+        *,
+        handler: Callable[..., StepState],
+        stdout: Stream,
+        stderr: Stream,
+    ) -> None:
+        """Update the entries migrated by this part to the shared directories.
+
+        Entries are updated in place only if they were migrated by the built-in
+        handler. Otherwise the step is cleaned and executed again.
+
+        :param step_info: The step information.
+        :param handler: The handler to run the step.
+        """
+        step = step_info.step
+        areas = self._get_shared_areas(step)
+
+        if (
+            self._state_cache.load_step_state(self._part, step)
+            and not self._part.has_overlay
+            and self._part.spec.get_scriptlet(step) is None
+            and all(
+                migration.can_update_files(dirs=area.dirs, srcdir=area.srcdir)
+                for area in areas
+            )
+        ):
+            for area in areas:
+                migration.remove_outdated_files(
+                    files=area.files, srcdir=area.srcdir, destdir=area.shared_dir
+                )
+
+            state = handler(step_info, stdout=stdout, stderr=stderr, update=True)
+
+            for area in areas:
+                migrated_files, migrated_dirs = area.migrated_contents(state)
+                migration.remove_stale_files(
+                    files=area.files,
+                    dirs=area.dirs,
+                    migrated_files=migrated_files,
+                    migrated_dirs=migrated_dirs,
+                    shared_dir=area.shared_dir,
+                )
+        else:
+            logger.debug("cannot update %s:%s in place", self._part.name, step)
+            self.clean_step(step)
+            state = handler(step_info, stdout=stdout, stderr=stderr)
+
+        state.write(states.get_step_state_path(self._part, step))
+        step_info.state = state
+
+    def _get_shared_areas(self, step: Step) -> list[_SharedArea]:
+        """Obtain the entries migrated only by this part to the shared directories.
+
+        :param step: The step corresponding to the shared directories.
+
+        :return: The entries migrated to each shared directory.
+        """
+        areas: list[_SharedArea] = []
+
+        if step == Step.STAGE:
+            shared_dirs = self._part.stage_dirs
+        else:
+            shared_dirs = self._part.prime_dirs
+
+        for partition, shared_dir in shared_dirs.items():
+            if step == Step.STAGE:
+                srcdir = self._part.part_install_dirs[partition]
+            else:
+                srcdir = self._part.dirs.get_stage_dir(partition)
+            index = self._state_cache.get_migration_index(
+                step,
+                part_list=self._part_list,
+                partition=partition,
+                overlay_state_dir=self._part.overlay_dirs[partition],
+            )
+            files, dirs = index.get_exclusive_contents(self._part.name)
+            areas.append(
+                _SharedArea(
+                    srcdir=srcdir,
+                    shared_dir=shared_dir,
+                    files=files,
+                    dirs=dirs,
+                    partition=partition,
+                )
+            )
+
+        if step == Step.STAGE:
+            index = self._state_cache.get_migration_index(
+                step, part_list=self._part_list, backstage=True
+            )
+            files, dirs = index.get_exclusive_contents(self._part.name)
+            areas.append(
+                _SharedArea(
+                    srcdir=self._part.part_export_dir,
+                    shared_dir=self._part.backstage_dir,
+                    files=files,
+                    dirs=dirs,
+                    backstage=True,
+                )
+            )
+
+        return areas
+
     def _reapply_action(
         self,
         action: Action,
@@ -866,9 +1270,11 @@ class PartHandler:
         self, step_info: StepInfo, *, stdout: Stream, stderr: Stream
     ) -> None:
         """Clean and repopulate the current part's layer, keeping its state."""
+        self._overlay_manager.release()
+
         # delete partition layer dirs, if any
         for partition in self._part_info.partitions or (None,):
-            _remove(self._part.part_layer_dirs[partition])
+            _remove(self._part.part_layer_dirs[partition], trash=self._trash)
 
         self._run_overlay(step_info, stdout=stdout, stderr=stderr)
 
@@ -1069,35 +1475,36 @@ class PartHandler:
             )
 
         handler()
-        states.remove(self._part, step)
+        self._state_cache.remove(self._part, step)
 
     def _clean_pull(self) -> None:
         """Remove the current part's pull step files and state."""
         # remove dirs where stage packages and snaps are fetched
-        _remove(self._part.part_packages_dir)
-        _remove(self._part.part_snaps_dir)
+        _remove(self._part.part_packages_dir, trash=self._trash)
+        _remove(self._part.part_snaps_dir, trash=self._trash)
 
         # remove the source tree
-        _remove(self._part.part_src_dir)
+        _remove(self._part.part_src_dir, trash=self._trash)
 
     def _clean_overlay(self) -> None:
         """Remove the current part' s layer data and verification hash."""
+        self._overlay_manager.release()
         for partition in self._part_info.partitions or (None,):
-            _remove(self._part.part_layer_dirs[partition])
-        _remove(self._part.part_state_dir / "layer_hash")
+            _remove(self._part.part_layer_dirs[partition], trash=self._trash)
+        _remove(self._part.part_state_dir / "layer_hash", trash=self._trash)
         # Clean the package cache if the part was below it and if the
         # cache was not directly on top of the base layer.
         part_level = self._part_list.index(self._part)
         if part_level < self._overlay_manager.cache_level:
-            _remove(self._part.dirs.overlay_packages_dir)
+            _remove(self._part.dirs.overlay_packages_dir, trash=self._trash)
 
     def _clean_build(self) -> None:
         """Remove the current part's build step files and state."""
-        _remove(self._part.part_build_dir)
+        _remove(self._part.part_build_dir, trash=self._trash)
         for install_dir in self._part.part_install_dirs.values():
-            _remove(install_dir)
+            _remove(install_dir, trash=self._trash)
 
-        _remove(self._part.part_export_dir)
+        _remove(self._part.part_export_dir, trash=self._trash)
 
     def _clean_stage(self) -> None:
         """Remove the current part's stage step files and state."""
@@ -1107,11 +1514,11 @@ class PartHandler:
         ) in self._part.stage_dirs.items():  # iterate over partitions
             self._clean_shared(Step.STAGE, partition=partition, shared_dir=stage_dir)
 
-        migration.clean_backstage(
+        migration.clean_shared_area(
             part_name=self._part.name,
             shared_dir=self._part.backstage_dir,
-            part_states=cast(
-                dict[str, StageState], _load_part_states(Step.STAGE, self._part_list)
+            index=self._state_cache.get_migration_index(
+                Step.STAGE, part_list=self._part_list, backstage=True
             ),
         )
 
@@ -1134,17 +1541,15 @@ class PartHandler:
         logger.debug(
             f"clean shared dir: {shared_dir} for step: {step} for partition {partition}"
         )
-        part_states = _load_part_states(step, self._part_list)
-        overlay_migration_state = states.load_overlay_migration_state(
-            self._part.overlay_dirs[partition], step
+        index = self._state_cache.get_migration_index(
+            step,
+            part_list=self._part_list,
+            partition=partition,
+            overlay_state_dir=self._part.overlay_dirs[partition],
         )
 
         migration.clean_shared_area(
-            part_name=self._part.name,
-            shared_dir=shared_dir,
-            part_states=part_states,
-            overlay_migration_state=overlay_migration_state,
-            partition=partition,
+            part_name=self._part.name, shared_dir=shared_dir, index=index
         )
 
         parts_with_overlay_in_step = _parts_with_overlay_in_step(
@@ -1153,19 +1558,13 @@ class PartHandler:
 
         # remove overlay data if this is the last part with overlay
         if self._part.has_overlay and len(parts_with_overlay_in_step) == 1:
-            migration.clean_shared_overlay(
-                shared_dir=shared_dir,
-                part_states=part_states,
-                overlay_migration_state=overlay_migration_state,
-                partition=partition,
-            )
-            overlay_migration_state_path = states.get_overlay_migration_state_path(
-                self._part.overlay_dirs[partition], step
-            )
+            migration.clean_shared_overlay(shared_dir=shared_dir, index=index)
             logger.info(
                 f"remove overlay migration state file for part {self._part.name}, step {step}"
             )
-            overlay_migration_state_path.unlink()
+            self._state_cache.remove_overlay_migration_state(
+                self._part.overlay_dirs[partition], step
+            )
 
     def _symlink_alias_to_default(self) -> None:
         """Create directory and symlinks for the alias of the default partition.
@@ -1258,6 +1657,7 @@ class PartHandler:
         self._symlink_alias_to_default()
         self._create_usrmerge_scaffolding()
 
+    @instrumentation.timed("fetch stage packages")
     def _fetch_stage_packages(self, *, step_info: StepInfo) -> list[str] | None:
         """Download stage packages to the part's package directory.
 
@@ -1317,6 +1717,7 @@ class PartHandler:
                 part_name=self._part.name, package_name=err.package_name
             ) from err
 
+    @instrumentation.timed("unpack stage packages")
     def _unpack_stage_packages(self) -> None:
         """Extract stage packages contents to the part's install directory."""
         pulled_packages = None
@@ -1333,6 +1734,30 @@ class PartHandler:
             track_stage_packages=self._track_stage_packages,
         )
 
+    def _load_stage_packages_index(self) -> StagePackagesIndex | None:
+        """Load the index of files unpacked from stage packages, if any."""
+        return StagePackagesIndex.read(
+            self._part.part_packages_dir / STAGE_PACKAGES_INDEX_FILE,
+            install_dir=self._part.part_install_dir,
+        )
+
+    def _update_stage_packages_index(self) -> None:
+        """Update the stage packages index with the built install directory.
+
+        Files unpacked from stage packages may have been organized or replaced
+        during the build, so the index is updated to reflect the final location
+        of each file.
+        """
+        if not (self._part.spec.stage_packages and self._track_stage_packages):
+            return
+
+        index = self._load_stage_packages_index()
+        if index is None:
+            return
+
+        index.update()
+        index.write(self._part.part_packages_dir / STAGE_PACKAGES_INDEX_FILE)
+
     def _unpack_stage_snaps(self) -> None:
         """Extract stage snap contents to the part's install directory."""
         stage_snaps = self._part.spec.stage_snaps
@@ -1356,20 +1781,24 @@ class PartHandler:
         )
 
         for snap_source in snap_sources:
-            snap_source.provision(install_dir, keep=True)
+            snap_source.provision(install_dir, keep=True, use_cache=True)
 
 
-def _remove(filename: Path) -> None:
+def _remove(filename: Path, *, trash: Trash | None = None) -> None:
     """Remove the given directory entry.
 
     :param filename: The path to the file or directory to remove.
+    :param trash: The trash to delete directories in the background, if any.
     """
     if filename.is_symlink() or filename.is_file():
         logger.debug("remove file %s", filename)
         filename.unlink()
     elif filename.is_dir():
         logger.debug("remove directory %s", filename)
-        shutil.rmtree(filename)
+        if trash:
+            trash.discard(filename)
+        else:
+            shutil.rmtree(filename)
 
 
 def _apply_file_filter(
@@ -1492,22 +1921,6 @@ def _get_machine_manifest() -> dict[str, Any]:
     }
 
 
-def _load_part_states(step: Step, part_list: list[Part]) -> dict[str, StepState]:
-    """Return a dictionary of the state of the given step for all given parts.
-
-    :param step: The step whose states should be loaded.
-    :part_list: The list of parts whose states should be loaded.
-
-    :return: A dictionary mapping part names to its state for the given step.
-    """
-    part_states: dict[str, StepState] = {}
-    for part in part_list:
-        state = states.load_step_state(part, step)
-        if state:
-            part_states[part.name] = state
-    return part_states
-
-
 def _parts_with_overlay_in_step(step: Step, *, part_list: list[Part]) -> list[Part]:
     """Obtain a list of parts with overlay that reached the given step.
 
@@ -27,13 +27,14 @@ import tempfile
 from pathlib import Path
 from typing import TextIO
 
-from craft_parts import errors, packages
+from craft_parts import errors, instrumentation, packages
+from craft_parts.ctl import PROTOCOL_HEADER
 from craft_parts.infos import StepInfo
 from craft_parts.parts import Part
 from craft_parts.plugins import Plugin
 from craft_parts.sources.local_source import SourceHandler
 from craft_parts.steps import Step
-from craft_parts.utils import process
+from craft_parts.utils import file_utils, process
 from craft_parts.utils.partition_utils import DEFAULT_PARTITION
 
 from . import filesets
@@ -44,6 +45,48 @@ logger = logging.getLogger(__name__)
 
 Stream = TextIO | int | None
 
+_CTL_RECV_SIZE = 65536
+
+# Shell function defined in the scriptlet environment to handle ``craftctl get``
+# and ``craftctl set`` without spawning a Python interpreter. Requests are written
+# to the PARTS_CTL_FIFO input FIFO, and replies are read from the output FIFO.
+# Callers are serialized with a lock, so that concurrent calls (for example, from
+# background jobs) don't read each other's replies. Other commands, arguments
+# containing control characters, or systems without flock use the craftctl
+# executable.
+_CRAFTCTL_SHELL_FUNCTION = r"""
+craftctl() {
+    { local -; set +x; } 2>/dev/null
+    if [[ ( "${1:-}" == get || "${1:-}" == set ) && $# -eq 2 && \
+          "$2" != *[[:cntrl:]]* && -p "${PARTS_CTL_FIFO:-}.in" ]] && \
+          type -P flock >/dev/null; then
+        local LC_ALL=C arg="$2" status="" length=0 message=""
+        arg="${arg//\\/\\\\}"
+        arg="${arg//\"/\\\"}"
+        {
+            flock 9
+            printf '{"function": "%s", "args": ["%s"]}\n' "$1" "$arg" \
+                > "${PARTS_CTL_FIFO}.in"
+            {
+                read -r status length
+                if (( length > 0 )); then
+                    IFS= read -r -N "$length" message
+                fi
+            } < "${PARTS_CTL_FIFO}.out"
+        } 9> "${PARTS_CTL_FIFO}.lock"
+        if [[ "$status" != OK ]]; then
+            echo "craftctl: $message" >&2
+            return 1
+        fi
+        if [[ -n "$message" ]]; then
+            printf '%s\n' "$message"
+        fi
+        return 0
+    fi
+    command craftctl "$@"
+}
+"""
+
 
 @dataclasses.dataclass(frozen=True)
 class StepPartitionContents:
@@ -98,7 +141,7 @@ class StepHandler:
     the running instance.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         part: Part,
         *,
@@ -109,6 +152,7 @@ class StepHandler:
         stdout: Stream = None,
         stderr: Stream = None,
         partitions: list[str] | None = None,
+        update: bool = False,
     ) -> None:
         self._part = part
         self._step_info = step_info
@@ -118,6 +162,7 @@ class StepHandler:
         self._stdout = stdout
         self._stderr = stderr
         self._partitions = partitions
+        self._update = update
 
     def run_builtin(self) -> StepContents:
         """Run the built-in commands for the current step."""
@@ -195,6 +240,28 @@ class StepHandler:
 
         return StepContents()
 
+    def run_epilogue(self) -> None:
+        """Run the plugin epilogue commands in the build environment.
+
+        :raises ProcessError: If the epilogue commands fail.
+        """
+        epilogue_commands = self._plugin.get_epilogue_commands()
+        if not epilogue_commands:
+            return
+
+        environment_script_path = self._part.part_run_dir.absolute() / "environment.sh"
+        environment_script_path.write_text(self._env)
+        environment_script_path.chmod(0o644)
+
+        _create_and_run_script(
+            epilogue_commands,
+            script_path=self._part.part_run_dir.absolute() / "epilogue.sh",
+            environment_script_path=environment_script_path,
+            cwd=self._part.part_build_subdir,
+            stdout=self._stdout,
+            stderr=self._stderr,
+        )
+
     def _builtin_stage(self) -> StepContents:
         stage_fileset = Fileset(
             self._part.spec.stage_files,
@@ -239,6 +306,7 @@ class StepHandler:
                     srcdir=self._part.part_install_dirs[partition],
                     destdir=self._part.dirs.get_stage_dir(partition),
                     fixup_func=pkgconfig_fixup,
+                    skip_unchanged=self._update,
                 )
                 # Backstage content is managed only in the default partition
                 if partition == self._step_info.default_partition:
@@ -247,6 +315,7 @@ class StepHandler:
                         dirs=backstage_dirs,
                         srcdir=self._part.part_export_dir,
                         destdir=self._part.backstage_dir,
+                        skip_unchanged=self._update,
                     )
                     step_contents.partitions_contents[partition] = (
                         StagePartitionContents(
@@ -274,6 +343,7 @@ class StepHandler:
                 srcdir=self._part.part_install_dir,
                 destdir=self._part.stage_dir,
                 fixup_func=pkgconfig_fixup,
+                skip_unchanged=self._update,
             )
             backstage_files, backstage_dirs = filesets.migratable_filesets(
                 Fileset(["*"], name="backstage"),
@@ -285,6 +355,7 @@ class StepHandler:
                 dirs=backstage_dirs,
                 srcdir=self._part.part_export_dir,
                 destdir=self._part.backstage_dir,
+                skip_unchanged=self._update,
             )
             step_contents.partitions_contents[DEFAULT_PARTITION] = (
                 StagePartitionContents(
@@ -340,6 +411,7 @@ class StepHandler:
                     srcdir=srcdir,
                     destdir=destdir,
                     permissions=self._part.spec.permissions,
+                    skip_unchanged=self._update,
                 )
 
                 step_contents.partitions_contents[partition] = StepPartitionContents(
@@ -358,6 +430,7 @@ class StepHandler:
                 srcdir=self._part.stage_dir,
                 destdir=self._part.prime_dir,
                 permissions=self._part.spec.permissions,
+                skip_unchanged=self._update,
             )
             step_contents.partitions_contents[DEFAULT_PARTITION] = (
                 StepPartitionContents(files=files, dirs=dirs)
@@ -365,6 +438,7 @@ class StepHandler:
 
         return step_contents
 
+    @instrumentation.timed("scriptlet")
     def run_scriptlet(
         self,
         scriptlet: str,
@@ -384,9 +458,20 @@ class StepHandler:
             ctl_socket.bind(ctl_socket_path)
             ctl_socket.listen(1)
 
-            selector = self._ctl_server_selector(step, scriptlet_name, ctl_socket)
+            ctl_fifo_path = os.path.join(tempdir, "craftctl")  # noqa: PTH118
+            ctl_fifo_in = file_utils.NonBlockingRWFifo(f"{ctl_fifo_path}.in")
+            ctl_fifo_out = file_utils.NonBlockingRWFifo(f"{ctl_fifo_path}.out")
+
+            selector = self._ctl_server_selector(
+                step, scriptlet_name, ctl_socket, (ctl_fifo_in, ctl_fifo_out)
+            )
 
-            environment = f"export PARTS_CTL_SOCKET={ctl_socket_path}\n" + self._env
+            environment = (
+                f"export PARTS_CTL_SOCKET={ctl_socket_path}\n"
+                f"export PARTS_CTL_FIFO={ctl_fifo_path}\n"
+                + _CRAFTCTL_SHELL_FUNCTION
+                + self._env
+            )
             environment_script_path = Path(tempdir) / "scriptlet_environment.sh"
             environment_script_path.write_text(environment)
             environment_script_path.chmod(0o644)
@@ -409,40 +494,101 @@ class StepHandler:
                     stderr=process_error.result.stderr,
                 ) from process_error
             finally:
+                selector.close()
                 ctl_socket.close()
+                ctl_fifo_in.close()
+                ctl_fifo_out.close()
 
     def _ctl_server_selector(
-        self, step: Step, scriptlet_name: str, stream: socket.socket
+        self,
+        step: Step,
+        scriptlet_name: str,
+        stream: socket.socket,
+        fifos: tuple[file_utils.NonBlockingRWFifo, file_utils.NonBlockingRWFifo],
     ) -> selectors.BaseSelector:
-        selector = selectors.SelectSelector()
+        """Create a selector to serve control requests from the scriptlet.
+
+        Requests are received from the control socket and from the input FIFO
+        used by the ``craftctl`` shell function. Clients sending the protocol
+        header, and the shell function, can send several newline-terminated
+        requests and receive length-prefixed replies. Other clients send a
+        single request per connection and receive a newline-terminated reply.
+        """
+        selector = selectors.DefaultSelector()
+        buffers: dict[socket.socket, _CtlBuffer] = {}
+        fifo_in, fifo_out = fifos
+        fifo_buffer = _CtlBuffer(framed=True)
+        # Replies not yet written to the output FIFO, which holds a limited amount
+        # of data until the shell function reads it.
+        fifo_pending = bytearray()
 
         def accept(sock: socket.socket, _mask: int) -> None:
             conn, _ = sock.accept()
+            buffers[conn] = _CtlBuffer()
             selector.register(conn, selectors.EVENT_READ, read)
 
         def read(conn: socket.socket, _mask: int) -> None:
-            data = conn.recv(1024)
+            data = conn.recv(_CTL_RECV_SIZE)
             logger.debug(f"ctl server received: {data!s}")
             if not data:
                 selector.unregister(conn)
                 conn.close()
+                del buffers[conn]
                 return
 
+            for message, framed in buffers[conn].feed(data):
+                conn.sendall(
+                    self._ctl_reply(step, scriptlet_name, message, framed=framed)
+                )
+
+        def read_fifo(fifo: file_utils.NonBlockingRWFifo, _mask: int) -> None:
             try:
-                retval = self._handle_control_api(
-                    step, scriptlet_name, data.decode("utf-8")
+                data = os.read(fifo.fileno(), _CTL_RECV_SIZE)
+            except BlockingIOError:
+                return
+            logger.debug(f"ctl server received from fifo: {data!s}")
+
+            for message, framed in fifo_buffer.feed(data):
+                if not fifo_pending:
+                    selector.register(fifo_out, selectors.EVENT_WRITE, write_fifo)
+                fifo_pending.extend(
+                    self._ctl_reply(step, scriptlet_name, message, framed=framed)
                 )
-                conn.send((f"OK {retval!s}\n" if retval else "OK\n").encode())
-            except errors.PluginBuildError:
-                # If craftctl default raises PluginBuildError, pass it upwards.
-                raise
-            except errors.PartsError as error:
-                conn.send(f"ERR {error!s}\n".encode())
+
+        def write_fifo(fifo: file_utils.NonBlockingRWFifo, _mask: int) -> None:
+            try:
+                written = fifo.write_bytes(fifo_pending)
+            except BlockingIOError:
+                return
+            del fifo_pending[:written]
+            if not fifo_pending:
+                selector.unregister(fifo)
 
         selector.register(stream, selectors.EVENT_READ, accept)
+        selector.register(fifo_in, selectors.EVENT_READ, read_fifo)
 
         return selector
 
+    def _ctl_reply(
+        self, step: Step, scriptlet_name: str, message: str, *, framed: bool
+    ) -> bytes:
+        """Handle a control request and build the reply to send to the client."""
+        try:
+            retval = self._handle_control_api(step, scriptlet_name, message)
+            status = "OK"
+        except errors.PluginBuildError:
+            # If craftctl default raises PluginBuildError, pass it upwards.
+            raise
+        except errors.PartsError as error:
+            retval = str(error)
+            status = "ERR"
+
+        if framed:
+            payload = retval.encode()
+            return f"{status} {len(payload)}\n".encode() + payload
+
+        return (f"{status} {retval!s}\n" if retval else f"{status}\n").encode()
+
     def _handle_control_api(
         self, step: Step, scriptlet_name: str, function_call: str
     ) -> str:
@@ -544,6 +690,43 @@ class StepHandler:
             self._builtin_prime()
 
 
+class _CtlBuffer:
+    """Split the data received from a ctl client into requests.
+
+    :param framed: Whether the client sends newline-terminated requests. If
+        not set, it's determined by the presence of the protocol header.
+    """
+
+    def __init__(self, *, framed: bool | None = None) -> None:
+        self._data = b""
+        self._framed = framed
+
+    def feed(self, data: bytes) -> list[tuple[str, bool]]:
+        """Add received data and obtain the complete requests.
+
+        :param data: The data received from the client.
+
+        :returns: The complete requests and whether their replies must be framed.
+        """
+        self._data += data
+
+        if self._framed is None:
+            if PROTOCOL_HEADER.startswith(self._data):
+                # wait for the complete header
+                return []
+            self._framed = self._data.startswith(PROTOCOL_HEADER)
+            if self._framed:
+                self._data = self._data[len(PROTOCOL_HEADER) :]
+
+        if not self._framed:
+            # clients without the protocol header send one unterminated request
+            message, self._data = self._data, b""
+            return [(message.decode("utf-8"), False)]
+
+        *messages, self._data = self._data.split(b"\n")
+        return [(m.decode("utf-8"), True) for m in messages if m.strip()]
+
+
 def _create_and_run_script(
     commands: list[str],
     script_path: Path,
@@ -0,0 +1,121 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Background removal of directory trees."""
+
+import contextlib
+import logging
+import os
+import shutil
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MAX_WORKERS = 4
+
+
+class Trash:
+    """Remove directory trees without blocking the lifecycle execution.
+
+    Trees are atomically moved to the trash directory and deleted by a pool
+    of worker threads. The trash directory must be in the same filesystem as
+    the trees to remove, otherwise trees are deleted immediately. Trees left
+    in the trash by an interrupted execution are deleted by :meth:`empty`.
+
+    :param trash_dir: The directory holding the trees being deleted.
+    :param max_workers: The maximum number of trees deleted in parallel.
+    """
+
+    def __init__(self, trash_dir: Path, *, max_workers: int | None = None) -> None:
+        self._trash_dir = trash_dir
+        self._max_workers = max_workers or min(_MAX_WORKERS, os.cpu_count() or 1)
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: dict[Path, Future[None]] = {}
+
+    @property
+    def trash_dir(self) -> Path:
+        """The directory holding the trees being deleted."""
+        return self._trash_dir
+
+    def discard(self, path: Path) -> None:
+        """Move a directory tree to the trash and delete it in the background.
+
+        :param path: The directory to remove.
+        """
+        target = self._trash_dir / f"{path.name}-{uuid.uuid4().hex}"
+        try:
+            self._trash_dir.mkdir(parents=True, exist_ok=True)
+            path.rename(target)
+        except OSError as err:
+            logger.debug("cannot move %s to the trash: %s", path, err)
+            shutil.rmtree(path)
+            return
+
+        logger.debug("move directory %s to the trash", path)
+        self._submit(target)
+
+    def empty(self) -> None:
+        """Delete the trees left in the trash by previous executions."""
+        if not self._trash_dir.is_dir():
+            return
+
+        for entry in self._trash_dir.iterdir():
+            if entry not in self._pending:
+                logger.debug("remove leftover trash %s", entry)
+                self._submit(entry)
+
+    def wait(self) -> None:
+        """Wait until all trees in the trash are deleted.
+
+        Trees that can't be deleted are kept in the trash and deleted again
+        by the next call to :meth:`empty`.
+        """
+        for path, future in self._pending.items():
+            err = future.exception()
+            if err:
+                logger.warning("Cannot remove %s: %s", path, err)
+
+        self._pending.clear()
+
+        if self._pool:
+            self._pool.shutdown()
+            self._pool = None
+
+        # Only succeeds if the trash is empty.
+        with contextlib.suppress(OSError):
+            self._trash_dir.rmdir()
+
+    def _submit(self, path: Path) -> None:
+        if not self._pool:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="trash"
+            )
+        self._pending[path] = self._pool.submit(_delete, path)
+
+
+def _delete(path: Path) -> None:
+    """Delete a trashed entry.
+
+    On platforms supporting it, ``shutil.rmtree`` walks the tree using
+    ``os.scandir`` on directory file descriptors and removes entries with
+    ``unlinkat``, so trees are not traversed by path.
+    """
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
@@ -83,6 +83,9 @@ _DEB_TO_TRIPLET: dict[str, str] = {
     "s390x": "s390x-linux-gnu",
 }
 
+# Supported compiler cache launchers.
+_COMPILER_CACHES = ("ccache", "sccache")
+
 
 _var_name_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
@@ -420,6 +423,15 @@ class ProjectInfo:
     :param filesystem_mounts: A dict of filesystem_mounts.
     :param usrmerged_by_default: Whether the parts' install dirs should be filled with
         usrmerge-safe directories and symlinks prior to a part's build.
+    :param compiler_cache: The compiler cache launcher to use when building C and
+        C++ code, either ``ccache`` or ``sccache``. Compiler caching is disabled
+        if not set.
+    :param compiler_cache_max_size: The maximum size of the compiler cache, in the
+        format used by the compiler cache launcher (for example, ``5G``).
+    :param reuse_python_venvs: Whether Python plugins should reuse virtual
+        environments with the same locked dependencies.
+    :param use_git_mirrors: Whether git sources should be cloned from mirrors
+        kept in the cache directory.
     """
 
     def __init__(  # noqa: PLR0913
@@ -440,11 +452,18 @@ class ProjectInfo:
         base_layer_dir: Path | None = None,
         base_layer_hash: bytes | None = None,
         usrmerged_by_default: bool = False,
+        compiler_cache: str | None = None,
+        compiler_cache_max_size: str | None = None,
+        reuse_python_venvs: bool = False,
+        use_git_mirrors: bool = False,
         **custom_args: Any,  # custom passthrough args
     ) -> None:
         if arch and arch not in _DEB_TO_TRIPLET:
             raise errors.InvalidArchitecture(arch)
 
+        if compiler_cache and compiler_cache not in _COMPILER_CACHES:
+            raise errors.InvalidCompilerCache(compiler_cache)
+
         if not project_dirs:
             project_dirs = ProjectDirs(partitions=partitions)
 
@@ -468,6 +487,10 @@ class ProjectInfo:
         self._base_layer_hash = base_layer_hash
         self.global_environment: dict[str, str] = {}
         self._usrmerged_by_default = usrmerged_by_default
+        self._compiler_cache = compiler_cache or None
+        self._compiler_cache_max_size = compiler_cache_max_size
+        self._reuse_python_venvs = reuse_python_venvs
+        self._use_git_mirrors = use_git_mirrors
 
         self.execution_finished = False
 
@@ -718,6 +741,26 @@ class ProjectInfo:
         """Return whether parts should be usrmerged by default."""
         return self._usrmerged_by_default
 
+    @property
+    def compiler_cache(self) -> str | None:
+        """Return the compiler cache launcher, if compiler caching is enabled."""
+        return self._compiler_cache
+
+    @property
+    def compiler_cache_max_size(self) -> str | None:
+        """Return the maximum size of the compiler cache, if set."""
+        return self._compiler_cache_max_size
+
+    @property
+    def reuse_python_venvs(self) -> bool:
+        """Return whether Python virtual environments should be reused."""
+        return self._reuse_python_venvs
+
+    @property
+    def use_git_mirrors(self) -> bool:
+        """Return whether git sources should be cloned from cached mirrors."""
+        return self._use_git_mirrors
+
     def set_project_var(
         self,
         name: str,
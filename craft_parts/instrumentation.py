@@ -0,0 +1,291 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lifecycle timing and I/O instrumentation.
+
+Components record spans (timed operations) and counters using the module
+functions :func:`span`, :func:`timed` and :func:`count`. They are recorded in
+the active :class:`Instrumentation`, if any, and ignored otherwise.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+# The instrumentation recording spans and counters, innermost last.
+_active: list[Instrumentation] = []
+
+
+@dataclasses.dataclass(frozen=True)
+class Span:
+    """A timed operation.
+
+    :param name: The operation name.
+    :param category: The operation category, such as ``action`` or ``phase``.
+    :param start: The start time, in seconds since the instrumentation was created.
+    :param duration: The operation duration, in seconds.
+    :param thread_id: The identifier of the thread running the operation.
+    :param args: Additional information about the operation.
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread_id: int
+    args: dict[str, str]
+
+
+class Instrumentation:
+    """Spans and counters recorded during a lifecycle run.
+
+    Spans and counters are recorded while the instrumentation is active, by
+    all threads.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+        self._counters: Counter[str] = Counter()
+
+    @property
+    def spans(self) -> list[Span]:
+        """The recorded spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """The recorded counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[Instrumentation]:
+        """Record spans and counters in this instrumentation."""
+        _active.append(self)
+        try:
+            yield self
+        finally:
+            _active.remove(self)
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, *, category: str, size: int | None = None, **args: object
+    ) -> Iterator[None]:
+        """Record the duration of an operation.
+
+        :param name: The operation name.
+        :param category: The operation category.
+        :param size: The number of bytes processed by the operation, recorded
+            with its throughput.
+        :param args: Additional information about the operation.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            span_args = {k: str(v) for k, v in args.items()}
+            if size is not None:
+                span_args["size"] = str(size)
+                span_args["throughput"] = _format_throughput(size, end - start)
+            new_span = Span(
+                name=name,
+                category=category,
+                start=start - self._origin,
+                duration=end - start,
+                thread_id=threading.get_ident(),
+                args=span_args,
+            )
+            with self._lock:
+                self._spans.append(new_span)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+
+        :param name: The counter name.
+        :param value: The value to add to the counter.
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def clear(self) -> None:
+        """Remove all recorded spans and counters."""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    def get_chrome_trace(self) -> dict[str, Any]:
+        """Obtain the recorded spans and counters in the Chrome trace format.
+
+        The trace can be loaded in ``chrome://tracing`` or in Perfetto.
+
+        :return: The trace data, to be serialized as JSON.
+        """
+        pid = os.getpid()
+        spans = self.spans
+        events: list[dict[str, Any]] = [
+            {
+                "name": s.name,
+                "cat": s.category,
+                "ph": "X",
+                "ts": round(s.start * 1e6),
+                "dur": round(s.duration * 1e6),
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": s.args,
+            }
+            for s in spans
+        ]
+
+        end = max((s.start + s.duration for s in spans), default=0.0)
+        events.extend(
+            {
+                "name": name,
+                "ph": "C",
+                "ts": round(end * 1e6),
+                "pid": pid,
+                "args": {name: value},
+            }
+            for name, value in sorted(self.counters.items())
+        )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the recorded spans and counters as a Chrome trace JSON file.
+
+        :param path: The file to write.
+        """
+        path.write_text(json.dumps(self.get_chrome_trace()))
+
+    def get_summary(self) -> str:
+        """Obtain a table with the total duration of each operation and counters.
+
+        :return: The summary table.
+        """
+        totals: dict[tuple[str, str], list[float]] = {}
+        for s in self.spans:
+            totals.setdefault((s.category, s.name), []).append(s.duration)
+
+        rows = [
+            (category, name, str(len(durations)), f"{sum(durations):.3f}")
+            for (category, name), durations in sorted(
+                totals.items(), key=lambda item: sum(item[1]), reverse=True
+            )
+        ]
+        lines = _format_table(
+            ("Category", "Operation", "Count", "Total (s)"), rows, text_columns=2
+        )
+
+        counters = self.counters
+        if counters:
+            lines.append("")
+            lines.extend(
+                _format_table(
+                    ("Counter", "Value"),
+                    [(name, str(value)) for name, value in sorted(counters.items())],
+                    text_columns=1,
+                )
+            )
+
+        return "\n".join(lines)
+
+
+def span(
+    name: str, *, category: str = "phase", size: int | None = None, **args: object
+) -> AbstractContextManager[None]:
+    """Record the duration of an operation in the active instrumentation.
+
+    :param name: The operation name.
+    :param category: The operation category.
+    :param size: The number of bytes processed by the operation, recorded
+        with its throughput.
+    :param args: Additional information about the operation.
+
+    :return: A context manager timing the operation.
+    """
+    if not _active:
+        return contextlib.nullcontext()
+    return _active[-1].span(name, category=category, size=size, **args)
+
+
+def timed(
+    name: str, *, category: str = "phase"
+) -> Callable[[Callable[_P, _T]], Callable[_P, _T]]:
+    """Record the duration of each call to the decorated function.
+
+    :param name: The operation name.
+    :param category: The operation category.
+    """
+
+    def decorator(func: Callable[_P, _T]) -> Callable[_P, _T]:
+        @functools.wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+            with span(name, category=category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increment a counter in the active instrumentation.
+
+    :param name: The counter name.
+    :param value: The value to add to the counter.
+    """
+    if _active:
+        _active[-1].count(name, value)
+
+
+def _format_table(
+    header: tuple[str, ...], rows: list[tuple[str, ...]], *, text_columns: int
+) -> list[str]:
+    """Align table columns, numbers are aligned to the right."""
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    return [
+        "  ".join(
+            cell.ljust(width) if i < text_columns else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        for row in [header, *rows]
+    ]
+
+
+def _format_throughput(size: int, duration: float) -> str:
+    """Format the throughput of an operation, in MiB per second."""
+    throughput = size / duration if duration > 0 else 0.0
+    return f"{throughput / (1024 * 1024):.1f} MiB/s"
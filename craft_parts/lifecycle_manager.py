@@ -16,24 +16,26 @@
 
 """The parts lifecycle manager."""
 
+import contextlib
 import os
 import re
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Any, cast
 
 from pydantic import ValidationError
 
-from craft_parts import errors, executor, packages, plugins, sequencer
+from craft_parts import errors, executor, instrumentation, packages, plugins, sequencer
 from craft_parts.actions import Action
 from craft_parts.dirs import ProjectDirs
 from craft_parts.features import Features
 from craft_parts.filesystem_mounts import FilesystemMounts, validate_filesystem_mounts
 from craft_parts.infos import ProjectInfo, ProjectVarInfo
+from craft_parts.instrumentation import Instrumentation
 from craft_parts.overlays import LayerHash
 from craft_parts.parts import Part, part_by_name
-from craft_parts.state_manager import states
+from craft_parts.state_manager import StateCache, states
 from craft_parts.steps import Step
 from craft_parts.utils.partition_utils import validate_partition_names
 
@@ -88,6 +90,24 @@ class LifecycleManager:
     :param filesystem_mounts: A dict of filesystem_mounts to apply when migrating files.
     :param usrmerged_by_default: Whether the parts' install dirs should be filled with
         usrmerge-safe directories and symlinks prior to a part's build.
+    :param use_build_cache: Restore part build outputs from a cache in ``cache_dir``
+        instead of running the build again if the part was built before with the
+        same sources, properties, build packages and dependencies.
+    :param compiler_cache: The compiler cache launcher (``ccache`` or ``sccache``)
+        used by plugins building C and C++ code. Cached objects are shared by all
+        parts in a directory under ``cache_dir``.
+    :param compiler_cache_max_size: The maximum size of the compiler cache, in the
+        format used by the compiler cache launcher (for example, ``5G``).
+    :param reuse_python_venvs: Reuse virtual environments created by Python plugins
+        for parts with the same locked dependencies. Templates are stored under
+        ``cache_dir`` and copied into the part install directory.
+    :param use_git_mirrors: Keep bare mirrors of git sources under ``cache_dir``,
+        updated once per execution, and clone parts from them. Parts using the
+        same repository, or pulled again after being cleaned, don't download the
+        repository history again.
+    :param record_timings: Record the duration of planning, execution, actions
+        and their phases, and I/O counters. The recorded data is available in
+        :attr:`instrumentation`.
     :param custom_args: Any additional arguments that will be passed directly
         to callbacks.
     """
@@ -117,6 +137,12 @@ class LifecycleManager:
         partitions: list[str] | None = None,
         filesystem_mounts: dict[str, Any] | None = None,
         usrmerged_by_default: bool = False,
+        use_build_cache: bool = False,
+        compiler_cache: str | None = None,
+        compiler_cache_max_size: str | None = None,
+        reuse_python_venvs: bool = False,
+        use_git_mirrors: bool = False,
+        record_timings: bool = False,
         **custom_args: Any,  # custom passthrough args
     ) -> None:
         # pylint: disable=too-many-locals
@@ -159,6 +185,10 @@ class LifecycleManager:
             base_layer_dir=base_layer_dir,
             base_layer_hash=base_layer_hash,
             usrmerged_by_default=usrmerged_by_default,
+            compiler_cache=compiler_cache,
+            compiler_cache_max_size=compiler_cache_max_size,
+            reuse_python_venvs=reuse_python_venvs,
+            use_git_mirrors=use_git_mirrors,
             **custom_args,
         )
 
@@ -207,11 +237,15 @@ class LifecycleManager:
         self._part_list = part_list
         self._application_name = application_name
         self._target_arch = project_info.target_arch
+        # States are loaded once and shared by the sequencer and executor
+        state_cache = StateCache()
+
         self._sequencer = sequencer.Sequencer(
             part_list=self._part_list,
             project_info=project_info,
             ignore_outdated=ignore_outdated,
             base_layer_hash=layer_hash,
+            state_cache=state_cache,
         )
         self._executor = executor.Executor(
             part_list=self._part_list,
@@ -222,8 +256,11 @@ class LifecycleManager:
             track_stage_packages=track_stage_packages,
             base_layer_dir=base_layer_dir,
             base_layer_hash=layer_hash,
+            use_build_cache=use_build_cache,
+            state_cache=state_cache,
         )
         self._project_info = project_info
+        self._instrumentation = Instrumentation() if record_timings else None
         # pylint: enable=too-many-locals
 
     @property
@@ -231,6 +268,16 @@ class LifecycleManager:
         """Obtain information about this project."""
         return self._project_info
 
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """Obtain the recorded timings, if enabled with ``record_timings``.
+
+        Spans and counters can be exported using
+        :meth:`Instrumentation.write_chrome_trace` and
+        :meth:`Instrumentation.get_summary`.
+        """
+        return self._instrumentation
+
     def clean(
         self, step: Step = Step.PULL, *, part_names: list[str] | None = None
     ) -> None:
@@ -244,7 +291,8 @@ class LifecycleManager:
         :param part_names: The list of part names to clean. If not specified,
             all parts will be cleaned and work directories will be removed.
         """
-        self._executor.clean(initial_step=step, part_names=part_names)
+        with self._recording(), instrumentation.span("clean", category="lifecycle"):
+            self._executor.clean(initial_step=step, part_names=part_names)
 
     def refresh_packages_list(self) -> None:
         """Update the available packages list.
@@ -271,7 +319,8 @@ class LifecycleManager:
         :return: The list of :class:`Action` objects that should be executed in
             order to reach the target step for the specified parts.
         """
-        return self._sequencer.plan(target_step, part_names, rerun=rerun)
+        with self._recording(), instrumentation.span("plan", category="lifecycle"):
+            return self._sequencer.plan(target_step, part_names, rerun=rerun)
 
     def reload_state(self) -> None:
         """Reload the ephemeral state from disk."""
@@ -279,7 +328,19 @@ class LifecycleManager:
 
     def action_executor(self) -> executor.ExecutionContext:
         """Return a context manager for action execution."""
-        return executor.ExecutionContext(executor=self._executor)
+        return executor.ExecutionContext(
+            executor=self._executor, instrumentation=self._instrumentation
+        )
+
+    @contextlib.contextmanager
+    def _recording(self) -> Iterator[None]:
+        """Record timings in the instrumentation, if enabled."""
+        if not self._instrumentation:
+            yield
+            return
+
+        with self._instrumentation.activate():
+            yield
 
     def get_pull_assets(self, *, part_name: str) -> dict[str, Any] | None:
         """Return the part's pull state assets.
@@ -36,6 +36,7 @@ from xdg import BaseDirectory  # type: ignore[import]
 import craft_parts
 import craft_parts.errors
 from craft_parts import ActionType, Step
+from craft_parts.utils.file_watcher import FileWatcher
 
 
 def main() -> None:
@@ -79,6 +80,26 @@ def main() -> None:
 
 
 def _process_inputs(options: argparse.Namespace) -> None:
+    if options.command == "watch":
+        _do_watch(options)
+        return
+
+    lcm, _ = _create_lifecycle_manager(options)
+
+    command = options.command if options.command else "prime"
+    if command == "clean":
+        _do_clean(lcm, options)
+        sys.exit()
+
+    _do_step(lcm, options)
+
+    if lcm.instrumentation:
+        _report_timings(lcm.instrumentation, Path(options.timings))
+
+
+def _create_lifecycle_manager(
+    options: argparse.Namespace,
+) -> tuple[craft_parts.LifecycleManager, dict[str, Any]]:
     with open(options.file) as opt_file:  # noqa: PTH123
         part_data = yaml.safe_load(opt_file)
 
@@ -120,14 +141,13 @@ def _process_inputs(options: argparse.Namespace) -> None:
         base_layer_hash=base_layer_hash,
         partitions=partitions,
         filesystem_mounts=filesystem_mounts_data,
+        use_build_cache=options.build_cache,
+        compiler_cache=options.compiler_cache,
+        use_git_mirrors=options.git_mirrors,
+        record_timings=bool(options.timings),
     )
 
-    command = options.command if options.command else "prime"
-    if command == "clean":
-        _do_clean(lcm, options)
-        sys.exit()
-
-    _do_step(lcm, options)
+    return lcm, part_data
 
 
 def _do_step(lcm: craft_parts.LifecycleManager, options: argparse.Namespace) -> None:
@@ -139,8 +159,6 @@ def _do_step(lcm: craft_parts.LifecycleManager, options: argparse.Namespace) ->
 
     actions = lcm.plan(target_step, part_names)
 
-    output_stream = None if options.verbose else subprocess.DEVNULL
-
     if options.dry_run:
         printed = False
         for action in actions:
@@ -151,6 +169,16 @@ def _do_step(lcm: craft_parts.LifecycleManager, options: argparse.Namespace) ->
             print("No actions to execute.")
         sys.exit()
 
+    _execute(lcm, actions, options)
+
+
+def _execute(
+    lcm: craft_parts.LifecycleManager,
+    actions: list[craft_parts.Action],
+    options: argparse.Namespace,
+) -> None:
+    output_stream = None if options.verbose else subprocess.DEVNULL
+
     with lcm.action_executor() as ctx:
         for action in actions:
             if options.show_skipped or action.action_type != ActionType.SKIP:
@@ -168,6 +196,137 @@ def _do_clean(lcm: craft_parts.LifecycleManager, options: argparse.Namespace) ->
     lcm.clean(Step.PULL, part_names=options.parts)
 
 
+def _do_watch(options: argparse.Namespace) -> None:
+    parts_file = Path(options.file).resolve()
+    target_step = _parse_step(options.step)
+
+    try:
+        while True:
+            try:
+                lcm, part_data = _create_lifecycle_manager(options)
+            except (
+                OSError,
+                ValueError,
+                TypeError,
+                yaml.YAMLError,
+                craft_parts.errors.PartsError,
+            ) as err:
+                print(f"Error: {err}", file=sys.stderr)
+                with FileWatcher([parts_file]) as watcher:
+                    _wait_for_changes(watcher, options.debounce)
+                continue
+
+            _watch_project(lcm, part_data, parts_file, target_step, options)
+            print("Parts file changed, reloading.")
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+
+
+def _watch_project(
+    lcm: craft_parts.LifecycleManager,
+    part_data: dict[str, Any],
+    parts_file: Path,
+    target_step: Step,
+    options: argparse.Namespace,
+) -> None:
+    """Process parts affected by source changes until the parts file changes."""
+    sources = _get_local_sources(part_data)
+    dirs = lcm.project_info.dirs
+    work_dirs = [
+        dirs.parts_dir,
+        dirs.overlay_dir,
+        dirs.stage_dir,
+        dirs.backstage_dir,
+        dirs.prime_dir,
+        dirs.trash_dir,
+    ]
+    if dirs.partition_dir:
+        work_dirs.append(dirs.partition_dir)
+
+    # Start watching before the first run, so changes made meanwhile are seen.
+    with FileWatcher([parts_file, *sources.values()], exclude=work_dirs) as watcher:
+        _run_watch_cycle(lcm, target_step, options.parts, options)
+
+        while True:
+            changes = _wait_for_changes(watcher, options.debounce)
+            if parts_file in changes:
+                return
+
+            changed_parts = {
+                name
+                for name, source in sources.items()
+                if any(path.is_relative_to(source) for path in changes)
+            }
+            part_names = _get_dependent_parts(changed_parts, part_data)
+            if options.parts:
+                part_names &= set(options.parts)
+            if not part_names:
+                continue
+
+            print(f"Changes detected in {', '.join(sorted(changed_parts))}.")
+            _run_watch_cycle(lcm, target_step, sorted(part_names), options)
+
+
+def _run_watch_cycle(
+    lcm: craft_parts.LifecycleManager,
+    target_step: Step,
+    part_names: list[str],
+    options: argparse.Namespace,
+) -> None:
+    # Planning updates the ephemeral state, reload it from the last execution.
+    lcm.reload_state()
+    try:
+        actions = lcm.plan(target_step, part_names)
+        _execute(lcm, actions, options)
+    except craft_parts.errors.PartsError as err:
+        print(f"Error: {err}", file=sys.stderr)
+
+    print("Watching for changes...")
+
+
+def _wait_for_changes(watcher: FileWatcher, debounce: float) -> set[Path]:
+    """Wait for changes, and until no further changes happen for a while."""
+    changes = watcher.wait()
+    while more_changes := watcher.wait(debounce):
+        changes |= more_changes
+    return changes
+
+
+def _get_local_sources(part_data: dict[str, Any]) -> dict[str, Path]:
+    """Obtain the parts with sources in the local filesystem."""
+    sources: dict[str, Path] = {}
+    for name, spec in part_data.get("parts", {}).items():
+        source = spec.get("source")
+        if isinstance(source, str) and "://" not in source:
+            path = Path(source).resolve()
+            if path.exists():
+                sources[name] = path
+    return sources
+
+
+def _get_dependent_parts(part_names: set[str], part_data: dict[str, Any]) -> set[str]:
+    """Obtain the given parts and the parts that depend on them, recursively."""
+    dependents = set(part_names)
+    parts = part_data.get("parts", {})
+    while True:
+        new_dependents = {
+            name
+            for name, spec in parts.items()
+            if name not in dependents and dependents & set(spec.get("after", []))
+        }
+        if not new_dependents:
+            return dependents
+        dependents |= new_dependents
+
+
+def _report_timings(
+    instrumentation: craft_parts.Instrumentation, trace_file: Path
+) -> None:
+    instrumentation.write_chrome_trace(trace_file)
+    print(instrumentation.get_summary(), file=sys.stderr)
+    print(f"Timings trace written to {trace_file}.", file=sys.stderr)
+
+
 def _action_message(action: craft_parts.Action) -> str:
     msg = {
         Step.PULL: {
@@ -193,11 +352,13 @@ def _action_message(action: craft_parts.Action) -> str:
             ActionType.RUN: "Stage",
             ActionType.RERUN: "Restage",
             ActionType.SKIP: "Skip stage",
+            ActionType.UPDATE: "Update stage for",
         },
         Step.PRIME: {
             ActionType.RUN: "Prime",
             ActionType.RERUN: "Re-prime",
             ActionType.SKIP: "Skip prime",
+            ActionType.UPDATE: "Update prime for",
         },
     }
 
@@ -292,6 +453,23 @@ def _parse_arguments() -> argparse.Namespace:
         default="",
         help="Set an alternate cache directory location.",
     )
+    parser.add_argument(
+        "--build-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse part build outputs from previous builds with the same inputs.",
+    )
+    parser.add_argument(
+        "--compiler-cache",
+        choices=["ccache", "sccache"],
+        help="Cache C and C++ compilation results using the given launcher.",
+    )
+    parser.add_argument(
+        "--git-mirrors",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Clone git sources from mirrors kept in the cache directory.",
+    )
     parser.add_argument(
         "--partitions",
         metavar="name",
@@ -303,6 +481,14 @@ def _parse_arguments() -> argparse.Namespace:
         metavar="filesystem_mounts",
         help="The filesystem mounts file.",
     )
+    parser.add_argument(
+        "--timings",
+        metavar="filename",
+        help=(
+            "Record lifecycle timings, write them to the given file in the "
+            "Chrome trace format and print a summary."
+        ),
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -372,6 +558,31 @@ def _parse_arguments() -> argparse.Namespace:
         help="The list of parts to prime. Default is all parts.",
     )
 
+    watch_parser = add_subparser(
+        "watch", help="Process parts again when their local sources change."
+    )
+    watch_parser.add_argument(
+        "parts",
+        nargs="*",
+        help="The list of parts to process. Default is all parts.",
+    )
+    watch_parser.add_argument(
+        "--step",
+        choices=["pull", "overlay", "build", "stage", "prime"],
+        default="prime",
+        help="The step to process parts to. Default is 'prime'.",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        metavar="seconds",
+        type=float,
+        default=0.5,
+        help=(
+            "Wait until no changes happen for the given time before processing "
+            "parts. Default is 0.5."
+        ),
+    )
+
     clean_parser = add_subparser("clean", help="Remove a part's assets and state.")
     clean_parser.add_argument(
         "parts",
@@ -21,9 +21,10 @@ from __future__ import annotations
 import logging
 import multiprocessing
 import os
+import pickle
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast
 
 from craft_parts.utils import os_utils
 
@@ -50,6 +51,105 @@ def chroot(path: Path, target: Callable[..., _T], *args: Any, **kwargs: Any) ->
     """
     logger.debug("[pid=%d] parent process", os.getpid())
 
+    logger.debug("[pid=%d] set up chroot", os.getpid())
+    _setup_chroot(path)
+    try:
+        return _run_child(path, target, args, kwargs)
+    finally:
+        logger.debug("[pid=%d] clean up chroot", os.getpid())
+        _cleanup_chroot(path)
+
+
+class ChrootWorker:
+    """A process executing callables in a chroot environment.
+
+    The chroot environment is set up when the worker starts, and the worker
+    process serves calls received over a pipe until it is stopped. Callables
+    that can't be pickled with their arguments are executed in a new child
+    process instead. The worker is a daemon process, so callables executed
+    by it can't start other processes using :mod:`multiprocessing`.
+
+    :param path: The new filesystem root.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._process: multiprocessing.Process | None = None
+        self._conn: Connection[bytes, tuple[Any, str | None]] | None = None
+
+    @property
+    def path(self) -> Path:
+        """The root of the chroot environment."""
+        return self._path
+
+    def run(self, target: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Execute a callable in the chroot environment.
+
+        :param target: The callable to run in the chroot environment.
+        :param args: Arguments for target.
+        :param kwargs: Keyword arguments for target.
+
+        :returns: The target function return value.
+        """
+        if not self._process:
+            self._start()
+
+        try:
+            request = pickle.dumps((target, args, kwargs))
+        except (pickle.PicklingError, AttributeError, TypeError) as err:
+            logger.debug("run %r in a new process: %s", target, err)
+            return _run_child(self._path, target, args, kwargs)
+
+        conn = cast("Connection[bytes, tuple[_T, str | None]]", self._conn)
+        conn.send_bytes(request)
+        res, err = conn.recv()
+
+        if isinstance(err, str):
+            raise errors.OverlayChrootExecutionError(err)
+
+        return res
+
+    def stop(self) -> None:
+        """Stop the worker process and clean up the chroot environment."""
+        if not self._process or not self._conn:
+            return
+
+        logger.debug("[pid=%d] stop chroot worker", os.getpid())
+        try:
+            self._conn.send_bytes(b"")
+            self._process.join()
+            self._conn.close()
+        finally:
+            self._process = None
+            self._conn = None
+            logger.debug("[pid=%d] clean up chroot", os.getpid())
+            _cleanup_chroot(self._path)
+
+    def _start(self) -> None:
+        logger.debug("[pid=%d] set up chroot", os.getpid())
+        _setup_chroot(self._path)
+
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_serve, args=(self._path, child_conn), daemon=True
+        )
+        try:
+            process.start()
+        except Exception:
+            _cleanup_chroot(self._path)
+            raise
+
+        self._process = process
+        self._conn = parent_conn
+
+
+def _run_child(
+    path: Path,
+    target: Callable[..., _T],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> _T:
+    """Execute a callable in a new child process in a prepared chroot environment."""
     # This typehint technically should be "Connection[Any, tuple[_T, None] | tuple[None, str]]"
     # However, types surrounding multiprocessing are finnicky at best and the way we handle the
     # result here makes the typehint effectively true, since we don't attempt to access the first
@@ -59,15 +159,9 @@ def chroot(path: Path, target: Callable[..., _T], *args: Any, **kwargs: Any) ->
     child = multiprocessing.Process(
         target=_runner, args=(Path(path), child_conn, target, args, kwargs)
     )
-    logger.debug("[pid=%d] set up chroot", os.getpid())
-    _setup_chroot(path)
-    try:
-        child.start()
-        res, err = parent_conn.recv()
-        child.join()
-    finally:
-        logger.debug("[pid=%d] clean up chroot", os.getpid())
-        _cleanup_chroot(path)
+    child.start()
+    res, err = parent_conn.recv()
+    child.join()
 
     if isinstance(err, str):
         raise errors.OverlayChrootExecutionError(err)
@@ -97,6 +191,41 @@ def _runner(
     conn.send((res, None))
 
 
+def _serve(path: Path, conn: Connection[tuple[Any, str | None], bytes]) -> None:
+    """Chroot to the execution directory and call targets until stopped.
+
+    Each request is a pickled tuple containing the target function and its
+    arguments. An empty request stops the worker.
+    """
+    logger.debug("[pid=%d] chroot worker: chroot to %r", os.getpid(), path)
+    error: str | None = None
+    try:
+        os.chdir(path)
+        os.chroot(path)
+    except OSError as exc:
+        error = str(exc)
+
+    while True:
+        try:
+            request = conn.recv_bytes()
+        except EOFError:
+            return
+        if not request:
+            return
+
+        if error:
+            conn.send((None, error))
+            continue
+
+        try:
+            target, args, kwargs = pickle.loads(request)  # noqa: S301
+            logger.debug("[pid=%d] chroot worker: target=%r", os.getpid(), target)
+            res = target(*args, **kwargs)
+            conn.send((res, None))
+        except Exception as exc:  # noqa: BLE001
+            conn.send((None, str(exc)))
+
+
 def _setup_chroot(path: Path) -> None:
     """Prepare the chroot environment before executing the target function."""
     logger.debug("setup chroot: %r", path)
@@ -25,7 +25,7 @@ from typing import Any, Literal, TypeVar, cast
 
 from typing_extensions import Self
 
-from craft_parts import packages
+from craft_parts import instrumentation, packages
 from craft_parts.infos import ProjectInfo
 from craft_parts.parts import Part
 
@@ -50,11 +50,36 @@ def _defer_evaluation(method: Callable[..., _T]) -> Callable[..., _T]:
     if instance is None or method_name is None:
         raise TypeError("Only bound methods can be deferred")
 
-    def _thunk(*args: Any, **kwargs: Any) -> _T:
-        method = cast(Callable[..., _T], getattr(instance, method_name))
+    return _DeferredMethod(instance, method_name)
+
+
+def _refresh_packages_list() -> None:
+    """Refresh the list of available packages.
+
+    The result of previous refreshes is cached in the process running the
+    refresh, such as a chroot worker, so the cache is reset there to ensure
+    the list is always refreshed.
+    """
+    packages.Repository.refresh_packages_list.cache_clear()  # type: ignore[attr-defined]
+    packages.Repository.refresh_packages_list()
+
+
+class _DeferredMethod:
+    """A method looked up when called.
+
+    Unlike a closure, it can be pickled to be sent to a chroot worker.
+    """
+
+    def __init__(self, instance: object, method_name: str) -> None:
+        self._instance = instance
+        self._method_name = method_name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        method = cast(Callable[..., Any], getattr(self._instance, self._method_name))
         return method(*args, **kwargs)
 
-    return _thunk
+    def __repr__(self) -> str:
+        return f"<deferred {self._instance!r}.{self._method_name}>"
 
 
 class OverlayManager:
@@ -66,6 +91,12 @@ class OverlayManager:
         if the project doesn't use overlay parameters.
     :param cache_level: The number of part layers to be mounted before the
         package cache.
+
+    During an overlay session, the layer stack stays mounted after it's
+    unmounted, and requests to mount the same stack reuse it. The stack is
+    only unmounted when a different stack is requested, when it's released,
+    or when the session ends. Callables executed in the chroot environment
+    of a mounted stack are served by a single worker process.
     """
 
     def __init__(
@@ -82,6 +113,9 @@ class OverlayManager:
         self._overlay_fs: OverlayFS | None = None
         self._base_layer_dir = base_layer_dir
         self._cache_level = cache_level
+        self._keep_mounted = False
+        self._mounted: tuple[tuple[Path, ...], OverlayFS] | None = None
+        self._chroot_worker: chroot.ChrootWorker | None = None
 
     @property
     def base_layer_dir(self) -> Path | None:
@@ -125,13 +159,7 @@ class OverlayManager:
         # lower dirs are stacked from right to left
         lowers.reverse()
 
-        self._overlay_fs = OverlayFS(
-            lower_dirs=lowers,
-            upper_dir=upper,
-            work_dir=self._project_info.overlay_work_dir,
-        )
-
-        self._overlay_fs.mount(self._project_info.overlay_mount_dir)
+        self._mount(lower_dirs=lowers, upper_dir=upper)
 
     def mount_pkg_cache(self) -> None:
         """Mount the overlay step package cache layer."""
@@ -146,23 +174,84 @@ class OverlayManager:
         # Lower dirs are stacked from right to left.
         lowers.reverse()
 
-        self._overlay_fs = OverlayFS(
-            lower_dirs=lowers,
-            upper_dir=self._project_info.overlay_packages_dir,
-            work_dir=self._project_info.overlay_work_dir,
+        logger.debug("Mount cache layer %d", self._cache_level)
+
+        self._mount(
+            lower_dirs=lowers, upper_dir=self._project_info.overlay_packages_dir
         )
 
-        logger.debug("Mount cache layer %d", self._cache_level)
+    def _mount(self, *, lower_dirs: list[Path], upper_dir: Path) -> None:
+        """Mount a layer stack, reusing the stack kept mounted if it's the same."""
+        layers = (*lower_dirs, upper_dir)
+        if self._keep_mounted:
+            if self._mounted and self._mounted[0] == layers:
+                logger.debug("Reuse mounted overlay layer stack")
+                instrumentation.count("overlay mounts reused")
+                self._overlay_fs = self._mounted[1]
+                return
+
+            self._unmount_stack()
+
+        overlay_fs = OverlayFS(
+            lower_dirs=lower_dirs,
+            upper_dir=upper_dir,
+            work_dir=self._project_info.overlay_work_dir,
+        )
+        overlay_fs.mount(self._project_info.overlay_mount_dir)
 
-        self._overlay_fs.mount(self._project_info.overlay_mount_dir)
+        self._overlay_fs = overlay_fs
+        if self._keep_mounted:
+            self._mounted = (layers, overlay_fs)
 
     def unmount(self) -> None:
-        """Unmount the overlay step layer stack."""
+        """Unmount the overlay step layer stack.
+
+        During an overlay session, the stack is kept mounted to be reused.
+        """
         if not self._overlay_fs:
             raise RuntimeError("filesystem is not mounted")
 
-        self._overlay_fs.unmount()
+        overlay_fs = self._overlay_fs
+        self._overlay_fs = None
+        if self._keep_mounted:
+            return
+
+        self._stop_chroot_worker()
+        self._mounted = None
+        overlay_fs.unmount()
+
+    def start_session(self) -> None:
+        """Keep layer stacks mounted until the session ends."""
+        self._keep_mounted = True
+
+    def end_session(self) -> None:
+        """Unmount the layer stack kept mounted and end the overlay session."""
+        self._keep_mounted = False
         self._overlay_fs = None
+        self._unmount_stack()
+
+    def release(self) -> None:
+        """Unmount the layer stack kept mounted, if it's not in use.
+
+        The stack must be released before layer directories are changed
+        without mounting them.
+        """
+        if not self._overlay_fs:
+            self._unmount_stack()
+
+    def _unmount_stack(self) -> None:
+        """Stop the chroot worker and unmount the mounted layer stack."""
+        self._stop_chroot_worker()
+
+        if self._mounted:
+            _, overlay_fs = self._mounted
+            self._mounted = None
+            overlay_fs.unmount()
+
+    def _stop_chroot_worker(self) -> None:
+        if self._chroot_worker:
+            self._chroot_worker.stop()
+            self._chroot_worker = None
 
     def mkdirs(self) -> None:
         """Create overlay directories and mountpoints."""
@@ -179,13 +268,7 @@ class OverlayManager:
             raise RuntimeError("overlay filesystem not mounted")
 
         logger.debug("Refreshing packages list in overlay")
-
-        mount_dir = self._project_info.overlay_mount_dir
-        # Ensure we always run refresh_packages_list by resetting the cache
-        packages.Repository.refresh_packages_list.cache_clear()  # type: ignore[attr-defined]
-        chroot.chroot(
-            mount_dir, _defer_evaluation(packages.Repository.refresh_packages_list)
-        )
+        self.run(_refresh_packages_list)
 
     def download_packages(self, package_names: list[str]) -> None:
         """Download packages and populate the overlay package cache.
@@ -213,9 +296,14 @@ class OverlayManager:
         if not self._overlay_fs:
             raise RuntimeError("overlay filesystem not mounted")
 
-        return chroot.chroot(
-            self._project_info.overlay_mount_dir, target, *args, **kwargs
-        )
+        mount_dir = self._project_info.overlay_mount_dir
+        if not self._keep_mounted:
+            return chroot.chroot(mount_dir, target, *args, **kwargs)
+
+        if not self._chroot_worker:
+            self._chroot_worker = chroot.ChrootWorker(mount_dir)
+
+        return self._chroot_worker.run(target, *args, **kwargs)
 
 
 class LayerMount:
@@ -18,8 +18,10 @@
 
 import abc
 import contextlib
+import json
 import logging
 import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -32,12 +34,22 @@ logger = logging.getLogger(__name__)
 
 _STAGE_PACKAGE_KEY = "origin_stage_package"
 
+STAGE_PACKAGES_INDEX_FILE = "stage_packages_index.json"
+
+# The inode number, size and modification time of a file.
+_FileSignature = tuple[int, int, int]
+
 
 class BaseRepository(abc.ABC):
     """Base implementation for a platform specific repository handler."""
 
     stage_packages_filters: set[str] | None = None
 
+    # Whether the origin of tracked stage package files should also be recorded
+    # in their extended attributes, in addition to the stage packages index.
+    # Applications not reading the attributes from primed files can disable it.
+    stage_packages_xattrs: bool = True
+
     @classmethod
     @abc.abstractmethod
     def configure(cls, application_package_name: str) -> None:
@@ -283,3 +295,141 @@ def mark_origin_stage_package(sources_dir: str, stage_package: str) -> None:
 
             # Mark source.
             write_origin_stage_package(file_path, stage_package)
+
+
+class StagePackagesIndex:
+    """The origin stage package of files unpacked to an install directory.
+
+    Files are recorded by their path relative to the install directory and by
+    their inode number, size and modification time. These are used to follow
+    files that are moved or linked to other locations in the install directory
+    after being unpacked (for example, when organizing files) and to drop files
+    that were replaced, even if a new file reuses the inode of a removed one.
+
+    :param install_dir: The directory the stage packages are unpacked to.
+    """
+
+    def __init__(self, install_dir: Path) -> None:
+        self._install_dir = install_dir
+        # Maps file paths relative to the install dir to their signature and
+        # origin stage package.
+        self._entries: dict[str, tuple[_FileSignature, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def mark(self, sources_dir: Path, stage_package: str) -> None:
+        """Record all files in sources_dir as coming from stage_package.
+
+        The files are expected to have been linked or copied to the same relative
+        paths in the install directory.
+
+        :param sources_dir: The directory containing the unpacked package files.
+        :param stage_package: The name and version of the origin stage package.
+        """
+        for path in _walk_files(sources_dir):
+            relpath = os.path.relpath(path, sources_dir)
+            try:
+                signature = _get_signature(self._install_dir / relpath)
+            except FileNotFoundError:
+                continue
+            self._entries[relpath] = (signature, stage_package)
+
+    def update(self) -> None:
+        """Update the recorded paths with the current install directory contents.
+
+        Files that were moved or linked are recorded in their new locations, and
+        files that are no longer the ones unpacked from a stage package are removed.
+        """
+        packages = dict(self._entries.values())
+        entries: dict[str, tuple[_FileSignature, str]] = {}
+        for path in _walk_files(self._install_dir):
+            signature = _get_signature(path)
+            stage_package = packages.get(signature)
+            if stage_package is not None:
+                relpath = os.path.relpath(path, self._install_dir)
+                entries[relpath] = (signature, stage_package)
+        self._entries = entries
+
+    def refresh(self) -> None:
+        """Record the current signature of each indexed path.
+
+        This is used when indexed files were modified in place by craft-parts,
+        or the install directory was recreated with the same contents (for
+        example, when restoring it from a cache).
+        """
+        entries: dict[str, tuple[_FileSignature, str]] = {}
+        for relpath, (_, stage_package) in self._entries.items():
+            try:
+                signature = _get_signature(self._install_dir / relpath)
+            except FileNotFoundError:
+                continue
+            entries[relpath] = (signature, stage_package)
+        self._entries = entries
+
+    def get_stage_packages(self, files: Iterable[str]) -> set[str]:
+        """Get the origin stage packages of the given files.
+
+        :param files: File paths relative to the install directory.
+
+        :return: The set of stage packages the files came from.
+        """
+        return {self._entries[f][1] for f in self._entries.keys() & set(files)}
+
+    def write(self, index_file: Path) -> None:
+        """Save the index to a file.
+
+        :param index_file: The file to write the index to.
+        """
+        packages: dict[str, int] = {}
+        files = [
+            [path, *signature, packages.setdefault(pkg, len(packages))]
+            for path, (signature, pkg) in sorted(self._entries.items())
+        ]
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        index_file.write_text(
+            json.dumps({"packages": list(packages), "files": files}),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def read(
+        cls, index_file: Path, *, install_dir: Path
+    ) -> "StagePackagesIndex | None":
+        """Load an index from a file.
+
+        :param index_file: The file containing the index.
+        :param install_dir: The directory the stage packages were unpacked to.
+
+        :return: The loaded index, or None if the index file doesn't exist.
+        """
+        try:
+            data = json.loads(index_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+        index = cls(install_dir)
+        packages = data["packages"]
+        index._entries = {
+            path: ((inode, size, mtime), packages[pkg])
+            for path, inode, size, mtime, pkg in data["files"]
+        }
+        return index
+
+
+def _get_signature(path: str | Path) -> _FileSignature:
+    """Obtain the inode number, size and modification time of a file."""
+    file_stat = os.lstat(path)
+    return file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns
+
+
+def _walk_files(top: Path) -> Iterator[str]:
+    """Yield the paths of all regular files under top, not following symlinks."""
+    pending = [str(top)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path
@@ -33,7 +33,13 @@ from typing import Any, TypeVar
 from craft_parts.utils import deb_utils, file_utils, os_utils
 
 from . import errors
-from .base import BaseRepository, get_pkg_name_parts, mark_origin_stage_package
+from .base import (
+    STAGE_PACKAGES_INDEX_FILE,
+    BaseRepository,
+    StagePackagesIndex,
+    get_pkg_name_parts,
+    mark_origin_stage_package,
+)
 from .deb_package import DebPackage
 from .normalize import normalize
 
@@ -725,6 +731,7 @@ class Ubuntu(BaseRepository):
         track_stage_packages: bool,
     ) -> None:
         pkg_path = None
+        index = StagePackagesIndex(install_path)
 
         for pkg_path in stage_packages_path.glob("*.deb"):
             with tempfile.TemporaryDirectory(
@@ -733,17 +740,27 @@ class Ubuntu(BaseRepository):
                 # Extract deb package.
                 deb_utils.extract_deb(pkg_path, Path(extract_dir), logger.debug)
 
-                # Mark source of files.
+                marked_name = None
                 if track_stage_packages:
                     marked_name = cls._extract_deb_name_version(pkg_path)
-                    mark_origin_stage_package(extract_dir, marked_name)
+                    if cls.stage_packages_xattrs:
+                        mark_origin_stage_package(extract_dir, marked_name)
 
                 # Stage files to install_dir.
                 file_utils.link_or_copy_tree(extract_dir, install_path.as_posix())
 
+                # Record source of files.
+                if marked_name:
+                    index.mark(Path(extract_dir), marked_name)
+
         if pkg_path:
             normalize(install_path, repository=cls)
 
+        if track_stage_packages:
+            # Normalizing may have modified unpacked files.
+            index.refresh()
+            index.write(stage_packages_path / STAGE_PACKAGES_INDEX_FILE)
+
     @classmethod
     def _unpack_stage_slices(
         cls, *, stage_packages: list[str], install_path: pathlib.Path
@@ -16,10 +16,12 @@
 
 """Specify and apply permissions and ownership to part-owned files."""
 
+import fnmatch
 import os
-from fnmatch import fnmatch
+import re
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -115,7 +117,7 @@ class Permissions(BaseModel):
         if self.path == "*":
             return True
 
-        return fnmatch(str(path), self.path)
+        return fnmatch.fnmatch(str(path), self.path)
 
     def apply_permissions(self, target: Path | str) -> None:
         """Apply the permissions configuration to ``target``.
@@ -172,49 +174,166 @@ def permissions_are_compatible(
         # If either (or both) of the lists are empty, consider them "compatible".
         return True
 
-    # Otherwise, "squash" both lists into individual Permissions objects to
-    # compare them.
-    squashed_left = _squash_permissions(left)
-    squashed_right = _squash_permissions(right)
+    # Otherwise, "squash" both lists into the effective owner, group and mode
+    # to compare them.
+    return _squash_permissions(left) == _squash_permissions(right)
 
-    if squashed_left.owner != squashed_right.owner:
-        return False
 
-    if squashed_left.group != squashed_right.group:
-        return False
+class EffectivePermissions(NamedTuple):
+    """The combined result of applying a list of permissions definitions.
 
-    if squashed_left.mode is None and squashed_right.mode is None:
-        return True
-
-    if squashed_left.mode is None or squashed_right.mode is None:
-        return False
+    Attributes that are not set by any of the definitions are None.
+    """
 
-    return squashed_left.mode_octal == squashed_right.mode_octal
+    owner: int | None
+    group: int | None
+    mode: int | None
 
 
-def _squash_permissions(permissions: list[Permissions]) -> Permissions:
-    """Compress a sequence of Permissions into a single one.
+def _squash_permissions(permissions: Sequence[Permissions]) -> EffectivePermissions:
+    """Compress a sequence of Permissions into a single set of attributes.
 
-    This function produces a single ``Permissions`` object whose application to a path
-    is equivalent to calling ``apply_permissions()`` with the full list ``permissions``.
-    Note that the ``path`` attribute of the Permissions objects are ignored, as they
-    are assumed to all match (so they must have been pre-filtered with
-    ``filter_permissions``).
+    This function produces the ownership and mode that result from calling
+    ``apply_permissions()`` with the full list ``permissions``. Note that the
+    ``path`` attribute of the Permissions objects are ignored, as they are assumed
+    to all match (so they must have been pre-filtered with ``filter_permissions``).
 
     :param permissions: A series of Permissions objects to be "squashed" into a single
-        one.
+        set of attributes.
     """
-    squashed_permissions = Permissions(
-        path=permissions[-1].path,
-        owner=permissions[0].owner,
-        group=permissions[0].group,
-        mode=permissions[0].mode,
-    )
+    owner: int | None = None
+    group: int | None = None
+    mode: int | None = None
+
+    for permission in permissions:
+        if permission.owner is not None:
+            owner = permission.owner
+        if permission.group is not None:
+            group = permission.group
+        if permission.mode is not None:
+            mode = permission.mode_octal
+
+    return EffectivePermissions(owner=owner, group=group, mode=mode)
+
+
+class PermissionsTable:
+    """A precompiled table of permissions definitions.
 
-    for permission in permissions[1:]:
-        for key in ["path", "owner", "group", "mode"]:
-            permission_value = getattr(permission, key)
-            if permission_value is not None:
-                setattr(squashed_permissions, key, permission_value)
+    The path patterns of the definitions are compiled once, so that the definitions
+    applying to each of the files in a large tree can be obtained without matching
+    every pattern individually. Results are cached for each combination of matching
+    definitions.
 
-    return squashed_permissions
+    :param permissions: The permissions definitions, in the order they are applied.
+    """
+
+    def __init__(self, permissions: Sequence[Permissions] | None = None) -> None:
+        self._permissions = list(permissions or [])
+        self._everything: list[int] = []
+        self._literals: dict[str, list[int]] = {}
+        self._patterns: list[tuple[int, re.Pattern[str]]] = []
+
+        for index, permission in enumerate(self._permissions):
+            pattern = os.path.normcase(permission.path)
+            if pattern == "*":
+                self._everything.append(index)
+            elif _is_literal(pattern):
+                self._literals.setdefault(pattern, []).append(index)
+            else:
+                self._patterns.append((index, re.compile(fnmatch.translate(pattern))))
+
+        # A single expression matching any of the patterns, used to quickly
+        # discard paths that none of them apply to.
+        self._any_pattern: re.Pattern[str] | None = None
+        if self._patterns:
+            self._any_pattern = re.compile(
+                "|".join(f"(?:{regex.pattern})" for _, regex in self._patterns)
+            )
+
+        self._subsets: dict[tuple[int, ...], list[Permissions]] = {}
+        self._squashed: dict[tuple[int, ...], EffectivePermissions] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._permissions)
+
+    def filter(self, target: Path | str) -> list[Permissions]:
+        """Get the permissions definitions that apply to ``target``.
+
+        This is equivalent to calling ``filter_permissions()`` with the list of
+        definitions in this table. The returned list must not be modified.
+        """
+        key = self._match(target)
+        subset = self._subsets.get(key)
+        if subset is None:
+            subset = [self._permissions[i] for i in key]
+            self._subsets[key] = subset
+        return subset
+
+    def squash(self, target: Path | str) -> EffectivePermissions:
+        """Get the ownership and mode resulting from the definitions matching ``target``."""
+        key = self._match(target)
+        squashed = self._squashed.get(key)
+        if squashed is None:
+            squashed = _squash_permissions([self._permissions[i] for i in key])
+            self._squashed[key] = squashed
+        return squashed
+
+    def _match(self, target: Path | str) -> tuple[int, ...]:
+        if not self._permissions:
+            return ()
+
+        path = os.path.normcase(str(target))
+        matches = [*self._everything, *self._literals.get(path, [])]
+
+        if self._any_pattern is not None and self._any_pattern.match(path):
+            matches.extend(i for i, regex in self._patterns if regex.match(path))
+
+        return tuple(sorted(matches))
+
+
+def _is_literal(pattern: str) -> bool:
+    """Whether a path pattern only matches a path identical to itself."""
+    return not any(c in pattern for c in "*?[")
+
+
+def apply_effective_permissions(
+    root: Path | str, targets: Mapping[str, EffectivePermissions]
+) -> None:
+    """Apply ownership and mode to multiple paths under ``root``.
+
+    Paths are grouped by their parent directory, and modes are set relative to a
+    single open descriptor of that directory. Directories are processed deepest
+    first, so that a restrictive mode set on a directory doesn't prevent changes
+    to its contents. Ownership is changed before the mode, so that the set-user-ID
+    and set-group-ID bits are not cleared by the ownership change.
+
+    :param root: The directory containing the paths to change.
+    :param targets: A mapping of paths, relative to ``root``, to the ownership and
+        mode to apply to them.
+    """
+    entries_by_dir: dict[str, list[tuple[str, EffectivePermissions]]] = {}
+    for target, effective in targets.items():
+        if effective == (None, None, None):
+            continue
+        dirname, basename = os.path.split(target)
+        entries_by_dir.setdefault(dirname, []).append((basename, effective))
+
+    for dirname in sorted(entries_by_dir, key=_dir_depth, reverse=True):
+        dirpath = os.path.join(root, dirname)  # noqa: PTH118
+        dir_fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for basename, effective in entries_by_dir[dirname]:
+                if effective.owner is not None and effective.group is not None:
+                    os.chown(
+                        os.path.join(dirpath, basename),  # noqa: PTH118
+                        effective.owner,
+                        effective.group,
+                    )
+                if effective.mode is not None:
+                    os.chmod(basename, effective.mode, dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _dir_depth(dirname: str) -> int:
+    return dirname.count(os.sep) if dirname else -1
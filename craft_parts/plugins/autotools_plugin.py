@@ -21,6 +21,7 @@ from typing import Literal, cast
 from typing_extensions import override
 
 from .base import Plugin
+from .compiler_cache import CompilerCache
 from .properties import PluginProperties
 
 
@@ -75,12 +76,24 @@ class AutotoolsPlugin(Plugin):
     @override
     def get_build_packages(self) -> set[str]:
         """Return a set of required packages to install in the build environment."""
-        return {"autoconf", "automake", "autopoint", "gcc", "libtool"}
+        compiler_cache = CompilerCache(self._part_info)
+        return {
+            "autoconf",
+            "automake",
+            "autopoint",
+            "gcc",
+            "libtool",
+            *compiler_cache.get_build_packages(),
+        }
 
     @override
     def get_build_environment(self) -> dict[str, str]:
         """Return a dictionary with the environment to use in the build step."""
-        return {}
+        compiler_cache = CompilerCache(self._part_info)
+        return {
+            **compiler_cache.get_build_environment(),
+            **compiler_cache.get_compiler_environment(),
+        }
 
     def _get_configure_command(self) -> str:
         options = cast(AutotoolsPluginProperties, self._options)
@@ -103,15 +116,17 @@ class AutotoolsPlugin(Plugin):
     def get_build_commands(self) -> list[str]:
         """Return a list of commands to run during the build step."""
         options = cast(AutotoolsPluginProperties, self._options)
-        return [
-            "[ ! -f ./configure ] && [ -f ./autogen.sh ] && env NOCONFIGURE=1 ./autogen.sh",
-            f"[ ! -f ./configure ] && [ -f ./bootstrap ] && {self._get_bootstrap_command()}",
-            "[ ! -f ./configure ] && autoreconf --install",
-            self._get_configure_command(),
-            (
-                "make"
-                if options.disable_parallel
-                else f"make -j{self._part_info.parallel_build_count}"
-            ),
-            f'make install DESTDIR="{self._part_info.part_install_dir}"',
-        ]
+        return CompilerCache(self._part_info).wrap_build_commands(
+            [
+                "[ ! -f ./configure ] && [ -f ./autogen.sh ] && env NOCONFIGURE=1 ./autogen.sh",
+                f"[ ! -f ./configure ] && [ -f ./bootstrap ] && {self._get_bootstrap_command()}",
+                "[ ! -f ./configure ] && autoreconf --install",
+                self._get_configure_command(),
+                (
+                    "make"
+                    if options.disable_parallel
+                    else f"make -j{self._part_info.parallel_build_count}"
+                ),
+                f'make install DESTDIR="{self._part_info.part_install_dir}"',
+            ]
+        )
@@ -19,6 +19,8 @@
 from __future__ import annotations
 
 import abc
+import hashlib
+import shlex
 import textwrap
 from copy import deepcopy
 from typing import TYPE_CHECKING
@@ -85,6 +87,15 @@ class Plugin(abc.ABC):
     def get_build_commands(self) -> list[str]:
         """Return a list of commands to run during the build step."""
 
+    def get_epilogue_commands(self) -> list[str]:
+        """Return the commands to run when the lifecycle execution finishes.
+
+        The commands run in the build environment, only if the part was built
+        during the execution. Plugins use them to stop services started by the
+        build, such as build tool daemons. Failures are logged and ignored.
+        """
+        return []
+
     def set_action_properties(self, action_properties: ActionProperties) -> None:
         """Store a copy of the given action properties.
 
@@ -135,8 +146,28 @@ class BasePythonPlugin(Plugin):
             "PATH": f"{self._part_info.part_install_dir}/bin:${{PATH}}",
             "PARTS_PYTHON_INTERPRETER": "python3",
             "PARTS_PYTHON_VENV_ARGS": "",
+            **self._get_package_cache_environment(),
         }
 
+    def _get_python_cache_dir(self) -> pathlib.Path:
+        """Get the directory containing Python caches shared by all parts."""
+        return self._part_info.cache_dir / "python"
+
+    def _get_package_cache_environment(self) -> dict[str, str]:
+        """Get the environment pointing the package installer to its cache.
+
+        Downloaded and locally built wheels are kept in the project cache directory
+        and shared by all parts and builds.
+        """
+        return {"PIP_CACHE_DIR": str(self._get_python_cache_dir() / "pip")}
+
+    def _get_install_stamp(self) -> pathlib.Path:
+        """Get the file marking the start of the package installation.
+
+        Files changed after this file was touched were installed by the plugin.
+        """
+        return self._part_info.part_cache_dir / "python-install.stamp"
+
     def _get_venv_directory(self) -> pathlib.Path:
         """Get the directory into which the virtualenv should be placed.
 
@@ -210,8 +241,13 @@ class BasePythonPlugin(Plugin):
         shebangs in the final environment should be handled.
         """
         script_interpreter = self._get_script_interpreter()
+        # Only consider the virtual environment scripts and the files installed by
+        # the package installer. Inode change times are used because installers
+        # may link files from their cache.
         find_cmd = (
-            f'find "{self._part_info.part_install_dir}" -type f -executable -print0'
+            f'find "{self._part_info.part_install_dir}" -type f -executable '
+            f'\\( -cnewer "{self._get_install_stamp()}" '
+            f'-o -path "{self._get_venv_directory()}/bin/*" \\) -print0'
         )
         xargs_cmd = "xargs --no-run-if-empty -0"
         sed_cmd = f'sed -i "1 s|^#\\!${{PARTS_PYTHON_VENV_INTERP_PATH}}.*$|{script_interpreter}|"'
@@ -265,6 +301,84 @@ class BasePythonPlugin(Plugin):
         """Get the pip command to use."""
         return f"{self._get_venv_directory()}/bin/pip"
 
+    def _get_dependency_install_commands(self) -> list[str]:
+        """Get the commands for installing the locked dependencies of the package.
+
+        Plugins override this method together with :meth:`_get_dependency_files`
+        to allow reusing virtual environments with the same dependencies. The
+        package install commands must still install the package dependencies, since
+        these commands are only used to create a virtual environment template.
+        """
+        return []
+
+    def _get_dependency_files(self) -> list[str]:
+        """Get the files, relative to the build directory, pinning the dependencies.
+
+        Virtual environment templates are not used if any of these files is missing.
+        """
+        return []
+
+    def _get_venv_template_commands(self) -> list[str]:
+        """Get the commands reusing a virtual environment with the same dependencies.
+
+        If the project enables virtual environment reuse, the files installed by the
+        dependency install commands are stored as a template in the cache directory,
+        keyed by the contents of the dependency files, the interpreter version and
+        the virtual environment location. When a template exists, its files are
+        copied into the virtual environment instead of being installed again. Files
+        are copied, not linked, both ways so that changes made in the virtual
+        environment never reach the shared template.
+        """
+        dependency_commands = self._get_dependency_install_commands()
+        dependency_files = self._get_dependency_files()
+        if not (
+            self._part_info.reuse_python_venvs
+            and dependency_commands
+            and dependency_files
+        ):
+            return []
+
+        venv_dir = self._get_venv_directory()
+        templates_dir = self._get_python_cache_dir() / "venvs"
+        commands_digest = hashlib.sha256(
+            "\n".join([str(venv_dir), *dependency_commands]).encode()
+        ).hexdigest()
+        files = " ".join(shlex.quote(f) for f in dependency_files)
+        files_exist = " && ".join(f"[ -f {shlex.quote(f)} ]" for f in dependency_files)
+        install_commands = textwrap.indent("\n".join(dependency_commands), "    ")
+        template = "${venv_template}"
+        template_tmp = "${venv_template_tmp}"
+
+        return [
+            textwrap.dedent(
+                f"""\
+                # reuse a virtual environment with the same locked dependencies
+                venv_template=""
+                if {files_exist}; then
+                    venv_template="{templates_dir}/$({{ echo {commands_digest}; "${{PARTS_PYTHON_VENV_INTERP_PATH}}" --version; echo "${{PARTS_PYTHON_VENV_ARGS}}"; cat {files}; }} | sha256sum | cut -d " " -f 1)"
+                fi
+                if [ -n "{template}" ] && [ -d "{template}" ]; then
+                    echo "Reusing virtual environment template ${{venv_template##*/}}"
+                    cp -a --reflink=auto --remove-destination "{template}"/. "{venv_dir}"
+                else
+                """
+            )
+            + install_commands
+            + "\n"
+            + textwrap.dedent(
+                f"""\
+                    if [ -n "{template}" ]; then
+                        mkdir -p "{templates_dir}"
+                        venv_template_tmp="$(mktemp -d "{templates_dir}/.tmp.XXXXXX")"
+                        (cd "{venv_dir}" && find . -cnewer "{self._get_install_stamp()}" ! -type d -print0 | \\
+                            xargs --no-run-if-empty -0 cp -a --reflink=auto --parents -t "{template_tmp}") && \\
+                            mv -T "{template_tmp}" "{template}" 2>/dev/null || rm -rf "{template_tmp}"
+                    fi
+                fi
+                """
+            )
+        ]
+
     @abc.abstractmethod
     def _get_package_install_commands(self) -> list[str]:
         """Get the commands for installing the given package in the Python virtualenv.
@@ -278,6 +392,9 @@ class BasePythonPlugin(Plugin):
         """Return a list of commands to run during the build step."""
         return [
             *self._get_create_venv_commands(),
+            f'mkdir -p "{self._part_info.part_cache_dir}"',
+            f'touch "{self._get_install_stamp()}"',
+            *self._get_venv_template_commands(),
             *self._get_package_install_commands(),
             *self._get_rewrite_shebangs_commands(),
             *self._get_find_python_interpreter_commands(),
@@ -21,6 +21,7 @@ from typing import Literal, cast
 from typing_extensions import override
 
 from .base import Plugin
+from .compiler_cache import CompilerCache
 from .properties import PluginProperties
 
 
@@ -77,7 +78,11 @@ class CMakePlugin(Plugin):
     @override
     def get_build_packages(self) -> set[str]:
         """Return a set of required packages to install in the build environment."""
-        build_packages = {"gcc", "cmake"}
+        build_packages = {
+            "gcc",
+            "cmake",
+            *CompilerCache(self._part_info).get_build_packages(),
+        }
 
         options = cast(CMakePluginProperties, self._options)
 
@@ -91,30 +96,39 @@ class CMakePlugin(Plugin):
         """Return a dictionary with the environment to use in the build step."""
         return {
             # Also look for staged headers and libraries.
-            "CMAKE_PREFIX_PATH": str(self._part_info.stage_dir)
+            "CMAKE_PREFIX_PATH": str(self._part_info.stage_dir),
+            **CompilerCache(self._part_info).get_build_environment(),
         }
 
     @override
     def get_build_commands(self) -> list[str]:
         """Return a list of commands to run during the build step."""
         options = cast(CMakePluginProperties, self._options)
+        compiler_cache = CompilerCache(self._part_info)
 
         cmake_command = [
             "cmake",
             f'"{self._part_info.part_src_subdir}"',
             "-G",
             f'"{options.cmake_generator}"',
-            *options.cmake_parameters,
-        ]
-
-        return [
-            " ".join(cmake_command),
-            f"cmake --build . -- -j{self._part_info.parallel_build_count}",
-            (
-                f'DESTDIR="{self._part_info.part_install_dir}"'
-                " cmake --build . --target install"
-            ),
         ]
+        if compiler_cache:
+            cmake_command.extend(
+                f"-DCMAKE_{lang}_COMPILER_LAUNCHER={compiler_cache.launcher}"
+                for lang in ("C", "CXX")
+            )
+        cmake_command.extend(options.cmake_parameters)
+
+        return compiler_cache.wrap_build_commands(
+            [
+                " ".join(cmake_command),
+                f"cmake --build . -- -j{self._part_info.parallel_build_count}",
+                (
+                    f'DESTDIR="{self._part_info.part_install_dir}"'
+                    " cmake --build . --target install"
+                ),
+            ]
+        )
 
     @classmethod
     @override
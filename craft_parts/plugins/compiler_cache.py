@@ -0,0 +1,121 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compiler cache support for plugins building C and C++ code."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from craft_parts import infos
+
+
+class CompilerCache:
+    """Compiler cache configuration for a part.
+
+    If the project enables a compiler cache, compiler invocations made by the
+    part build are prefixed with the cache launcher. Cached objects are shared
+    by all parts and builds in a directory under the project cache directory.
+
+    :param part_info: The part information for the applicable part.
+    """
+
+    def __init__(self, part_info: infos.PartInfo) -> None:
+        self._part_info = part_info
+        self.launcher: str | None = part_info.compiler_cache
+
+    def __bool__(self) -> bool:
+        return self.launcher is not None
+
+    @property
+    def cache_dir(self) -> Path:
+        """Return the directory containing the cached compilation results."""
+        return Path(self._part_info.cache_dir, "compiler", str(self.launcher))
+
+    @property
+    def c_compiler(self) -> str:
+        """Return the launcher-prefixed C compiler, honoring ``CC`` if set."""
+        return f"{self.launcher} ${{CC:-{self._default_compiler('gcc')}}}"
+
+    @property
+    def cxx_compiler(self) -> str:
+        """Return the launcher-prefixed C++ compiler, honoring ``CXX`` if set."""
+        return f"{self.launcher} ${{CXX:-{self._default_compiler('g++')}}}"
+
+    def _default_compiler(self, name: str) -> str:
+        if self._part_info.is_cross_compiling:
+            return f"{self._part_info.arch_triplet}-{name}"
+        return name
+
+    def get_build_packages(self) -> set[str]:
+        """Return the packages providing the compiler cache."""
+        if not self:
+            return set()
+        return {str(self.launcher)}
+
+    def get_build_environment(self) -> dict[str, str]:
+        """Return the environment configuring the compiler cache location and size.
+
+        Launchers are not set in the environment, plugins must inject them in
+        the way supported by their build system.
+        """
+        max_size = self._part_info.compiler_cache_max_size
+        if self.launcher == "ccache":
+            env = {
+                "CCACHE_DIR": str(self.cache_dir),
+                # Hash paths relative to the work directory so that objects can
+                # be shared between parts.
+                "CCACHE_BASEDIR": str(self._part_info.dirs.work_dir),
+            }
+            if max_size:
+                env["CCACHE_MAXSIZE"] = max_size
+            return env
+
+        if self.launcher == "sccache":
+            env = {"SCCACHE_DIR": str(self.cache_dir)}
+            if max_size:
+                env["SCCACHE_CACHE_SIZE"] = max_size
+            return env
+
+        return {}
+
+    def get_compiler_environment(self) -> dict[str, str]:
+        """Return ``CC`` and ``CXX`` set to the launcher-prefixed compilers."""
+        if not self:
+            return {}
+        return {"CC": self.c_compiler, "CXX": self.cxx_compiler}
+
+    def wrap_build_commands(self, commands: list[str]) -> list[str]:
+        """Add the compiler cache statistics commands to the build commands.
+
+        Statistics are reset before the build, and the cache hit rate for the
+        part is reported after it completes.
+
+        :param commands: The plugin build commands.
+
+        :return: The build commands including the statistics commands.
+        """
+        if not self:
+            return commands
+
+        return [
+            f'mkdir -p "{self.cache_dir}"',
+            f"{self.launcher} --zero-stats > /dev/null",
+            *commands,
+            f"{self.launcher} --show-stats",
+        ]
@@ -17,6 +17,7 @@
 """The Dotnet plugin."""
 
 import logging
+from pathlib import Path
 from typing import Literal, cast
 
 from typing_extensions import override
@@ -28,6 +29,22 @@ from .properties import PluginProperties
 logger = logging.getLogger(__name__)
 
 
+def get_nuget_environment(cache_dir: Path) -> dict[str, str]:
+    """Return the environment setting the NuGet cache locations.
+
+    Packages and HTTP responses downloaded by NuGet are stored in the project
+    cache directory, so that they can be shared between parts and builds.
+
+    :param cache_dir: The project cache directory.
+
+    :return: The environment variables configuring the NuGet caches.
+    """
+    return {
+        "NUGET_PACKAGES": str(cache_dir / "dotnet" / "packages"),
+        "NUGET_HTTP_CACHE_PATH": str(cache_dir / "dotnet" / "http-cache"),
+    }
+
+
 class DotnetPluginProperties(PluginProperties, frozen=True):
     """The part properties used by the Dotnet plugin."""
 
@@ -98,7 +115,7 @@ class DotnetPlugin(Plugin):
     @override
     def get_build_environment(self) -> dict[str, str]:
         """Return a dictionary with the environment to use in the build step."""
-        return {}
+        return get_nuget_environment(self._part_info.cache_dir)
 
     @override
     def get_build_commands(self) -> list[str]:
@@ -16,8 +16,10 @@
 
 """The new .NET plugin."""
 
+import hashlib
 import logging
 import re
+import textwrap
 from enum import Enum
 from typing import Literal, cast
 
@@ -28,6 +30,7 @@ from craft_parts.utils.formatting_utils import humanize_list
 
 from . import validator
 from .base import Plugin
+from .dotnet_plugin import get_nuget_environment
 from .properties import PluginProperties
 
 logger = logging.getLogger(__name__)
@@ -245,6 +248,7 @@ class DotnetV2Plugin(Plugin):
 
         environment = {
             "DOTNET_NOLOGO": "1",
+            **get_nuget_environment(self._part_info.cache_dir),
         }
 
         # .NET binary provided by the user
@@ -280,7 +284,9 @@ class DotnetV2Plugin(Plugin):
         dotnet_rid, _ = self._get_dotnet_platform_info(build_for)
 
         # Restore step
-        restore_cmd = self._get_restore_command(dotnet_rid, options)
+        restore_cmd = self._get_cached_restore_command(
+            self._get_restore_command(dotnet_rid, options)
+        )
 
         # Build step
         build_cmd = self._get_build_command(dotnet_rid, options)
@@ -305,6 +311,56 @@ class DotnetV2Plugin(Plugin):
 
         return f"dotnet-sdk-{snap_version}"
 
+    def _get_cached_restore_command(self, restore_cmd: str) -> str:
+        """Wrap the restore command to reuse the outputs of a previous restore.
+
+        If the project locks its dependencies with ``packages.lock.json`` files,
+        the restore outputs in the ``obj`` directories are stored in the cache
+        directory, keyed by the restore command and the contents of the lock and
+        project files. The restore is skipped if a matching entry exists and all
+        packages it references are present in the NuGet package cache.
+
+        :param restore_cmd: The command restoring the project dependencies.
+
+        :return: The restore command with cache handling.
+        """
+        nuget_packages = get_nuget_environment(self._part_info.cache_dir)[
+            "NUGET_PACKAGES"
+        ]
+        restore_dir = self._part_info.cache_dir / "dotnet" / "restore"
+        command_digest = hashlib.sha256(
+            "\n".join([str(self._part_info.part_build_subdir), restore_cmd]).encode()
+        ).hexdigest()
+        entry = "${dotnet_restore_entry}"
+        entry_tmp = "${dotnet_restore_tmp}"
+
+        return textwrap.dedent(
+            f"""\
+            # reuse the outputs of a restore with the same locked dependencies
+            dotnet_restore_entry=""
+            if [ -n "$(find . -name packages.lock.json -not -path "*/obj/*" -print -quit)" ]; then
+                dotnet_restore_entry="{restore_dir}/$({{ echo {command_digest}; find . -type f \\( -name packages.lock.json -o -name "*.*proj" -o -name "*.sln" -o -name "Directory.*.props" -o -name "Directory.*.targets" -o -iname nuget.config \\) -not -path "*/obj/*" -not -path "*/bin/*" -print0 | sort -z | xargs --no-run-if-empty -0 sha256sum; }} | sha256sum | cut -d " " -f 1)"
+            fi
+            if [ -n "{entry}" ] && [ -f "{entry}/packages.txt" ] && \\
+                (while read -r package; do [ -f "{nuget_packages}/${{package}}/.nupkg.metadata" ] || exit 1; done < "{entry}/packages.txt"); then
+                echo "Reusing restore outputs ${{dotnet_restore_entry##*/}}"
+                cp -a "{entry}"/files/. .
+            else
+                {restore_cmd}
+                if [ -n "{entry}" ]; then
+                    mkdir -p "{restore_dir}"
+                    dotnet_restore_tmp="$(mktemp -d "{restore_dir}/.tmp.XXXXXX")"
+                    mkdir "{entry_tmp}/files"
+                    find . -path "*/obj/*" \\( -name project.assets.json -o -name project.nuget.cache -o -name "*.nuget.*" \\) -print0 | \\
+                        xargs --no-run-if-empty -0 cp -a --parents -t "{entry_tmp}/files" --
+                    find "{entry_tmp}/files" -name project.assets.json -exec sed -n 's/^ *"path": "\\([^"]*\\)",\\?$/\\1/p' {{}} + | \\
+                        sed '/proj$/d' | sort -u > "{entry_tmp}/packages.txt"
+                    mv -T "{entry_tmp}" "{entry}" 2>/dev/null || rm -rf "{entry_tmp}"
+                fi
+            fi
+            """
+        )
+
     def _get_restore_command(
         self, dotnet_rid: str, options: DotnetV2PluginProperties
     ) -> str:
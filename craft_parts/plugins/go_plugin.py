@@ -17,6 +17,7 @@
 """The Go plugin."""
 
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal, cast
 
 from typing_extensions import override
@@ -30,9 +31,35 @@ from .properties import PluginProperties
 if TYPE_CHECKING:
     import pathlib
 
+    from craft_parts import infos
+
 logger = logging.getLogger(__name__)
 
 
+def get_go_cache_dir(part_info: "infos.PartInfo") -> Path:
+    """Return the directory containing the Go caches shared by all parts.
+
+    :param part_info: The part information for the applicable part.
+    """
+    return Path(part_info.cache_dir, "go")
+
+
+def get_go_cache_environment(part_info: "infos.PartInfo") -> dict[str, str]:
+    """Return the environment placing the Go module and build caches in the cache dir.
+
+    The module cache is made writable so that it can be removed without changing
+    file permissions first.
+
+    :param part_info: The part information for the applicable part.
+    """
+    cache_dir = get_go_cache_dir(part_info)
+    return {
+        "GOMODCACHE": str(cache_dir / "mod"),
+        "GOCACHE": str(cache_dir / "build"),
+        "GOFLAGS": "-modcacherw ${GOFLAGS:-}",
+    }
+
+
 class GoPluginProperties(PluginProperties, frozen=True):
     """The part properties used by the Go plugin."""
 
@@ -40,6 +67,7 @@ class GoPluginProperties(PluginProperties, frozen=True):
 
     go_buildtags: list[str] = []
     go_generate: list[str] = []
+    go_offline: bool = False
 
     # part properties required by the plugin
     source: str  # pyright: ignore[reportGeneralTypeIssues]
@@ -96,6 +124,10 @@ class GoPlugin(Plugin):
       (list of strings)
       Parameters to pass to `go generate` before building. Each item on the list
       will be a separate `go generate` call. Default is not to call `go generate`.
+    - ``go-offline``
+      (boolean)
+      Only retrieve modules from the shared module cache, which is used as a
+      ``GOPROXY`` file mirror. Default is to retrieve modules from the network.
     """
 
     properties_class = GoPluginProperties
@@ -114,10 +146,20 @@ class GoPlugin(Plugin):
     @override
     def get_build_environment(self) -> dict[str, str]:
         """Return a dictionary with the environment to use in the build step."""
-        return {
+        options = cast(GoPluginProperties, self._options)
+        environment = {
             "GOBIN": f"{self._part_info.part_install_dir}/bin",
+            **get_go_cache_environment(self._part_info),
         }
 
+        if options.go_offline:
+            # The module cache download directory has the layout of a module proxy.
+            mirror_dir = get_go_cache_dir(self._part_info) / "mod/cache/download"
+            environment["GOPROXY"] = f"file://{mirror_dir}"
+            environment["GOSUMDB"] = "off"
+
+        return environment
+
     @override
     def get_build_commands(self) -> list[str]:
         """Return a list of commands to run during the build step."""
@@ -136,7 +178,13 @@ class GoPlugin(Plugin):
                 ),
             ]
         else:
-            setup_cmds = ["go mod download all"]
+            # Serialize downloads to the shared module cache, so that concurrent
+            # builds don't retrieve the same modules.
+            lock_file = get_go_cache_dir(self._part_info) / ".lock"
+            setup_cmds = [
+                f'mkdir -p "{lock_file.parent}"',
+                f'flock "{lock_file}" go mod download all',
+            ]
 
         tags = f"-tags={','.join(options.go_buildtags)}" if options.go_buildtags else ""
 
@@ -146,4 +194,5 @@ class GoPlugin(Plugin):
             *setup_cmds,
             *generate_cmds,
             f'go install -p "{self._part_info.parallel_build_count}" {tags} ./...',
+            'du -sh "$GOMODCACHE" "$GOCACHE" || true',
         ]
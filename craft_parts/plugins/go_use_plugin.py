@@ -22,7 +22,7 @@ from typing import Literal
 from typing_extensions import override
 
 from .base import Plugin
-from .go_plugin import GoPluginEnvironmentValidator
+from .go_plugin import GoPluginEnvironmentValidator, get_go_cache_environment
 from .properties import PluginProperties
 
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ class GoUsePlugin(Plugin):
     @override
     def get_build_environment(self) -> dict[str, str]:
         """Return a dictionary with the environment to use in the build step."""
-        return {}
+        return get_go_cache_environment(self._part_info)
 
     @override
     def get_build_commands(self) -> list[str]:
@@ -48,6 +48,12 @@ class GradlePluginProperties(PluginProperties, frozen=True):
     - gradle_use_daemon:
       (boolean)
       Whether to use the Gradle daemon during the build.
+    - gradle_shared_cache:
+      (boolean)
+      Whether to share the Gradle user home and build cache with other parts.
+    - gradle_configuration_cache:
+      (boolean)
+      Whether to reuse the build configuration of previous builds.
     """
 
     plugin: Literal["gradle"] = "gradle"
@@ -56,6 +62,8 @@ class GradlePluginProperties(PluginProperties, frozen=True):
     gradle_parameters: list[str] = []
     gradle_task: str = "build"
     gradle_use_daemon: bool = False
+    gradle_shared_cache: bool = False
+    gradle_configuration_cache: bool = False
 
     # part properties required by the plugin
     source: str  # pyright: ignore[reportGeneralTypeIssues]
@@ -103,7 +111,15 @@ class GradlePlugin(JavaPlugin):
       The task to run to build the project.
     - gradle-use-daemon:
       (boolean, default False)
-      Whether to use the Gradle daemon during the build.
+      Whether to use the Gradle daemon during the build. The daemon is kept
+      alive until the lifecycle execution finishes.
+    - gradle-shared-cache:
+      (boolean, default False)
+      Whether to use a Gradle user home shared by all parts in the cache
+      directory, and to enable the Gradle build cache.
+    - gradle-configuration-cache:
+      (boolean, default False)
+      Whether to enable the Gradle configuration cache.
     """
 
     properties_class = GradlePluginProperties
@@ -133,9 +149,29 @@ class GradlePlugin(JavaPlugin):
 
     @property
     def _gradle_user_home(self) -> Path:
-        """Path to default Gradle user home."""
+        """Path to the Gradle user home.
+
+        The shared user home is safe to use by concurrent builds, since Gradle locks
+        the caches it contains.
+        """
+        options = cast(GradlePluginProperties, self._options)
+        if options.gradle_shared_cache:
+            return self._part_info.cache_dir / "gradle"
         return self._part_info.part_build_subdir / ".gradle"
 
+    @property
+    def _gradle_properties(self) -> Path:
+        """Path to the properties file holding the proxy configuration.
+
+        Properties are not written to a shared user home, since they are specific
+        to the part build. Gradle also reads system properties from the project
+        properties file.
+        """
+        options = cast(GradlePluginProperties, self._options)
+        if options.gradle_shared_cache:
+            return self._part_info.part_build_subdir / "gradle.properties"
+        return self._gradle_user_home / "gradle.properties"
+
     @override
     def get_build_snaps(self) -> set[str]:
         """Return a set of required snaps to install in the build environment."""
@@ -173,6 +209,12 @@ class GradlePlugin(JavaPlugin):
         if not options.gradle_use_daemon:
             extra_args.append("--no-daemon")
 
+        if options.gradle_shared_cache:
+            extra_args.append("--build-cache")
+
+        if options.gradle_configuration_cache:
+            extra_args.append("--configuration-cache")
+
         tasks = shlex.split(options.gradle_task)
         gradle_cmd = shlex.join(
             [
@@ -191,6 +233,30 @@ class GradlePlugin(JavaPlugin):
             *self._get_java_post_build_commands(),
         ]
 
+    @override
+    def get_epilogue_commands(self) -> list[str]:
+        """Return the commands to stop the Gradle daemons started by the build.
+
+        The Gradle wrapper can't be used, as its jar file is removed after the
+        build. Daemons are stopped using each Gradle distribution downloaded by
+        the wrapper to the user home, and the system Gradle if available.
+        """
+        options = cast(GradlePluginProperties, self._options)
+        if not options.gradle_use_daemon:
+            return []
+
+        return [
+            dedent(
+                f"""\
+                for gradle in $(command -v gradle) "{self._gradle_user_home}"/wrapper/dists/*/*/gradle-*/bin/gradle; do
+                    if [ -x "${{gradle}}" ]; then
+                        "${{gradle}}" --stop || true
+                    fi
+                done
+                """
+            )
+        ]
+
     def _create_self_contained_init_script(
         self, options: GradlePluginProperties
     ) -> str:
@@ -219,9 +285,17 @@ class GradlePlugin(JavaPlugin):
         if not any(k in case_insensitive_env for k in ("http_proxy", "https_proxy")):
             return
 
-        gradle_user_home = self._gradle_user_home
-        gradle_user_home.mkdir(parents=True, exist_ok=True)
-        gradle_properties = gradle_user_home / "gradle.properties"
+        gradle_properties = self._gradle_properties
+        gradle_properties.parent.mkdir(parents=True, exist_ok=True)
+        # Don't append to the last line of an existing project properties file.
+        if gradle_properties.is_file():
+            contents = gradle_properties.read_text(encoding="utf-8")
+            if contents and not contents.endswith("\n"):
+                with open(  # noqa: PTH123
+                    gradle_properties, "a", encoding="utf-8"
+                ) as gradle_properties_file:
+                    gradle_properties_file.write("\n")
+
         for protocol in ("http", "https"):
             env_name = f"{protocol}_proxy"
             if env_name not in case_insensitive_env:
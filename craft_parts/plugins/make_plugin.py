@@ -21,6 +21,7 @@ from typing import Literal, cast
 from typing_extensions import override
 
 from .base import Plugin
+from .compiler_cache import CompilerCache
 from .properties import PluginProperties
 
 
@@ -65,12 +66,17 @@ class MakePlugin(Plugin):
     @override
     def get_build_packages(self) -> set[str]:
         """Return a set of required packages to install in the build environment."""
-        return {"gcc", "make"}
+        compiler_cache = CompilerCache(self._part_info)
+        return {"gcc", "make", *compiler_cache.get_build_packages()}
 
     @override
     def get_build_environment(self) -> dict[str, str]:
         """Return a dictionary with the environment to use in the build step."""
-        return {}
+        compiler_cache = CompilerCache(self._part_info)
+        return {
+            **compiler_cache.get_build_environment(),
+            **compiler_cache.get_compiler_environment(),
+        }
 
     def _get_make_command(self, target: str = "") -> str:
         cmd = ["make", f'-j"{self._part_info.parallel_build_count}"']
@@ -86,8 +92,11 @@ class MakePlugin(Plugin):
     @override
     def get_build_commands(self) -> list[str]:
         """Return a list of commands to run during the build step."""
-        return [
-            self._get_make_command(),
-            f"{self._get_make_command(target='install')} "
-            f'DESTDIR="{self._part_info.part_install_dir}"',
-        ]
+        compiler_cache = CompilerCache(self._part_info)
+        return compiler_cache.wrap_build_commands(
+            [
+                self._get_make_command(),
+                f"{self._get_make_command(target='install')} "
+                f'DESTDIR="{self._part_info.part_install_dir}"',
+            ]
+        )
@@ -24,10 +24,13 @@ from typing_extensions import override
 
 from . import validator
 from .base import Plugin
+from .compiler_cache import CompilerCache
 from .properties import PluginProperties
 
 logger = logging.getLogger(__name__)
 
+_COMPILER_CACHE_NATIVE_FILE = "compiler-cache.ini"
+
 
 class MesonPluginProperties(PluginProperties, frozen=True):
     """The part properties used by the Meson plugin."""
@@ -98,24 +101,51 @@ class MesonPlugin(Plugin):
     @override
     def get_build_packages(self) -> set[str]:
         """Return a set of required packages to install in the build environment."""
-        return set()
+        return CompilerCache(self._part_info).get_build_packages()
 
     @override
     def get_build_environment(self) -> dict[str, str]:
         """Return a dictionary with the environment to use in the build step."""
-        return {}
+        return CompilerCache(self._part_info).get_build_environment()
 
     @override
     def get_build_commands(self) -> list[str]:
         """Return a list of commands to run during the build step."""
         options = cast(MesonPluginProperties, self._options)
 
+        compiler_cache = CompilerCache(self._part_info)
+        commands: list[str] = []
+
         meson_cmd = ["meson", "setup", str(self._part_info.part_src_subdir)]
+
+        # Cross builds need a cross file provided in the meson parameters, so
+        # the launcher is only injected in native builds.
+        if compiler_cache and not self._part_info.is_cross_compiling:
+            commands.append(self._get_native_file_command(compiler_cache))
+            meson_cmd.extend(["--native-file", _COMPILER_CACHE_NATIVE_FILE])
+
         if options.meson_parameters:
             meson_cmd.extend(shlex.quote(p) for p in options.meson_parameters)
 
-        return [
-            " ".join(meson_cmd),
-            "ninja",
-            f"DESTDIR={self._part_info.part_install_dir} ninja install",
-        ]
+        return compiler_cache.wrap_build_commands(
+            [
+                *commands,
+                " ".join(meson_cmd),
+                "ninja",
+                f"DESTDIR={self._part_info.part_install_dir} ninja install",
+            ]
+        )
+
+    @staticmethod
+    def _get_native_file_command(compiler_cache: CompilerCache) -> str:
+        """Return the command writing a native file with the cached compilers."""
+        launcher = compiler_cache.launcher
+        return "\n".join(
+            [
+                f"cat > {_COMPILER_CACHE_NATIVE_FILE} << EOF",
+                "[binaries]",
+                f"c = ['{launcher}', '${{CC:-gcc}}']",
+                f"cpp = ['{launcher}', '${{CXX:-g++}}']",
+                "EOF",
+            ]
+        )
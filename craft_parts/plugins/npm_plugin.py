@@ -16,10 +16,12 @@
 
 """The npm plugin."""
 
+import json
 import logging
 import os
 import platform
 import re
+import time
 from pathlib import Path
 from textwrap import dedent
 from typing import Any, Literal, cast
@@ -45,6 +47,9 @@ _NODE_ARCH_FROM_SNAP_ARCH = {
     "ppc64el": "ppc64le",
     "s390x": "s390x",
 }
+# How long the cached Node.js release index is used before fetching it again.
+_NODE_RELEASE_INDEX_TTL = 24 * 60 * 60
+
 _NODE_ARCH_FROM_PLATFORM = {
     "x86_64": {"32bit": "x86", "64bit": "x64"},
     "aarch64": {"32bit": "armv7l", "64bit": "arm64"},
@@ -53,6 +58,23 @@ _NODE_ARCH_FROM_PLATFORM = {
 }
 
 
+def _read_node_release_index(index_file: Path) -> list[dict[str, Any]] | None:
+    """Read a cached list of Node.js releases.
+
+    :param index_file: The file containing the cached list.
+
+    :return: The list of Node.js releases, or None if the file doesn't exist or
+        is invalid.
+    """
+    try:
+        versions = json.loads(index_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(versions, list):
+        return None
+    return cast(list[dict[str, Any]], versions)
+
+
 class NpmPluginProperties(PluginProperties, frozen=True):
     """The part properties used by the npm plugin."""
 
@@ -156,6 +178,11 @@ class NpmPlugin(Plugin):
         """Path to npm cache to consume packages from."""
         return self._part_info.project_info.dirs.backstage_dir / "npm-cache"
 
+    @property
+    def _npm_cache_dir(self) -> Path:
+        """Path to the npm and Node.js caches shared by all parts."""
+        return self._part_info.cache_dir / "npm"
+
     @staticmethod
     def _get_architecture() -> str:
         """Get system architecture, formatted for downloading node.
@@ -182,31 +209,58 @@ class NpmPlugin(Plugin):
         return node_arch
 
     @staticmethod
-    def _fetch_node_release_index() -> list[dict[str, Any]]:
+    def _fetch_node_release_index(cache_dir: Path) -> list[dict[str, Any]]:
         """Fetch the list of Node.js releases.
 
+        The list is cached and fetched again when the cached copy expires. If
+        the list can't be fetched, an expired cached copy is used.
+
+        :param cache_dir: The directory to cache the list of releases in.
+
         :return: The list of Node.js releases.
         """
+        index_file = cache_dir / "index.json"
+        cached_versions = _read_node_release_index(index_file)
+        if (
+            cached_versions is not None
+            and time.time() - index_file.stat().st_mtime < _NODE_RELEASE_INDEX_TTL
+        ):
+            return cached_versions
+
         logging.info("Fetching Node.js release index...")
-        resp = requests.get("https://nodejs.org/dist/index.json", timeout=10)
-        resp.raise_for_status()
+        try:
+            resp = requests.get("https://nodejs.org/dist/index.json", timeout=10)
+            resp.raise_for_status()
+        except requests.RequestException as err:
+            if cached_versions is None:
+                raise
+            logger.warning(
+                "Cannot fetch Node.js release index (%s), using cached copy.", err
+            )
+            return cached_versions
+
         versions: list[dict[str, Any]] = resp.json()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = index_file.with_name(f".{index_file.name}.{os.getpid()}")
+        tmp_file.write_text(json.dumps(versions))
+        tmp_file.replace(index_file)
         return versions
 
     @staticmethod
     def _get_best_node_version(  # noqa: PLR0912
-        node_version: str | None, target_arch: str
+        node_version: str | None, target_arch: str, *, cache_dir: Path
     ) -> tuple[str, str]:
         """Get the best matching Node.js version using NVM-style version tags.
 
         :param node_version: The version of Node.js to match.
         :param target_arch: The target architecture.
+        :param cache_dir: The directory containing the cached list of releases.
         :return: The best matching node version and its remote file name.
         """
         logging.info(
             "Searching for Node.js version %s for %s ...", node_version, target_arch
         )
-        versions = NpmPlugin._fetch_node_release_index()
+        versions = NpmPlugin._fetch_node_release_index(cache_dir)
         node_os_id = f"linux-{target_arch}"
         candidate = None
         if node_version is None or node_version == "node":
@@ -290,6 +344,9 @@ class NpmPlugin(Plugin):
         if self._is_self_contained:
             # explicitly block registry access during offline builds
             base_env["npm_config_registry"] = "https://localhost:1"
+        else:
+            # share downloaded packages between parts and builds
+            base_env["npm_config_cache"] = str(self._npm_cache_dir / "cache")
 
         return base_env
 
@@ -309,24 +366,40 @@ class NpmPlugin(Plugin):
         if options.npm_include_node:
             arch = self._get_architecture()
             version = options.npm_node_version
-            resolved_version, file_name = self._get_best_node_version(version, arch)
+            node_cache_dir = self._npm_cache_dir / "node"
+            exact_file_name = f"node-v{version}-linux-{arch}.tar.gz"
+
+            if (
+                version
+                and re.match(r"^\d+\.\d+\.\d+$", version)
+                and (node_cache_dir / exact_file_name).is_file()
+            ):
+                # already cached, no need to look up the release index
+                resolved_version, file_name = f"v{version}", exact_file_name
+            else:
+                resolved_version, file_name = self._get_best_node_version(
+                    version, arch, cache_dir=self._npm_cache_dir
+                )
 
             node_uri = f"https://nodejs.org/dist/{resolved_version}/{file_name}"
             checksum_uri = f"https://nodejs.org/dist/{resolved_version}/SHASUMS256.txt"
-            self._node_binary_path = os.path.join(  # noqa: PTH118
-                self._part_info.part_cache_dir, file_name
-            )
+            self._node_binary_path = os.path.join(node_cache_dir, file_name)  # noqa: PTH118
+
+            # The checksum is verified once, before the runtime enters the cache.
             cmd += [
                 dedent(
                     f"""\
                 if [ ! -f "{self._node_binary_path}" ]; then
-                    mkdir -p "{self._part_info.part_cache_dir}"
-                    curl --retry 5 -s "{checksum_uri}" -o "{self._part_info.part_cache_dir}"/SHASUMS256.txt
-                    curl --retry 5 -s "{node_uri}" -o "{self._node_binary_path}"
+                    mkdir -p "{node_cache_dir}"
+                    NODE_DOWNLOAD_DIR="$(mktemp -d "{node_cache_dir}/.download.XXXXXX")"
+                    curl --retry 5 -s "{checksum_uri}" -o "$NODE_DOWNLOAD_DIR"/SHASUMS256.txt
+                    curl --retry 5 -s "{node_uri}" -o "$NODE_DOWNLOAD_DIR/{file_name}"
+                    pushd "$NODE_DOWNLOAD_DIR"
+                    sha256sum --ignore-missing --strict -c SHASUMS256.txt
+                    popd
+                    mv "$NODE_DOWNLOAD_DIR/{file_name}" "{self._node_binary_path}"
+                    rm -rf "$NODE_DOWNLOAD_DIR"
                 fi
-                pushd "{self._part_info.part_cache_dir}"
-                sha256sum --ignore-missing --strict -c SHASUMS256.txt
-                popd
                 """
                 )
             ]
@@ -17,37 +17,14 @@
 """Definitions and helpers to handle plugins."""
 
 import enum
-from collections.abc import Mapping
+import importlib
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
 from craft_parts import errors
 
-from .ant_plugin import AntPlugin
-from .autotools_plugin import AutotoolsPlugin
 from .base import Plugin
-from .cargo_use_plugin import CargoUsePlugin
-from .cmake_plugin import CMakePlugin
-from .dotnet_plugin import DotnetPlugin
-from .dump_plugin import DumpPlugin
-from .go_plugin import GoPlugin
-from .go_use_plugin import GoUsePlugin
-from .gradle_plugin import GradlePlugin
-from .jlink_plugin import JLinkPlugin
-from .make_plugin import MakePlugin
-from .maven_plugin import MavenPlugin
-from .maven_use_plugin import MavenUsePlugin
-from .meson_plugin import MesonPlugin
-from .nil_plugin import NilPlugin
-from .npm_plugin import NpmPlugin
-from .npm_use_plugin import NpmUsePlugin
-from .poetry_plugin import PoetryPlugin
 from .properties import PluginProperties
-from .python_plugin import PythonPlugin
-from .qmake_plugin import QmakePlugin
-from .ruby_plugin import RubyPlugin
-from .rust_plugin import RustPlugin
-from .scons_plugin import SConsPlugin
-from .uv_plugin import UvPlugin
 
 if TYPE_CHECKING:
     # import module to avoid circular imports in sphinx doc generation
@@ -58,50 +35,152 @@ PluginType = type[Plugin]
 # build-attributes that require plugin support.
 PLUGINS_BUILD_ATTRIBUTES = {"self-contained"}
 
+# Built-in plugin classes and the modules defining them. Plugin modules are
+# only imported when the plugin class is first used.
+_BUILTIN_PLUGIN_MODULES: dict[str, str] = {
+    "AntPlugin": "ant_plugin",
+    "AutotoolsPlugin": "autotools_plugin",
+    "CargoUsePlugin": "cargo_use_plugin",
+    "CMakePlugin": "cmake_plugin",
+    "DotnetPlugin": "dotnet_plugin",
+    "DumpPlugin": "dump_plugin",
+    "GoPlugin": "go_plugin",
+    "GoUsePlugin": "go_use_plugin",
+    "GradlePlugin": "gradle_plugin",
+    "JLinkPlugin": "jlink_plugin",
+    "MakePlugin": "make_plugin",
+    "MavenPlugin": "maven_plugin",
+    "MavenUsePlugin": "maven_use_plugin",
+    "MesonPlugin": "meson_plugin",
+    "NilPlugin": "nil_plugin",
+    "NpmPlugin": "npm_plugin",
+    "NpmUsePlugin": "npm_use_plugin",
+    "PoetryPlugin": "poetry_plugin",
+    "PythonPlugin": "python_plugin",
+    "QmakePlugin": "qmake_plugin",
+    "RubyPlugin": "ruby_plugin",
+    "RustPlugin": "rust_plugin",
+    "SConsPlugin": "scons_plugin",
+    "UvPlugin": "uv_plugin",
+}
+
+
+def _load_builtin_plugin(class_name: str) -> PluginType:
+    """Import the module defining a built-in plugin and obtain its class.
+
+    :param class_name: The name of the built-in plugin class.
+
+    :return: The plugin class.
+    """
+    module = importlib.import_module(
+        f".{_BUILTIN_PLUGIN_MODULES[class_name]}", __package__
+    )
+    return getattr(module, class_name)  # type: ignore[no-any-return]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import built-in plugin classes on first access."""
+    if name in _BUILTIN_PLUGIN_MODULES:
+        return _load_builtin_plugin(name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _BuiltinPlugins(Mapping[str, PluginType]):
+    """A mapping of plugin names to built-in plugin classes.
+
+    Plugin classes are resolved by name when they are first accessed. Copies
+    and unions with other mappings are dictionaries of plugin classes.
+
+    :param class_names: A dictionary mapping plugin names to the names of the
+        built-in plugin classes.
+    """
+
+    def __init__(self, class_names: dict[str, str]) -> None:
+        self.class_names = class_names
+
+    def __getitem__(self, name: str) -> PluginType:
+        return _load_builtin_plugin(self.class_names[name])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.class_names)
+
+    def __len__(self) -> int:
+        return len(self.class_names)
+
+    def __eq__(self, other: object) -> bool:
+        # Compare class names without importing plugins if possible.
+        if isinstance(other, _BuiltinPlugins):
+            return self.class_names == other.class_names
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Mapping[str, PluginType]) -> dict[str, PluginType]:
+        return self.copy() | dict(other)
+
+    def __ror__(self, other: Mapping[str, PluginType]) -> dict[str, PluginType]:
+        return dict(other) | self.copy()
+
+    def copy(self) -> dict[str, PluginType]:
+        """Obtain a dictionary of the plugin classes, importing their modules."""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.class_names!r})"
+
+
+# Plugin names and built-in plugin classes in each plugin group.
+_MINIMAL_PLUGINS = {
+    "dump": "DumpPlugin",
+    "nil": "NilPlugin",
+}
+
+_DEFAULT_PLUGINS = _MINIMAL_PLUGINS | {
+    "ant": "AntPlugin",
+    "autotools": "AutotoolsPlugin",
+    "cargo-use": "CargoUsePlugin",
+    "cmake": "CMakePlugin",
+    "dotnet": "DotnetPlugin",
+    "go": "GoPlugin",
+    "go-use": "GoUsePlugin",
+    "gradle": "GradlePlugin",
+    "jlink": "JLinkPlugin",
+    "make": "MakePlugin",
+    "maven": "MavenPlugin",
+    "maven-use": "MavenUsePlugin",
+    "meson": "MesonPlugin",
+    "npm": "NpmPlugin",
+    "npm-use": "NpmUsePlugin",
+    "poetry": "PoetryPlugin",
+    "python": "PythonPlugin",
+    "qmake": "QmakePlugin",
+    "ruby": "RubyPlugin",
+    "rust": "RustPlugin",
+    "scons": "SConsPlugin",
+    "uv": "UvPlugin",
+}
+
 
 class PluginGroup(enum.Enum):
     """Plugin groups available for use."""
 
-    MINIMAL = {
-        "dump": DumpPlugin,
-        "nil": NilPlugin,
-    }
+    MINIMAL = _BuiltinPlugins(_MINIMAL_PLUGINS)
     """A completely minimal set of plugins.
 
     The plugins in this group are required for all applications.
     """
 
-    DEFAULT = MINIMAL | {
-        "ant": AntPlugin,
-        "autotools": AutotoolsPlugin,
-        "cargo-use": CargoUsePlugin,
-        "cmake": CMakePlugin,
-        "dotnet": DotnetPlugin,
-        "go": GoPlugin,
-        "go-use": GoUsePlugin,
-        "gradle": GradlePlugin,
-        "jlink": JLinkPlugin,
-        "make": MakePlugin,
-        "maven": MavenPlugin,
-        "maven-use": MavenUsePlugin,
-        "meson": MesonPlugin,
-        "npm": NpmPlugin,
-        "npm-use": NpmUsePlugin,
-        "poetry": PoetryPlugin,
-        "python": PythonPlugin,
-        "qmake": QmakePlugin,
-        "ruby": RubyPlugin,
-        "rust": RustPlugin,
-        "scons": SConsPlugin,
-        "uv": UvPlugin,
-    }
+    DEFAULT = _BuiltinPlugins(_DEFAULT_PLUGINS)
     """The default set of plugins for most use cases.
 
     The plugins in this group are generally considered functional on most legacy bases.
     """
 
 
-_plugins: dict[str, type[Plugin]] = {}
+# Registered plugins. Built-in plugins are registered by class name and replaced
+# with the plugin class when first used.
+_plugins: dict[str, PluginType | str] = {}
 
 
 def set_plugin_group(group: Mapping[str, type[Plugin]] | PluginGroup) -> None:
@@ -114,7 +193,10 @@ def set_plugin_group(group: Mapping[str, type[Plugin]] | PluginGroup) -> None:
     if isinstance(group, PluginGroup):
         group = group.value
     _plugins.clear()
-    _plugins.update(group)
+    if isinstance(group, _BuiltinPlugins):
+        _plugins.update(group.class_names)
+    else:
+        _plugins.update(group)
 
 
 set_plugin_group(PluginGroup.DEFAULT)
@@ -152,12 +234,17 @@ def get_plugin_class(name: str) -> PluginType:
     if name not in _plugins:
         raise ValueError(f"plugin not registered: {name!r}")
 
-    return _plugins[name]
+    plugin_class = _plugins[name]
+    if isinstance(plugin_class, str):
+        plugin_class = _load_builtin_plugin(plugin_class)
+        _plugins[name] = plugin_class
+
+    return plugin_class
 
 
 def get_registered_plugins() -> dict[str, PluginType]:
     """Return the list of currently registered plugins."""
-    return _plugins.copy()
+    return {name: get_plugin_class(name) for name in list(_plugins)}
 
 
 def register(plugins: dict[str, PluginType]) -> None:
@@ -151,6 +151,20 @@ class PoetryPlugin(BasePythonPlugin):
             f"{pip} check",
         ]
 
+    @override
+    def _get_dependency_install_commands(self) -> list[str]:
+        requirements_path = self._part_info.part_build_dir / "requirements.txt"
+        pip_extra_args = shlex.join(self._options.poetry_pip_extra_args)
+
+        return [
+            *self._get_poetry_export_commands(requirements_path),
+            f"{self._get_pip()} install {pip_extra_args} --requirement={requirements_path}",
+        ]
+
+    @override
+    def _get_dependency_files(self) -> list[str]:
+        return ["poetry.lock"]
+
     @override
     def _get_package_install_commands(self) -> list[str]:
         """Return a list of commands to run during the build step."""
@@ -42,6 +42,9 @@ class PluginProperties(pydantic.BaseModel, frozen=True):  # type: ignore[misc]
         extra="forbid",
         frozen=True,
         validate_assignment=True,
+        # Plugin properties are built when first used, so that applications
+        # don't pay for the validators of plugins they don't use.
+        defer_build=True,
     )
 
     plugin: str = ""
@@ -19,6 +19,8 @@
 import shlex
 from typing import Literal
 
+from typing_extensions import override
+
 from .base import BasePythonPlugin
 from .properties import PluginProperties
 
@@ -42,17 +44,15 @@ class PythonPlugin(BasePythonPlugin):
     properties_class = PythonPluginProperties
     _options: PythonPluginProperties
 
-    def _get_package_install_commands(self) -> list[str]:
+    def _get_constraints(self) -> str:
+        return " ".join(f"-c {c!r}" for c in self._options.python_constraints)
+
+    @override
+    def _get_dependency_install_commands(self) -> list[str]:
         commands: list[str] = []
 
         pip = self._get_pip()
-
-        if self._options.python_constraints:
-            constraints = " ".join(
-                f"-c {c!r}" for c in self._options.python_constraints
-            )
-        else:
-            constraints = ""
+        constraints = self._get_constraints()
 
         if self._options.python_packages:
             python_packages = " ".join(
@@ -68,8 +68,21 @@ class PythonPlugin(BasePythonPlugin):
             requirements_cmd = f"{pip} install {constraints} -U {requirements}"
             commands.append(requirements_cmd)
 
-        commands.append(
-            f"[ -f setup.py ] || [ -f pyproject.toml ] && {pip} install {constraints} -U ."
-        )
-
         return commands
+
+    @override
+    def _get_dependency_files(self) -> list[str]:
+        return [
+            *self._options.python_requirements,
+            *self._options.python_constraints,
+        ]
+
+    @override
+    def _get_package_install_commands(self) -> list[str]:
+        pip = self._get_pip()
+        constraints = self._get_constraints()
+
+        return [
+            *self._get_dependency_install_commands(),
+            f"[ -f setup.py ] || [ -f pyproject.toml ] && {pip} install {constraints} -U .",
+        ]
@@ -23,6 +23,7 @@ from typing import Literal, cast
 from typing_extensions import override
 
 from .base import Plugin
+from .compiler_cache import CompilerCache
 from .properties import PluginProperties
 
 
@@ -81,6 +82,8 @@ class QmakePlugin(Plugin):
             build_packages = {"g++", "make", "qmake6"}
         else:
             build_packages = {"g++", "make", "qt5-qmake"}
+
+        build_packages.update(CompilerCache(self._part_info).get_build_packages())
         return build_packages
 
     @override
@@ -88,10 +91,11 @@ class QmakePlugin(Plugin):
         """Return a dictionary with the environment to use in the build step."""
         options = cast(QmakePluginProperties, self._options)
 
+        environment = CompilerCache(self._part_info).get_build_environment()
         if options.qmake_major_version == 6:  # noqa: PLR2004 (magic value)
-            return {"QT_SELECT": "qt6"}
+            return {"QT_SELECT": "qt6", **environment}
 
-        return {"QT_SELECT": "qt5"}
+        return {"QT_SELECT": "qt5", **environment}
 
     @override
     def get_build_commands(self) -> list[str]:
@@ -115,6 +119,14 @@ class QmakePlugin(Plugin):
                 *options.qmake_parameters,
             ]
 
+        compiler_cache = CompilerCache(self._part_info)
+        if compiler_cache:
+            # Set the compilers before the user parameters so they can be overridden.
+            qmake_configure_command[4:4] = [
+                f'QMAKE_CC="{compiler_cache.c_compiler}"',
+                f'QMAKE_CXX="{compiler_cache.cxx_compiler}"',
+            ]
+
         if options.qmake_project_file:
             qmake_configure_command.append(
                 str(self._part_info.part_src_dir / options.qmake_project_file)
@@ -122,11 +134,13 @@ class QmakePlugin(Plugin):
         else:
             qmake_configure_command.append(str(self._part_info.part_src_dir))
 
-        return [
-            " ".join(qmake_configure_command),
-            f"env -u CFLAGS -u CXXFLAGS make -j{self._part_info.parallel_build_count}",
-            f"make install INSTALL_ROOT={self._part_info.part_install_dir}",
-        ]
+        return compiler_cache.wrap_build_commands(
+            [
+                " ".join(qmake_configure_command),
+                f"env -u CFLAGS -u CXXFLAGS make -j{self._part_info.parallel_build_count}",
+                f"make install INSTALL_ROOT={self._part_info.part_install_dir}",
+            ]
+        )
 
     @classmethod
     @override
@@ -16,10 +16,12 @@
 
 """The craft Rust plugin."""
 
+import hashlib
 import logging
 import os
 import re
 import subprocess
+from pathlib import Path
 from textwrap import dedent
 from typing import Literal, cast
 
@@ -34,6 +36,11 @@ from .properties import PluginProperties
 
 logger = logging.getLogger(__name__)
 
+# Channels naming a fixed toolchain release, which rustup never updates.
+_PINNED_CHANNEL_RE = re.compile(
+    r"^(\d+\.\d+\.\d+|(stable|beta|nightly)-\d{4}-\d{2}-\d{2})(-[\w-]+)?$"
+)
+
 
 class RustPluginProperties(PluginProperties, frozen=True):
     """The part properties used by the Rust plugin."""
@@ -223,6 +230,9 @@ class RustPlugin(Plugin):
         )
         if registry_dir.exists():
             variables["CARGO_HOME"] = str(self._part_info.work_dir / "cargo")
+        else:
+            # Share the registry and git checkouts cache between parts and builds.
+            variables["CARGO_HOME"] = str(self._part_info.cache_dir / "cargo")
 
         options = cast(RustPluginProperties, self._options)
         if options.rust_ignore_toolchain_file:
@@ -255,8 +265,16 @@ class RustPlugin(Plugin):
             # (otherwise rustup won't install the correct version)
             return ["cargo --version"]
         logger.info("Switch rustup channel to %s", rust_channel)
+        if _PINNED_CHANNEL_RE.match(rust_channel):
+            # A pinned toolchain never changes, only install it if missing.
+            update_cmd = (
+                f"rustup which --toolchain {rust_channel} rustc > /dev/null 2>&1"
+                f" || rustup update {rust_channel}"
+            )
+        else:
+            update_cmd = f"rustup update {rust_channel}"
         return [
-            f"rustup update {rust_channel}",
+            update_cmd,
             f"rustup default {rust_channel}",
         ]
 
@@ -309,24 +327,31 @@ class RustPlugin(Plugin):
         for crate in options.rust_path:
             logger.info("Generating build commands for %s", crate)
             config_cmd_string = " ".join(config_cmd)
+            install_dir = self._part_info.part_install_dir
+            # Keep build artifacts across clean builds, cargo rebuilds what changed.
+            # Each crate has its own target directory so that binaries from other
+            # crates or earlier builds are never installed.
+            target_dir = self._get_target_dir(crate)
+            artifacts = target_dir / "artifacts.json"
             # pylint: disable=line-too-long
             rust_build_cmd_single = dedent(
                 f"""\
                 if cargo read-manifest --manifest-path "{crate}"/Cargo.toml > /dev/null; then
-                    cargo install -f --locked --path "{crate}" --root "{self._part_info.part_install_dir}" {config_cmd_string}
+                    CARGO_TARGET_DIR="{target_dir}" cargo install -f --locked --path "{crate}" --root "{install_dir}" {config_cmd_string}
                     # remove the installation metadata
-                    rm -f "{self._part_info.part_install_dir}"/.crates{{.toml,2.json}}
+                    rm -f "{install_dir}"/.crates{{.toml,2.json}}
                 else
                     # virtual workspace is a bit tricky,
                     # we need to build the whole workspace and then copy the binaries ourselves
                     pushd "{crate}"
-                    cargo build --workspace --release {config_cmd_string}
-                    # install the final binaries
-                    find ./target/release -maxdepth 1 -executable -exec install -Dvm755 {{}} "{self._part_info.part_install_dir}" ';'
-                    # remove proc_macro objects
-                    for i in "{self._part_info.part_install_dir}"/*.so; do
-                        readelf --wide --dyn-syms "$i" | grep -q '__rustc_proc_macro_decls_[0-9a-f]*__' && \
-                        rm -fv "$i"
+                    mkdir -p "{target_dir}"
+                    CARGO_TARGET_DIR="{target_dir}" cargo build --workspace --release --message-format=json-render-diagnostics {config_cmd_string} > "{artifacts}"
+                    # install the binaries and shared libraries produced by this build
+                    {{
+                        sed -n 's/.*"executable":"\\([^"]*\\)".*/\\1/p' "{artifacts}"
+                        grep -E '"kind":\\[[^]]*"c?dylib"' "{artifacts}" | grep -o '"[^"]*\\.so"' | tr -d '"' || true
+                    }} | sort -u | while read -r artifact; do
+                        install -Dvm755 "$artifact" -t "{install_dir}"
                     done
                     popd
                 fi\
@@ -334,3 +359,13 @@ class RustPlugin(Plugin):
             )
             rust_build_cmd.append(rust_build_cmd_single)
         return rust_build_cmd
+
+    def _get_target_dir(self, crate: str) -> Path:
+        """Return the cargo target directory used to build a crate.
+
+        :param crate: The path to the crate or workspace to build.
+
+        :return: A directory in the part cache unique to the crate path.
+        """
+        crate_id = hashlib.sha256(os.path.normpath(crate).encode()).hexdigest()
+        return self._part_info.part_cache_dir / "cargo-target" / crate_id[:16]
@@ -24,6 +24,7 @@ from craft_parts import errors
 
 from . import validator
 from .base import Plugin
+from .compiler_cache import CompilerCache
 from .properties import PluginProperties
 
 
@@ -109,13 +110,16 @@ class SConsPlugin(Plugin):
     @override
     def get_build_packages(self) -> set[str]:
         """Return a set of required packages to install in the build environment."""
-        return set()
+        return CompilerCache(self._part_info).get_build_packages()
 
     @override
     def get_build_environment(self) -> dict[str, str]:
         """Return a dictionary with the environment to use in the build step."""
+        compiler_cache = CompilerCache(self._part_info)
         return {
             "DESTDIR": f"{self._part_info.part_install_dir}",
+            **compiler_cache.get_build_environment(),
+            **compiler_cache.get_compiler_environment(),
         }
 
     @override
@@ -123,7 +127,9 @@ class SConsPlugin(Plugin):
         """Return a list of commands to run during the build step."""
         options = cast(SConsPluginProperties, self._options)
 
-        return [
-            " ".join(["scons", *options.scons_parameters]),
-            " ".join(["scons", "install", *options.scons_parameters]),
-        ]
+        return CompilerCache(self._part_info).wrap_build_commands(
+            [
+                " ".join(["scons", *options.scons_parameters]),
+                " ".join(["scons", "install", *options.scons_parameters]),
+            ]
+        )
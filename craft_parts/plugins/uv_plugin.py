@@ -110,22 +110,34 @@ class UvPlugin(BasePythonPlugin):
         ]
 
     @override
-    def _get_package_install_commands(self) -> list[str]:
-        """Return a list of commands to run during the build step."""
-        sync_command = [
-            "uv",
-            "sync",
-            "--no-dev",
-            "--no-editable",
-            "--reinstall",
-        ]
+    def _get_package_cache_environment(self) -> dict[str, str]:
+        return {"UV_CACHE_DIR": str(self._get_python_cache_dir() / "uv")}
+
+    def _get_sync_command(self, *options: str) -> str:
+        sync_command = ["uv", "sync", "--no-dev", "--no-editable", *options]
 
         for extra in sorted(self._options.uv_extras):
             sync_command.extend(["--extra", extra])
         for group in sorted(self._options.uv_groups):
             sync_command.extend(["--group", group])
 
-        return [shlex.join(sync_command)]
+        return shlex.join(sync_command)
+
+    @override
+    def _get_dependency_install_commands(self) -> list[str]:
+        return [self._get_sync_command("--reinstall", "--no-install-project")]
+
+    @override
+    def _get_dependency_files(self) -> list[str]:
+        return ["uv.lock"]
+
+    @override
+    def _get_package_install_commands(self) -> list[str]:
+        """Return a list of commands to run during the build step."""
+        if self._part_info.reuse_python_venvs:
+            # Dependencies from the virtual environment template are kept.
+            return [self._get_sync_command()]
+        return [self._get_sync_command("--reinstall")]
 
     @override
     def get_build_environment(self) -> dict[str, str]:
@@ -25,7 +25,7 @@ from craft_parts.features import Features
 from craft_parts.infos import ProjectInfo, ProjectOptions, ProjectVarInfo
 from craft_parts.overlays import LayerHash, LayerStateManager
 from craft_parts.parts import Part, part_list_by_name, sort_parts
-from craft_parts.state_manager import StateManager, states
+from craft_parts.state_manager import StateCache, StateManager, states
 from craft_parts.steps import Step
 
 logger = logging.getLogger(__name__)
@@ -43,6 +43,7 @@ class Sequencer:
     :param project_info: Information about this project.
     :param ignore_outdated: A list of file patterns to ignore when testing for
         outdated files.
+    :param state_cache: The cache to load states from.
     """
 
     def __init__(
@@ -52,13 +53,16 @@ class Sequencer:
         project_info: ProjectInfo,
         ignore_outdated: list[str] | None = None,
         base_layer_hash: LayerHash | None = None,
+        state_cache: StateCache | None = None,
     ) -> None:
         self._part_list = sort_parts(part_list)
         self._project_info = project_info
+        self._state_cache = state_cache or StateCache()
         self._sm = StateManager(
             project_info=project_info,
             part_list=part_list,
             ignore_outdated=ignore_outdated,
+            state_cache=self._state_cache,
         )
         self._layer_state = LayerStateManager(self._part_list, base_layer_hash)
         self._actions: list[Action] = []
@@ -95,7 +99,9 @@ class Sequencer:
     def reload_state(self) -> None:
         """Reload state from persistent storage."""
         self._sm = StateManager(
-            project_info=self._project_info, part_list=self._part_list
+            project_info=self._project_info,
+            part_list=self._part_list,
+            state_cache=self._state_cache,
         )
 
     def _add_all_actions(
@@ -211,6 +217,11 @@ class Sequencer:
                         outdated_files=outdated_files,
                         outdated_dirs=outdated_dirs,
                     )
+            elif not part.has_overlay:
+                # Stage and prime are updated by migrating only the entries that
+                # changed since the step ran.
+                self._process_dependencies(part, current_step)
+                self._update_step(part, current_step, reason=outdated_report.reason())
             else:
                 self._rerun_step(part, current_step, reason=outdated_report.reason())
 
@@ -29,6 +29,7 @@ import pydantic
 import requests
 from typing_extensions import override
 
+from craft_parts import instrumentation
 from craft_parts.dirs import ProjectDirs
 from craft_parts.utils import os_utils, url_utils
 
@@ -64,6 +65,7 @@ def get_model_config(
         alias_generator=lambda s: s.replace("_", "-"),
         json_schema_extra=json_schema_extra,
         extra="forbid",
+        defer_build=True,
     )
 
 
@@ -258,23 +260,27 @@ class FileSourceHandler(SourceHandler):
 
         # First check if it is a url and download and if not
         # it is probably locally referenced.
-        if is_source_url:
-            source_file = self.download()
-        else:
-            basename = os.path.basename(self.source)  # noqa: PTH119
-            source_file = Path(self.part_src_dir, basename)
-            # We make this copy as the provisioning logic can delete
-            # this file and we don't want that.
-            try:
-                shutil.copy2(self.source, source_file)
-            except FileNotFoundError as err:
-                raise errors.SourceNotFound(self.source) from err
+        with instrumentation.span("download", source=self.source):
+            if is_source_url:
+                source_file = self.download()
+            else:
+                basename = os.path.basename(self.source)  # noqa: PTH119
+                source_file = Path(self.part_src_dir, basename)
+                # We make this copy as the provisioning logic can delete
+                # this file and we don't want that.
+                try:
+                    shutil.copy2(self.source, source_file)
+                except FileNotFoundError as err:
+                    raise errors.SourceNotFound(self.source) from err
 
         # Verify before provisioning
         if self.source_checksum:
             verify_checksum(self.source_checksum, source_file)
 
-        self.provision(self.part_src_dir, src=source_file)
+        size = source_file.stat().st_size
+        with instrumentation.span("extract", source=source_file.name, size=size):
+            self.provision(self.part_src_dir, src=source_file)
+        instrumentation.count("source bytes extracted", size)
 
     def download(self, filepath: Path | None = None) -> Path:
         """Download the URL from a remote location.
@@ -14,12 +14,17 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-"""Cache base and file cache."""
+"""Cache base, file cache and directory tree cache."""
 
+import dataclasses
+import errno
 import logging
+import os
 import shutil
 from pathlib import Path
 
+from craft_parts import instrumentation
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +67,7 @@ class FileCache:
         cached_file_path = self.file_cache / key
         if cached_file_path.is_file():
             logger.debug("Cache hit for key %s", key)
+            instrumentation.count("file cache hits")
             return cached_file_path
 
         return None
@@ -69,3 +75,165 @@ class FileCache:
     def clean(self) -> None:
         """Remove all files from the cache namespace."""
         shutil.rmtree(self.file_cache)
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """Information about an entry stored in a :class:`DirectoryCache`.
+
+    :param key: The key the entry was cached under.
+    :param path: The path to the cached directory tree.
+    :param size: The total size of regular files in the entry, in bytes.
+    :param last_used: The time the entry was last stored or retrieved.
+    """
+
+    key: str
+    path: Path
+    size: int
+    last_used: float
+
+
+class DirectoryCache:
+    """Cache directory trees based on the supplied key.
+
+    Each entry is a directory named after its key. The entry modification time
+    is updated whenever it is retrieved, so entries can be evicted in least
+    recently used order.
+    """
+
+    def __init__(self, cache_dir: Path, *, namespace: str = "trees") -> None:
+        """Create a DirectoryCache under namespace.
+
+        :param str namespace: The namespace for the cache (default is "trees").
+        """
+        self.tree_cache = Path(cache_dir, namespace)
+
+    def cache(self, *, tree: Path, key: str) -> Path | None:
+        """Move a directory tree into the cache, unless the key already exists.
+
+        The tree is renamed into place, so that concurrent readers never see a
+        partially populated entry. If the tree is in a different filesystem it
+        is copied to a temporary location in the cache first.
+
+        :param tree: The path to the directory tree to cache. The tree is moved
+            or removed if it was successfully cached.
+        :param key: The key to cache the tree under. It must be a valid file name.
+
+        :return: The path to the cached tree, or None if the tree was not cached.
+        """
+        cached_tree_path = self.tree_cache / key
+        if cached_tree_path.is_dir():
+            return cached_tree_path
+
+        self.tree_cache.mkdir(parents=True, exist_ok=True)
+
+        try:
+            try:
+                tree.rename(cached_tree_path)
+            except OSError as err:
+                if err.errno != errno.EXDEV:
+                    raise
+                partial_tree_path = self.tree_cache / f".{key}.{os.getpid()}"
+                shutil.copytree(tree, partial_tree_path, symlinks=True)
+                partial_tree_path.rename(cached_tree_path)
+                shutil.rmtree(tree)
+        except OSError:
+            # Another process may have cached the same tree in the meantime.
+            if cached_tree_path.is_dir():
+                return cached_tree_path
+            logger.warning("Unable to cache directory %s.", cached_tree_path)
+            return None
+
+        return cached_tree_path
+
+    def get(self, *, key: str) -> Path | None:
+        """Get the directory tree cached under the given key.
+
+        :param key: The key used to cache the tree.
+
+        :return: The path to the cached tree, or None if the tree is not cached.
+        """
+        cached_tree_path = self.tree_cache / key
+        if not cached_tree_path.is_dir():
+            return None
+
+        logger.debug("Cache hit for key %s", key)
+        instrumentation.count("directory cache hits")
+        try:
+            os.utime(cached_tree_path)
+        except OSError as err:
+            logger.debug("Unable to update access time of %s: %s", key, err)
+        return cached_tree_path
+
+    def entries(self) -> list[CacheEntry]:
+        """Obtain information about all entries in the cache.
+
+        :return: The list of cache entries, least recently used first.
+        """
+        if not self.tree_cache.is_dir():
+            return []
+
+        cache_entries: list[CacheEntry] = []
+        for entry in os.scandir(self.tree_cache):
+            if entry.name.startswith(".") or not entry.is_dir(follow_symlinks=False):
+                continue
+            cache_entries.append(
+                CacheEntry(
+                    key=entry.name,
+                    path=Path(entry.path),
+                    size=_get_tree_size(Path(entry.path)),
+                    last_used=entry.stat(follow_symlinks=False).st_mtime,
+                )
+            )
+
+        return sorted(cache_entries, key=lambda e: e.last_used)
+
+    def size(self) -> int:
+        """Obtain the total size of the entries in the cache.
+
+        :return: The cache size, in bytes.
+        """
+        return sum(entry.size for entry in self.entries())
+
+    def evict(self, *, max_size: int) -> list[str]:
+        """Remove least recently used entries until the cache fits in max_size.
+
+        :param max_size: The maximum cache size, in bytes.
+
+        :return: The keys of the removed entries.
+        """
+        cache_entries = self.entries()
+        total_size = sum(entry.size for entry in cache_entries)
+        evicted: list[str] = []
+
+        for entry in cache_entries:
+            if total_size <= max_size:
+                break
+            logger.debug("Evict cache entry %s (%d bytes)", entry.key, entry.size)
+            shutil.rmtree(entry.path, ignore_errors=True)
+            total_size -= entry.size
+            evicted.append(entry.key)
+
+        logger.debug("Cache size: %d bytes in %s", total_size, self.tree_cache)
+        return evicted
+
+    def clean(self) -> None:
+        """Remove all entries from the cache namespace."""
+        shutil.rmtree(self.tree_cache)
+
+
+def _get_tree_size(path: Path) -> int:
+    """Add the sizes of regular files in a directory tree.
+
+    Files hard-linked more than once inside the tree are only counted once.
+    """
+    seen: set[int] = set()
+    size = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            file_stat = os.lstat(os.path.join(root, file_name))  # noqa: PTH118
+            if file_stat.st_ino in seen:
+                continue
+            seen.add(file_stat.st_ino)
+            size += file_stat.st_size
+    return size
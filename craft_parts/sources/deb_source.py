@@ -55,7 +55,7 @@ class DebSource(FileSourceHandler):
         """Extract deb file contents to the part source dir."""
         deb_file = src if src else self.part_src_dir / os.path.basename(self.source)  # noqa: PTH119
 
-        deb_utils.extract_deb(deb_file, dst, logger.debug)
+        deb_utils.stream_extract_deb(deb_file, dst, logger.debug)
 
         if not keep:
             deb_file.unlink()
@@ -16,10 +16,16 @@
 
 """Implement the git source handler."""
 
+import contextlib
+import fcntl
+import hashlib
 import logging
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -41,6 +47,19 @@ logger = logging.getLogger(__name__)
 
 MAX_COMMIT_LENGTH = 40
 
+# Mirrors already updated in this execution, so that parts using the same
+# repository fetch it only once.
+_UPDATED_MIRRORS: set[Path] = set()
+
+
+def reset_mirror_updates() -> None:
+    """Update git mirrors again the next time they are used.
+
+    Mirrors are updated once per lifecycle execution, this is called when a new
+    execution starts.
+    """
+    _UPDATED_MIRRORS.clear()
+
 
 class GitSourceModel(BaseSourceModel, frozen=True):  # type: ignore[misc]
     """Pydantic model for a git-based source."""
@@ -81,6 +100,10 @@ class GitSource(SourceHandler):
     Retrieve part sources from a git repository. Branch, depth, commit
     and tag can be specified using part properties ``source-branch``,
     ``source-depth``, `source-commit``, ``source-tag``, and ``source-submodules``.
+
+    If mirrors are used, repositories and their submodules are mirrored in the
+    cache directory and parts are cloned from the mirrors, hard-linking their
+    objects. Mirrors are not used for shallow clones.
     """
 
     source_model = GitSourceModel
@@ -171,9 +194,14 @@ class GitSource(SourceHandler):
         self,
         source: str,
         part_src_dir: Path,
+        *,
+        use_mirrors: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(source, part_src_dir, **kwargs)
+        self._use_mirrors = use_mirrors
+        self._outdated_refspec: str | None = None
+        self._updated_files: list[str] = []
 
     def _expand_commit(self, commit: str) -> str:
         """Expand a commit hash to full length."""
@@ -270,6 +298,10 @@ class GitSource(SourceHandler):
 
     def _clone_new(self) -> None:
         """Clone a git repository, using submodules, branch, and depth if defined."""
+        if self._use_mirrors and not self.source_depth:
+            self._clone_from_mirror()
+            return
+
         git_version = self._get_git_version()
 
         # Attempt a shallow fetch for source_commits
@@ -324,6 +356,157 @@ class GitSource(SourceHandler):
             logger.debug("Executing: %s", " ".join([str(i) for i in command]))
             self._run(command)
 
+    def _get_mirror_dir(self, url: str) -> Path:
+        """Return the mirror directory for a repository.
+
+        Mirrors are keyed by the normalized repository URL, so that URLs
+        differing only by a trailing slash or ``.git`` suffix share a mirror.
+
+        :param url: The repository URL.
+        """
+        normalized_url = url.strip().rstrip("/").removesuffix(".git")
+        digest = hashlib.sha256(normalized_url.encode()).hexdigest()[:16]
+        name = re.sub(r"[^\w.-]", "_", normalized_url.rsplit("/", 1)[-1])
+        return Path(self._cache_dir, "git", "mirrors", f"{name}-{digest}.git")
+
+    def _update_mirror(self, url: str) -> Path:
+        """Create or update the mirror of a repository.
+
+        Each mirror is fetched at most once per process.
+
+        :param url: The repository URL.
+
+        :return: The mirror directory.
+        """
+        mirror_dir = self._get_mirror_dir(url)
+        if mirror_dir in _UPDATED_MIRRORS:
+            return mirror_dir
+
+        with _locked(mirror_dir.with_suffix(".lock")):
+            if mirror_dir.is_dir():
+                logger.debug("Updating mirror of %s", url)
+                self._run(
+                    [get_git_command(), "-C", str(mirror_dir), "fetch", "--prune"]
+                )
+            else:
+                logger.debug("Creating mirror of %s", url)
+                temp_dir = Path(
+                    tempfile.mkdtemp(
+                        prefix=f".{mirror_dir.name}.", dir=mirror_dir.parent
+                    )
+                )
+                try:
+                    self._run(
+                        [get_git_command(), "clone", "--mirror", url, str(temp_dir)]
+                    )
+                    temp_dir.rename(mirror_dir)
+                finally:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+
+        _UPDATED_MIRRORS.add(mirror_dir)
+        return mirror_dir
+
+    def _clone_from_mirror(self) -> None:
+        """Clone a git repository from its mirror.
+
+        The clone is a local clone of the mirror, with its origin set to the
+        repository URL afterwards. Submodules are also cloned from mirrors.
+        """
+        url = self._format_source()
+        mirror_dir = self._update_mirror(url)
+
+        command = [
+            get_git_command(),
+            "-c",
+            "advice.detachedHead=false",
+            "clone",
+        ]
+        if self.source_tag or self.source_branch:
+            command.extend(
+                ["--branch", cast(str, self.source_tag or self.source_branch)]
+            )
+        self._run([*command, str(mirror_dir), str(self.part_src_dir)])
+
+        command_prefix = [get_git_command(), "-C", str(self.part_src_dir)]
+        self._run([*command_prefix, "remote", "set-url", "origin", url])
+
+        if self.source_commit:
+            full_commit = self._expand_commit(self.source_commit)
+            self._run([*command_prefix, "checkout", full_commit])
+
+        if self.source_submodules is None or self.source_submodules:
+            self._update_submodules_from_mirrors(
+                self.part_src_dir, self.source_submodules
+            )
+
+    def _update_submodules_from_mirrors(
+        self, repo_dir: Path, submodules: list[str] | None = None
+    ) -> None:
+        """Check out the submodules of a repository, cloning them from mirrors.
+
+        Nested submodules are checked out recursively.
+
+        :param repo_dir: The repository containing the submodules.
+        :param submodules: The paths of the submodules to check out, or None to
+            check out all submodules.
+        """
+        command_prefix = [get_git_command(), "-C", str(repo_dir)]
+        self._run([*command_prefix, "submodule", "init", *(submodules or [])])
+
+        try:
+            urls = self._run_output(
+                [*command_prefix, "config", "--get-regexp", r"^submodule\..*\.url$"]
+            )
+        except errors.PullError:
+            # no submodules were initialized
+            return
+
+        for line in urls.splitlines():
+            key, url = line.split(" ", 1)
+            name = key.removeprefix("submodule.").removesuffix(".url")
+            path = self._run_output(
+                [
+                    *command_prefix,
+                    "config",
+                    "--file",
+                    ".gitmodules",
+                    f"submodule.{name}.path",
+                ]
+            )
+            mirror_dir = self._update_mirror(url)
+
+            # Clone from the mirror, then point the submodule back to its URL.
+            self._run(
+                [*command_prefix, "config", f"submodule.{name}.url", str(mirror_dir)]
+            )
+            self._run(
+                [
+                    get_git_command(),
+                    "-c",
+                    "protocol.file.allow=always",
+                    "-C",
+                    str(repo_dir),
+                    "submodule",
+                    "update",
+                    "--",
+                    path,
+                ]
+            )
+            self._run([*command_prefix, "config", f"submodule.{name}.url", url])
+            self._run(
+                [
+                    get_git_command(),
+                    "-C",
+                    str(repo_dir / path),
+                    "remote",
+                    "set-url",
+                    "origin",
+                    url,
+                ]
+            )
+
+            self._update_submodules_from_mirrors(repo_dir / path)
+
     def _clone_at_commit(self) -> None:
         """Load a repository at a specific commit.
 
@@ -415,6 +598,125 @@ class GitSource(SourceHandler):
             self._clone_new()
         self.source_details = self._get_source_details()
 
+    @override
+    def check_if_outdated(
+        self,
+        target: str,
+        *,
+        ignore_files: list[str] | None = None,
+    ) -> bool:
+        """Check if the tracked remote reference moved since the source was pulled.
+
+        The commit checked out in the part source directory is compared with the
+        commit the remote reference points to, obtained with ``git ls-remote``.
+        Sources pinned to a commit are never outdated. Nothing is fetched, the
+        new commits are only fetched when the source is updated.
+
+        :param target: Path to target file.
+        :param ignore_files: Files excluded from verification (unused).
+
+        :return: Whether the sources are outdated.
+        """
+        self._outdated_refspec = None
+        self._updated_files = []
+
+        if self.source_commit or not Path(target).exists() or not self.is_local():
+            return False
+
+        command_prefix = [get_git_command(), "-C", str(self.part_src_dir)]
+        refspec = self._get_tracked_refspec()
+        try:
+            local_commit = self._run_output([*command_prefix, "rev-parse", "HEAD"])
+            output = self._run_output(
+                [*command_prefix, "ls-remote", "origin", refspec, f"{refspec}^{{}}"]
+            )
+        except errors.PullError:
+            logger.warning("Cannot check if %r is outdated.", self.source)
+            return False
+
+        remote_refs: dict[str, str] = {}
+        for line in output.splitlines():
+            commit, ref = line.split("\t", 1)
+            remote_refs[ref] = commit
+
+        # Annotated tags are also listed peeled to the commit they point to.
+        remote_commit = remote_refs.get(f"{refspec}^{{}}", remote_refs.get(refspec))
+        if not remote_commit or remote_commit == local_commit:
+            return False
+
+        logger.debug("%s moved from %s to %s", refspec, local_commit, remote_commit)
+        self._outdated_refspec = refspec
+        return True
+
+    @override
+    def get_outdated_files(self) -> tuple[list[str], list[str]]:
+        """Obtain lists of outdated files and directories.
+
+        The changed files are only known after the source is updated.
+
+        :return: The lists of files changed by the commits checked out by the
+            last update, and an empty list of directories.
+        """
+        return (sorted(self._updated_files), [])
+
+    @override
+    def update(self) -> None:
+        """Fetch and check out the new commits found by :meth:`check_if_outdated`.
+
+        Only the tracked remote reference is fetched. If the source wasn't
+        checked, the existing repository is pulled instead.
+        """
+        if not self._outdated_refspec:
+            self._pull_existing()
+            self.source_details = self._get_source_details()
+            return
+
+        command_prefix = [get_git_command(), "-C", str(self.part_src_dir)]
+        local_commit = self._run_output([*command_prefix, "rev-parse", "HEAD"])
+        self._run(
+            [
+                *command_prefix,
+                "fetch",
+                "--recurse-submodules=no",
+                "origin",
+                self._outdated_refspec,
+            ]
+        )
+        # The reference may have moved again since it was checked.
+        remote_commit = self._run_output(
+            [*command_prefix, "rev-parse", "FETCH_HEAD^{commit}"]
+        )
+        self._updated_files = self._run_output(
+            [*command_prefix, "diff", "--name-only", local_commit, remote_commit]
+        ).splitlines()
+        self._run([*command_prefix, "reset", "--hard", remote_commit])
+
+        if self.source_submodules is None or self.source_submodules:
+            self._run(
+                [
+                    *command_prefix,
+                    "submodule",
+                    "update",
+                    "--init",
+                    "--recursive",
+                    "--force",
+                    *(self.source_submodules or []),
+                ]
+            )
+        self.source_details = self._get_source_details()
+
+    def _get_tracked_refspec(self) -> str:
+        """Return the remote reference tracked by the source."""
+        if self.source_branch:
+            return f"refs/heads/{self.source_branch}"
+        if self.source_tag:
+            return f"refs/tags/{self.source_tag}"
+
+        current_branch = self._get_current_branch()
+        if current_branch:
+            return f"refs/heads/{current_branch}"
+        return "HEAD"
+
     def _get_source_details(self) -> dict[str, str | None]:
         """Return a dictionary containing current source parameters."""
         tag = self.source_tag
@@ -456,3 +758,18 @@ class GitSource(SourceHandler):
 
 class ShallowFetchError(Exception):
     """A shallow fetch was not possible."""
+
+
+@contextlib.contextmanager
+def _locked(lock_file: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a file, to serialize access between processes.
+
+    :param lock_file: The path to the lock file, created if it doesn't exist.
+    """
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with lock_file.open("w") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
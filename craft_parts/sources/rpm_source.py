@@ -35,6 +35,11 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+_NOCOMPRESSION = "--nocompression"
+
+# Options not supported by the installed rpm2archive.
+_unsupported_options: set[str] = set()
+
 
 class RpmSourceModel(BaseFileSourceModel, frozen=True):  # type: ignore[misc]
     """Pydantic model for an rpm file source."""
@@ -60,19 +65,42 @@ class RpmSource(FileSourceHandler):
         rpm_path = src or self.part_src_dir / os.path.basename(self.source)  # noqa: PTH119
         # NOTE: rpm2archive chosen here because while it's slower, it has broader
         # compatibility than rpm2cpio.
-        # --nocompression parameter excluded until all supported platforms
-        # include rpm >= 4.17
-        command = ["rpm2archive", "-"]
-
-        with rpm_path.open("rb") as rpm:
+        # --nocompression (rpm >= 4.17) makes rpm2archive write the payload it
+        # decompressed as a plain tarball, instead of compressing it again with
+        # gzip to be decompressed in this process.
+        if _NOCOMPRESSION in _unsupported_options:
+            _extract(rpm_path, ["rpm2archive", "-"], dst)
+        else:
             try:
-                with subprocess.Popen(
-                    command, stdin=rpm, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                ) as archive:
-                    with tarfile.open(mode="r|*", fileobj=archive.stdout) as tar:
-                        tar.extractall(path=dst)
-            except (tarfile.TarError, subprocess.CalledProcessError) as err:
-                raise errors.InvalidRpmPackage(rpm_path.name) from err
+                _extract(rpm_path, ["rpm2archive", _NOCOMPRESSION, "-"], dst)
+            except _UnsupportedOptionError:
+                logger.debug("rpm2archive doesn't support %s", _NOCOMPRESSION)
+                _unsupported_options.add(_NOCOMPRESSION)
+                _extract(rpm_path, ["rpm2archive", "-"], dst)
 
         if not keep:
             rpm_path.unlink()
+
+
+class _UnsupportedOptionError(Exception):
+    """rpm2archive doesn't support a command line option."""
+
+
+def _extract(rpm_path: Path, command: list[str], dst: Path) -> None:
+    with rpm_path.open("rb") as rpm:
+        try:
+            with subprocess.Popen(
+                command, stdin=rpm, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            ) as archive:
+                try:
+                    with tarfile.open(mode="r|*", fileobj=archive.stdout) as tar:
+                        tar.extractall(path=dst)
+                except tarfile.ReadError:
+                    # Older versions fail on unknown options without output.
+                    if _NOCOMPRESSION in command and archive.stderr:
+                        stderr = archive.stderr.read()
+                        if _NOCOMPRESSION.encode() in stderr:
+                            raise _UnsupportedOptionError from None
+                    raise
+        except (tarfile.TarError, subprocess.CalledProcessError) as err:
+            raise errors.InvalidRpmPackage(rpm_path.name) from err
@@ -52,7 +52,8 @@ class SevenzipSource(FileSourceHandler):
         sevenzip_file = src or Path(self.part_src_dir, os.path.basename(self.source))  # noqa: PTH119
 
         sevenzip_file = sevenzip_file.expanduser().resolve()
-        self._run_output(["7z", "x", f"-o{dst}", str(sevenzip_file)])
+        # -mmt: decompress using multiple threads where the codec supports it
+        self._run_output(["7z", "x", "-mmt=on", f"-o{dst}", str(sevenzip_file)])
 
         if not keep:
             os.remove(sevenzip_file)  # noqa: PTH107
@@ -16,7 +16,10 @@
 
 """The snap source handler."""
 
+import base64
+import logging
 import os
+import re
 import shutil
 import tempfile
 from pathlib import Path
@@ -34,6 +37,14 @@ from .base import (
     get_json_extra_schema,
     get_model_config,
 )
+from .cache import DirectoryCache
+
+logger = logging.getLogger(__name__)
+
+# Maximum size of the extracted stage snaps cache, in bytes.
+STAGE_SNAPS_CACHE_MAX_SIZE = 20 * 2**30
+
+_SNAP_DIGEST_REGEX = re.compile(r"^snap-sha3-384: (?P<digest>\S+)$", re.MULTILINE)
 
 
 class SnapSourceModel(BaseFileSourceModel, frozen=True):  # type: ignore[misc]
@@ -60,44 +71,111 @@ class SnapSource(FileSourceHandler):
         dst: Path,
         keep: bool = False,
         src: Path | None = None,
+        *,
+        use_cache: bool = False,
     ) -> None:
         """Provision the snap source.
 
         :param dst: The destination directory to provision to.
         :param keep: Whether to keep the snap after provisioning is complete.
         :param src: Force a new source to use for extraction.
+        :param use_cache: Reuse the snap contents extracted in a previous run,
+            and keep the extracted contents for future runs. Files are copied
+            from the cache, so changes to the destination don't affect it.
 
         raises errors.InvalidSnap: If trying to provision an invalid snap.
         """
         snap_file = src if src else self.part_src_dir / os.path.basename(self.source)  # noqa: PTH119
         snap_file = snap_file.resolve()
 
-        # unsquashfs [options] filesystem [directories or files to extract]
-        # options:
-        # -force: if file already exists then overwrite
-        # -dest <pathname>: unsquash to <pathname>
-        with tempfile.TemporaryDirectory(prefix=str(snap_file.parent)) as temp_dir:
-            extract_command: list[str | Path] = [
-                "unsquashfs",
-                "-force",
-                "-dest",
-                temp_dir,
-                snap_file,
-            ]
-            self._run_output(extract_command)
-            snap_name = _get_snap_name(snap_file.name, temp_dir)
-            # Rename meta and snap dirs from the snap
-            rename_paths = (os.path.join(temp_dir, d) for d in ["meta", "snap"])  # noqa: PTH118
-            rename_paths = (d for d in rename_paths if os.path.exists(d))  # noqa: PTH110
-            for rename in rename_paths:
-                shutil.move(rename, f"{rename}.{snap_name}")
+        extract_cache: DirectoryCache | None = None
+        cache_key = ""
+        cached_tree: Path | None = None
+
+        if use_cache:
+            extract_cache = DirectoryCache(self._cache_dir, namespace="stage-snaps")
+            cache_key = get_snap_digest(snap_file)
+            cached_tree = extract_cache.get(key=cache_key)
+
+        if cached_tree is None:
+            with tempfile.TemporaryDirectory(prefix=str(snap_file.parent)) as temp_dir:
+                tree = Path(temp_dir, "snap")
+                self._extract(snap_file, tree)
+                if extract_cache:
+                    cached_tree = extract_cache.cache(tree=tree, key=cache_key)
+                if cached_tree is None:
+                    file_utils.link_or_copy_tree(
+                        source_tree=str(tree), destination_tree=str(dst)
+                    )
+
+        if cached_tree is not None:
+            # Parts may modify their files later (for example, when applying
+            # permissions), so don't share inodes with the cache.
+            logger.debug("Copy extracted snap %s from cache", snap_file.name)
             file_utils.link_or_copy_tree(
-                source_tree=temp_dir, destination_tree=str(dst)
+                source_tree=str(cached_tree),
+                destination_tree=str(dst),
+                copy_function=file_utils.copy,
             )
 
+        # Evict old entries only after the snap contents were provisioned.
+        if extract_cache:
+            evicted = extract_cache.evict(max_size=STAGE_SNAPS_CACHE_MAX_SIZE)
+            if evicted:
+                logger.debug("Evicted %d extracted snaps from cache", len(evicted))
+
         if not keep:
             os.remove(snap_file)  # noqa: PTH107
 
+    def _extract(self, snap_file: Path, tree: Path) -> None:
+        """Extract the snap contents and rename its metadata directories.
+
+        :param snap_file: The snap package file.
+        :param tree: The directory to extract the snap contents to.
+        """
+        # unsquashfs [options] filesystem [directories or files to extract]
+        # options:
+        # -force: if file already exists then overwrite
+        # -processors <number>: use <number> processors to decompress
+        # -dest <pathname>: unsquash to <pathname>
+        extract_command: list[str | Path] = [
+            "unsquashfs",
+            "-force",
+            "-processors",
+            str(os.cpu_count() or 1),
+            "-dest",
+            tree,
+            snap_file,
+        ]
+        self._run_output(extract_command)
+        snap_name = _get_snap_name(snap_file.name, str(tree))
+        # Rename meta and snap dirs from the snap
+        rename_paths = (tree / d for d in ["meta", "snap"])
+        for rename in (d for d in rename_paths if d.exists()):
+            shutil.move(rename, f"{rename}.{snap_name}")
+
+
+def get_snap_digest(snap_file: Path) -> str:
+    """Obtain the SHA3-384 digest of a snap package file.
+
+    The digest is read from the snap revision assertion downloaded alongside
+    the snap if available, otherwise it's computed from the snap file contents.
+    The digest is encoded in the same unpadded URL-safe base64 format used in
+    snap assertions.
+
+    :param snap_file: The snap package file.
+
+    :return: The encoded snap digest.
+    """
+    assert_file = snap_file.with_suffix(".assert")
+    if assert_file.is_file():
+        match = _SNAP_DIGEST_REGEX.search(assert_file.read_text())
+        if match:
+            return match.group("digest")
+
+    digest = file_utils.calculate_hash(snap_file, algorithm="sha3_384")
+    return base64.urlsafe_b64encode(bytes.fromhex(digest)).decode().rstrip("=")
+
 
 def _get_snap_name(snap: str, snap_dir: str) -> str:
     """Obtain the snap name from the snap details file.
@@ -155,12 +155,16 @@ def get_source_handler(
     part: "Part",
     project_dirs: ProjectDirs,
     ignore_patterns: list[str] | None = None,
+    *,
+    use_git_mirrors: bool = False,
 ) -> SourceHandler | None:
     """Return the appropriate handler for the given source.
 
     :param application_name: The name of the application using Craft Parts.
     :param part: The part to get a source handler for.
     :param project_dirs: The project's work directories.
+    :param use_git_mirrors: Whether git sources are cloned from mirrors kept
+        in the cache directory.
     """
     source_handler = None
     if part.spec.source:
@@ -168,6 +172,9 @@ def get_source_handler(
             part.spec.source,
             source_type=part.spec.source_type,
         )
+        handler_options: dict[str, bool] = {}
+        if use_git_mirrors and issubclass(handler_class, GitSource):
+            handler_options["use_mirrors"] = True
         source_handler = handler_class(
             cache_dir=cache_dir,
             source=part.spec.source,
@@ -181,6 +188,7 @@ def get_source_handler(
             source_submodules=part.spec.source_submodules,
             project_dirs=project_dirs,
             ignore_patterns=ignore_patterns,
+            **handler_options,
         )
 
     return source_handler
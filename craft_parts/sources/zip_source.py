@@ -16,8 +16,12 @@
 
 """Implement the zip file source handler."""
 
+import logging
 import os
+import shutil
+import stat
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
@@ -28,6 +32,12 @@ from .base import (
     get_model_config,
 )
 
+logger = logging.getLogger(__name__)
+
+# Archives with fewer files are extracted in the calling thread.
+_MIN_PARALLEL_FILES = 64
+_MAX_WORKERS = 8
+
 
 class ZipSourceModel(BaseFileSourceModel, frozen=True):  # type: ignore[misc]
     """Pydantic model for a zip file source."""
@@ -53,21 +63,149 @@ class ZipSource(FileSourceHandler):
 
         # Workaround for: https://bugs.python.org/issue15795
         with zipfile.ZipFile(zip_file, "r") as zipf:
-            for info in zipf.infolist():
-                extracted_file = zipf.extract(info.filename, path=dst)
-
-                # Extract the mode from the file. Note that external_attr is
-                # a four-byte value, where the high two bytes represent UNIX
-                # permissions and file type bits, and the low two bytes contain
-                # MS-DOS FAT file attributes. Keep the mode to permissions
-                # only-- no sticky bit, uid bit, or gid bit.
-                mode = info.external_attr >> 16 & 0x1FF
-
-                # If the zip file was created on a non-unix system, it's
-                # possible for the mode to end up being zero. That makes it
-                # pretty useless, so ignore it if so.
-                if mode:
-                    os.chmod(extracted_file, mode)  # noqa: PTH101
+            _extract_all(zipf, zip_file, dst)
 
         if not keep:
             os.remove(zip_file)  # noqa: PTH107
+
+
+def _extract_all(zipf: zipfile.ZipFile, zip_file: Path, dst: Path) -> None:
+    """Extract all members of a zip file, applying their modes.
+
+    The directory skeleton is created first, so regular files can be
+    decompressed concurrently using a zip file handle per thread. Symbolic
+    links are created after the files, and directory modes are applied last
+    so read-only directories can be populated.
+
+    :param zipf: The open zip file.
+    :param zip_file: The path to the zip file, to open a handle per thread.
+    :param dst: The directory to extract the zip file contents to.
+    """
+    members = _get_members(zipf, dst)
+
+    dirs: list[tuple[Path, zipfile.ZipInfo]] = []
+    files: list[tuple[Path, zipfile.ZipInfo]] = []
+    links: list[tuple[Path, zipfile.ZipInfo]] = []
+    for target, info in members.items():
+        if info.is_dir():
+            dirs.append((target, info))
+        elif _is_symlink(info):
+            links.append((target, info))
+        else:
+            files.append((target, info))
+
+    for target, _ in dirs:
+        target.mkdir(parents=True, exist_ok=True)
+    for target, _ in [*files, *links]:
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+    workers = min(_MAX_WORKERS, os.cpu_count() or 1, len(files) // _MIN_PARALLEL_FILES)
+    if workers > 1:
+        logger.debug("extract %d files using %d threads", len(files), workers)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="unzip"
+        ) as executor:
+            futures = [
+                executor.submit(_extract_files_from, zip_file, chunk)
+                for chunk in _split_by_size(files, workers)
+            ]
+            for future in futures:
+                future.result()
+    else:
+        _extract_files(zipf, files)
+
+    for target, info in links:
+        _extract_symlink(zipf, info, target, dst)
+
+    # Deepest directories first, so parents are still writable.
+    for target, info in sorted(dirs, key=lambda d: len(d[0].parts), reverse=True):
+        _set_mode(target, info)
+
+
+def _get_members(zipf: zipfile.ZipFile, dst: Path) -> dict[Path, zipfile.ZipInfo]:
+    """Map the extraction path of each member to its information.
+
+    Paths are sanitized the same way as ``ZipFile.extract`` does: absolute
+    paths are made relative, and empty, ``.`` and ``..`` components are
+    dropped. If a path appears more than once, the last member is extracted.
+    """
+    members: dict[Path, zipfile.ZipInfo] = {}
+    for info in zipf.infolist():
+        parts = [p for p in info.filename.split("/") if p not in ("", ".", "..")]
+        if not parts:
+            continue
+        target = dst.joinpath(*parts)
+        members.pop(target, None)
+        members[target] = info
+    return members
+
+
+def _is_symlink(info: zipfile.ZipInfo) -> bool:
+    return stat.S_ISLNK(info.external_attr >> 16)
+
+
+def _split_by_size(
+    files: list[tuple[Path, zipfile.ZipInfo]], count: int
+) -> list[list[tuple[Path, zipfile.ZipInfo]]]:
+    """Split files in chunks with a similar uncompressed size."""
+    chunks: list[list[tuple[Path, zipfile.ZipInfo]]] = [[] for _ in range(count)]
+    sizes = [0] * count
+    for item in sorted(files, key=lambda f: f[1].file_size, reverse=True):
+        smallest = sizes.index(min(sizes))
+        chunks[smallest].append(item)
+        sizes[smallest] += item[1].file_size
+    return chunks
+
+
+def _extract_files_from(
+    zip_file: Path, files: list[tuple[Path, zipfile.ZipInfo]]
+) -> None:
+    # ZipFile handles can't be shared by threads reading members.
+    with zipfile.ZipFile(zip_file, "r") as zipf:
+        _extract_files(zipf, files)
+
+
+def _extract_files(
+    zipf: zipfile.ZipFile, files: list[tuple[Path, zipfile.ZipInfo]]
+) -> None:
+    for target, info in files:
+        with zipf.open(info) as source, target.open("wb") as dest:
+            shutil.copyfileobj(source, dest)
+        _set_mode(target, info)
+
+
+def _extract_symlink(
+    zipf: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path, dst: Path
+) -> None:
+    """Create a symbolic link stored in the zip file.
+
+    Links pointing outside of the extraction directory are extracted as
+    regular files containing the link target.
+    """
+    link = zipf.read(info).decode()
+    resolved = Path(os.path.normpath(target.parent / link))
+    if Path(link).is_absolute() or not resolved.is_relative_to(os.path.normpath(dst)):
+        logger.debug("extract symlink %s to %s as a file", info.filename, link)
+        _extract_files(zipf, [(target, info)])
+        return
+
+    if target.is_dir() and not target.is_symlink():
+        logger.debug("cannot replace directory %s with a symlink", target)
+        return
+
+    target.unlink(missing_ok=True)
+    target.symlink_to(link)
+
+
+def _set_mode(target: Path, info: zipfile.ZipInfo) -> None:
+    # Extract the mode from the file. Note that external_attr is a four-byte
+    # value, where the high two bytes represent UNIX permissions and file type
+    # bits, and the low two bytes contain MS-DOS FAT file attributes. Keep the
+    # mode to permissions only-- no sticky bit, uid bit, or gid bit.
+    mode = info.external_attr >> 16 & 0x1FF
+
+    # If the zip file was created on a non-unix system, it's possible for the
+    # mode to end up being zero. That makes it pretty useless, so ignore it if
+    # so.
+    if mode:
+        target.chmod(mode)
@@ -16,12 +16,14 @@
 
 """Part state management."""
 
+from .state_cache import StateCache
 from .state_manager import StateManager
 from .step_state import MigrationState, StepState, MigrationContents
 
 __all__ = [
     "MigrationContents",
     "MigrationState",
+    "StateCache",
     "StateManager",
     "StepState",
 ]
@@ -0,0 +1,320 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lifecycle-scoped cache of the states stored on disk."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, cast
+
+from craft_parts import instrumentation
+
+from . import states
+from .stage_state import StageState
+from .step_state import MigrationState, StepState
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from pathlib import Path
+
+    from craft_parts.parts import Part
+    from craft_parts.steps import Step
+
+logger = logging.getLogger(__name__)
+
+_Signature = tuple[int, int, int, int]
+
+
+class MigrationIndex:
+    """Reference counts of the entries migrated to a shared directory.
+
+    Each file and directory is counted once for each owner that migrated it.
+    Owners are part names, or None for the entries migrated from the overlay.
+    """
+
+    def __init__(self) -> None:
+        self._contents: dict[str | None, tuple[set[str], set[str]]] = {}
+        self._file_refs: Counter[str] = Counter()
+        self._dir_refs: Counter[str] = Counter()
+
+    @classmethod
+    def from_states(
+        cls,
+        part_states: Mapping[str, MigrationState],
+        *,
+        overlay_migration_state: MigrationState | None = None,
+        partition: str | None = None,
+    ) -> MigrationIndex:
+        """Create an index of the entries migrated to a shared directory.
+
+        :param part_states: A dictionary mapping each part to the part's state
+            for the step corresponding to the shared directory.
+        :param overlay_migration_state: The state of the overlay migration to
+            the step.
+        :param partition: The partition of the shared directory.
+
+        :return: The new index.
+        """
+        index = cls()
+        for part_name, state in part_states.items():
+            contents = state.contents(partition=partition)
+            if contents:
+                index.add(part_name, files=contents[0], dirs=contents[1])
+
+        # The overlay migration state is stored per partition, so its contents
+        # are recorded in the top-level files and directories.
+        if overlay_migration_state:
+            contents = overlay_migration_state.contents(partition=None)
+            if contents:
+                index.add(None, files=contents[0], dirs=contents[1])
+
+        return index
+
+    @classmethod
+    def from_backstage_states(
+        cls, part_states: Mapping[str, StageState]
+    ) -> MigrationIndex:
+        """Create an index of the entries migrated to the backstage directory.
+
+        :param part_states: A dictionary mapping each part to the part's state
+            for the stage step.
+
+        :return: The new index.
+        """
+        index = cls()
+        for part_name, state in part_states.items():
+            index.add(
+                part_name,
+                files=state.backstage_files,
+                dirs=state.backstage_directories,
+            )
+
+        return index
+
+    def add(self, owner: str | None, *, files: set[str], dirs: set[str]) -> None:
+        """Add the entries migrated by an owner, replacing existing ones.
+
+        :param owner: The name of the part that migrated the entries, or None
+            for the entries migrated from the overlay.
+        :param files: The migrated files.
+        :param dirs: The migrated directories.
+        """
+        self.remove(owner)
+        self._contents[owner] = (set(files), set(dirs))
+        self._file_refs.update(files)
+        self._dir_refs.update(dirs)
+
+    def remove(self, owner: str | None) -> None:
+        """Remove the entries migrated by an owner.
+
+        :param owner: The name of the part that migrated the entries, or None
+            for the entries migrated from the overlay.
+        """
+        contents = self._contents.pop(owner, None)
+        if contents:
+            self._file_refs.subtract(contents[0])
+            self._dir_refs.subtract(contents[1])
+
+    def get_exclusive_contents(self, owner: str | None) -> tuple[set[str], set[str]]:
+        """Obtain the entries migrated only by the given owner.
+
+        :param owner: The name of the part that migrated the entries, or None
+            for the entries migrated from the overlay.
+
+        :return: A tuple containing sets of files and directories not migrated
+            by other owners.
+        """
+        files, dirs = self._contents.get(owner, (set(), set()))
+        return (
+            {f for f in files if self._file_refs[f] == 1},
+            {d for d in dirs if self._dir_refs[d] == 1},
+        )
+
+
+class StateCache:
+    """Step and overlay migration states loaded from disk.
+
+    States are parsed once, and reused while their state files are not
+    modified. Indexes of the entries migrated to each shared directory are
+    created once, and updated as states are removed. The cache is shared by
+    the components of the lifecycle manager.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[Path, tuple[_Signature, MigrationState]] = {}
+        self._indexes: dict[
+            tuple[Step, str | None, bool],
+            tuple[dict[Path, _Signature | None], MigrationIndex],
+        ] = {}
+
+    def load_step_state(self, part: Part, step: Step) -> StepState | None:
+        """Retrieve the state for the given part and step.
+
+        :param part: The part corresponding to the state to load.
+        :param step: The step corresponding to the state to load.
+
+        :return: The step state.
+        """
+        state = self._load(
+            states.get_step_state_path(part, step),
+            lambda: states.load_step_state(part, step),
+        )
+        return cast(StepState | None, state)
+
+    def load_part_states(
+        self, step: Step, part_list: list[Part]
+    ) -> dict[str, StepState]:
+        """Return a dictionary of the state of the given step for all given parts.
+
+        :param step: The step whose states should be loaded.
+        :param part_list: The list of parts whose states should be loaded.
+
+        :return: A dictionary mapping part names to its state for the given step.
+        """
+        part_states: dict[str, StepState] = {}
+        for part in part_list:
+            state = self.load_step_state(part, step)
+            if state:
+                part_states[part.name] = state
+        return part_states
+
+    def load_overlay_migration_state(
+        self, state_dir: Path, step: Step
+    ) -> MigrationState | None:
+        """Retrieve the overlay migration state for the given step.
+
+        :param state_dir: The directory containing migration state files.
+        :param step: The step corresponding to the migration state to load.
+
+        :return: The overlay migration state.
+        """
+        return self._load(
+            states.get_overlay_migration_state_path(state_dir, step),
+            lambda: states.load_overlay_migration_state(state_dir, step),
+        )
+
+    def remove(self, part: Part, step: Step) -> None:
+        """Remove the state for the given part and step.
+
+        :param part: The part whose state is to be removed.
+        :param step: The step whose state is to be removed.
+        """
+        states.remove(part, step)
+        self._forget(states.get_step_state_path(part, step), step, owner=part.name)
+
+    def remove_overlay_migration_state(self, state_dir: Path, step: Step) -> None:
+        """Remove the overlay migration state for the given step.
+
+        :param state_dir: The directory containing migration state files.
+        :param step: The step whose migration state is to be removed.
+        """
+        path = states.get_overlay_migration_state_path(state_dir, step)
+        path.unlink(missing_ok=True)
+        self._forget(path, step, owner=None)
+
+    def get_migration_index(
+        self,
+        step: Step,
+        *,
+        part_list: list[Part],
+        partition: str | None = None,
+        overlay_state_dir: Path | None = None,
+        backstage: bool = False,
+    ) -> MigrationIndex:
+        """Obtain the index of the entries migrated to a shared directory.
+
+        :param step: The step corresponding to the shared directory.
+        :param part_list: The list of parts migrating entries to the directory.
+        :param partition: The partition of the shared directory.
+        :param overlay_state_dir: The directory containing the overlay
+            migration state files, if overlay entries are also migrated.
+        :param backstage: Whether the shared directory is the backstage.
+
+        :return: The migration index.
+        """
+        paths = [states.get_step_state_path(p, step) for p in part_list]
+        if overlay_state_dir:
+            paths.append(
+                states.get_overlay_migration_state_path(overlay_state_dir, step)
+            )
+        signatures = {path: _get_signature(path) for path in paths}
+
+        key = (step, partition, backstage)
+        cached = self._indexes.get(key)
+        if cached and cached[0] == signatures:
+            return cached[1]
+
+        logger.debug("index migrated entries for %s (partition %s)", step, partition)
+        part_states = self.load_part_states(step, part_list)
+        if backstage:
+            index = MigrationIndex.from_backstage_states(
+                cast(dict[str, StageState], part_states)
+            )
+        else:
+            overlay_migration_state = None
+            if overlay_state_dir:
+                overlay_migration_state = self.load_overlay_migration_state(
+                    overlay_state_dir, step
+                )
+            index = MigrationIndex.from_states(
+                part_states,
+                overlay_migration_state=overlay_migration_state,
+                partition=partition,
+            )
+
+        self._indexes[key] = (signatures, index)
+        return index
+
+    def _load(
+        self, path: Path, loader: Callable[[], MigrationState | None]
+    ) -> MigrationState | None:
+        signature = _get_signature(path)
+        if signature is None:
+            self._states.pop(path, None)
+            return None
+
+        cached = self._states.get(path)
+        if cached and cached[0] == signature:
+            instrumentation.count("state cache hits")
+            return cached[1]
+
+        state = loader()
+        if state:
+            self._states[path] = (signature, state)
+        return state
+
+    def _forget(self, path: Path, step: Step, *, owner: str | None) -> None:
+        """Drop a removed state from the cache and from the step indexes."""
+        self._states.pop(path, None)
+        for (index_step, _, _), (signatures, index) in self._indexes.items():
+            if index_step == step and path in signatures:
+                index.remove(owner)
+                signatures[path] = None
+
+
+def _get_signature(path: Path) -> _Signature | None:
+    """Return the inode, change times and size of a state file, if it exists.
+
+    The inode and status change time detect files replaced or rewritten while
+    keeping their modification time and size.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        stat = path.stat()
+        return stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size
+    return None
@@ -30,7 +30,8 @@ from craft_parts.infos import ProjectInfo, ProjectOptions, ProjectVarInfo
 from craft_parts.steps import Step
 
 from .reports import Dependency, DirtyReport, OutdatedReport
-from .states import PullState, StepState, get_step_state_path, load_step_state
+from .state_cache import StateCache
+from .states import PullState, StepState, get_step_state_path
 
 if TYPE_CHECKING:
     from craft_parts.parts import Part
@@ -171,6 +172,7 @@ class StateManager:
     :param part_list: A list of this project's parts.
     :param ignore_outdated: A list of file patterns to ignore when testing for
         outdated files.
+    :param state_cache: The cache to load states from.
     """
 
     def __init__(
@@ -179,6 +181,7 @@ class StateManager:
         project_info: ProjectInfo,
         part_list: list[Part],
         ignore_outdated: list[str] | None = None,
+        state_cache: StateCache | None = None,
     ) -> None:
         self._state_db = _StateDB()
         self._project_info = project_info
@@ -188,9 +191,10 @@ class StateManager:
         self._dirty_report_cache: dict[tuple[str, Step], DirtyReport | None] = {}
 
         part_step_list = _sort_steps_by_state_timestamp(part_list)
+        state_cache = state_cache or StateCache()
 
         for part, step, _ in part_step_list:
-            state = load_step_state(part, step)
+            state = state_cache.load_step_state(part, step)
             if state:
                 self.set_state(part, step, state=state)
 
@@ -313,6 +317,7 @@ class StateManager:
                     part=part,
                     project_dirs=self._project_info.dirs,
                     ignore_patterns=self._ignore_outdated,
+                    use_git_mirrors=self._project_info.use_git_mirrors,
                 )
                 self._source_handler_cache[part.name] = source_handler
 
@@ -25,6 +25,7 @@ import yaml
 from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import override
 
+from craft_parts import instrumentation
 from craft_parts.infos import ProjectOptions
 from craft_parts.utils import os_utils
 
@@ -68,6 +69,7 @@ class MigrationState(BaseModel):
         """
         return self.model_dump(by_alias=True)
 
+    @instrumentation.timed("state write")
     def write(self, filepath: Path) -> None:
         """Write state data to disk.
 
@@ -16,12 +16,44 @@
 
 """deb-related utilities used by both `packages` and `sources`."""
 
+import contextlib
+import os
+import shutil
 import subprocess
+import tarfile
+import tempfile
+import threading
 from collections.abc import Callable
 from pathlib import Path
+from typing import IO, cast
 
 from craft_parts import errors
-from craft_parts.utils import os_utils
+from craft_parts.utils import file_utils, os_utils
+
+_AR_MAGIC = b"!<arch>\n"
+_AR_HEADER_SIZE = 60
+_DATA_MEMBER_PREFIX = "data.tar"
+
+# Data archive compressions decompressed in-process, and their tarfile modes.
+_TAR_STREAM_MODES = {
+    "": "r|",
+    ".gz": "r|gz",
+    ".bz2": "r|bz2",
+    ".xz": "r|xz",
+    ".lzma": "r|xz",
+}
+
+# Data archive compressions decompressed by a multi-threaded tool, if available.
+_DECOMPRESSORS = {
+    ".xz": ["xz", "--decompress", "--stdout", "--threads=0"],
+    ".zst": ["zstd", "--decompress", "--stdout", "--quiet", "-T0"],
+}
+
+_BUFFER_SIZE = 1024 * 1024
+
+
+class _StreamError(Exception):
+    """The data archive can't be extracted from the deb file stream."""
 
 
 def extract_deb(
@@ -36,3 +68,162 @@ def extract_deb(
         )
     except subprocess.CalledProcessError as err:
         raise errors.DebError(deb_path, command, err.returncode) from err
+
+
+def stream_extract_deb(
+    deb_path: Path, extract_dir: Path, log_func: Callable[[str], None]
+) -> None:
+    """Extract file `deb_path` into `extract_dir` reading its data archive.
+
+    The data archive member is streamed from the deb file to the extraction,
+    without intermediate files. Archives compressed with xz or zstd are
+    decompressed by the multi-threaded ``xz`` and ``zstd`` tools if they are
+    available. Files are extracted into a temporary directory and moved to
+    `extract_dir` once the whole archive is extracted. If the deb file can't
+    be streamed, it's extracted using ``dpkg-deb``.
+    """
+    extract_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with tempfile.TemporaryDirectory(
+            prefix=".deb-", dir=extract_dir.parent
+        ) as temp_dir:
+            _stream_extract(deb_path, Path(temp_dir))
+            _merge_tree(Path(temp_dir), extract_dir)
+    except (_StreamError, tarfile.TarError, EOFError) as err:
+        log_func(f"Cannot stream {deb_path.name}: {err}")
+        extract_deb(deb_path, extract_dir, log_func)
+
+
+def _stream_extract(deb_path: Path, extract_dir: Path) -> None:
+    """Extract the data archive of `deb_path` into an empty `extract_dir`."""
+    # Extraction filters are available in Python 3.10.12 and later.
+    if not hasattr(tarfile, "tar_filter"):
+        raise _StreamError("tarfile extraction filters are not supported")
+
+    with deb_path.open("rb") as deb:
+        name, size = _find_data_member(deb)
+        compression = name[len(_DATA_MEMBER_PREFIX) :]
+        decompressor = _DECOMPRESSORS.get(compression)
+        if decompressor and shutil.which(decompressor[0]):
+            _extract_decompressed(_MemberReader(deb, size), decompressor, extract_dir)
+        elif compression in _TAR_STREAM_MODES:
+            reader = _MemberReader(deb, size)
+            with tarfile.open(
+                mode=_TAR_STREAM_MODES[compression], fileobj=reader
+            ) as tar:
+                tar.extractall(path=extract_dir, filter=_filter_member)
+        else:
+            raise _StreamError(f"unsupported data archive {name!r}")
+
+
+def _filter_member(member: tarfile.TarInfo, dest_path: str) -> tarfile.TarInfo:
+    """Validate a data archive member before it's extracted.
+
+    The ``tar`` extraction filter keeps members inside the destination, but
+    allows the absolute symbolic links used in packages. Hard links must also
+    point inside the destination. File modes are kept as in the package.
+    """
+    if member.islnk():
+        dest_path = os.path.realpath(dest_path)
+        target = os.path.realpath(
+            os.path.join(dest_path, member.linkname)  # noqa: PTH118
+        )
+        if os.path.commonpath([target, dest_path]) != dest_path:
+            raise tarfile.LinkOutsideDestinationError(member, target)
+
+    return tarfile.tar_filter(member, dest_path).replace(mode=member.mode, deep=False)
+
+
+def _merge_tree(source: Path, destination: Path) -> None:
+    """Hard-link the contents of `source` into the existing `destination`."""
+    for entry in source.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            file_utils.link_or_copy_tree(str(entry), str(destination / entry.name))
+        else:
+            file_utils.link_or_copy(str(entry), str(destination / entry.name))
+
+
+def _find_data_member(deb: IO[bytes]) -> tuple[str, int]:
+    """Position the deb file at the start of the data archive member.
+
+    :return: The name and size of the data archive member.
+    """
+    if deb.read(len(_AR_MAGIC)) != _AR_MAGIC:
+        raise _StreamError("not an ar archive")
+
+    while header := deb.read(_AR_HEADER_SIZE):
+        if len(header) != _AR_HEADER_SIZE or header[58:60] != b"`\n":
+            raise _StreamError("invalid ar member header")
+
+        # GNU ar terminates member names with a slash.
+        name = header[0:16].decode("ascii", errors="replace").rstrip().rstrip("/")
+        try:
+            size = int(header[48:58])
+        except ValueError as err:
+            raise _StreamError("invalid ar member size") from err
+
+        if name.startswith(_DATA_MEMBER_PREFIX):
+            return name, size
+
+        # Members are aligned to even offsets.
+        deb.seek(size + size % 2, 1)
+
+    raise _StreamError("data archive not found")
+
+
+class _MemberReader:
+    """Read an ar member from the deb file, up to the member size."""
+
+    def __init__(self, deb: IO[bytes], size: int) -> None:
+        self._deb = deb
+        self._remaining = size
+
+    def read(self, size: int = -1) -> bytes:
+        """Read at most size bytes, or the rest of the member."""
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._deb.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+def _extract_decompressed(
+    reader: _MemberReader, decompressor: list[str], extract_dir: Path
+) -> None:
+    """Pipe the data archive through a decompressor and extract its output."""
+    with subprocess.Popen(
+        decompressor,
+        bufsize=0,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as proc:
+        stdin = cast(IO[bytes], proc.stdin)
+        stdout = cast(IO[bytes], proc.stdout)
+
+        # Feed the decompressor from a thread while its output is extracted.
+        feeder = threading.Thread(
+            target=_feed, args=(reader, stdin), name="deb-feed", daemon=True
+        )
+        feeder.start()
+        try:
+            with tarfile.open(mode="r|", fileobj=stdout) as tar:
+                tar.extractall(path=extract_dir, filter=_filter_member)
+            # Drain the archive padding so the decompressor can finish.
+            while stdout.read(_BUFFER_SIZE):
+                pass
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            feeder.join()
+
+    if proc.returncode:
+        raise _StreamError(f"{decompressor[0]} exited with code {proc.returncode}")
+
+
+def _feed(reader: _MemberReader, stdin: IO[bytes]) -> None:
+    with contextlib.suppress(BrokenPipeError):
+        while data := reader.read(_BUFFER_SIZE):
+            stdin.write(data)
+        stdin.close()
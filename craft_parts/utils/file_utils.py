@@ -27,7 +27,7 @@ import sys
 from collections.abc import Callable, Generator
 from pathlib import Path
 
-from craft_parts import errors
+from craft_parts import errors, instrumentation
 from craft_parts.permissions import Permissions, apply_permissions
 
 logger = logging.getLogger(__name__)
@@ -65,7 +65,18 @@ class NonBlockingRWFifo:
 
         :param data: The data to write.
         """
-        return os.write(self._fd, data.encode(sys.getfilesystemencoding()))
+        return self.write_bytes(data.encode(sys.getfilesystemencoding()))
+
+    def write_bytes(self, data: bytes) -> int:
+        """Write raw data to the FIFO.
+
+        :param data: The data to write.
+        """
+        return os.write(self._fd, data)
+
+    def fileno(self) -> int:
+        """Return the FIFO file descriptor."""
+        return self._fd
 
     def close(self) -> None:
         """Close the FIFO."""
@@ -143,6 +154,8 @@ def link(source: str, destination: str, *, follow_symlinks: bool = False) -> Non
     except FileNotFoundError as err:
         raise errors.CopyFileNotFound(source) from err
 
+    instrumentation.count("files linked")
+
 
 def copy(
     source: str,
@@ -174,11 +187,18 @@ def copy(
     except FileNotFoundError as err:
         raise errors.CopyFileNotFound(source) from err
 
-    uid = os.stat(source, follow_symlinks=follow_symlinks).st_uid  # noqa: PTH116
-    gid = os.stat(source, follow_symlinks=follow_symlinks).st_gid  # noqa: PTH116
+    source_stat = os.stat(source, follow_symlinks=follow_symlinks)  # noqa: PTH116
+    instrumentation.count("files copied")
+    if stat.S_ISREG(source_stat.st_mode):
+        instrumentation.count("bytes copied", source_stat.st_size)
 
     try:
-        os.chown(destination, uid, gid, follow_symlinks=follow_symlinks)
+        os.chown(
+            destination,
+            source_stat.st_uid,
+            source_stat.st_gid,
+            follow_symlinks=follow_symlinks,
+        )
     except PermissionError as err:
         logger.debug("Unable to chown %s: %s", destination, err)
 
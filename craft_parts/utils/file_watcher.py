@@ -0,0 +1,322 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Detection of changes to files and directory trees."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import stat
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks, see inotify(7).
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+_READ_SIZE = 64 * 1024
+
+_Signature = tuple[int, int, int]
+
+
+class FileWatcher:
+    """Report the files created, modified or removed in the watched paths.
+
+    Directories are watched recursively. Changes are detected using inotify
+    where available, otherwise by periodically comparing the modification
+    time and size of the watched entries.
+
+    :param paths: The files and directory trees to watch.
+    :param exclude: The directories whose changes are ignored.
+    :param poll_interval: The interval between checks when inotify is not
+        available, in seconds.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        *,
+        exclude: Iterable[Path] = (),
+        poll_interval: float = 1.0,
+    ) -> None:
+        self._paths = {p.resolve() for p in paths}
+        self._exclude = {p.resolve() for p in exclude}
+        self._backend: _InotifyBackend | _PollingBackend
+        try:
+            self._backend = _InotifyBackend(self._paths, self._exclude)
+        except OSError as err:
+            logger.debug("inotify not available, polling for changes: %s", err)
+            self._backend = _PollingBackend(self._paths, self._exclude, poll_interval)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Wait until watched entries change.
+
+        :param timeout: The maximum time to wait, in seconds, or None to wait
+            until a change happens.
+
+        :return: The changed paths, or an empty set if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            changes = {p for p in self._backend.read(remaining) if self.is_watched(p)}
+            if changes:
+                return changes
+
+    def close(self) -> None:
+        """Stop watching for changes."""
+        self._backend.close()
+
+    def is_watched(self, path: Path) -> bool:
+        """Whether changes to the given path are reported.
+
+        :param path: The absolute path to verify.
+        """
+        if _is_excluded(path, self._exclude):
+            return False
+        return any(path.is_relative_to(watched) for watched in self._paths)
+
+
+class _InotifyBackend:
+    """Detect changes using inotify watches on each watched directory.
+
+    Files are watched through their parent directory, so changes are also
+    detected when editors replace a file instead of modifying it.
+    """
+
+    def __init__(self, paths: set[Path], exclude: set[Path]) -> None:
+        if sys.platform != "linux":
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+
+        self._paths = paths
+        self._trees = {p for p in paths if p.is_dir()}
+        self._exclude = exclude
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self._dirs: dict[int, Path] = {}
+        try:
+            for path in paths - self._trees:
+                self._add_watch(path.parent)
+            for tree in self._trees:
+                for directory in _walk_dirs(tree, exclude):
+                    self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Wait for inotify events and return the changed paths."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changes: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            changes |= self._parse(data)
+        return changes
+
+    def close(self) -> None:
+        """Release the inotify instance."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _parse(self, data: bytes) -> set[Path]:
+        changes: set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost, consider everything changed.
+                logger.debug("inotify event queue overflow")
+                changes |= self._paths
+                continue
+
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+
+            if mask & _IN_IGNORED:
+                del self._dirs[wd]
+                continue
+
+            path = directory / os.fsdecode(name) if name else directory
+            changes.add(path)
+
+            # Watch directories created or moved into a watched tree.
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                changes |= self._watch_new_tree(path)
+
+        return changes
+
+    def _watch_new_tree(self, root: Path) -> set[Path]:
+        in_tree = any(root.is_relative_to(tree) for tree in self._trees)
+        if not in_tree or _is_excluded(root, self._exclude):
+            return set()
+
+        # Entries created before the watch was added don't generate events.
+        changes: set[Path] = set()
+        for directory in _walk_dirs(root, self._exclude):
+            changes |= self._watch_new_dir(directory)
+        return changes
+
+    def _watch_new_dir(self, directory: Path) -> set[Path]:
+        try:
+            self._add_watch(directory)
+            return set(directory.iterdir())
+        except OSError as err:
+            logger.warning("Cannot watch %s for changes: %s", directory, err)
+            return set()
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(directory))
+        self._dirs[wd] = directory
+
+
+class _PollingBackend:
+    """Detect changes comparing snapshots of the watched entries."""
+
+    def __init__(
+        self, paths: set[Path], exclude: set[Path], poll_interval: float
+    ) -> None:
+        self._paths = paths
+        self._exclude = exclude
+        self._poll_interval = poll_interval
+        self._snapshot = self._take_snapshot()
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Wait for the next check and return the changed paths."""
+        delay = self._poll_interval
+        if timeout is not None:
+            delay = min(delay, timeout)
+        time.sleep(delay)
+
+        snapshot = self._take_snapshot()
+        changes = {
+            path
+            for path in self._snapshot.keys() | snapshot.keys()
+            if self._snapshot.get(path) != snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changes
+
+    def close(self) -> None:
+        """Release the snapshot."""
+        self._snapshot.clear()
+
+    def _take_snapshot(self) -> dict[Path, _Signature]:
+        snapshot: dict[Path, _Signature] = {}
+        for path in self._paths:
+            if not path.is_dir():
+                _add_signature(snapshot, path)
+                continue
+            for directory in _walk_dirs(path, self._exclude):
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        _add_signature(snapshot, Path(entry.path))
+        return snapshot
+
+
+def _is_excluded(path: Path, exclude: set[Path]) -> bool:
+    return any(path.is_relative_to(excluded) for excluded in exclude)
+
+
+def _walk_dirs(root: Path, exclude: set[Path]) -> Iterator[Path]:
+    """Yield the directories in a tree, skipping excluded subtrees."""
+    for dirpath, dirnames, _ in os.walk(root):
+        directory = Path(dirpath)
+        if _is_excluded(directory, exclude):
+            dirnames.clear()
+            continue
+        yield directory
+
+
+def _add_signature(snapshot: dict[Path, _Signature], path: Path) -> None:
+    try:
+        path_stat = path.lstat()
+    except FileNotFoundError:
+        return
+    # Directory entries are tracked individually, only detect replacements.
+    if stat.S_ISDIR(path_stat.st_mode):
+        snapshot[path] = (0, 0, path_stat.st_ino)
+    else:
+        snapshot[path] = (path_stat.st_mtime_ns, path_stat.st_size, path_stat.st_ino)
@@ -16,11 +16,16 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import hashlib
+import json
 import logging
 import os
+import time
 from dataclasses import dataclass
-from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
 from lxml import etree
@@ -460,6 +465,165 @@ def _find_or_create_ele(element: Element, tag: str, namespaces: Namespaces) -> E
     return result
 
 
+_ARTIFACT_INDEX_VERSION = 1
+
+# Directories modified less than this many nanoseconds before they are scanned
+# are listed again in the next refresh, since files could still be added to them
+# without changing their modification time.
+_ARTIFACT_INDEX_RACY_WINDOW = 2 * 10**9
+
+
+class _ArtifactIndex:
+    """A persistent index of the artifacts in a Maven repository directory.
+
+    The index records the modification time of each directory in the repository,
+    along with its subdirectories and the artifacts described by its POM files.
+    When refreshed, only directories with a different modification time are listed
+    again, and only new or modified POM files in them are parsed.
+
+    :param repository: The Maven repository directory.
+    :param index_file: The file to persist the index to.
+    """
+
+    def __init__(self, repository: Path, index_file: Path) -> None:
+        self._repository = repository
+        self._index_file = index_file
+        self._directories: dict[str, dict[str, Any]] = {}
+        self._changed = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self._index_file.read_text())
+        except (OSError, ValueError):
+            return
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _ARTIFACT_INDEX_VERSION
+            or data.get("repository") != str(self._repository)
+        ):
+            logger.debug("Ignoring outdated Maven artifact index %s", self._index_file)
+            return
+
+        self._directories = data.get("directories", {})
+
+    def save(self) -> None:
+        """Write the index to disk if it changed since it was loaded."""
+        if not self._changed:
+            return
+
+        data = {
+            "version": _ARTIFACT_INDEX_VERSION,
+            "repository": str(self._repository),
+            "directories": self._directories,
+        }
+        self._index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self._index_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(data))
+        tmp_file.replace(self._index_file)
+        self._changed = False
+
+    def refresh(self) -> None:
+        """Update the index with the current contents of the repository."""
+        directories: dict[str, dict[str, Any]] = {}
+        pending = ["."]
+        while pending:
+            relpath = pending.pop()
+            try:
+                mtime = (self._repository / relpath).stat().st_mtime_ns
+            except OSError:
+                continue
+
+            entry = self._directories.get(relpath)
+            if entry is None or entry["mtime"] != mtime:
+                entry = self._scan_directory(relpath, mtime, entry)
+                self._changed = True
+
+            directories[relpath] = entry
+            pending.extend(
+                str(PurePosixPath(relpath, name)) for name in entry["subdirs"]
+            )
+
+        if directories.keys() != self._directories.keys():
+            self._changed = True
+        self._directories = directories
+
+    def _scan_directory(
+        self, relpath: str, mtime: int, previous: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """List a directory, parsing the POM files not found in the previous entry."""
+        previous_poms: dict[str, Any] = previous["poms"] if previous else {}
+        subdirs: list[str] = []
+        poms: dict[str, Any] = {}
+
+        with os.scandir(self._repository / relpath) as entries:
+            for dir_entry in entries:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    subdirs.append(dir_entry.name)
+                    continue
+                if not dir_entry.name.endswith(".pom"):
+                    continue
+
+                try:
+                    pom_mtime = dir_entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+                pom = previous_poms.get(dir_entry.name)
+                if pom is None or pom["mtime"] != pom_mtime:
+                    art = MavenArtifact.from_pom(Path(dir_entry.path))
+                    pom = {
+                        "mtime": pom_mtime,
+                        "artifact": [
+                            art.group_id,
+                            art.artifact_id,
+                            art.version,
+                            art.packaging_type,
+                        ],
+                    }
+                poms[dir_entry.name] = pom
+
+        if time.time_ns() - mtime < _ARTIFACT_INDEX_RACY_WINDOW:
+            mtime = -1
+
+        return {"mtime": mtime, "subdirs": sorted(subdirs), "poms": poms}
+
+    def get_artifacts(self) -> list[MavenArtifact]:
+        """Get the artifacts of all POM files in the repository."""
+        return [
+            MavenArtifact(*pom["artifact"])
+            for entry in self._directories.values()
+            for pom in entry["poms"].values()
+        ]
+
+
+# Indexes already loaded in this process, shared by all parts.
+_ARTIFACT_INDEXES: dict[Path, _ArtifactIndex] = {}
+
+
+def _get_artifact_index(repository: Path, cache_dir: Path) -> _ArtifactIndex:
+    """Get the up-to-date artifact index for a Maven repository directory.
+
+    :param repository: The Maven repository directory.
+    :param cache_dir: The directory to persist artifact indexes in.
+    """
+    index = _ARTIFACT_INDEXES.get(repository)
+    if index is None:
+        digest = hashlib.sha256(str(repository).encode()).hexdigest()[:16]
+        index_file = cache_dir / "maven" / "index" / f"{digest}.json"
+        index = _ArtifactIndex(repository, index_file)
+        _ARTIFACT_INDEXES[repository] = index
+
+    index.refresh()
+    try:
+        index.save()
+    except OSError as err:
+        logger.debug("Cannot save Maven artifact index: %s", err)
+
+    return index
+
+
 def _get_existing_artifacts(part_info: PartInfo) -> GroupDict:
     result: GroupDict = GroupDict()
 
@@ -470,13 +634,19 @@ def _get_existing_artifacts(part_info: PartInfo) -> GroupDict:
     for loc in search_locations:
         if not loc.is_dir():
             continue
-        for pom in loc.glob("**/*.pom"):
-            art = MavenArtifact.from_pom(pom)
+        index = _get_artifact_index(loc.resolve(), part_info.cache_dir)
+        for art in index.get_artifacts():
             _insert_into_existing(result, art)
 
     return result
 
 
+@functools.cache
+def _parse_version(version: str) -> Version:
+    """Parse a semantic version, reusing the result for repeated versions."""
+    return Version.parse(version)
+
+
 class _Versions:
     """Convenience type for versions available on-disk."""
 
@@ -498,12 +668,13 @@ class _Versions:
             if art.version is None:
                 continue
             try:
-                available.add(Version.parse(art.version))
+                available.add(_parse_version(art.version))
             except ValueError:
                 fallbacks.add(art.version)
 
         self.semvers = available
         self.fallbacks = fallbacks
+        self._sorted_semvers = sorted(available)
 
     def nearest_to(self, target: str) -> str:
         """Calculate the nearest available version to `target`.
@@ -522,7 +693,7 @@ class _Versions:
         # If this succeeds, the target is a semantic version. If not, we can't understand the target
         # beyond equality, so just do our best.
         try:
-            parsed_target = Version.parse(target)
+            parsed_target = _parse_version(target)
         except ValueError:
             logger.debug("Requested version was not a semantic version.")
 
@@ -549,17 +720,15 @@ class _Versions:
             logger.debug("Exact match was found.")
             return target
 
-        # Sort the available versions into those that are newer than the target
-        semvers_newer = {ver for ver in self.semvers if ver > parsed_target}
-
-        if semvers_newer:
+        # Find the oldest version that is newer than the target
+        newer_index = bisect.bisect_right(self._sorted_semvers, parsed_target)
+        if newer_index < len(self._sorted_semvers):
             logger.debug("Using the closest newer version.")
-            return str(min(semvers_newer))
+            return str(self._sorted_semvers[newer_index])
 
         # What remains must then be older than the target
-        semvers_older = self.semvers - semvers_newer
         logger.debug("Using the closest older version.")
-        return str(max(semvers_older))
+        return str(max(self.semvers))
 
     def max(self) -> str:
         """Get the latest version on-disk."""
@@ -715,7 +884,8 @@ def _get_poms(
         raise MavenXMLError("'pom.xml' does not exist")
     poms.append(base_pom)
 
-    _recurse_submodules(part_info, base_pom, poms, existing)
+    project = etree.parse(base_pom, parser=_XML_PARSER).getroot()
+    _recurse_submodules(part_info, base_pom, project, poms, existing)
 
     logger.debug(
         "Discovered poms for part '%s': [%s]",
@@ -729,11 +899,16 @@ def _get_poms(
 
 
 def _recurse_submodules(
-    part_info: PartInfo, parent_pom: Path, all_poms: list[Path], existing: GroupDict
+    part_info: PartInfo,
+    parent_pom: Path,
+    project: Element,
+    all_poms: list[Path],
+    existing: GroupDict,
 ) -> None:
-    """Recursively find submodule poms and add them to the existing artifacts."""
-    tree = etree.parse(parent_pom, parser=_XML_PARSER)
-    project = tree.getroot()
+    """Recursively find submodule poms and add them to the existing artifacts.
+
+    Each submodule pom is parsed only once.
+    """
     namespaces = _get_namespaces(project)
 
     # Check if there are any modules and end recursion early if not
@@ -760,11 +935,14 @@ def _recurse_submodules(
         all_poms.append(pom_path)
 
         # - Add it to the list of existing artifacts
-        art = MavenArtifact.from_pom(pom_path)
+        module_project = etree.parse(pom_path, parser=_XML_PARSER).getroot()
+        art = MavenArtifact.from_element(
+            module_project, _get_namespaces(module_project)
+        )
         _insert_into_existing(existing, art)
 
         # - Recurse on its pom.xml for more submodules
-        _recurse_submodules(part_info, pom_path, all_poms, existing)
+        _recurse_submodules(part_info, pom_path, module_project, all_poms, existing)
 
 
 def _insert_into_existing(existing: GroupDict, art: MavenArtifact) -> None:
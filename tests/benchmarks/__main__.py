@@ -0,0 +1,140 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Run the lifecycle benchmarks and compare results against a baseline."""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from . import suite
+
+
+def main() -> int:
+    """Run the benchmark suite.
+
+    :return: The exit status, 1 if regressions are found.
+    """
+    options = _parse_arguments()
+    logging.basicConfig(level=logging.ERROR)
+
+    scenarios = [
+        s.scaled(options.scale)
+        for s in suite.SCENARIOS
+        if not options.scenario or s.name in options.scenario
+    ]
+
+    scenario_results = {}
+    for scenario in scenarios:
+        print(f"Running scenario {scenario.name}...", file=sys.stderr)
+        with tempfile.TemporaryDirectory(
+            prefix=f"benchmark-{scenario.name}-", dir=options.work_dir
+        ) as work_dir:
+            scenario_results[scenario.name] = suite.run_scenario(
+                scenario, Path(work_dir), repeats=options.repeats
+            )
+
+    results = suite.get_results(scenario_results)
+    print(suite.format_results(results))
+
+    if options.output:
+        options.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {options.output}.", file=sys.stderr)
+
+    if not options.baseline:
+        return 0
+
+    baseline = json.loads(options.baseline.read_text())
+    comparisons = suite.compare(results, baseline)
+    print()
+    print(
+        suite.format_comparisons(
+            comparisons, threshold=options.threshold, min_delta=options.min_delta
+        )
+    )
+
+    regressions = [
+        c
+        for c in comparisons
+        if c.is_regression(threshold=options.threshold, min_delta=options.min_delta)
+    ]
+    if regressions:
+        print(f"{len(regressions)} operations regressed.", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks", description=__doc__
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[s.name for s in suite.SCENARIOS],
+        help="Run only the given scenario, can be used multiple times.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply the number of parts and files of each scenario.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="The number of times each operation is timed.",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="The directory to create projects in, defaults to a temporary one.",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        metavar="filename",
+        help="Write the results to the given JSON file.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="filename",
+        help="Compare the results against a previous results file.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="The slowdown relative to the baseline reported as a regression.",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.005,
+        help="Slowdowns shorter than this, in seconds, are not regressions.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Generation of synthetic projects."""
+
+import dataclasses
+import enum
+from pathlib import Path
+from typing import Any
+
+# The partitions used by projects with partitions enabled.
+PARTITIONS = ["default", "extra"]
+
+# The number of files stored in each directory of a part source.
+_FILES_PER_DIR = 50
+
+# The number of parts in each layer of a layered dependency graph.
+_LAYER_SIZE = 8
+
+
+class Shape(enum.Enum):
+    """The shape of the dependency graph between parts.
+
+    :cvar FLAT: Parts don't depend on each other.
+    :cvar CHAIN: Each part depends on the previous one.
+    :cvar TREE: Parts form a binary tree, each part depends on its parent.
+    :cvar LAYERED: Parts are grouped in layers of up to 8 parts, each part
+        depends on all parts of the previous layer.
+    """
+
+    FLAT = "flat"
+    CHAIN = "chain"
+    TREE = "tree"
+    LAYERED = "layered"
+
+
+@dataclasses.dataclass(frozen=True)
+class ProjectSpec:
+    """The parameters of a synthetic project.
+
+    :param parts: The number of parts.
+    :param files: The number of files in each part.
+    :param shape: The shape of the dependency graph between parts.
+    :param overlap: The ratio of files that each part shares with all other
+        parts. Shared files have the same path and contents in all parts, so
+        they are checked for collisions but don't collide.
+    :param partitions: Whether the partitions feature is enabled. Part of the
+        files of each part are organized to a second partition.
+    :param overlay: Whether the overlay feature is enabled. Parts don't declare
+        overlay parameters, so the overlay step runs without mounting layers.
+    :param file_size: The size of each file, in bytes.
+    """
+
+    parts: int
+    files: int
+    shape: Shape = Shape.FLAT
+    overlap: float = 0.0
+    partitions: bool = False
+    overlay: bool = False
+    file_size: int = 512
+
+    def __post_init__(self) -> None:
+        if self.parts < 1 or self.files < 1:
+            raise ValueError("projects must have at least one part and one file")
+        if not 0.0 <= self.overlap <= 1.0:
+            raise ValueError("overlap must be between 0 and 1")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the project parameters as a serializable dictionary."""
+        data = dataclasses.asdict(self)
+        data["shape"] = self.shape.value
+        return data
+
+
+def part_name(index: int) -> str:
+    """Return the name of the part with the given index."""
+    return f"part-{index:04d}"
+
+
+def get_dependencies(shape: Shape, index: int) -> list[int]:
+    """Return the indexes of the parts the given part depends on.
+
+    :param shape: The shape of the dependency graph.
+    :param index: The index of the part.
+
+    :return: The list of part indexes, in ascending order.
+    """
+    if index == 0 or shape == Shape.FLAT:
+        return []
+    if shape == Shape.CHAIN:
+        return [index - 1]
+    if shape == Shape.TREE:
+        return [(index - 1) // 2]
+
+    layer = index // _LAYER_SIZE
+    if layer == 0:
+        return []
+    return list(range((layer - 1) * _LAYER_SIZE, layer * _LAYER_SIZE))
+
+
+def generate(spec: ProjectSpec, sources_dir: Path) -> dict[str, Any]:
+    """Create the part sources and parts definition of a synthetic project.
+
+    Each part uses the ``dump`` plugin with a local source, so the project
+    can be processed without network access.
+
+    :param spec: The project parameters.
+    :param sources_dir: The directory to create the part sources in.
+
+    :return: The parts definition, to be passed to the lifecycle manager.
+    """
+    shared = round(spec.files * spec.overlap)
+    parts: dict[str, Any] = {}
+
+    for index in range(spec.parts):
+        name = part_name(index)
+        source_dir = sources_dir / name
+        for number in range(spec.files):
+            if number < shared:
+                path = Path("shared", _file_path(number))
+                contents = _contents(f"shared-{number}", spec.file_size)
+            else:
+                path = Path(name, _file_path(number))
+                contents = _contents(f"{name}-{number}", spec.file_size)
+            (source_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (source_dir / path).write_bytes(contents)
+
+        data: dict[str, Any] = {"plugin": "dump", "source": str(source_dir)}
+        dependencies = get_dependencies(spec.shape, index)
+        if dependencies:
+            data["after"] = [part_name(i) for i in dependencies]
+        if spec.partitions and shared < spec.files:
+            # Distribute the first directory of part-specific files.
+            subdir = f"{name}/{_file_path(shared).parent}"
+            data["organize"] = {subdir: f"(extra)/{subdir}"}
+        parts[name] = data
+
+    return {"parts": parts}
+
+
+def _file_path(number: int) -> Path:
+    return Path(f"dir-{number // _FILES_PER_DIR:04d}", f"file-{number:06d}")
+
+
+def _contents(seed: str, size: int) -> bytes:
+    line = f"{seed}\n".encode()
+    return (line * (size // len(line) + 1))[:size]
@@ -0,0 +1,412 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark scenarios, results and comparison against a baseline."""
+
+import dataclasses
+import os
+import platform
+import shutil
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from craft_parts import LifecycleManager, Step
+from craft_parts.executor import collisions, filesets, migration
+from craft_parts.features import Features
+from craft_parts.parts import Part
+from craft_parts.state_manager import StateManager
+
+from . import project
+from .project import ProjectSpec, Shape
+
+_T = TypeVar("_T")
+
+RESULTS_VERSION = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    """A named synthetic project to benchmark.
+
+    :param name: The scenario name.
+    :param spec: The parameters of the synthetic project.
+    """
+
+    name: str
+    spec: ProjectSpec
+
+    def scaled(self, factor: float) -> "Scenario":
+        """Return the scenario with the number of parts and files scaled.
+
+        :param factor: The factor to multiply the number of parts and files by.
+        """
+        spec = dataclasses.replace(
+            self.spec,
+            parts=max(1, round(self.spec.parts * factor)),
+            files=max(1, round(self.spec.files * factor)),
+        )
+        return Scenario(self.name, spec)
+
+
+SCENARIOS = [
+    Scenario("flat", ProjectSpec(parts=20, files=200)),
+    Scenario("chain", ProjectSpec(parts=20, files=200, shape=Shape.CHAIN)),
+    Scenario(
+        "tree-overlap",
+        ProjectSpec(parts=30, files=100, shape=Shape.TREE, overlap=0.25),
+    ),
+    Scenario(
+        "layered-many-parts",
+        ProjectSpec(parts=48, files=20, shape=Shape.LAYERED, overlap=0.1),
+    ),
+    Scenario(
+        "partitions",
+        ProjectSpec(parts=20, files=200, shape=Shape.TREE, partitions=True),
+    ),
+    Scenario(
+        "overlay",
+        ProjectSpec(parts=20, files=200, shape=Shape.TREE, overlay=True),
+    ),
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class Timing:
+    """The durations of the repeated runs of an operation.
+
+    :param samples: The duration of each run, in seconds.
+    """
+
+    samples: list[float]
+
+    @property
+    def best(self) -> float:
+        """The shortest duration, the least affected by system noise."""
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        """The median duration."""
+        return statistics.median(self.samples)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing as a serializable dictionary."""
+        return {"best": self.best, "median": self.median, "samples": self.samples}
+
+
+@dataclasses.dataclass(frozen=True)
+class Comparison:
+    """The timing of an operation compared to a baseline.
+
+    :param scenario: The scenario name.
+    :param operation: The operation name.
+    :param baseline: The best duration in the baseline, in seconds.
+    :param current: The best duration in the current results, in seconds.
+    """
+
+    scenario: str
+    operation: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """The current duration relative to the baseline."""
+        if not self.baseline:
+            return 1.0
+        return self.current / self.baseline
+
+    def is_regression(self, *, threshold: float, min_delta: float) -> bool:
+        """Whether the operation is slower than allowed.
+
+        :param threshold: The allowed slowdown, relative to the baseline.
+        :param min_delta: The slowdown ignored regardless of the ratio, in
+            seconds, so that noise in short operations is not reported.
+        """
+        return self.ratio > 1.0 + threshold and self.current - self.baseline > min_delta
+
+
+def run_scenario(
+    scenario: Scenario, work_dir: Path, *, repeats: int = 5
+) -> dict[str, Any]:
+    """Generate a synthetic project and time its lifecycle operations.
+
+    The project is planned and executed up to the prime step, then planning,
+    state loading, collision checking, migration and cleaning are timed.
+
+    :param scenario: The scenario to run.
+    :param work_dir: The directory to create the project in.
+    :param repeats: The number of times each operation is timed. The
+        execution and the final clean are only run once.
+
+    :return: The scenario results, with timings in seconds.
+    """
+    spec = scenario.spec
+    _configure_features(spec)
+    partitions = project.PARTITIONS if spec.partitions else None
+    parts_data = project.generate(spec, work_dir / "sources")
+
+    def new_manager(**kwargs: Any) -> LifecycleManager:
+        return LifecycleManager(
+            parts_data,
+            application_name="benchmark",
+            cache_dir=work_dir / "cache",
+            work_dir=work_dir / "project",
+            partitions=partitions,
+            **kwargs,
+        )
+
+    timings: dict[str, Timing] = {}
+
+    # Planning updates the ephemeral state, reload it before planning again.
+    lcm = new_manager(record_timings=True)
+    timings["plan"] = _measure(
+        lambda _: lcm.plan(Step.PRIME), lcm.reload_state, repeats=repeats
+    )
+
+    lcm.reload_state()
+    actions = lcm.plan(Step.PRIME)
+    start = time.perf_counter()
+    with lcm.action_executor() as ctx, Path(os.devnull).open("w") as devnull:
+        ctx.execute(actions, stdout=devnull, stderr=devnull)
+    timings["execute"] = Timing([time.perf_counter() - start])
+    counters = lcm.instrumentation.counters if lcm.instrumentation else {}
+
+    timings["plan (up to date)"] = _measure(
+        lambda manager: manager.plan(Step.PRIME), new_manager, repeats=repeats
+    )
+
+    part_list = [
+        Part(
+            name,
+            data,
+            project_dirs=lcm.project_info.dirs,
+            partitions=partitions,
+        )
+        for name, data in parts_data["parts"].items()
+    ]
+
+    timings["state manager init"] = _measure(
+        lambda _: StateManager(project_info=lcm.project_info, part_list=part_list),
+        lambda: None,
+        repeats=repeats,
+    )
+    timings["collision check"] = _measure(
+        lambda _: collisions.check_for_stage_collisions(part_list, partitions),
+        lambda: None,
+        repeats=repeats,
+    )
+    timings["migratable filesets"] = _measure(
+        lambda _: _get_filesets(part_list, partitions),
+        lambda: None,
+        repeats=repeats,
+    )
+
+    part_filesets = _get_filesets(part_list, partitions)
+    stage_dir = work_dir / "migrate"
+
+    def new_stage_dir() -> Path:
+        shutil.rmtree(stage_dir, ignore_errors=True)
+        return stage_dir
+
+    timings["migrate files"] = _measure(
+        lambda destdir: _migrate(part_filesets, destdir),
+        new_stage_dir,
+        repeats=repeats,
+    )
+    shutil.rmtree(stage_dir, ignore_errors=True)
+
+    start = time.perf_counter()
+    lcm.clean()
+    timings["clean"] = Timing([time.perf_counter() - start])
+
+    return {
+        "project": spec.as_dict(),
+        "timings": {name: timing.as_dict() for name, timing in timings.items()},
+        "counters": counters,
+    }
+
+
+def get_results(scenario_results: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Create the benchmark results document.
+
+    :param scenario_results: A dictionary mapping scenario names to results.
+
+    :return: The results, to be serialized as JSON.
+    """
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "system": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "scenarios": scenario_results,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> list[Comparison]:
+    """Compare benchmark results against a baseline.
+
+    Only scenarios and operations present in both results are compared.
+
+    :param results: The current benchmark results.
+    :param baseline: The baseline benchmark results.
+
+    :return: The comparison of each operation.
+    """
+    if baseline.get("version") != RESULTS_VERSION:
+        raise ValueError(f"unsupported baseline version {baseline.get('version')!r}")
+
+    comparisons: list[Comparison] = []
+    for name, scenario in results["scenarios"].items():
+        baseline_scenario = baseline["scenarios"].get(name)
+        if not baseline_scenario:
+            continue
+        if baseline_scenario["project"] != scenario["project"]:
+            # Timings of different projects are not comparable.
+            continue
+        for operation, timing in scenario["timings"].items():
+            baseline_timing = baseline_scenario["timings"].get(operation)
+            if baseline_timing:
+                comparisons.append(
+                    Comparison(
+                        scenario=name,
+                        operation=operation,
+                        baseline=baseline_timing["best"],
+                        current=timing["best"],
+                    )
+                )
+    return comparisons
+
+
+def format_results(results: dict[str, Any]) -> str:
+    """Format benchmark results as a table.
+
+    :param results: The benchmark results.
+
+    :return: The results table.
+    """
+    rows = [("Scenario", "Operation", "Best (s)", "Median (s)")]
+    for name, scenario in results["scenarios"].items():
+        for operation, timing in scenario["timings"].items():
+            rows.append(
+                (
+                    name,
+                    operation,
+                    f"{timing['best']:.4f}",
+                    f"{timing['median']:.4f}",
+                )
+            )
+    return _format_table(rows)
+
+
+def format_comparisons(
+    comparisons: list[Comparison], *, threshold: float, min_delta: float
+) -> str:
+    """Format a comparison against a baseline as a table.
+
+    :param comparisons: The comparison of each operation.
+    :param threshold: The allowed slowdown, relative to the baseline.
+    :param min_delta: The slowdown ignored regardless of the ratio, in seconds.
+
+    :return: The comparison table.
+    """
+    rows = [("Scenario", "Operation", "Baseline (s)", "Current (s)", "Ratio", "")]
+    for comparison in comparisons:
+        regression = comparison.is_regression(threshold=threshold, min_delta=min_delta)
+        rows.append(
+            (
+                comparison.scenario,
+                comparison.operation,
+                f"{comparison.baseline:.4f}",
+                f"{comparison.current:.4f}",
+                f"{comparison.ratio:.2f}",
+                "REGRESSION" if regression else "",
+            )
+        )
+    return _format_table(rows)
+
+
+def _configure_features(spec: ProjectSpec) -> None:
+    """Enable the features used by the project."""
+    features = Features()
+    if (
+        features.enable_overlay == spec.overlay
+        and features.enable_partitions == spec.partitions
+    ):
+        return
+
+    Features.reset()
+    Features(enable_overlay=spec.overlay, enable_partitions=spec.partitions)
+
+
+def _measure(
+    func: Callable[[_T], object], setup: Callable[[], _T], *, repeats: int
+) -> Timing:
+    """Time repeated calls to a function.
+
+    :param func: The function to time, called with the value returned by setup.
+    :param setup: The function preparing each run, which is not timed.
+    :param repeats: The number of runs.
+    """
+    samples: list[float] = []
+    for _ in range(repeats):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        samples.append(time.perf_counter() - start)
+    return Timing(samples)
+
+
+_PartFilesets = list[tuple[Path, str | None, set[str], set[str]]]
+
+
+def _get_filesets(part_list: list[Part], partitions: list[str] | None) -> _PartFilesets:
+    """Obtain the files and directories each part migrates to the stage step."""
+    result: _PartFilesets = []
+    for part in part_list:
+        stage_fileset = filesets.Fileset(part.spec.stage_files, name="stage")
+        for partition in partitions or [None]:
+            srcdir = part.part_install_dirs[partition]
+            files, dirs = filesets.migratable_filesets(
+                stage_fileset, str(srcdir), part.default_partition, partition
+            )
+            result.append((srcdir, partition, files, dirs))
+    return result
+
+
+def _migrate(part_filesets: _PartFilesets, destdir: Path) -> None:
+    """Migrate the files of all parts, as done by the stage step."""
+    for srcdir, partition, files, dirs in part_filesets:
+        migration.migrate_files(
+            files=files,
+            dirs=dirs,
+            srcdir=srcdir,
+            destdir=destdir / (partition or "default"),
+        )
+
+
+def _format_table(rows: list[tuple[str, ...]]) -> str:
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
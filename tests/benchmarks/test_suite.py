@@ -0,0 +1,162 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Verify the benchmark suite on small projects."""
+
+import pytest
+
+from tests.benchmarks import project, suite
+from tests.benchmarks.project import ProjectSpec, Shape
+
+
+@pytest.mark.parametrize(
+    ("shape", "index", "dependencies"),
+    [
+        (Shape.FLAT, 5, []),
+        (Shape.CHAIN, 0, []),
+        (Shape.CHAIN, 5, [4]),
+        (Shape.TREE, 5, [2]),
+        (Shape.TREE, 6, [2]),
+        (Shape.LAYERED, 5, []),
+        (Shape.LAYERED, 17, list(range(8, 16))),
+    ],
+)
+def test_get_dependencies(shape, index, dependencies):
+    assert project.get_dependencies(shape, index) == dependencies
+
+
+def test_generate(tmp_path):
+    spec = ProjectSpec(parts=3, files=4, shape=Shape.CHAIN, overlap=0.5)
+
+    parts_data = project.generate(spec, tmp_path)
+
+    assert parts_data == {
+        "parts": {
+            "part-0000": {"plugin": "dump", "source": str(tmp_path / "part-0000")},
+            "part-0001": {
+                "plugin": "dump",
+                "source": str(tmp_path / "part-0001"),
+                "after": ["part-0000"],
+            },
+            "part-0002": {
+                "plugin": "dump",
+                "source": str(tmp_path / "part-0002"),
+                "after": ["part-0001"],
+            },
+        }
+    }
+    source_dir = tmp_path / "part-0001"
+    files = sorted(str(p.relative_to(source_dir)) for p in source_dir.rglob("file-*"))
+    assert files == [
+        "part-0001/dir-0000/file-000002",
+        "part-0001/dir-0000/file-000003",
+        "shared/dir-0000/file-000000",
+        "shared/dir-0000/file-000001",
+    ]
+    # Shared files are identical in all parts
+    shared_file = "shared/dir-0000/file-000001"
+    assert (tmp_path / "part-0000" / shared_file).read_bytes() == (
+        source_dir / shared_file
+    ).read_bytes()
+
+
+def test_generate_partitions(tmp_path):
+    spec = ProjectSpec(parts=1, files=2, partitions=True)
+
+    parts_data = project.generate(spec, tmp_path)
+
+    assert parts_data["parts"]["part-0000"]["organize"] == {
+        "part-0000/dir-0000": "(extra)/part-0000/dir-0000"
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"parts": 0, "files": 1}, {"parts": 1, "files": 1, "overlap": 2.0}]
+)
+def test_project_spec_invalid(kwargs):
+    with pytest.raises(ValueError):  # noqa: PT011
+        ProjectSpec(**kwargs)
+
+
+def test_run_scenario(tmp_path):
+    scenario = suite.Scenario("test", ProjectSpec(parts=2, files=3, overlap=0.5))
+
+    results = suite.run_scenario(scenario, tmp_path, repeats=2)
+
+    assert results["project"] == scenario.spec.as_dict()
+    assert list(results["timings"]) == [
+        "plan",
+        "execute",
+        "plan (up to date)",
+        "state manager init",
+        "collision check",
+        "migratable filesets",
+        "migrate files",
+        "clean",
+    ]
+    assert len(results["timings"]["plan"]["samples"]) == 2
+    assert len(results["timings"]["clean"]["samples"]) == 1
+    assert results["counters"]["files linked"] > 0
+
+
+def _results(spec: ProjectSpec, **timings: float) -> dict:
+    return suite.get_results(
+        {
+            "flat": {
+                "project": spec.as_dict(),
+                "timings": {
+                    name: suite.Timing([value]).as_dict()
+                    for name, value in timings.items()
+                },
+                "counters": {},
+            }
+        }
+    )
+
+
+def test_compare():
+    spec = ProjectSpec(parts=2, files=3)
+    baseline = _results(spec, plan=1.0, clean=0.001, migrate=1.0)
+    results = _results(spec, plan=1.5, clean=0.002, execute=1.0)
+
+    comparisons = suite.compare(results, baseline)
+
+    assert comparisons == [
+        suite.Comparison("flat", "plan", baseline=1.0, current=1.5),
+        suite.Comparison("flat", "clean", baseline=0.001, current=0.002),
+    ]
+    regressions = [
+        c.operation
+        for c in comparisons
+        if c.is_regression(threshold=0.25, min_delta=0.005)
+    ]
+    # Short operations are not reported even if their duration doubled
+    assert regressions == ["plan"]
+
+
+def test_compare_different_project():
+    baseline = _results(ProjectSpec(parts=2, files=3), plan=1.0)
+    results = _results(ProjectSpec(parts=4, files=3), plan=2.0)
+
+    assert suite.compare(results, baseline) == []
+
+
+def test_compare_invalid_version():
+    baseline = {"version": 0, "scenarios": {}}
+    results = _results(ProjectSpec(parts=2, files=3), plan=2.0)
+
+    with pytest.raises(ValueError, match="unsupported baseline version 0"):
+        suite.compare(results, baseline)
@@ -26,7 +26,6 @@ from craft_parts import (
     Step,
     StepInfo,
     callbacks,
-    errors,
 )
 from craft_parts.state_manager import StepState
 
@@ -239,7 +238,7 @@ _update_yaml = textwrap.dedent(
 )
 
 
-@pytest.mark.parametrize("step", [Step.PULL, Step.BUILD])
+@pytest.mark.parametrize("step", [Step.PULL, Step.BUILD, Step.STAGE, Step.PRIME])
 def test_update_callback_pre(tmpdir, capfd, step):
     callbacks.register_pre_step(_my_step_callback, step_list=[step])
 
@@ -261,7 +260,7 @@ def test_update_callback_pre(tmpdir, capfd, step):
     assert out == f"callback\nstep {step!r}\n"
 
 
-@pytest.mark.parametrize("step", [Step.PULL, Step.BUILD])
+@pytest.mark.parametrize("step", [Step.PULL, Step.BUILD, Step.STAGE, Step.PRIME])
 def test_update_callback_post(tmpdir, capfd, step):
     callbacks.register_post_step(_my_step_callback, step_list=[step])
 
@@ -283,50 +282,6 @@ def test_update_callback_post(tmpdir, capfd, step):
     assert out == f"step {step!r}\ncallback\n"
 
 
-@pytest.mark.parametrize("step", [Step.STAGE, Step.PRIME])
-def test_invalid_update_callback_pre(tmpdir, step):
-    callbacks.register_pre_step(_my_step_callback, step_list=[step])
-
-    parts = yaml.safe_load(_update_yaml)
-    lf = craft_parts.LifecycleManager(
-        parts,
-        application_name="test_callback",
-        cache_dir=tmpdir,
-        work_dir=tmpdir,
-        base_layer_dir=tmpdir,
-        base_layer_hash=b"hash",
-        message="callback",
-    )
-
-    with lf.action_executor() as ctx, pytest.raises(errors.InvalidAction) as raised:
-        ctx.execute(Action("foo", step, action_type=ActionType.UPDATE))
-
-    name = step.name.lower()
-    assert raised.value.message == f"cannot update step {name!r} of 'foo'"
-
-
-@pytest.mark.parametrize("step", [Step.STAGE, Step.PRIME])
-def test_invalid_update_callback_post(tmpdir, step):
-    callbacks.register_post_step(_my_step_callback, step_list=[step])
-
-    parts = yaml.safe_load(_update_yaml)
-    lf = craft_parts.LifecycleManager(
-        parts,
-        application_name="test_callback",
-        cache_dir=tmpdir,
-        work_dir=tmpdir,
-        base_layer_dir=tmpdir,
-        base_layer_hash=b"hash",
-        message="callback",
-    )
-
-    with lf.action_executor() as ctx, pytest.raises(errors.InvalidAction) as raised:
-        ctx.execute(Action("foo", step, action_type=ActionType.UPDATE))
-
-    name = step.name.lower()
-    assert raised.value.message == f"cannot update step {name!r} of 'foo'"
-
-
 def _my_exec_callback(info: ProjectInfo) -> None:
     print(info.message)
 
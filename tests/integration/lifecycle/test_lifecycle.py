@@ -195,7 +195,7 @@ def test_basic_lifecycle_actions(new_dir, partitions, mocker):
         Action(
             "foo",
             Step.STAGE,
-            action_type=ActionType.RERUN,
+            action_type=ActionType.UPDATE,
             reason="'BUILD' step changed",
         ),
         Action(
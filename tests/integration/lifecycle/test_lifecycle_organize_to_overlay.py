@@ -239,7 +239,7 @@ def test_basic_lifecycle_actions(new_dir, mocker):
         Action(
             "foo",
             Step.STAGE,
-            action_type=ActionType.RERUN,
+            action_type=ActionType.UPDATE,
             reason="'BUILD' step changed",
         ),
         Action(
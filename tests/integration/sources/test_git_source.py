@@ -21,6 +21,7 @@ from pathlib import Path
 
 import pytest
 from craft_parts import ProjectDirs
+from craft_parts.sources import git_source
 from craft_parts.sources.git_source import GitSource
 from craft_parts.utils.os_utils import OsRelease
 
@@ -373,6 +374,219 @@ class TestGitConflicts(GitBaseTestCase):
         )
 
 
+class TestGitMirrors(GitBaseTestCase):
+    @pytest.fixture(autouse=True)
+    def setup_remote(self, new_dir, monkeypatch):
+        self.remote = Path("remote.git").absolute()
+        self.clean_dir(self.remote)
+        monkeypatch.chdir(self.remote)
+        _call(["git", "init", "--bare"])
+
+        self.helper_tree = Path("helper-tree").absolute()
+        self.clone_repo(self.remote, self.helper_tree)
+        self.add_file("test.txt", "v1", "created test.txt")
+        _call(["git", "push", str(self.remote), "HEAD"])
+        monkeypatch.chdir(new_dir)
+
+    def _git(self, new_dir, working_tree, **kwargs) -> GitSource:
+        return GitSource(
+            str(self.remote),
+            working_tree,
+            cache_dir=new_dir / "cache",
+            project_dirs=self._dirs,
+            use_mirrors=True,
+            **kwargs,
+        )
+
+    def test_pull_from_mirror(self, new_dir, monkeypatch):
+        first_tree = Path("first").absolute()
+        second_tree = Path("second").absolute()
+
+        self._git(new_dir, first_tree).pull()
+        self._git(new_dir, second_tree).pull()
+
+        (mirror,) = Path(new_dir, "cache/git/mirrors").glob("*.git")
+        assert mirror.name.startswith("remote-")
+        for tree in (first_tree, second_tree):
+            assert Path(tree, "test.txt").read_text() == "v1"
+            assert (
+                _call_with_output(
+                    ["git", "-C", str(tree), "remote", "get-url", "origin"]
+                )
+                == f"file://{self.remote}"
+            )
+
+        # Objects are hard-linked from the mirror
+        (pack,) = Path(first_tree, ".git/objects/pack").glob("*.pack")
+        assert pack.stat().st_nlink > 1
+
+        # A new execution updates the mirror once before cloning
+        monkeypatch.chdir(self.helper_tree)
+        self.add_file("test.txt", "v2", "updated test.txt")
+        _call(["git", "push", str(self.remote), "HEAD"])
+        monkeypatch.chdir(new_dir)
+        git_source.reset_mirror_updates()
+
+        shutil.rmtree(first_tree)
+        self._git(new_dir, first_tree).pull()
+        assert Path(first_tree, "test.txt").read_text() == "v2"
+
+    def test_pull_from_mirror_commit(self, new_dir, monkeypatch):
+        commit = self.get_commit(self.helper_tree)
+        monkeypatch.chdir(self.helper_tree)
+        self.add_file("test.txt", "v2", "updated test.txt")
+        _call(["git", "push", str(self.remote), "HEAD"])
+        monkeypatch.chdir(new_dir)
+
+        working_tree = Path("working-tree").absolute()
+        git = self._git(new_dir, working_tree, source_commit=commit[:10])
+        git.pull()
+
+        assert Path(working_tree, "test.txt").read_text() == "v1"
+        assert self.get_commit(working_tree) == commit
+
+    def test_pull_from_mirror_with_depth(self, new_dir):
+        working_tree = Path("working-tree").absolute()
+        self._git(new_dir, working_tree, source_depth=1).pull()
+
+        assert Path(working_tree, "test.txt").read_text() == "v1"
+        assert not Path(new_dir, "cache/git/mirrors").exists()
+
+    def test_pull_from_mirror_with_submodules(self, new_dir, monkeypatch):
+        sub_remote = Path("sub-remote.git").absolute()
+        self.clean_dir(sub_remote)
+        monkeypatch.chdir(sub_remote)
+        _call(["git", "init", "--bare"])
+        self.clone_repo(sub_remote, Path("../sub-tree").absolute())
+        self.add_file("sub-file", "sub-file", "created sub-file")
+        _call(["git", "push", str(sub_remote), "HEAD"])
+
+        monkeypatch.chdir(self.helper_tree)
+        _call(
+            [
+                "git",
+                "-c",
+                "protocol.file.allow=always",
+                "submodule",
+                "add",
+                str(sub_remote),
+                "sub",
+            ]
+        )
+        _call(["git", "commit", "-am", "added submodule"])
+        _call(["git", "push", str(self.remote), "HEAD"])
+        monkeypatch.chdir(new_dir)
+
+        working_tree = Path("working-tree").absolute()
+        self._git(new_dir, working_tree).pull()
+
+        assert Path(working_tree, "sub/sub-file").read_text() == "sub-file"
+        assert len(list(Path(new_dir, "cache/git/mirrors").glob("*.git"))) == 2
+        assert _call_with_output(
+            ["git", "-C", str(working_tree / "sub"), "remote", "get-url", "origin"]
+        ) == str(sub_remote)
+        assert _call_with_output(
+            ["git", "-C", str(working_tree), "config", "submodule.sub.url"]
+        ) == str(sub_remote)
+
+        # Submodules can be excluded
+        shutil.rmtree(working_tree)
+        self._git(new_dir, working_tree, source_submodules=[]).pull()
+        assert not Path(working_tree, "sub/sub-file").exists()
+
+
+class TestGitOutdated(GitBaseTestCase):
+    @pytest.fixture(autouse=True)
+    def setup_remote(self, new_dir, monkeypatch):
+        self.remote = Path("remote.git").absolute()
+        self.clean_dir(self.remote)
+        monkeypatch.chdir(self.remote)
+        _call(["git", "init", "--bare"])
+
+        self.helper_tree = Path("helper-tree").absolute()
+        self.clone_repo(self.remote, self.helper_tree)
+        self.add_file("test.txt", "v1", "created test.txt")
+        self.add_file("other.txt", "other", "created other.txt")
+        _call(["git", "tag", "-a", "-m", "v1", "v1"])
+        _call(["git", "push", "--follow-tags", str(self.remote), "HEAD"])
+        monkeypatch.chdir(new_dir)
+
+        self.working_tree = Path("working-tree").absolute()
+        self.target = Path("pull.state").absolute()
+
+    def _pull(self, new_dir, **kwargs) -> GitSource:
+        git = GitSource(
+            str(self.remote),
+            self.working_tree,
+            cache_dir=new_dir,
+            project_dirs=self._dirs,
+            **kwargs,
+        )
+        git.pull()
+        self.target.touch()
+        return git
+
+    def _push(self, monkeypatch, new_dir, filename, content) -> None:
+        monkeypatch.chdir(self.helper_tree)
+        self.add_file(filename, content, f"updated {filename}")
+        _call(["git", "push", str(self.remote), "HEAD"])
+        monkeypatch.chdir(new_dir)
+
+    def test_check_if_outdated_branch(self, new_dir, monkeypatch, mocker):
+        git = self._pull(new_dir)
+        run = mocker.spy(git, "_run")
+
+        assert git.check_if_outdated(str(self.target)) is False
+        run.assert_not_called()
+
+        self._push(monkeypatch, new_dir, "test.txt", "v2")
+        run_output = mocker.spy(git, "_run_output")
+        assert git.check_if_outdated(str(self.target)) is True
+        run.assert_not_called()
+        commands = [c.args[0][3] for c in run_output.call_args_list]
+        assert "ls-remote" in commands
+        assert "fetch" not in commands
+
+        # The changed files are only known after the update
+        assert git.get_outdated_files() == ([], [])
+        assert Path(self.working_tree, "test.txt").read_text() == "v1"
+
+        git.update()
+        assert git.get_outdated_files() == (["test.txt"], [])
+        assert Path(self.working_tree, "test.txt").read_text() == "v2"
+        assert self.get_commit(self.working_tree) == self.get_commit(self.helper_tree)
+        assert git.check_if_outdated(str(self.target)) is False
+
+    def test_check_if_outdated_tag(self, new_dir, monkeypatch):
+        git = self._pull(new_dir, source_tag="v1")
+        assert git.check_if_outdated(str(self.target)) is False
+
+        # move the tag
+        self._push(monkeypatch, new_dir, "other.txt", "changed")
+        monkeypatch.chdir(self.helper_tree)
+        _call(["git", "tag", "-f", "-a", "-m", "v1", "v1"])
+        _call(["git", "push", "-f", str(self.remote), "refs/tags/v1"])
+        monkeypatch.chdir(new_dir)
+
+        assert git.check_if_outdated(str(self.target)) is True
+        git.update()
+        assert git.get_outdated_files() == (["other.txt"], [])
+        assert Path(self.working_tree, "other.txt").read_text() == "changed"
+
+    def test_check_if_outdated_commit(self, new_dir, monkeypatch):
+        git = self._pull(new_dir, source_commit=self.get_commit(self.helper_tree))
+        self._push(monkeypatch, new_dir, "test.txt", "v2")
+
+        assert git.check_if_outdated(str(self.target)) is False
+
+    def test_check_if_outdated_unreachable(self, new_dir, caplog):
+        git = self._pull(new_dir)
+        shutil.rmtree(self.remote)
+
+        assert git.check_if_outdated(str(self.target)) is False
+        assert f"Cannot check if {str(self.remote)!r} is outdated." in caplog.messages
+
+
 class TestGitDetails(GitBaseTestCase):
     @pytest.fixture(autouse=True)
     def setup_method_fixture(self, new_dir, partitions, monkeypatch):
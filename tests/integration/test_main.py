@@ -688,9 +688,13 @@ def test_main_strict(mocker):
         "base_layer_dir": None,
         "base_layer_hash": b"",
         "cache_dir": mocker.ANY,
+        "compiler_cache": None,
         "filesystem_mounts": None,
         "partitions": None,
         "strict_mode": True,
+        "record_timings": False,
+        "use_build_cache": False,
+        "use_git_mirrors": False,
         "work_dir": ".",
     }
 
@@ -710,9 +714,13 @@ def test_main_partitions(mocker):
         "base_layer_dir": None,
         "base_layer_hash": b"",
         "cache_dir": mocker.ANY,
+        "compiler_cache": None,
         "filesystem_mounts": None,
         "partitions": ["default", "foo", "bar"],
         "strict_mode": False,
+        "record_timings": False,
+        "use_build_cache": False,
+        "use_git_mirrors": False,
         "work_dir": ".",
     }
 
@@ -776,8 +784,132 @@ def test_main_filesystem_mounts(mocker):
         "base_layer_dir": None,
         "base_layer_hash": b"",
         "cache_dir": mocker.ANY,
+        "compiler_cache": None,
         "partitions": ["default", "foo"],
         "filesystem_mounts": {"default": [{"mount": "/", "device": "foo"}]},
         "strict_mode": False,
+        "record_timings": False,
+        "use_build_cache": False,
+        "use_git_mirrors": False,
         "work_dir": ".",
     }
+
+
+watch_parts_yaml = textwrap.dedent(
+    """
+    parts:
+      foo:
+        plugin: dump
+        source: foo-src
+      bar:
+        after: [foo]
+        plugin: nil
+      baz:
+        plugin: nil
+"""
+)
+
+
+@pytest.fixture
+def watch_project():
+    Path("parts.yaml").write_text(watch_parts_yaml)
+    Path("foo-src").mkdir()
+    Path("foo-src/file").write_text("foo")
+
+
+def _mock_changes(mocker, *changes):
+    """Make each wait for changes call the next function, then interrupt."""
+    pending = list(changes)
+
+    def wait_for_changes(*_):
+        if not pending:
+            raise KeyboardInterrupt
+        return pending.pop(0)()
+
+    mocker.patch.object(main, "_wait_for_changes", side_effect=wait_for_changes)
+
+
+@pytest.mark.usefixtures("watch_project")
+def test_main_watch(mocker, capfd):
+    def change_source(*_):
+        Path("foo-src/file").write_text("bar")
+        return {Path("foo-src/file").resolve()}
+
+    _mock_changes(mocker, change_source)
+    mocker.patch.object(sys, "argv", ["cmd", "watch", "--step", "stage"])
+    main.main()
+
+    out, err = capfd.readouterr()
+    assert err == ""
+    assert out == (
+        "Execute: Pull foo\nExecute: Pull bar\nExecute: Pull baz\n"
+        "Execute: Overlay foo\nExecute: Overlay bar\nExecute: Overlay baz\n"
+        "Execute: Build foo\nExecute: Stage foo (required to build 'bar')\n"
+        "Execute: Build bar\nExecute: Build baz\n"
+        "Execute: Stage bar\nExecute: Stage baz\n"
+        "Watching for changes...\n"
+        "Changes detected in foo.\n"
+        "Execute: Update sources for foo (source changed)\n"
+        "Execute: Update overlay for foo ('PULL' step changed)\n"
+        "Execute: Update build for foo ('PULL' step changed)\n"
+        "Execute: Update stage for foo ('BUILD' step changed)\n"
+        "Execute: Rebuild bar (stage for part 'foo' changed)\n"
+        "Execute: Stage bar\n"
+        "Watching for changes...\n"
+        "Stopped watching.\n"
+    )
+    assert Path("stage/file").read_text() == "bar"
+
+
+@pytest.mark.usefixtures("watch_project")
+def test_main_watch_parts_file_changed(mocker, capfd):
+    def touch_parts_file(*_):
+        Path("parts.yaml").touch()
+        return {Path("parts.yaml").resolve()}
+
+    _mock_changes(mocker, touch_parts_file, touch_parts_file)
+    mocker.patch.object(sys, "argv", ["cmd", "watch", "baz", "--step", "pull"])
+    main.main()
+
+    out, err = capfd.readouterr()
+    assert err == ""
+    assert out == (
+        "Execute: Pull baz\n"
+        "Watching for changes...\n"
+        "Parts file changed, reloading.\n"
+        "Watching for changes...\n"
+        "Parts file changed, reloading.\n"
+        "Watching for changes...\n"
+        "Stopped watching.\n"
+    )
+
+
+@pytest.mark.usefixtures("watch_project")
+def test_main_watch_invalid_parts_file(mocker, capfd):
+    def fix_parts_file(*_):
+        Path("parts.yaml").write_text(watch_parts_yaml)
+        return {Path("parts.yaml").resolve()}
+
+    Path("parts.yaml").write_text("parts: [")
+    _mock_changes(mocker, fix_parts_file)
+    mocker.patch.object(sys, "argv", ["cmd", "watch", "baz", "--step", "pull"])
+    main.main()
+
+    out, err = capfd.readouterr()
+    assert err.startswith("Error: ")
+    assert out == "Execute: Pull baz\nWatching for changes...\nStopped watching.\n"
+
+
+def test_get_dependent_parts():
+    part_data = {
+        "parts": {
+            "foo": {},
+            "bar": {"after": ["foo"]},
+            "baz": {"after": ["bar"]},
+            "qux": {},
+        }
+    }
+
+    assert main._get_dependent_parts({"bar"}, part_data) == {"bar", "baz"}
+    assert main._get_dependent_parts({"foo"}, part_data) == {"foo", "bar", "baz"}
+    assert main._get_dependent_parts(set(), part_data) == set()
@@ -0,0 +1,185 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from craft_parts.executor.build_cache import (
+    BuildCache,
+    BuildCacheStats,
+    get_build_key,
+    get_tree_digest,
+)
+
+
+@pytest.fixture
+def install_dir(tmp_path) -> Path:
+    install_dir = tmp_path / "install"
+    (install_dir / "usr/bin").mkdir(parents=True)
+    (install_dir / "usr/bin/hello").write_text("hello")
+    (install_dir / "usr/bin/hello").chmod(0o755)
+    (install_dir / "usr/bin/hi").symlink_to("hello")
+    return install_dir
+
+
+class TestBuildCache:
+    """Verify storing and restoring build outputs."""
+
+    def test_store_restore(self, tmp_path, install_dir):
+        cache = BuildCache(tmp_path / "cache")
+        index_file = tmp_path / "index.json"
+        index_file.write_text("{}")
+
+        cache.store(
+            key="abc",
+            paths={
+                "install": install_dir,
+                "export": tmp_path / "export",
+                "index": index_file,
+            },
+            metadata={"foo": "bar"},
+        )
+
+        restored = tmp_path / "restored"
+        metadata = cache.restore(
+            key="abc",
+            paths={
+                "install": restored / "install",
+                "export": restored / "export",
+                "index": restored / "index.json",
+            },
+        )
+
+        assert metadata == {"foo": "bar"}
+        assert get_tree_digest(restored / "install") == get_tree_digest(install_dir)
+        assert (restored / "install/usr/bin/hi").is_symlink()
+        assert not (restored / "export").exists()
+        assert (restored / "index.json").read_text() == "{}"
+        assert cache.stats == BuildCacheStats(hits=1, misses=0, stored=1)
+
+    def test_store_copies_outputs(self, tmp_path, install_dir):
+        cache = BuildCache(tmp_path / "cache")
+        cache.store(key="abc", paths={"install": install_dir})
+
+        # Changes to the build outputs don't affect the cached entry
+        with Path(install_dir, "usr/bin/hello").open("w") as f:
+            f.write("changed")
+
+        restored = tmp_path / "restored"
+        cache.restore(key="abc", paths={"install": restored})
+        assert Path(restored, "usr/bin/hello").read_text() == "hello"
+        assert not Path(restored, "usr/bin/hello").samefile(
+            install_dir / "usr/bin/hello"
+        )
+
+    def test_restore_miss(self, tmp_path):
+        cache = BuildCache(tmp_path / "cache")
+
+        metadata = cache.restore(key="abc", paths={"install": tmp_path / "install"})
+
+        assert metadata is None
+        assert not Path(tmp_path, "install").exists()
+        assert cache.stats == BuildCacheStats(hits=0, misses=1, stored=0)
+
+    def test_restore_replaces_paths(self, tmp_path, install_dir):
+        cache = BuildCache(tmp_path / "cache")
+        cache.store(key="abc", paths={"install": install_dir})
+
+        restored = tmp_path / "restored"
+        (restored / "install").mkdir(parents=True)
+        (restored / "install/stale").write_text("stale")
+        (restored / "export").mkdir()
+
+        # Existing paths are kept if the outputs are not in the cache
+        cache.restore(
+            key="other",
+            paths={"install": restored / "install", "export": restored / "export"},
+        )
+        assert (restored / "install/stale").exists()
+        assert (restored / "export").is_dir()
+
+        removed: list[Path] = []
+
+        def remove(path: Path) -> None:
+            removed.append(path)
+            shutil.rmtree(path)
+
+        cache.restore(
+            key="abc",
+            paths={"install": restored / "install", "export": restored / "export"},
+            remove_function=remove,
+        )
+        assert removed == [restored / "install", restored / "export"]
+        assert get_tree_digest(restored / "install") == get_tree_digest(install_dir)
+        assert not (restored / "export").exists()
+
+    def test_evict(self, tmp_path, install_dir):
+        cache = BuildCache(tmp_path / "cache", max_size=10)
+        cache.store(key="old", paths={"install": install_dir})
+        os.utime(tmp_path / "cache/builds/old", (0, 0))
+        cache.store(key="new", paths={"install": install_dir})
+
+        assert cache.evict() == ["old"]
+        assert cache.restore(key="new", paths={}) == {}
+
+    def test_report(self, tmp_path, install_dir, caplog):
+        caplog.set_level("INFO")
+        cache = BuildCache(tmp_path / "cache")
+        cache.report()
+        assert caplog.records == []
+
+        cache.restore(key="abc", paths={})
+        cache.store(key="abc", paths={"install": install_dir})
+        cache.report()
+        assert caplog.messages == [
+            "Build cache: 0 hits, 1 misses, 1 stored, 0.0 MiB in use"
+        ]
+
+
+class TestBuildKey:
+    """Verify the computation of build keys."""
+
+    def test_build_key(self):
+        key = get_build_key(source="abc", properties={"a": 1, "b": [1, 2]})
+
+        assert key == get_build_key(properties={"b": [1, 2], "a": 1}, source="abc")
+        assert key != get_build_key(source="abd", properties={"a": 1, "b": [1, 2]})
+
+    def test_tree_digest(self, tmp_path, install_dir):
+        digest = get_tree_digest(install_dir)
+
+        # Timestamps don't change the digest
+        os.utime(install_dir / "usr/bin/hello", (0, 0))
+        assert get_tree_digest(install_dir) == digest
+
+        # Modes, contents and symlink targets do
+        (install_dir / "usr/bin/hello").chmod(0o644)
+        assert get_tree_digest(install_dir) != digest
+        (install_dir / "usr/bin/hello").chmod(0o755)
+        assert get_tree_digest(install_dir) == digest
+
+        (install_dir / "usr/bin/hello").write_text("hi")
+        assert get_tree_digest(install_dir) != digest
+        (install_dir / "usr/bin/hello").write_text("hello")
+
+        (install_dir / "usr/bin/hi").unlink()
+        (install_dir / "usr/bin/hi").symlink_to("other")
+        assert get_tree_digest(install_dir) != digest
+
+    def test_tree_digest_missing(self, tmp_path):
+        assert get_tree_digest(tmp_path / "missing") == ""
@@ -17,11 +17,13 @@
 from pathlib import Path
 
 import pytest
-from craft_parts import callbacks
+from craft_parts import callbacks, plugins
 from craft_parts.actions import Action
 from craft_parts.executor import ExecutionContext, Executor
 from craft_parts.infos import ProjectInfo
 from craft_parts.parts import Part
+from craft_parts.plugins.nil_plugin import NilPlugin
+from craft_parts.sources import git_source
 from craft_parts.steps import Step
 
 
@@ -57,6 +59,8 @@ class TestExecutor:
         assert file2.exists() is False
         assert file3.exists() is False
         assert stage_dir.exists() is False
+        # removed trees are deleted before returning
+        assert Path(".trash").exists() is False
 
     def test_clean_part(self, new_dir):
         p1 = Part("p1", {"plugin": "nil"})
@@ -246,6 +250,18 @@ class TestExecutionContext:
         captured = capfd.readouterr()
         assert captured.out == "prologue custom\nbuild\n"
 
+    def test_prologue_git_mirrors(self, new_dir, partitions):
+        git_source._UPDATED_MIRRORS.add(Path("mirror.git"))
+        p1 = Part("p1", {"plugin": "nil"}, partitions=partitions)
+        info = ProjectInfo(
+            application_name="test", cache_dir=new_dir, partitions=partitions
+        )
+        e = Executor(project_info=info, part_list=[p1])
+
+        # Git mirrors are updated again in each execution
+        with ExecutionContext(executor=e):
+            assert not git_source._UPDATED_MIRRORS
+
     def test_epilogue(self, capfd, new_dir, partitions):
         def cbf(info):
             print(f"epilogue {info.custom}")
@@ -270,6 +286,31 @@ class TestExecutionContext:
         captured = capfd.readouterr()
         assert captured.out == "build\nepilogue custom\n"
 
+    def test_epilogue_plugin_commands(self, capfd, new_dir, partitions):
+        class StopPlugin(NilPlugin):
+            def get_epilogue_commands(self) -> list[str]:
+                return ["echo stop"]
+
+        plugins.register({"stop": StopPlugin})
+        part_list = [
+            Part(name, {"plugin": "stop"}, partitions=partitions)
+            for name in ("p1", "p2", "p3")
+        ]
+        info = ProjectInfo(
+            application_name="test", cache_dir=new_dir, partitions=partitions
+        )
+        e = Executor(project_info=info, part_list=part_list)
+
+        try:
+            with ExecutionContext(executor=e) as ctx:
+                ctx.execute([Action("p1", Step.BUILD), Action("p2", Step.BUILD)])
+        finally:
+            plugins.unregister("stop")
+
+        # Commands run once, and only for parts built in this execution
+        captured = capfd.readouterr()
+        assert captured.out == "stop\n"
+
     def test_capture_stdout(self, capfd, new_dir, partitions):
         def cbf(info):
             print(f"prologue {info.custom}")
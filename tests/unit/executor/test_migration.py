@@ -27,6 +27,8 @@ from craft_parts.infos import PartInfo, ProjectInfo
 from craft_parts.overlays import OverlayManager
 from craft_parts.parts import Part
 from craft_parts.permissions import Permissions
+from craft_parts.state_manager import StateCache
+from craft_parts.state_manager.state_cache import MigrationIndex
 from craft_parts.steps import Step
 
 
@@ -486,6 +488,42 @@ class TestFileMigration:
         for file, exists in filemap.items():
             assert Path(stage_dir, file).exists() == exists
 
+    def test_migrate_files_skip_unchanged(self):
+        install_dir = Path("install")
+        stage_dir = Path("stage")
+
+        install_dir.mkdir()
+        stage_dir.mkdir()
+
+        Path(install_dir, "foo").write_text("installed")
+        Path(install_dir, "bar").write_text("installed")
+        Path(install_dir, "baz").symlink_to("foo")
+        migration.migrate_files(
+            files={"foo", "bar", "baz"},
+            dirs=set(),
+            srcdir=install_dir,
+            destdir=stage_dir,
+        )
+        foo_inode = Path(stage_dir, "foo").stat().st_ino
+
+        Path(install_dir, "bar").unlink()
+        Path(install_dir, "bar").write_text("changed")
+
+        fixed_up: list[str] = []
+        migrated_files, _ = migration.migrate_files(
+            files={"foo", "bar", "baz"},
+            dirs=set(),
+            srcdir=install_dir,
+            destdir=stage_dir,
+            fixup_func=fixed_up.append,
+            skip_unchanged=True,
+        )
+
+        assert migrated_files == {"foo", "bar", "baz"}
+        assert fixed_up == [str(stage_dir / "bar")]
+        assert Path(stage_dir, "foo").stat().st_ino == foo_inode
+        assert Path(stage_dir, "bar").read_text() == "changed"
+
 
 @pytest.mark.usefixtures("new_dir")
 class TestFileMigrationErrors:
@@ -548,32 +586,28 @@ class TestHelpers:
             handler1.run_action(Action("p1", step))
             handler2.run_action(Action("p2", step))
 
-        part_states = part_handler._load_part_states(Step.STAGE, part_list=[p1, p2])
-        print(f"partitions: {partitions}")
-        print(f"part_states: {part_states}")
+        part_states = StateCache().load_part_states(Step.STAGE, part_list=[p1, p2])
+        indexes = [
+            MigrationIndex.from_states(part_states, partition=partition)
+            for partition in partitions or (None,)
+        ]
 
         assert foo_path.is_file()
         assert bar_path.is_file()
 
-        for partition in partitions or (None,):
+        for index in indexes:
             migration.clean_shared_area(
-                part_name="p1",
-                shared_dir=p1.stage_dir,
-                part_states=part_states,
-                overlay_migration_state=None,
-                partition=partition,
+                part_name="p1", shared_dir=p1.stage_dir, index=index
             )
+            # p1 state is removed after cleaning
+            index.remove("p1")
 
         assert foo_path.is_file()  # remains, it's shared with p2
         assert bar_path.is_file()
 
-        for partition in partitions or (None,):
+        for index in indexes:
             migration.clean_shared_area(
-                part_name="p2",
-                shared_dir=p2.stage_dir,
-                part_states=part_states,
-                overlay_migration_state=None,
-                partition=partition,
+                part_name="p2", shared_dir=p2.stage_dir, index=index
             )
 
         assert not foo_path.exists()
@@ -635,6 +669,56 @@ class TestHelpers:
         migration._clean_migrated_files({"foo.txt"}, {"bar"}, Path("stage"))
 
 
+class TestUpdateHelpers:
+    """Verify helper functions used to update migrated files."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method_fixture(self, new_dir):
+        Path("install/dir").mkdir(parents=True)
+        Path("install/same").write_text("same")
+        Path("install/changed").write_text("changed")
+        Path("install/link").symlink_to("same")
+        Path("stage/dir").mkdir(parents=True)
+        Path("stage/changed").write_text("old")
+        Path("stage/link").symlink_to("changed")
+        Path("stage/removed").write_text("removed")
+        os.link("install/same", "stage/same")
+
+    def test_can_update_files(self):
+        assert migration.can_update_files(dirs={"dir"}, srcdir=Path("install"))
+        assert migration.can_update_files(dirs={"missing"}, srcdir=Path("install"))
+        assert not migration.can_update_files(
+            dirs={"dir", "same"}, srcdir=Path("install")
+        )
+        assert not migration.can_update_files(dirs={"link"}, srcdir=Path("install"))
+
+    def test_remove_outdated_files(self):
+        migration.remove_outdated_files(
+            files={"same", "changed", "link", "removed"},
+            srcdir=Path("install"),
+            destdir=Path("stage"),
+        )
+
+        assert Path("stage/same").exists()
+        assert not Path("stage/changed").exists()
+        assert not Path("stage/link").is_symlink()
+        # files removed from the source are cleaned after migration
+        assert Path("stage/removed").exists()
+
+    def test_remove_stale_files(self):
+        migration.remove_stale_files(
+            files={"same", "removed"},
+            dirs={"dir"},
+            migrated_files={"same"},
+            migrated_dirs=set(),
+            shared_dir=Path("stage"),
+        )
+
+        assert Path("stage/same").exists()
+        assert not Path("stage/removed").exists()
+        assert not Path("stage/dir").exists()
+
+
 class TestFilterWhiteouts:
     """Remove dangling file and opaque dir whiteouts."""
 
@@ -25,14 +25,17 @@ import pytest_check  # type: ignore[import]
 from craft_parts import ProjectDirs, errors, packages
 from craft_parts.actions import Action, ActionType
 from craft_parts.executor import filesets, part_handler
+from craft_parts.executor.build_cache import BuildCache, BuildCacheStats
 from craft_parts.executor.part_handler import MigrationContents, PartHandler
 from craft_parts.executor.step_handler import (
     StagePartitionContents,
     StepContents,
     StepPartitionContents,
 )
+from craft_parts.executor.trash import Trash
 from craft_parts.infos import PartInfo, ProjectInfo, StepInfo
 from craft_parts.overlays import OverlayManager
+from craft_parts.packages.base import STAGE_PACKAGES_INDEX_FILE, StagePackagesIndex
 from craft_parts.parts import Part
 from craft_parts.state_manager import states
 from craft_parts.state_manager.step_state import MigrationState
@@ -138,6 +141,114 @@ class TestPartHandling:
         assert self._mock_mount_overlayfs.mock_calls == []
         assert self._mock_umount.mock_calls == []
 
+    @pytest.mark.usefixtures("new_dir")
+    def test_run_build_cache(self, mocker):
+        def fake_build():
+            self._part.part_install_dir.mkdir(parents=True, exist_ok=True)
+            Path(self._part.part_install_dir, "hello").write_text("hello")
+
+        mock_build = mocker.patch(
+            "craft_parts.executor.step_handler.StepHandler._builtin_build",
+            side_effect=fake_build,
+        )
+        mocker.patch(
+            "craft_parts.packages.Repository.get_installed_packages",
+            return_value=["hello=2.10", "pkg3=1.0"],
+        )
+        mocker.patch(
+            "craft_parts.packages.snaps.get_installed_snaps",
+            return_value=["snapcraft=6466"],
+        )
+        mocker.patch("subprocess.check_output", return_value=b"os-info")
+
+        self._part_info.part_src_dir.mkdir(parents=True)
+        Path(self._part_info.part_src_dir, "source.c").write_text("main() {}")
+
+        build_cache = BuildCache(Path("cache"))
+        handler = PartHandler(
+            self._part,
+            part_info=self._part_info,
+            part_list=[self._part],
+            overlay_manager=self._handler._overlay_manager,
+            build_cache=build_cache,
+        )
+        step_info = StepInfo(self._part_info, Step.BUILD)
+
+        state = handler._run_build(step_info, stdout=None, stderr=None)
+        assert mock_build.call_count == 1
+        assert build_cache.stats == BuildCacheStats(hits=0, misses=1, stored=1)
+
+        # Build again with the same inputs
+        handler.clean_step(Step.BUILD)
+        assert not Path(self._part.part_install_dir, "hello").exists()
+
+        restored_state = handler._run_build(step_info, stdout=None, stderr=None)
+        assert mock_build.call_count == 1
+        assert build_cache.stats == BuildCacheStats(hits=1, misses=1, stored=1)
+        assert restored_state == state
+        assert Path(self._part.part_install_dir, "hello").read_text() == "hello"
+        assert Path(self._part.part_build_dir, "source.c").exists()
+
+        # Build again with different sources
+        handler.clean_step(Step.BUILD)
+        Path(self._part_info.part_src_dir, "source.c").write_text("main() {0}")
+
+        handler._run_build(step_info, stdout=None, stderr=None)
+        assert mock_build.call_count == 2
+        assert build_cache.stats == BuildCacheStats(hits=1, misses=2, stored=2)
+
+    @pytest.mark.usefixtures("new_dir")
+    def test_run_build_cache_miss(self, mocker):
+        def fake_build():
+            # The build expects the install directory to exist
+            Path(self._part.part_install_dir, "hello").write_text("hello")
+
+        mocker.patch(
+            "craft_parts.executor.step_handler.StepHandler._builtin_build",
+            side_effect=fake_build,
+        )
+        mocker.patch("craft_parts.packages.Repository.get_installed_packages")
+        mocker.patch("craft_parts.packages.snaps.get_installed_snaps")
+        mocker.patch("subprocess.check_output", return_value=b"os-info")
+
+        build_cache = BuildCache(Path("cache"))
+        handler = PartHandler(
+            self._part,
+            part_info=self._part_info,
+            part_list=[self._part],
+            overlay_manager=self._handler._overlay_manager,
+            build_cache=build_cache,
+        )
+
+        handler._run_build(
+            StepInfo(self._part_info, Step.BUILD), stdout=None, stderr=None
+        )
+
+        assert build_cache.stats == BuildCacheStats(hits=0, misses=1, stored=1)
+        assert Path(self._part.part_install_dir, "hello").read_text() == "hello"
+
+    def test_get_build_key_dependencies(self, partitions):
+        def get_key(stage_files: list[str]) -> str:
+            part_list = [
+                Part(
+                    "p1", {"plugin": "nil", "stage": stage_files}, partitions=partitions
+                ),
+                Part("p2", {"plugin": "nil", "after": ["p1"]}, partitions=partitions),
+                Part("p3", {"plugin": "nil", "after": ["p2"]}, partitions=partitions),
+            ]
+            handler = PartHandler(
+                part_list[2],
+                part_info=PartInfo(self._project_info, part_list[2]),
+                part_list=part_list,
+                overlay_manager=self._handler._overlay_manager,
+            )
+            step_info = StepInfo(self._part_info, Step.BUILD)
+            return handler._get_build_key(step_info, assets={})
+
+        # Changes in indirect dependencies affect what is staged for the build
+        assert get_key(["*"]) == get_key(["*"])
+        assert get_key(["*"]) != get_key(["usr"])
+
     @pytest.mark.usefixtures("new_dir")
     @pytest.mark.parametrize("out_of_source", [True, False])
     def test_run_build_out_of_source_behavior(self, mocker, out_of_source):
@@ -297,6 +408,70 @@ class TestPartHandling:
             primed_stage_packages={"pkg"},
         )
 
+    def test_run_prime_stage_packages_index(self, new_dir, mocker, partitions):
+        default_partition = partitions[0] if partitions is not None else "default"
+        mock_step_contents = StepContents(partitions=partitions)
+        mock_step_contents.partitions_contents[default_partition] = (
+            StepPartitionContents(
+                files={"file", "pkg_file"},
+                dirs={"dir"},
+            )
+        )
+        partitions_migration_contents = {}
+        if partitions is not None:
+            for p in partitions[1:]:
+                mock_step_contents.partitions_contents[p] = StepPartitionContents(
+                    files=set(),
+                    dirs=set(),
+                )
+                partitions_migration_contents[p] = MigrationContents(
+                    files=set(),
+                    directories=set(),
+                )
+        mocker.patch(
+            "craft_parts.executor.step_handler.StepHandler._builtin_prime",
+            return_value=mock_step_contents,
+        )
+        mock_getxattr = mocker.patch("os.getxattr", return_value=b"xattr-pkg")
+
+        extract_dir = Path(new_dir, "extract")
+        extract_dir.mkdir()
+        Path(extract_dir, "pkg_file").touch()
+        install_dir = self._part.part_install_dir
+        install_dir.mkdir(parents=True)
+        os.link(extract_dir / "pkg_file", install_dir / "pkg_file")
+        index = StagePackagesIndex(install_dir)
+        index.mark(extract_dir, "pkg")
+        index.write(self._part.part_packages_dir / STAGE_PACKAGES_INDEX_FILE)
+
+        ovmgr = OverlayManager(
+            project_info=self._project_info,
+            part_list=[self._part],
+            base_layer_dir=None,
+            cache_level=0,
+        )
+        handler = PartHandler(
+            self._part,
+            track_stage_packages=True,
+            part_info=self._part_info,
+            part_list=[self._part],
+            overlay_manager=ovmgr,
+        )
+
+        state = handler._run_prime(
+            StepInfo(self._part_info, Step.PRIME), stdout=None, stderr=None
+        )
+        assert state == states.PrimeState(
+            partition=default_partition,
+            part_properties=self._part.spec.marshal(),
+            project_options=self._part_info.project_options,
+            files={"file", "pkg_file"},
+            directories={"dir"},
+            partitions_contents=partitions_migration_contents,
+            primed_stage_packages={"pkg"},
+        )
+        assert mock_getxattr.mock_calls == []
+
     def test_run_prime_dont_track_packages(self, mocker, partitions):
         default_partition = partitions[0] if partitions is not None else "default"
         mock_step_contents = StepContents(partitions=partitions)
@@ -559,6 +734,22 @@ class TestPartUpdateHandler:
         assert Path("parts/foo/src/foo.txt").read_text() == "change"
         assert Path("parts/foo/src/bar.txt").exists()
 
+    def test_update_pull_outdated_files(self, mocker):
+        self._handler.run_action(Action("foo", Step.PULL))
+        assert self._handler._source_handler is not None
+
+        # Files reported by the source after updating are recorded in the state
+        mocker.patch.object(
+            self._handler._source_handler,
+            "get_outdated_files",
+            return_value=(["foo.txt"], []),
+        )
+        self._handler.run_action(Action("foo", Step.PULL, ActionType.UPDATE))
+
+        state = cast(states.PullState, states.load_step_state(self._part, Step.PULL))
+        assert state.outdated_files == ["foo.txt"]
+        assert state.outdated_dirs == []
+
     def test_update_pull_no_source(self, new_dir, partitions, caplog):
         caplog.set_level(logging.WARNING)
         p1 = Part("p1", {"plugin": "nil"}, partitions=partitions)
@@ -663,10 +854,88 @@ class TestPartUpdateHandler:
 
         assert Path("parts/foo/install/hello").exists()
 
-    @pytest.mark.parametrize("step", [Step.STAGE, Step.PRIME])
-    def test_update_invalid(self, step):
-        with pytest.raises(errors.InvalidAction):
-            self._handler.run_action(Action("foo", step, ActionType.UPDATE))
+    @pytest.mark.parametrize(
+        ("step", "shared_dir"), [(Step.STAGE, "stage"), (Step.PRIME, "prime")]
+    )
+    def test_update_migration(self, step, shared_dir):
+        Path("subdir/old.txt").write_text("old")
+        for current_step in [Step.PULL, Step.OVERLAY, Step.BUILD, Step.STAGE]:
+            self._handler.run_action(Action("foo", current_step))
+        if step == Step.PRIME:
+            self._handler.run_action(Action("foo", Step.PRIME))
+
+        foo_stat = Path(shared_dir, "foo.txt").stat()
+        Path("parts/foo/install/old.txt").unlink()
+        Path("parts/foo/install/bar.txt").write_text("bar")
+        if step == Step.PRIME:
+            self._handler.run_action(Action("foo", Step.STAGE, ActionType.UPDATE))
+
+        self._handler.run_action(Action("foo", step, ActionType.UPDATE))
+
+        # unchanged files are not migrated again
+        assert Path(shared_dir, "foo.txt").stat().st_ino == foo_stat.st_ino
+        assert Path(shared_dir, "bar.txt").read_text() == "bar"
+        assert Path(shared_dir, "old.txt").exists() is False
+
+        state = states.load_step_state(self._part, step)
+        assert state is not None
+        assert state.files == {"foo.txt", "bar.txt"}
+
+    def test_update_migration_changed_file(self):
+        for step in [Step.PULL, Step.OVERLAY, Step.BUILD, Step.STAGE]:
+            self._handler.run_action(Action("foo", step))
+
+        Path("parts/foo/install/foo.txt").unlink()
+        Path("parts/foo/install/foo.txt").symlink_to("bar.txt")
+
+        self._handler.run_action(Action("foo", Step.STAGE, ActionType.UPDATE))
+
+        assert Path("stage/foo.txt").readlink() == Path("bar.txt")
+
+    def test_update_migration_shared_file(self, new_dir, partitions):
+        p2 = Part("p2", {"plugin": "nil"}, partitions=partitions)
+        for step in [Step.PULL, Step.OVERLAY, Step.BUILD, Step.STAGE]:
+            self._handler.run_action(Action("foo", step))
+
+        # another part staged the same file
+        states.StageState(
+            partition=self._part_info.default_partition,
+            part_properties=p2.spec.marshal(),
+            project_options=self._part_info.project_options,
+            files={"foo.txt"},
+        ).write(states.get_step_state_path(p2, Step.STAGE))
+        Path("parts/foo/install/foo.txt").unlink()
+
+        ovmgr = OverlayManager(
+            project_info=self._project_info,
+            part_list=[self._part, p2],
+            base_layer_dir=None,
+            cache_level=0,
+        )
+        handler = PartHandler(
+            self._part,
+            part_info=self._part_info,
+            part_list=[self._part, p2],
+            overlay_manager=ovmgr,
+        )
+        handler.run_action(Action("foo", Step.STAGE, ActionType.UPDATE))
+
+        assert Path("stage/foo.txt").exists()
+
+    def test_update_migration_type_changed(self, mocker):
+        for step in [Step.PULL, Step.OVERLAY, Step.BUILD, Step.STAGE]:
+            self._handler.run_action(Action("foo", step))
+
+        Path("parts/foo/install/dir").mkdir()
+        self._handler.run_action(Action("foo", Step.STAGE, ActionType.UPDATE))
+        clean_step = mocker.spy(self._handler, "clean_step")
+
+        Path("parts/foo/install/dir").rmdir()
+        Path("parts/foo/install/dir").write_text("dir")
+        self._handler.run_action(Action("foo", Step.STAGE, ActionType.UPDATE))
+
+        clean_step.assert_called_once_with(Step.STAGE)
+        assert Path("stage/dir").read_text() == "dir"
 
 
 def _run_step_migration(handler: PartHandler, step: Step) -> None:
@@ -963,6 +1232,7 @@ class TestPackages:
         mock_snap_provision.assert_called_once_with(
             new_dir / "parts/p1/install",
             keep=True,
+            use_cache=True,
         )
 
     def test_get_build_packages(self, new_dir, partitions):
@@ -1173,6 +1443,19 @@ class TestHelpers:
         part_handler._remove(test_dir)
         assert test_dir.exists() is False
 
+    def test_remove_dir_trash(self, mocker):
+        test_dir = Path("bar")
+        test_dir.mkdir()
+        trash = Trash(Path("trash"))
+        spy = mocker.spy(trash, "discard")
+
+        part_handler._remove(test_dir, trash=trash)
+        assert test_dir.exists() is False
+        spy.assert_called_once_with(test_dir)
+
+        trash.wait()
+        assert Path("trash").exists() is False
+
     def test_remove_non_existent(self):
         # this should not raise and exception
         part_handler._remove(Path("not_here"))
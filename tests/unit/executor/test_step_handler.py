@@ -15,12 +15,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import itertools
 import os
+import sys
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 from craft_parts import errors, plugins, sources
 from craft_parts.dirs import ProjectDirs
+from craft_parts.executor import step_handler
 from craft_parts.executor.environment import generate_step_environment
 from craft_parts.executor.step_handler import (
     StagePartitionContents,
@@ -32,6 +34,7 @@ from craft_parts.infos import (
     _DEB_TO_TRIPLET,
     PartInfo,
     ProjectInfo,
+    ProjectVarInfo,
     StepInfo,
     _get_host_architecture,
 )
@@ -395,3 +398,135 @@ class TestStepHandlerRunScriptlet:
             )
         assert raised.value.stderr is not None
         assert raised.value.stderr.endswith(b"\nuh-oh\n+ false\n")
+
+
+class TestStepHandlerControlProtocol:
+    """Verify the scriptlet control protocol server."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, new_dir, partitions):
+        # pylint: disable=attribute-defined-outside-init
+        self._part = Part("p1", {"source": "."}, partitions=partitions)
+        self._dirs = ProjectDirs(partitions=partitions)
+        self._project_info = ProjectInfo(
+            project_dirs=self._dirs,
+            application_name="test",
+            cache_dir=new_dir,
+            strict_mode=False,
+            partitions=partitions,
+            project_vars=ProjectVarInfo.unmarshal(
+                {
+                    "version": {"value": "", "part-name": "p1"},
+                    "grade": {"value": "stable", "part-name": "p1"},
+                }
+            ),
+        )
+        self._part_info = PartInfo(project_info=self._project_info, part=self._part)
+        # pylint: enable=attribute-defined-outside-init
+
+    def _run_scriptlet(self, new_dir, scriptlet: str) -> None:
+        sh = _step_handler_for_step(
+            Step.BUILD,
+            cache_dir=new_dir,
+            part_info=self._part_info,
+            part=self._part,
+            dirs=self._dirs,
+        )
+        sh.run_scriptlet(
+            scriptlet, scriptlet_name="name", step=Step.BUILD, work_dir=new_dir
+        )
+
+    def test_shell_function_get_set(self, new_dir, capfd):
+        self._run_scriptlet(
+            new_dir,
+            dedent(
+                """\
+                craftctl set version='1.0 "quoted" \\slashed'
+                echo "version: $(craftctl get version)"
+                echo "grade: $(craftctl get grade)"
+                """
+            ),
+        )
+
+        captured = capfd.readouterr()
+        assert captured.out == 'version: 1.0 "quoted" \\slashed\ngrade: stable\n'
+        assert self._project_info.get_project_var("version", raw_read=True) == (
+            '1.0 "quoted" \\slashed'
+        )
+        # the shell function internals are not traced
+        assert "printf" not in captured.err
+
+    def test_shell_function_large_reply(self, new_dir, capfd):
+        # The reply doesn't fit in the FIFO buffer
+        value = "x" * 200000
+        self._run_scriptlet(
+            new_dir,
+            dedent(
+                f"""\
+                craftctl set version={value}
+                craftctl get version | wc -c
+                """
+            ),
+        )
+
+        captured = capfd.readouterr()
+        assert captured.out == "200001\n"
+
+    def test_shell_function_concurrent(self, new_dir, capfd):
+        self._run_scriptlet(
+            new_dir,
+            dedent(
+                """\
+                for i in $(seq 20); do
+                    ( [[ "$(craftctl get grade)" == stable ]] || echo mismatch ) &
+                    ( [[ "$(craftctl get version)" == "" ]] || echo mismatch ) &
+                done
+                wait
+                echo done
+                """
+            ),
+        )
+
+        captured = capfd.readouterr()
+        assert captured.out == "done\n"
+
+    def test_shell_function_error(self, new_dir, capfd):
+        with pytest.raises(errors.ScriptletRunError):
+            self._run_scriptlet(new_dir, "craftctl get invalid")
+
+        captured = capfd.readouterr()
+        assert "craftctl: " in captured.err
+        assert "'invalid' not in project variables" in captured.err
+
+    def test_client_batch(self, new_dir, capfd):
+        root_dir = Path(__file__).parents[3]
+        self._run_scriptlet(
+            new_dir,
+            f"PYTHONPATH={root_dir} {sys.executable} -c "
+            "'from craft_parts.ctl import CraftCtl; "
+            'print(CraftCtl.run_batch([("set", ["version=2"]), ("get", ["version"])]))\'',
+        )
+
+        captured = capfd.readouterr()
+        assert captured.out == "[None, '2']\n"
+
+
+class TestCtlBuffer:
+    """Verify the splitting of control requests."""
+
+    def test_framed(self):
+        buffer = step_handler._CtlBuffer()
+
+        assert buffer.feed(b"CRAFTCTL/") == []
+        assert buffer.feed(b'2\n{"a": 1}\n{"b"') == [('{"a": 1}', True)]
+        assert buffer.feed(b": 2}\n\n") == [('{"b": 2}', True)]
+
+    def test_unframed(self):
+        buffer = step_handler._CtlBuffer()
+
+        assert buffer.feed(b'{"a": 1}') == [('{"a": 1}', False)]
+
+    def test_framed_by_default(self):
+        buffer = step_handler._CtlBuffer(framed=True)
+
+        assert buffer.feed(b'{"a": 1}\n') == [('{"a": 1}', True)]
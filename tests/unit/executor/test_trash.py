@@ -0,0 +1,98 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import shutil
+from pathlib import Path
+
+import pytest
+from craft_parts.executor.trash import Trash
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    tree = tmp_path / "tree"
+    (tree / "a/b").mkdir(parents=True)
+    (tree / "a/b/foo").write_text("foo")
+    (tree / "bar").symlink_to("a/b/foo")
+    return tree
+
+
+class TestTrash:
+    """Verify the background removal of directory trees."""
+
+    def test_discard(self, tmp_path, tree):
+        trash = Trash(tmp_path / "trash")
+
+        trash.discard(tree)
+        assert not tree.exists()
+
+        trash.wait()
+        assert not (tmp_path / "trash").exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_discard_same_name(self, tmp_path, tree):
+        trash = Trash(tmp_path / "trash")
+
+        trash.discard(tree)
+        tree.mkdir()
+        trash.discard(tree)
+        assert not tree.exists()
+
+        trash.wait()
+        assert not (tmp_path / "trash").exists()
+
+    def test_discard_cannot_move(self, mocker, tmp_path, tree):
+        mocker.patch.object(Path, "rename", side_effect=OSError("cross-device link"))
+        spy = mocker.spy(shutil, "rmtree")
+        trash = Trash(tmp_path / "trash")
+
+        trash.discard(tree)
+
+        assert not tree.exists()
+        spy.assert_called_once_with(tree)
+
+    def test_empty(self, tmp_path, tree):
+        # Trees left by an interrupted execution
+        trash_dir = tmp_path / "trash"
+        trash_dir.mkdir()
+        tree.rename(trash_dir / "tree-1234")
+        (trash_dir / "file").touch()
+
+        trash = Trash(trash_dir)
+        trash.empty()
+        trash.wait()
+
+        assert not trash_dir.exists()
+
+    def test_empty_no_trash(self, tmp_path):
+        trash = Trash(tmp_path / "trash")
+        trash.empty()
+        trash.wait()
+
+        assert not (tmp_path / "trash").exists()
+
+    def test_wait_error(self, mocker, tmp_path, tree, caplog):
+        caplog.set_level(logging.WARNING)
+        mocker.patch("craft_parts.executor.trash._delete", side_effect=OSError("busy"))
+        trash = Trash(tmp_path / "trash")
+
+        trash.discard(tree)
+        trash.wait()
+
+        # Trees not deleted are kept in the trash
+        assert len(list((tmp_path / "trash").iterdir())) == 1
+        assert "busy" in caplog.text
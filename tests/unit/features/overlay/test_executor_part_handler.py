@@ -19,6 +19,7 @@ import pytest
 from craft_parts import errors
 from craft_parts.actions import Action, ActionType
 from craft_parts.executor import part_handler
+from craft_parts.executor.build_cache import BuildCache, BuildCacheStats
 from craft_parts.executor.part_handler import MigrationContents, PartHandler
 from craft_parts.executor.step_handler import StagePartitionContents, StepContents
 from craft_parts.infos import PartInfo, ProjectInfo, StepInfo
@@ -153,6 +154,68 @@ class TestPartHandling(test_part_handler.TestPartHandling):
         )
         self._mock_umount.assert_called_with(f"{self._part_info.overlay_mount_dir}")
 
+    def test_run_build_cache(self, mocker):
+        mock_build = mocker.patch(
+            "craft_parts.executor.step_handler.StepHandler._builtin_build"
+        )
+        mocker.patch(
+            "craft_parts.packages.Repository.get_installed_packages",
+            return_value=["hello=2.10"],
+        )
+        mocker.patch(
+            "craft_parts.packages.snaps.get_installed_snaps",
+            return_value=["snapcraft=6466"],
+        )
+        mocker.patch("subprocess.check_output", return_value=b"os-info")
+
+        build_cache = BuildCache(Path("cache"))
+        handler = PartHandler(
+            self._part,
+            part_info=self._part_info,
+            part_list=[self._part],
+            overlay_manager=self._handler._overlay_manager,
+            build_cache=build_cache,
+        )
+        step_info = StepInfo(self._part_info, Step.BUILD)
+
+        # Builds that can see the overlay are not cached
+        handler._run_build(step_info, stdout=None, stderr=None)
+        handler.clean_step(Step.BUILD)
+        handler._run_build(step_info, stdout=None, stderr=None)
+
+        assert mock_build.call_count == 2
+        assert build_cache.stats == BuildCacheStats(hits=0, misses=0, stored=0)
+
+    def test_run_build_cache_miss(self, mocker):
+        def fake_build():
+            # The build expects the install directory to exist
+            Path(self._part.part_install_dir, "hello").write_text("hello")
+
+        mocker.patch(
+            "craft_parts.executor.step_handler.StepHandler._builtin_build",
+            side_effect=fake_build,
+        )
+        mocker.patch("craft_parts.packages.Repository.get_installed_packages")
+        mocker.patch("craft_parts.packages.snaps.get_installed_snaps")
+        mocker.patch("subprocess.check_output", return_value=b"os-info")
+
+        build_cache = BuildCache(Path("cache"))
+        handler = PartHandler(
+            self._part,
+            part_info=self._part_info,
+            part_list=[self._part],
+            overlay_manager=self._handler._overlay_manager,
+            build_cache=build_cache,
+        )
+
+        handler._run_build(
+            StepInfo(self._part_info, Step.BUILD), stdout=None, stderr=None
+        )
+
+        # Builds that can see the overlay are not cached
+        assert build_cache.stats == BuildCacheStats(hits=0, misses=0, stored=0)
+        assert Path(self._part.part_install_dir, "hello").read_text() == "hello"
+
     def test_run_build_without_overlay_visibility(self, mocker, new_dir, partitions):
         mocker.patch("craft_parts.executor.step_handler.StepHandler._builtin_build")
 
@@ -19,7 +19,7 @@ from pathlib import Path
 from unittest.mock import ANY, call
 
 import pytest
-from craft_parts.overlays import chroot
+from craft_parts.overlays import chroot, errors
 
 
 def target_func(content: str) -> int:
@@ -188,3 +188,75 @@ class TestChroot:
         assert fake_conn.sent[0] is None
         assert isinstance(fake_conn.sent[1], str)
         assert str(fake_conn.sent[1]) == "bummer"
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestChrootWorker:
+    """Execute in a chroot worker process."""
+
+    @pytest.fixture
+    def new_root(self, new_dir):
+        new_root = Path(new_dir, "dir1")
+        new_root.mkdir()
+        return new_root
+
+    def test_run(self, mocker, new_root, mock_chroot):
+        mock_mount = mocker.patch("craft_parts.utils.os_utils.mount")
+        mock_umount = mocker.patch("craft_parts.utils.os_utils.umount")
+        spy_process = mocker.spy(multiprocessing, "Process")
+        Path(new_root, "etc").mkdir()
+
+        worker = chroot.ChrootWorker(new_root)
+        try:
+            assert worker.run(target_func, "content") == 1337
+            assert Path("dir1/foo.txt").read_text() == "content"
+            assert worker.run(target_func, content="other") == 1337
+            assert Path("dir1/foo.txt").read_text() == "other"
+        finally:
+            worker.stop()
+
+        # a single process is used, mountpoints are set up once
+        assert spy_process.mock_calls == [
+            call(target=chroot._serve, args=(new_root, ANY), daemon=True)
+        ]
+        assert mock_mount.mock_calls == [
+            call("/etc/resolv.conf", f"{new_root}/etc/resolv.conf", "--bind"),
+            call(f"{new_root}/etc/resolv.conf", "--make-rprivate"),
+        ]
+        assert mock_umount.mock_calls == [
+            call(f"{new_root}/etc/resolv.conf", "--recursive"),
+        ]
+
+    def test_run_error(self, new_root, mock_chroot):
+        worker = chroot.ChrootWorker(new_root)
+        try:
+            with pytest.raises(errors.OverlayChrootExecutionError) as raised:
+                worker.run(target_func_error, "content")
+
+            # the worker is still usable
+            assert worker.run(target_func, "content") == 1337
+        finally:
+            worker.stop()
+
+        assert raised.value.message == "bummer"
+
+    def test_run_not_picklable(self, mocker, new_root, mock_chroot):
+        spy_process = mocker.spy(multiprocessing, "Process")
+
+        worker = chroot.ChrootWorker(new_root)
+        try:
+            assert worker.run(lambda: target_func("lambda")) == 1337
+        finally:
+            worker.stop()
+
+        assert Path("dir1/foo.txt").read_text() == "lambda"
+        assert spy_process.mock_calls[-1] == call(
+            target=chroot._runner, args=(new_root, ANY, ANY, (), {})
+        )
+
+    def test_stop_not_started(self, mocker, new_root):
+        mock_umount = mocker.patch("craft_parts.utils.os_utils.umount")
+
+        chroot.ChrootWorker(new_root).stop()
+
+        mock_umount.assert_not_called()
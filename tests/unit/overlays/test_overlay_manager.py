@@ -14,12 +14,20 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import pickle
 from pathlib import Path
+from unittest.mock import call
 
 import pytest
 from craft_parts.infos import ProjectInfo
-from craft_parts.overlays import LayerMount, OverlayManager, PackageCacheMount
+from craft_parts.overlays import (
+    LayerMount,
+    OverlayManager,
+    PackageCacheMount,
+    overlay_manager,
+)
 from craft_parts.overlays.overlay_fs import OverlayFS
+from craft_parts.overlays.overlay_manager import _defer_evaluation
 from craft_parts.parts import Part
 
 
@@ -132,6 +140,45 @@ class TestLayerMounting:
         assert str(raised.value) == "filesystem is not mounted"
         self.mock_umount.assert_not_called()
 
+    def test_session_reuse_mount(self, new_dir):
+        self.om.start_session()
+
+        self.om.mount_layer(self.p2)
+        self.om.unmount()
+        self.om.mount_layer(self.p2)
+        self.om.unmount()
+
+        assert self.mock_mount_overlayfs.call_count == 1
+        self.mock_umount.assert_not_called()
+
+        self.om.end_session()
+        self.mock_umount.assert_called_once_with(str(new_dir / "overlay/overlay"))
+
+    def test_session_remount(self, new_dir):
+        self.om.start_session()
+
+        self.om.mount_layer(self.p1)
+        self.om.unmount()
+        self.om.mount_layer(self.p2)
+
+        assert self.mock_mount_overlayfs.call_count == 2
+        self.mock_umount.assert_called_once_with(str(new_dir / "overlay/overlay"))
+
+    def test_session_release(self, new_dir):
+        self.om.start_session()
+        self.om.mount_layer(self.p2)
+
+        # the stack is in use
+        self.om.release()
+        self.mock_umount.assert_not_called()
+
+        self.om.unmount()
+        self.om.release()
+        self.mock_umount.assert_called_once_with(str(new_dir / "overlay/overlay"))
+
+        self.om.mount_layer(self.p2)
+        assert self.mock_mount_overlayfs.call_count == 2
+
     def test_mkdirs(self, new_dir):
         self.om.mkdirs()
         Path("overlay/overlay").is_dir()
@@ -285,10 +332,29 @@ class TestPackageManagement:
             f"workdir={new_dir}/overlay/work",
         )
         self.mock_chroot.assert_called_once_with(
-            new_dir / "overlay/overlay", self.mock_refresh_packages_list
+            new_dir / "overlay/overlay", overlay_manager._refresh_packages_list
         )
+        self.mock_refresh_packages_list.cache_clear.assert_called_once_with()
         self.mock_refresh_packages_list.assert_called_once_with()
 
+    def test_refresh_packages_list_chroot_worker(self, mocker, new_dir):
+        mock_worker = mocker.patch("craft_parts.overlays.chroot.ChrootWorker")
+
+        self.om.mkdirs()
+        self.om.start_session()
+        self.om.mount_pkg_cache()
+        self.om.refresh_packages_list()
+        self.om.refresh_packages_list()
+
+        # The cache is reset in the worker, which keeps the cached refresh
+        assert mock_worker.return_value.run.mock_calls == [
+            call(overlay_manager._refresh_packages_list),
+            call(overlay_manager._refresh_packages_list),
+        ]
+        refresh = pickle.loads(pickle.dumps(overlay_manager._refresh_packages_list))  # noqa: S301
+        assert refresh is overlay_manager._refresh_packages_list
+        self.om.end_session()
+
     def test_download_packages(self, mocker, new_dir):
         mock_download_packages = mocker.patch(
             "craft_parts.packages.Repository.download_packages"
@@ -333,6 +399,30 @@ class TestPackageManagement:
             ["pkg1", "pkg2"], refresh_package_cache=False
         )
 
+    def test_session_chroot_worker(self, mocker, new_dir):
+        mock_worker = mocker.patch("craft_parts.overlays.chroot.ChrootWorker")
+        mock_install_packages = mocker.patch(
+            "craft_parts.packages.Repository.install_packages"
+        )
+
+        self.om.mkdirs()
+        self.om.start_session()
+        self.om.mount_layer(self.p1, pkg_cache=True)
+        self.om.install_packages(["pkg1"])
+        self.om.install_packages(["pkg2"])
+        self.om.unmount()
+
+        self.mock_chroot.assert_not_called()
+        assert mock_worker.mock_calls[0] == call(new_dir / "overlay/overlay")
+        assert mock_worker.return_value.run.mock_calls == [
+            call(mock_install_packages, ["pkg1"], refresh_package_cache=False),
+            call(mock_install_packages, ["pkg2"], refresh_package_cache=False),
+        ]
+        mock_worker.return_value.stop.assert_not_called()
+
+        self.om.end_session()
+        mock_worker.return_value.stop.assert_called_once_with()
+
     def test_package_cache_mount_refresh(self, new_dir):
         self.om._overlay_fs = OverlayFS(
             lower_dirs=[Path("base_dir")],
@@ -350,8 +440,9 @@ class TestPackageManagement:
             f"workdir={new_dir}/overlay/work",
         )
         self.mock_chroot.assert_called_once_with(
-            new_dir / "overlay/overlay", self.mock_refresh_packages_list
+            new_dir / "overlay/overlay", overlay_manager._refresh_packages_list
         )
+        self.mock_refresh_packages_list.cache_clear.assert_called_once_with()
         self.mock_refresh_packages_list.assert_called_once_with()
         self.mock_umount.assert_called_once_with(new_dir / "overlay/overlay")
 
@@ -411,3 +502,16 @@ class TestPackageManagement:
             ["pkg1", "pkg2"], refresh_package_cache=False
         )
         self.mock_umount.assert_called_once_with(new_dir / "overlay/overlay")
+
+
+class _FakeRepository:
+    @classmethod
+    def install_packages(cls, package_names: list[str]) -> list[str]:
+        return package_names
+
+
+def test_defer_evaluation_pickle():
+    deferred = _defer_evaluation(_FakeRepository.install_packages)
+
+    unpickled = pickle.loads(pickle.dumps(deferred))  # noqa: S301
+    assert unpickled(["pkg1"]) == ["pkg1"]
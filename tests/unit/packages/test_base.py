@@ -13,6 +13,8 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import shutil
 import sys
 from pathlib import Path
 from unittest.mock import call
@@ -121,6 +123,105 @@ class TestOriginStagePackage:
         assert base.read_origin_stage_package(str(test_dir / "bar")) == "package"
 
 
+class TestStagePackagesIndex:
+    """Check the index of files unpacked from stage packages."""
+
+    @pytest.fixture
+    def install_dir(self, tmp_path):
+        install_dir = tmp_path / "install"
+        for pkg in ("foo", "bar"):
+            extract_dir = tmp_path / pkg
+            (extract_dir / "usr/bin").mkdir(parents=True)
+            (extract_dir / f"usr/bin/{pkg}").write_text(pkg)
+            (extract_dir / f"usr/bin/{pkg}-link").symlink_to(pkg)
+
+        shutil.copytree(tmp_path / "foo", install_dir, symlinks=True)
+        shutil.copytree(
+            tmp_path / "bar", install_dir, symlinks=True, dirs_exist_ok=True
+        )
+        return install_dir
+
+    def test_get_stage_packages(self, tmp_path, install_dir):
+        index = base.StagePackagesIndex(install_dir)
+        index.mark(tmp_path / "foo", "foo=1.0")
+        index.mark(tmp_path / "bar", "bar=2.0")
+
+        # Symlinks are not tracked.
+        assert len(index) == 2
+        assert index.get_stage_packages(["usr/bin/foo", "usr/bin/other"]) == {"foo=1.0"}
+        assert index.get_stage_packages(["usr/bin/foo", "usr/bin/bar"]) == {
+            "foo=1.0",
+            "bar=2.0",
+        }
+        assert index.get_stage_packages([]) == set()
+
+    def test_update(self, tmp_path, install_dir):
+        index = base.StagePackagesIndex(install_dir)
+        index.mark(tmp_path / "foo", "foo=1.0")
+        index.mark(tmp_path / "bar", "bar=2.0")
+
+        # Organize a file and replace another
+        (install_dir / "bin").mkdir()
+        (install_dir / "usr/bin/foo").rename(install_dir / "bin/foo")
+        (install_dir / "usr/bin/bar.new").write_text("built")
+        (install_dir / "usr/bin/bar.new").replace(install_dir / "usr/bin/bar")
+        index.update()
+
+        assert index.get_stage_packages(["usr/bin/foo", "usr/bin/bar"]) == set()
+        assert index.get_stage_packages(["bin/foo"]) == {"foo=1.0"}
+
+    def test_update_reused_inode(self, tmp_path, install_dir):
+        # A file created by the build reuses the inode of a removed package file
+        built_file = install_dir / "usr/bin/built"
+        built_file.write_text("built")
+        index_file = tmp_path / "index.json"
+        index_file.write_text(
+            json.dumps(
+                {
+                    "packages": ["foo=1.0"],
+                    "files": [["usr/bin/removed", built_file.stat().st_ino, 3, 0, 0]],
+                }
+            )
+        )
+        index = base.StagePackagesIndex.read(index_file, install_dir=install_dir)
+        assert index is not None
+
+        index.update()
+
+        assert index.get_stage_packages(["usr/bin/built"]) == set()
+
+    def test_refresh(self, tmp_path, install_dir):
+        index = base.StagePackagesIndex(install_dir)
+        index.mark(tmp_path / "foo", "foo=1.0")
+
+        # Files modified after being unpacked are still from the package once
+        # the index is refreshed.
+        (install_dir / "usr/bin/foo").write_text("normalized")
+        index.refresh()
+        index.update()
+
+        assert index.get_stage_packages(["usr/bin/foo"]) == {"foo=1.0"}
+
+    def test_write_read(self, tmp_path, install_dir):
+        index = base.StagePackagesIndex(install_dir)
+        index.mark(tmp_path / "foo", "foo=1.0")
+        index.mark(tmp_path / "bar", "bar=2.0")
+        index.write(tmp_path / "index/index.json")
+
+        loaded = base.StagePackagesIndex.read(
+            tmp_path / "index/index.json", install_dir=install_dir
+        )
+        assert loaded is not None
+        assert len(loaded) == 2
+        assert loaded.get_stage_packages(["usr/bin/bar"]) == {"bar=2.0"}
+
+    def test_read_missing(self, tmp_path):
+        index = base.StagePackagesIndex.read(
+            tmp_path / "index.json", install_dir=tmp_path
+        )
+        assert index is None
+
+
 class TestRepositoryEvaluation:
     def test_dynamic_repository(self, mocker):
         mocker.patch("craft_parts.packages.is_deb_based", return_value=False)
@@ -120,6 +120,7 @@ def test_python_get_build_environment(new_dir, python_plugin):
         "PATH": f"{new_dir}/parts/p1/install/bin:${{PATH}}",
         "PARTS_PYTHON_INTERPRETER": "python3",
         "PARTS_PYTHON_VENV_ARGS": "",
+        "PIP_CACHE_DIR": f"{new_dir}/python/pip",
     }
 
 
@@ -180,7 +181,7 @@ def test_python_get_rewrite_shebangs_commands(new_dir, python_plugin: FooPythonP
     assert python_plugin._get_rewrite_shebangs_commands() == [
         textwrap.dedent(
             f"""\
-            find "{new_dir}/parts/p1/install" -type f -executable -print0 | xargs --no-run-if-empty -0 \\
+            find "{new_dir}/parts/p1/install" -type f -executable \\( -cnewer "{new_dir}/parts/p1/cache/python-install.stamp" -o -path "{new_dir}/parts/p1/install/bin/*" \\) -print0 | xargs --no-run-if-empty -0 \\
                 sed -i "1 s|^#\\!${{PARTS_PYTHON_VENV_INTERP_PATH}}.*$|#!/usr/bin/env ${{PARTS_PYTHON_INTERPRETER}}|"
             """
         )
@@ -219,10 +220,12 @@ def test_python_get_build_commands(new_dir, python_plugin: FooPythonPlugin):
     assert python_plugin.get_build_commands() == [
         f'"${{PARTS_PYTHON_INTERPRETER}}" -m venv ${{PARTS_PYTHON_VENV_ARGS}} "{new_dir}/parts/p1/install"',
         f'PARTS_PYTHON_VENV_INTERP_PATH="{new_dir}/parts/p1/install/bin/${{PARTS_PYTHON_INTERPRETER}}"',
+        f'mkdir -p "{new_dir}/parts/p1/cache"',
+        f'touch "{new_dir}/parts/p1/cache/python-install.stamp"',
         "echo 'This is where I put my install commands... if I had any!'",
         textwrap.dedent(
             f"""\
-            find "{new_dir}/parts/p1/install" -type f -executable -print0 | xargs --no-run-if-empty -0 \\
+            find "{new_dir}/parts/p1/install" -type f -executable \\( -cnewer "{new_dir}/parts/p1/cache/python-install.stamp" -o -path "{new_dir}/parts/p1/install/bin/*" \\) -print0 | xargs --no-run-if-empty -0 \\
                 sed -i "1 s|^#\\!${{PARTS_PYTHON_VENV_INTERP_PATH}}.*$|#!/usr/bin/env ${{PARTS_PYTHON_INTERPRETER}}|"
             """
         ),
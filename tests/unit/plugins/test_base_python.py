@@ -13,6 +13,9 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 from textwrap import dedent
 from typing import Literal
@@ -107,7 +110,11 @@ def get_python_build_commands(
 def get_python_shebang_rewrite_commands(
     expected_shebang: str, install_dir: str
 ) -> list[str]:
-    find_cmd = f'find "{install_dir}" -type f -executable -print0'
+    stamp = Path(install_dir).parent / "cache/python-install.stamp"
+    find_cmd = (
+        f'find "{install_dir}" -type f -executable '
+        f'\\( -cnewer "{stamp}" -o -path "{install_dir}/bin/*" \\) -print0'
+    )
     xargs_cmd = "xargs --no-run-if-empty -0"
     sed_cmd = (
         f'sed -i "1 s|^#\\!${{PARTS_PYTHON_VENV_INTERP_PATH}}.*$|{expected_shebang}|"'
@@ -131,6 +138,7 @@ def test_get_build_environment(plugin, new_dir) -> None:
         "PATH": f"{new_dir}/parts/p1/install/bin:${{PATH}}",
         "PARTS_PYTHON_INTERPRETER": "python3",
         "PARTS_PYTHON_VENV_ARGS": "",
+        "PIP_CACHE_DIR": f"{new_dir}/python/pip",
     }
 
 
@@ -139,6 +147,8 @@ def test_get_build_commands(plugin, new_dir) -> None:
     assert plugin.get_build_commands() == [
         f'"${{PARTS_PYTHON_INTERPRETER}}" -m venv ${{PARTS_PYTHON_VENV_ARGS}} "{venv_path}"',
         f'PARTS_PYTHON_VENV_INTERP_PATH="{venv_path}/bin/${{PARTS_PYTHON_INTERPRETER}}"',
+        f'mkdir -p "{new_dir}/parts/p1/cache"',
+        f'touch "{new_dir}/parts/p1/cache/python-install.stamp"',
         '"${PARTS_PYTHON_INTERPRETER}" -m fake_pip --install',
         *get_python_shebang_rewrite_commands(
             "#!/usr/bin/env ${PARTS_PYTHON_INTERPRETER}",
@@ -155,6 +165,8 @@ def test_call_should_remove_symlinks(plugin, new_dir, monkeypatch):
     assert plugin.get_build_commands() == [
         f'"${{PARTS_PYTHON_INTERPRETER}}" -m venv ${{PARTS_PYTHON_VENV_ARGS}} "{venv_path}"',
         f'PARTS_PYTHON_VENV_INTERP_PATH="{venv_path}/bin/${{PARTS_PYTHON_INTERPRETER}}"',
+        f'mkdir -p "{new_dir}/parts/p1/cache"',
+        f'touch "{new_dir}/parts/p1/cache/python-install.stamp"',
         '"${PARTS_PYTHON_INTERPRETER}" -m fake_pip --install',
         *get_python_shebang_rewrite_commands(
             "#!/usr/bin/env ${PARTS_PYTHON_INTERPRETER}",
@@ -174,3 +186,73 @@ def test_get_system_python_interpreter(plugin):
     assert plugin._get_system_python_interpreter() == (
         '$(readlink -f "$(which "${PARTS_PYTHON_INTERPRETER}")")'
     )
+
+
+def test_venv_template_disabled(plugin, monkeypatch):
+    monkeypatch.setattr(plugin, "_get_dependency_install_commands", lambda: ["deps"])
+    monkeypatch.setattr(plugin, "_get_dependency_files", lambda: ["deps.lock"])
+
+    assert plugin._get_venv_template_commands() == []
+
+
+def test_venv_template_reuse(new_dir, monkeypatch):
+    properties = FakePythonPlugin.properties_class.unmarshal({"source": "."})
+    info = ProjectInfo(
+        application_name="test", cache_dir=new_dir / "cache", reuse_python_venvs=True
+    )
+    part_info = PartInfo(project_info=info, part=Part("p1", {}))
+    plugin = FakePythonPlugin(properties=properties, part_info=part_info)
+    venv_dir = part_info.part_install_dir
+    monkeypatch.setattr(
+        plugin,
+        "_get_dependency_install_commands",
+        lambda: [
+            f'mkdir -p "{venv_dir}/lib" && echo dep > "{venv_dir}/lib/dep.py"',
+            f'echo installed >> "{new_dir}/installs"',
+        ],
+    )
+    monkeypatch.setattr(plugin, "_get_dependency_files", lambda: ["deps.lock"])
+    Path("deps.lock").write_text("dep==1.0")
+
+    script = "\n".join(
+        [
+            "set -euo pipefail",
+            f'PARTS_PYTHON_VENV_INTERP_PATH="{sys.executable}"',
+            'PARTS_PYTHON_VENV_ARGS=""',
+            f'mkdir -p "{venv_dir}"',
+            # Files in the venv before the installation are not part of the template
+            f'touch "{venv_dir}/pyvenv.cfg"',
+            f'mkdir -p "{part_info.part_cache_dir}"',
+            f'touch "{plugin._get_install_stamp()}"',
+            *plugin._get_venv_template_commands(),
+        ]
+    )
+
+    def run() -> str:
+        return subprocess.run(
+            ["bash", "-c", script], check=True, capture_output=True, text=True
+        ).stdout
+
+    run()
+    (template,) = Path(new_dir, "cache/python/venvs").iterdir()
+    assert sorted(str(p.relative_to(template)) for p in template.rglob("*")) == [
+        "lib",
+        "lib/dep.py",
+    ]
+
+    shutil.rmtree(venv_dir)
+    assert "Reusing virtual environment template" in run()
+    assert Path(venv_dir, "lib/dep.py").read_text() == "dep\n"
+    assert Path(new_dir, "installs").read_text() == "installed\n"
+
+    # Files are copied, writes in the venv don't change the template
+    assert not Path(venv_dir, "lib/dep.py").samefile(template / "lib/dep.py")
+    Path(venv_dir, "lib/dep.py").write_text("changed\n")
+    assert (template / "lib/dep.py").read_text() == "dep\n"
+
+    # A change in the locked dependencies creates a new template
+    shutil.rmtree(venv_dir)
+    Path("deps.lock").write_text("dep==2.0")
+    run()
+    assert Path(new_dir, "installs").read_text() == "installed\ninstalled\n"
+    assert len(list(Path(new_dir, "cache/python/venvs").iterdir())) == 2
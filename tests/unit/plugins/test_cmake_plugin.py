@@ -142,6 +142,32 @@ class TestPluginCMakePlugin:
             ),
         ]
 
+    def test_get_build_commands_compiler_cache(self, setup_method_fixture, new_dir):
+        plugin = setup_method_fixture(new_dir, {"cmake-parameters": ["-DVERBOSE=1"]})
+        plugin._part_info.project_info._compiler_cache = "sccache"
+        cache_dir = Path(new_dir, "compiler/sccache")
+
+        assert plugin.get_build_packages() == {"gcc", "cmake", "sccache"}
+        assert plugin.get_build_environment() == {
+            "CMAKE_PREFIX_PATH": f"{str(new_dir)}/stage",
+            "SCCACHE_DIR": str(cache_dir),
+        }
+        assert plugin.get_build_commands() == [
+            f'mkdir -p "{cache_dir}"',
+            "sccache --zero-stats > /dev/null",
+            (
+                f'cmake "{plugin._part_info.part_src_dir}" -G "Unix Makefiles" '
+                "-DCMAKE_C_COMPILER_LAUNCHER=sccache "
+                "-DCMAKE_CXX_COMPILER_LAUNCHER=sccache -DVERBOSE=1"
+            ),
+            f"cmake --build . -- -j{plugin._part_info.parallel_build_count}",
+            (
+                f'DESTDIR="{plugin._part_info.part_install_dir}" '
+                "cmake --build . --target install"
+            ),
+            "sccache --show-stats",
+        ]
+
     def test_get_out_of_source_build(self, setup_method_fixture, new_dir):
         plugin = setup_method_fixture(new_dir)
 
@@ -0,0 +1,89 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import pytest
+from craft_parts.infos import PartInfo, ProjectInfo
+from craft_parts.parts import Part
+from craft_parts.plugins.compiler_cache import CompilerCache
+
+
+def _compiler_cache(new_dir, **kwargs) -> CompilerCache:
+    project_info = ProjectInfo(application_name="test", cache_dir=new_dir, **kwargs)
+    return CompilerCache(PartInfo(project_info=project_info, part=Part("foo", {})))
+
+
+def test_compiler_cache_disabled(new_dir):
+    compiler_cache = _compiler_cache(new_dir)
+
+    assert not compiler_cache
+    assert compiler_cache.get_build_packages() == set()
+    assert compiler_cache.get_build_environment() == {}
+    assert compiler_cache.get_compiler_environment() == {}
+    assert compiler_cache.wrap_build_commands(["make"]) == ["make"]
+
+
+def test_compiler_cache_ccache(new_dir):
+    compiler_cache = _compiler_cache(
+        new_dir, compiler_cache="ccache", compiler_cache_max_size="2G"
+    )
+    cache_dir = Path(new_dir, "compiler/ccache")
+
+    assert compiler_cache
+    assert compiler_cache.cache_dir == cache_dir
+    assert compiler_cache.get_build_packages() == {"ccache"}
+    assert compiler_cache.get_build_environment() == {
+        "CCACHE_DIR": str(cache_dir),
+        "CCACHE_BASEDIR": str(new_dir),
+        "CCACHE_MAXSIZE": "2G",
+    }
+    assert compiler_cache.get_compiler_environment() == {
+        "CC": "ccache ${CC:-gcc}",
+        "CXX": "ccache ${CXX:-g++}",
+    }
+    assert compiler_cache.wrap_build_commands(["make"]) == [
+        f'mkdir -p "{cache_dir}"',
+        "ccache --zero-stats > /dev/null",
+        "make",
+        "ccache --show-stats",
+    ]
+
+
+def test_compiler_cache_sccache(new_dir):
+    compiler_cache = _compiler_cache(new_dir, compiler_cache="sccache")
+    cache_dir = Path(new_dir, "compiler/sccache")
+
+    assert compiler_cache.get_build_packages() == {"sccache"}
+    assert compiler_cache.get_build_environment() == {"SCCACHE_DIR": str(cache_dir)}
+    assert compiler_cache.get_compiler_environment() == {
+        "CC": "sccache ${CC:-gcc}",
+        "CXX": "sccache ${CXX:-g++}",
+    }
+
+
+@pytest.mark.parametrize(
+    ("arch", "triplet"),
+    [("arm64", "aarch64-linux-gnu"), ("riscv64", "riscv64-linux-gnu")],
+)
+def test_compiler_cache_cross_compiling(mocker, new_dir, arch, triplet):
+    mocker.patch("platform.machine", return_value="x86_64")
+    compiler_cache = _compiler_cache(new_dir, arch=arch, compiler_cache="ccache")
+
+    assert compiler_cache.get_compiler_environment() == {
+        "CC": f"ccache ${{CC:-{triplet}-gcc}}",
+        "CXX": f"ccache ${{CXX:-{triplet}-g++}}",
+    }
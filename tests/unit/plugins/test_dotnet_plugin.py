@@ -113,7 +113,10 @@ def test_get_build_environment(new_dir, part_info):
     properties = DotnetPlugin.properties_class.unmarshal({"source": "."})
     plugin = DotnetPlugin(properties=properties, part_info=part_info)
 
-    assert plugin.get_build_environment() == {}
+    assert plugin.get_build_environment() == {
+        "NUGET_PACKAGES": f"{new_dir}/dotnet/packages",
+        "NUGET_HTTP_CACHE_PATH": f"{new_dir}/dotnet/http-cache",
+    }
 
 
 def test_get_build_commands(part_info):
@@ -14,6 +14,11 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+import shutil
+import subprocess
+import textwrap
+from pathlib import Path
 
 import pytest
 from craft_parts import errors
@@ -216,8 +221,13 @@ def test_get_build_environment_without_dotnet_deps_and_valid_versions(
     plugin = DotnetV2Plugin(properties=properties, part_info=part_info)
 
     environment = plugin.get_build_environment()
-    assert len(environment) == 3
+    assert len(environment) == 5
     assert environment["DOTNET_NOLOGO"] == "1"
+    assert environment["NUGET_PACKAGES"] == f"{part_info.cache_dir}/dotnet/packages"
+    assert (
+        environment["NUGET_HTTP_CACHE_PATH"]
+        == f"{part_info.cache_dir}/dotnet/http-cache"
+    )
     assert "LD_LIBRARY_PATH" in environment
     assert "PATH" in environment
 
@@ -230,7 +240,7 @@ def test_get_build_commands_default_values(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         ["dotnet", "restore", "--verbosity normal", f"--runtime {host_dotnet_rid}"],
     )
     assert build_commands[0] == ""
@@ -279,7 +289,7 @@ def test_get_build_commands_configuration(
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         ["dotnet", "restore", "--verbosity normal", f"--runtime {host_dotnet_rid}"],
     )
     assert build_commands[0] == ""
@@ -325,7 +335,7 @@ def test_get_build_commands_project(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         [
             "dotnet",
             "restore",
@@ -379,7 +389,7 @@ def test_get_build_commands_properties(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         [
             "dotnet",
             "restore",
@@ -436,7 +446,7 @@ def test_get_build_commands_self_contained(
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         ["dotnet", "restore", "--verbosity normal", f"--runtime {host_dotnet_rid}"],
     )
     assert build_commands[0] == ""
@@ -497,7 +507,7 @@ def test_get_build_commands_valid_verbosity(host_dotnet_rid: str, part_info, ver
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         [
             "dotnet",
             "restore",
@@ -558,7 +568,7 @@ def test_get_build_commands_valid_version(
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         ["dotnet", "restore", "--verbosity normal", f"--runtime {host_dotnet_rid}"],
     )
     assert build_commands[0] == ""
@@ -604,7 +614,7 @@ def test_get_build_commands_restore_properties(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         [
             "dotnet",
             "restore",
@@ -656,7 +666,7 @@ def test_get_build_commands_restore_sources(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         [
             "dotnet",
             "restore",
@@ -709,7 +719,7 @@ def test_get_build_commands_build_framework(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         ["dotnet", "restore", "--verbosity normal", f"--runtime {host_dotnet_rid}"],
     )
     assert build_commands[0] == ""
@@ -756,7 +766,7 @@ def test_get_build_commands_restore_configfile(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         [
             "dotnet",
             "restore",
@@ -808,7 +818,7 @@ def test_get_build_commands_build_properties(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         ["dotnet", "restore", "--verbosity normal", f"--runtime {host_dotnet_rid}"],
     )
     assert build_commands[0].strip() == ""
@@ -855,7 +865,7 @@ def test_get_build_commands_publish_properties(host_dotnet_rid: str, part_info):
     assert len(build_commands) == 3
 
     build_commands[0] = _remove_parameter_from_command(
-        build_commands[0],
+        _get_restore_command(build_commands[0]),
         ["dotnet", "restore", "--verbosity normal", f"--runtime {host_dotnet_rid}"],
     )
     assert build_commands[0].strip() == ""
@@ -919,8 +929,85 @@ def test_get_out_of_source_build(part_info):
     assert plugin.get_out_of_source_build() is False
 
 
+def test_restore_reuse(new_dir, part_info, monkeypatch):
+    properties = DotnetV2Plugin.properties_class.unmarshal({"source": "."})
+    plugin = DotnetV2Plugin(properties=properties, part_info=part_info)
+    environment = plugin.get_build_environment()
+    package_dir = Path(environment["NUGET_PACKAGES"], "newtonsoft.json/13.0.1")
+
+    # Fake restore, recording its invocations
+    bin_dir = Path(new_dir, "bin")
+    bin_dir.mkdir()
+    Path(bin_dir, "dotnet").write_text(
+        textwrap.dedent(
+            f"""\
+            #!/bin/sh
+            echo restored >> "{new_dir}/restores"
+            mkdir -p app/obj "{package_dir}"
+            touch "{package_dir}/.nupkg.metadata"
+            printf '{{\\n  "libraries": {{\\n    "Newtonsoft.Json/13.0.1": {{\\n      "path": "newtonsoft.json/13.0.1",\\n    }},\\n    "Lib/1.0.0": {{\\n      "path": "../lib/lib.csproj",\\n    }}\\n  }}\\n}}\\n' > app/obj/project.assets.json
+            touch app/obj/app.csproj.nuget.g.props
+            """
+        )
+    )
+    Path(bin_dir, "dotnet").chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+
+    Path("app").mkdir()
+    Path("app/app.csproj").write_text("<Project />")
+    script = "\n".join(
+        [
+            "set -euo pipefail",
+            *[f'export {key}="{value}"' for key, value in environment.items()],
+            plugin.get_build_commands()[0],
+        ]
+    )
+
+    def run() -> str:
+        return subprocess.run(
+            ["bash", "-c", script], check=True, capture_output=True, text=True
+        ).stdout
+
+    # Dependencies are not locked
+    run()
+    shutil.rmtree("app/obj")
+    run()
+    assert Path(new_dir, "restores").read_text() == "restored\n" * 2
+    assert not Path(part_info.cache_dir, "dotnet/restore").exists()
+
+    Path("app/packages.lock.json").write_text("{}")
+    run()
+    (entry,) = Path(part_info.cache_dir, "dotnet/restore").iterdir()
+    assert Path(entry, "packages.txt").read_text() == "newtonsoft.json/13.0.1\n"
+
+    shutil.rmtree("app/obj")
+    assert "Reusing restore outputs" in run()
+    assert Path("app/obj/project.assets.json").is_file()
+    assert Path("app/obj/app.csproj.nuget.g.props").is_file()
+    assert Path(new_dir, "restores").read_text() == "restored\n" * 3
+
+    # Missing packages are restored again
+    shutil.rmtree(package_dir)
+    shutil.rmtree("app/obj")
+    run()
+    assert Path(new_dir, "restores").read_text() == "restored\n" * 4
+
+    # A change in the locked dependencies creates a new entry
+    Path("app/packages.lock.json").write_text('{"version": 2}')
+    run()
+    assert Path(new_dir, "restores").read_text() == "restored\n" * 5
+    assert len(list(Path(part_info.cache_dir, "dotnet/restore").iterdir())) == 2
+
+
 def _remove_parameter_from_command(command: str, parameters: list[str]) -> str:
     for parameter in parameters:
         assert parameter in command
         command = command.replace(parameter, "").strip()
     return command
+
+
+def _get_restore_command(command: str) -> str:
+    (restore_cmd,) = [
+        line.strip() for line in command.splitlines() if "dotnet restore" in line
+    ]
+    return restore_cmd
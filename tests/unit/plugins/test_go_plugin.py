@@ -134,28 +134,46 @@ def test_get_build_environment(new_dir, part_info):
 
     assert plugin.get_build_environment() == {
         "GOBIN": f"{new_dir}/parts/my-part/install/bin",
+        "GOMODCACHE": f"{new_dir}/go/mod",
+        "GOCACHE": f"{new_dir}/go/build",
+        "GOFLAGS": "-modcacherw ${GOFLAGS:-}",
     }
 
 
-def test_get_build_commands(part_info):
+def test_get_build_environment_offline(new_dir, part_info):
+    properties = GoPlugin.properties_class.unmarshal(
+        {"source": ".", "go-offline": True}
+    )
+    plugin = GoPlugin(properties=properties, part_info=part_info)
+
+    environment = plugin.get_build_environment()
+    assert environment["GOPROXY"] == f"file://{new_dir}/go/mod/cache/download"
+    assert environment["GOSUMDB"] == "off"
+
+
+def test_get_build_commands(new_dir, part_info):
     properties = GoPlugin.properties_class.unmarshal({"source": "."})
     plugin = GoPlugin(properties=properties, part_info=part_info)
 
     assert plugin.get_build_commands() == [
-        "go mod download all",
+        f'mkdir -p "{new_dir}/go"',
+        f'flock "{new_dir}/go/.lock" go mod download all',
         'go install -p "1"  ./...',
+        'du -sh "$GOMODCACHE" "$GOCACHE" || true',
     ]
 
 
-def test_get_build_commands_with_buildtags(part_info):
+def test_get_build_commands_with_buildtags(new_dir, part_info):
     properties = GoPlugin.properties_class.unmarshal(
         {"source": ".", "go-buildtags": ["dev", "debug"]}
     )
     plugin = GoPlugin(properties=properties, part_info=part_info)
 
     assert plugin.get_build_commands() == [
-        "go mod download all",
+        f'mkdir -p "{new_dir}/go"',
+        f'flock "{new_dir}/go/.lock" go mod download all',
         'go install -p "1" -tags=dev,debug ./...',
+        'du -sh "$GOMODCACHE" "$GOCACHE" || true',
     ]
 
 
@@ -184,17 +202,19 @@ def test_get_out_of_source_build(part_info):
     assert plugin.get_out_of_source_build() is False
 
 
-def test_get_build_commands_go_generate(part_info):
+def test_get_build_commands_go_generate(new_dir, part_info):
     properties = GoPlugin.properties_class.unmarshal(
         {"source": ".", "go-generate": ["-v a", "-x b"]}
     )
     plugin = GoPlugin(properties=properties, part_info=part_info)
 
     assert plugin.get_build_commands() == [
-        "go mod download all",
+        f'mkdir -p "{new_dir}/go"',
+        f'flock "{new_dir}/go/.lock" go mod download all',
         "go generate -v a",
         "go generate -x b",
         'go install -p "1"  ./...',
+        'du -sh "$GOMODCACHE" "$GOCACHE" || true',
     ]
 
 
@@ -225,6 +245,7 @@ def test_get_build_commands_go_use(project_info, part_data):
         "go work init .",
         "go work use .",
         'go install -p "1"  ./...',
+        'du -sh "$GOMODCACHE" "$GOCACHE" || true',
     ]
 
 
@@ -250,4 +271,5 @@ def test_get_build_commands_go_use_with_go_dependency(project_info, part_data):
         "go work use .",
         f"go work use '{dependency_backstage}'",
         'go install -p "1"  ./...',
+        'du -sh "$GOMODCACHE" "$GOCACHE" || true',
     ]
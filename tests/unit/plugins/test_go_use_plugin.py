@@ -127,7 +127,11 @@ def test_get_build_environment(new_dir, part_info):
     properties = GoUsePlugin.properties_class.unmarshal({"source": "."})
     plugin = GoUsePlugin(properties=properties, part_info=part_info)
 
-    assert plugin.get_build_environment() == {}
+    assert plugin.get_build_environment() == {
+        "GOMODCACHE": f"{new_dir}/go/mod",
+        "GOCACHE": f"{new_dir}/go/build",
+        "GOFLAGS": "-modcacherw ${GOFLAGS:-}",
+    }
 
 
 def test_missing_parameters():
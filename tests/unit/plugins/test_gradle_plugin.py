@@ -271,3 +271,67 @@ def test_get_build_commands_self_contained_publish(self_contained_part_info):
         plugin._part_info.part_build_subdir / ".parts" / "self-contained.init.gradle"
     ).read_text()
     assert "maven-publish" in init_script
+
+
+def test_gradle_shared_cache(part_info, new_dir):
+    properties = GradlePlugin.properties_class.unmarshal(
+        {"source": ".", "gradle-shared-cache": True}
+    )
+    plugin = GradlePlugin(properties=properties, part_info=part_info)
+
+    assert plugin._gradle_user_home == new_dir / "gradle"
+    assert plugin.get_build_commands()[0] == "gradle build --no-daemon --build-cache"
+
+
+def test_gradle_configuration_cache(part_info):
+    properties = GradlePlugin.properties_class.unmarshal(
+        {"source": ".", "gradle-configuration-cache": True}
+    )
+    plugin = GradlePlugin(properties=properties, part_info=part_info)
+
+    assert plugin._gradle_user_home == part_info.part_build_subdir / ".gradle"
+    assert plugin.get_build_commands()[0] == (
+        "gradle build --no-daemon --configuration-cache"
+    )
+
+
+def test_proxy_settings_shared_cache(part_info, mocker, new_dir):
+    mocker.patch.object(
+        os, "environ", {"http_proxy": "http://test_proxy_http_url.com:3128"}
+    )
+    properties = GradlePlugin.properties_class.unmarshal(
+        {"source": ".", "gradle-shared-cache": True}
+    )
+    project_properties = part_info.part_build_subdir / "gradle.properties"
+    project_properties.parent.mkdir(parents=True)
+    project_properties.write_text("org.gradle.parallel=true")
+
+    plugin = GradlePlugin(properties=properties, part_info=part_info)
+    plugin._setup_proxy()
+
+    # Proxy settings are added to the project properties, not the shared user home
+    assert not (new_dir / "gradle/gradle.properties").exists()
+    assert project_properties.read_text().splitlines()[:2] == [
+        "org.gradle.parallel=true",
+        "systemProp.http.proxyHost=test_proxy_http_url.com",
+    ]
+
+
+def test_get_epilogue_commands(part_info, new_dir):
+    properties = GradlePlugin.properties_class.unmarshal({"source": "."})
+    plugin = GradlePlugin(properties=properties, part_info=part_info)
+    assert plugin.get_epilogue_commands() == []
+
+    properties = GradlePlugin.properties_class.unmarshal(
+        {"source": ".", "gradle-use-daemon": True, "gradle-shared-cache": True}
+    )
+    plugin = GradlePlugin(properties=properties, part_info=part_info)
+    assert plugin.get_epilogue_commands() == [
+        (
+            f'for gradle in $(command -v gradle) "{new_dir}/gradle"/wrapper/dists/*/*/gradle-*/bin/gradle; do\n'
+            '    if [ -x "${gradle}" ]; then\n'
+            '        "${gradle}" --stop || true\n'
+            "    fi\n"
+            "done\n"
+        )
+    ]
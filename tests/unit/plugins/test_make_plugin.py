@@ -76,6 +76,25 @@ class TestPluginMake:
             'make -j"8" install FLAVOR=gtk3 DESTDIR="/tmp"',
         ]
 
+    def test_compiler_cache(self, new_dir):
+        self._plugin._part_info.project_info._compiler_cache = "ccache"
+        cache_dir = Path(new_dir, "compiler/ccache")
+
+        assert "ccache" in self._plugin.get_build_packages()
+        assert self._plugin.get_build_environment() == {
+            "CCACHE_DIR": str(cache_dir),
+            "CCACHE_BASEDIR": str(new_dir),
+            "CC": "ccache ${CC:-gcc}",
+            "CXX": "ccache ${CXX:-g++}",
+        }
+        assert self._plugin.get_build_commands() == [
+            f'mkdir -p "{cache_dir}"',
+            "ccache --zero-stats > /dev/null",
+            'make -j"42"',
+            'make -j"42" install DESTDIR="install/dir"',
+            "ccache --show-stats",
+        ]
+
     def test_invalid_properties(self):
         with pytest.raises(ValidationError) as raised:
             MakePlugin.properties_class.unmarshal({"source": ".", "make-invalid": True})
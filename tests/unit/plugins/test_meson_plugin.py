@@ -205,6 +205,33 @@ def test_get_build_commands_with_parameters(part_info):
     ]
 
 
+def test_get_build_commands_compiler_cache(new_dir):
+    project_info = ProjectInfo(
+        application_name="test", cache_dir=new_dir, compiler_cache="ccache"
+    )
+    part_info = PartInfo(project_info=project_info, part=Part("my-part", {}))
+    properties = MesonPlugin.properties_class.unmarshal({"source": "."})
+    plugin = MesonPlugin(properties=properties, part_info=part_info)
+    cache_dir = new_dir / "compiler/ccache"
+
+    assert plugin.get_build_packages() == {"ccache"}
+    assert plugin.get_build_commands() == [
+        f'mkdir -p "{cache_dir}"',
+        "ccache --zero-stats > /dev/null",
+        (
+            "cat > compiler-cache.ini << EOF\n"
+            "[binaries]\n"
+            "c = ['ccache', '${CC:-gcc}']\n"
+            "cpp = ['ccache', '${CXX:-g++}']\n"
+            "EOF"
+        ),
+        f"meson setup {part_info.part_src_dir} --native-file compiler-cache.ini",
+        "ninja",
+        f"DESTDIR={part_info.part_install_dir} ninja install",
+        "ccache --show-stats",
+    ]
+
+
 def test_invalid_parameters():
     with pytest.raises(ValidationError) as raised:
         MesonPlugin.properties_class.unmarshal({"source": ".", "meson-invalid": True})
@@ -14,9 +14,12 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import json
 import os
+from pathlib import Path
 
 import pytest
+import requests
 from craft_parts import errors
 from craft_parts.infos import PartInfo, ProjectInfo
 from craft_parts.parts import Part
@@ -42,6 +45,24 @@ def self_contained_part_info(new_dir):
     )
 
 
+NODE_RELEASE_INDEX = [
+    {
+        "version": "v99.99.99",
+        "date": "3304-12-31",
+        "files": ["linux-x64"],
+        "lts": False,
+        "security": False,
+    },
+    {
+        "version": "v20.13.1",
+        "date": "2024-05-09",
+        "files": ["linux-x64"],
+        "lts": "Iron",
+        "security": False,
+    },
+]
+
+
 class TestPluginNpmPlugin:
     """Npm plugin tests."""
 
@@ -207,7 +228,10 @@ class TestPluginNpmPlugin:
         properties = NpmPlugin.properties_class.unmarshal({"source": "."})
         plugin = NpmPlugin(properties=properties, part_info=part_info)
 
-        assert plugin.get_build_environment() == {"NODE_ENV": "production"}
+        assert plugin.get_build_environment() == {
+            "NODE_ENV": "production",
+            "npm_config_cache": f"{new_dir}/npm/cache",
+        }
 
     def test_get_build_environment_include_node_false(self, part_info, new_dir):
         properties = NpmPlugin.properties_class.unmarshal(
@@ -218,7 +242,10 @@ class TestPluginNpmPlugin:
         )
         plugin = NpmPlugin(properties=properties, part_info=part_info)
 
-        assert plugin.get_build_environment() == {"NODE_ENV": "production"}
+        assert plugin.get_build_environment() == {
+            "NODE_ENV": "production",
+            "npm_config_cache": f"{new_dir}/npm/cache",
+        }
 
     def test_get_build_environment_include_node_true(self, part_info, new_dir):
         properties = NpmPlugin.properties_class.unmarshal(
@@ -233,6 +260,7 @@ class TestPluginNpmPlugin:
         assert plugin.get_build_environment() == {
             "PATH": "${CRAFT_PART_INSTALL}/bin:${PATH}",
             "NODE_ENV": "production",
+            "npm_config_cache": f"{new_dir}/npm/cache",
         }
 
     def test_get_build_commands(self, part_info, new_dir):
@@ -280,35 +308,27 @@ class TestPluginNpmPlugin:
                 "npm-node-version": version,
             }
         )
-        NpmPlugin._fetch_node_release_index = lambda: [
-            {
-                "version": "v99.99.99",
-                "date": "3304-12-31",
-                "files": ["linux-x64"],
-                "lts": False,
-                "security": False,
-            },
-            {
-                "version": "v20.13.1",
-                "date": "2024-05-09",
-                "files": ["linux-x64"],
-                "lts": "Iron",
-                "security": False,
-            },
-        ]
+        mocker.patch.object(
+            NpmPlugin, "_fetch_node_release_index", return_value=NODE_RELEASE_INDEX
+        )
         plugin = NpmPlugin(properties=properties, part_info=part_info)
+        node_dir = f"{new_dir}/npm/node"
 
         assert plugin.get_pull_commands() == []
 
         assert plugin.get_build_commands() == [
-            f'if [ ! -f "{part_info.part_cache_dir}/node-v20.13.1-linux-x64.tar.gz" ]; then\n'
-            f'    mkdir -p "{part_info.part_cache_dir}"\n'
-            f'    curl --retry 5 -s "https://nodejs.org/dist/v20.13.1/SHASUMS256.txt" -o "{part_info.part_cache_dir}"/SHASUMS256.txt\n'
-            f'    curl --retry 5 -s "https://nodejs.org/dist/v20.13.1/node-v20.13.1-linux-x64.tar.gz" -o "{part_info.part_cache_dir}/node-v20.13.1-linux-x64.tar.gz"\n'
-            "fi\n"
-            f'pushd "{part_info.part_cache_dir}"\n'
-            "sha256sum --ignore-missing --strict -c SHASUMS256.txt\npopd\n",
-            f'tar -xzf "{part_info.part_cache_dir}/node-v20.13.1-linux-x64.tar.gz"'
+            f'if [ ! -f "{node_dir}/node-v20.13.1-linux-x64.tar.gz" ]; then\n'
+            f'    mkdir -p "{node_dir}"\n'
+            f'    NODE_DOWNLOAD_DIR="$(mktemp -d "{node_dir}/.download.XXXXXX")"\n'
+            '    curl --retry 5 -s "https://nodejs.org/dist/v20.13.1/SHASUMS256.txt" -o "$NODE_DOWNLOAD_DIR"/SHASUMS256.txt\n'
+            '    curl --retry 5 -s "https://nodejs.org/dist/v20.13.1/node-v20.13.1-linux-x64.tar.gz" -o "$NODE_DOWNLOAD_DIR/node-v20.13.1-linux-x64.tar.gz"\n'
+            '    pushd "$NODE_DOWNLOAD_DIR"\n'
+            "    sha256sum --ignore-missing --strict -c SHASUMS256.txt\n"
+            "    popd\n"
+            f'    mv "$NODE_DOWNLOAD_DIR/node-v20.13.1-linux-x64.tar.gz" "{node_dir}/node-v20.13.1-linux-x64.tar.gz"\n'
+            '    rm -rf "$NODE_DOWNLOAD_DIR"\n'
+            "fi\n",
+            f'tar -xzf "{node_dir}/node-v20.13.1-linux-x64.tar.gz"'
             ' -C "${CRAFT_PART_INSTALL}/"                     --no-same-owner '
             "--strip-components=1\n",
             'NPM_VERSION="$(npm --version)"\n'
@@ -320,6 +340,64 @@ class TestPluginNpmPlugin:
             "fi\n",
         ]
 
+    def test_get_build_commands_include_node_cached(self, part_info, mocker, new_dir):
+        mocker.patch.dict(os.environ, {"SNAP_ARCH": "amd64"})
+        mock_fetch = mocker.patch.object(NpmPlugin, "_fetch_node_release_index")
+        node_dir = Path(new_dir, "npm/node")
+        node_dir.mkdir(parents=True)
+        (node_dir / "node-v20.13.1-linux-x64.tar.gz").touch()
+
+        properties = NpmPlugin.properties_class.unmarshal(
+            {"source": ".", "npm-include-node": True, "npm-node-version": "20.13.1"}
+        )
+        plugin = NpmPlugin(properties=properties, part_info=part_info)
+        commands = plugin.get_build_commands()
+
+        # the release index isn't needed for an exact version already cached
+        mock_fetch.assert_not_called()
+        assert f'"{node_dir}/node-v20.13.1-linux-x64.tar.gz"' in commands[0]
+
+    def test_fetch_node_release_index(self, requests_mock, new_dir):
+        requests_mock.get("https://nodejs.org/dist/index.json", json=NODE_RELEASE_INDEX)
+        cache_dir = Path(new_dir, "npm")
+
+        assert NpmPlugin._fetch_node_release_index(cache_dir) == NODE_RELEASE_INDEX
+        assert NpmPlugin._fetch_node_release_index(cache_dir) == NODE_RELEASE_INDEX
+
+        # the cached index is used until it expires
+        assert requests_mock.call_count == 1
+        assert json.loads((cache_dir / "index.json").read_text()) == (
+            NODE_RELEASE_INDEX
+        )
+
+    def test_fetch_node_release_index_expired(self, requests_mock, new_dir):
+        requests_mock.get(
+            "https://nodejs.org/dist/index.json", json=NODE_RELEASE_INDEX[1:]
+        )
+        cache_dir = Path(new_dir, "npm")
+        cache_dir.mkdir()
+        (cache_dir / "index.json").write_text(json.dumps(NODE_RELEASE_INDEX))
+        os.utime(cache_dir / "index.json", (0, 0))
+
+        assert NpmPlugin._fetch_node_release_index(cache_dir) == NODE_RELEASE_INDEX[1:]
+        assert requests_mock.call_count == 1
+
+    def test_fetch_node_release_index_offline(self, requests_mock, new_dir):
+        requests_mock.get(
+            "https://nodejs.org/dist/index.json", exc=requests.ConnectionError
+        )
+        cache_dir = Path(new_dir, "npm")
+
+        with pytest.raises(requests.ConnectionError):
+            NpmPlugin._fetch_node_release_index(cache_dir)
+
+        # an expired index is used if a new one can't be fetched
+        cache_dir.mkdir()
+        (cache_dir / "index.json").write_text(json.dumps(NODE_RELEASE_INDEX))
+        os.utime(cache_dir / "index.json", (0, 0))
+
+        assert NpmPlugin._fetch_node_release_index(cache_dir) == NODE_RELEASE_INDEX
+
     def test_get_build_commands_include_node_true_no_node_version(
         self, part_info, new_dir
     ):
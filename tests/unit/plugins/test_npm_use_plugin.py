@@ -47,6 +47,15 @@ class TestPluginNpmUsePlugin:
             f'mv "$(npm pack . | tail -1)" "{part_info.part_export_dir}/npm-cache/"'
         ]
 
+    def test_get_build_environment(self, part_info, new_dir):
+        properties = NpmUsePlugin.properties_class.unmarshal({"source": "."})
+        plugin = NpmUsePlugin(properties=properties, part_info=part_info)
+
+        assert plugin.get_build_environment() == {
+            "NODE_ENV": "production",
+            "npm_config_cache": f"{new_dir}/npm/cache",
+        }
+
     def test_get_self_contained_build_commands(self, self_contained_part_info, mocker):
         mocker.patch(
             "craft_parts.plugins.npm_use_plugin.get_install_from_local_tarballs_commands",
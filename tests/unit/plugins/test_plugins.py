@@ -193,6 +193,31 @@ class TestPluginRegistry:
         set_plugin_group(group)
         assert get_registered_plugins() == group.value
 
+    def test_builtin_plugins_resolved_on_use(self):
+        set_plugin_group(PluginGroup.DEFAULT)
+        assert plugins.plugins._plugins["make"] == "MakePlugin"
+
+        assert plugins.get_plugin_class("make") is MakePlugin
+        assert plugins.plugins._plugins["make"] is MakePlugin
+
+    def test_builtin_plugin_group_union(self):
+        group = PluginGroup.MINIMAL.value | {"make": MakePlugin}
+        assert group == {"dump": DumpPlugin, "nil": NilPlugin, "make": MakePlugin}
+        assert type(group) is dict
+
+        group = {"nil": MakePlugin, "go": GoPlugin} | PluginGroup.MINIMAL.value
+        assert group == {"nil": NilPlugin, "go": GoPlugin, "dump": DumpPlugin}
+
+        group = PluginGroup.MINIMAL.value.copy()
+        group["make"] = MakePlugin
+        assert PluginGroup.MINIMAL.value == {"dump": DumpPlugin, "nil": NilPlugin}
+
+    def test_builtin_plugin_class_attribute(self):
+        assert plugins.plugins.MakePlugin is MakePlugin
+
+        with pytest.raises(AttributeError):
+            plugins.plugins.InvalidPlugin  # noqa: B018
+
     @pytest.mark.parametrize(
         "group",
         [
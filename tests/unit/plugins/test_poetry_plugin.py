@@ -105,6 +105,17 @@ def test_get_install_commands(
     ]
 
 
+def test_get_dependency_install_commands(plugin, new_dir):
+    requirements = new_dir / "parts" / "p1" / "build" / "requirements.txt"
+    pip = new_dir / "parts" / "p1" / "install" / "bin" / "pip"
+
+    assert plugin._get_dependency_install_commands() == [
+        f"poetry export --format=requirements.txt --output={requirements} --with-credentials",
+        f"{pip} install  --requirement={requirements}",
+    ]
+    assert plugin._get_dependency_files() == ["poetry.lock"]
+
+
 def test_missing_properties():
     with pytest.raises(ValidationError) as raised:
         PoetryPlugin.properties_class.unmarshal({})
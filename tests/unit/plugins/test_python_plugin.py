@@ -74,3 +74,43 @@ def test_get_out_of_source_build(plugin):
 
 def test_should_remove_symlinks(plugin):
     assert plugin._should_remove_symlinks() is False
+
+
+def test_get_build_environment(plugin, new_dir):
+    assert plugin.get_build_environment()["PIP_CACHE_DIR"] == f"{new_dir}/python/pip"
+
+
+def test_get_dependency_install_commands(new_dir):
+    info = ProjectInfo(application_name="test", cache_dir=new_dir)
+    part_info = PartInfo(project_info=info, part=Part("p1", {}))
+    properties = PythonPlugin.properties_class.unmarshal(
+        {
+            "source": ".",
+            "python-constraints": ["constraints.txt"],
+            "python-requirements": ["requirements.txt"],
+        }
+    )
+
+    python_plugin = PythonPlugin(part_info=part_info, properties=properties)
+
+    assert python_plugin._get_dependency_install_commands() == [
+        f"{new_dir}/parts/p1/install/bin/pip install -c 'constraints.txt' -U pip setuptools wheel",
+        f"{new_dir}/parts/p1/install/bin/pip install -c 'constraints.txt' -U -r 'requirements.txt'",
+    ]
+    assert python_plugin._get_dependency_files() == [
+        "requirements.txt",
+        "constraints.txt",
+    ]
+
+
+def test_venv_template_without_requirements(new_dir):
+    info = ProjectInfo(
+        application_name="test", cache_dir=new_dir, reuse_python_venvs=True
+    )
+    part_info = PartInfo(project_info=info, part=Part("p1", {}))
+    properties = PythonPlugin.properties_class.unmarshal({"source": "."})
+
+    python_plugin = PythonPlugin(part_info=part_info, properties=properties)
+
+    # Unpinned dependencies are always installed
+    assert python_plugin._get_venv_template_commands() == []
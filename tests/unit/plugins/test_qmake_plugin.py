@@ -122,6 +122,26 @@ class TestPluginQMakePlugin:
             f"make install INSTALL_ROOT={plugin._part_info.part_install_dir}",
         ]
 
+    def test_get_build_commands_compiler_cache(self, setup_method_fixture, new_dir):
+        plugin = setup_method_fixture(new_dir, {"qmake-parameters": ["CONFIG+=debug"]})
+        plugin._part_info.project_info._compiler_cache = "ccache"
+        cache_dir = Path(new_dir, "compiler/ccache")
+
+        assert plugin.get_build_packages() == {"g++", "make", "qt5-qmake", "ccache"}
+        assert plugin.get_build_commands() == [
+            f'mkdir -p "{cache_dir}"',
+            "ccache --zero-stats > /dev/null",
+            (
+                'qmake QMAKE_CFLAGS+="${CFLAGS:-}" QMAKE_CXXFLAGS+="${CXXFLAGS:-}" '
+                'QMAKE_LFLAGS+="${LDFLAGS:-}" QMAKE_CC="ccache ${CC:-gcc}" '
+                'QMAKE_CXX="ccache ${CXX:-g++}" CONFIG+=debug '
+                f"{plugin._part_info.part_src_dir}"
+            ),
+            f"env -u CFLAGS -u CXXFLAGS make -j{plugin._part_info.parallel_build_count}",
+            f"make install INSTALL_ROOT={plugin._part_info.part_install_dir}",
+            "ccache --show-stats",
+        ]
+
     def test_get_out_of_source_build(self, setup_method_fixture, new_dir):
         plugin = setup_method_fixture(new_dir)
 
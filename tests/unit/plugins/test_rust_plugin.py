@@ -91,6 +91,8 @@ def test_get_build_environment(part_info, *, cargo_registry: bool):
             parents=True
         )
         expected_env["CARGO_HOME"] = str(part_info.work_dir / "cargo")
+    else:
+        expected_env["CARGO_HOME"] = str(part_info.cache_dir / "cargo")
 
     properties = RustPlugin.properties_class.unmarshal({"source": "."})
     plugin = RustPlugin(properties=properties, part_info=part_info)
@@ -150,6 +152,32 @@ def test_get_build_commands_multiple_crates(part_info):
     assert 'cargo install -f --locked --path "b"' in commands[1]
     assert 'cargo install -f --locked --path "c"' in commands[2]
 
+    # each crate is built in its own target directory
+    target_dirs = [plugin._get_target_dir(crate) for crate in ["a", "b", "c"]]
+    assert len(set(target_dirs)) == 3
+    for command, target_dir in zip(commands, target_dirs, strict=True):
+        assert target_dir.parent == part_info.part_cache_dir / "cargo-target"
+        assert command.count(f'CARGO_TARGET_DIR="{target_dir}"') == 2
+
+
+def test_get_build_commands_workspace_artifacts(part_info):
+    properties = RustPlugin.properties_class.unmarshal(
+        {"source": ".", "rust-channel": "none"}
+    )
+    plugin = RustPlugin(properties=properties, part_info=part_info)
+    artifacts = plugin._get_target_dir(".") / "artifacts.json"
+
+    commands = plugin.get_build_commands()
+    assert len(commands) == 1
+    assert (
+        "cargo build --workspace --release --message-format=json-render-diagnostics"
+        in commands[0]
+    )
+    assert f'> "{artifacts}"' in commands[0]
+    # only the binaries built by cargo are installed, not the target dir contents
+    assert "find" not in commands[0]
+    assert "executable" in commands[0]
+
 
 def test_get_build_commands_multiple_features(part_info):
     properties = RustPlugin.properties_class.unmarshal(
@@ -283,6 +311,38 @@ def test_get_pull_commands_compat_with_exceptions(
     ]
 
 
+@pytest.mark.parametrize(
+    "rust_channel",
+    ["1.75.0", "nightly-2024-01-01", "stable-2024-01-01-x86_64-unknown-linux-gnu"],
+)
+def test_get_pull_commands_pinned_channel(part_info, rust_channel):
+    properties = RustPlugin.properties_class.unmarshal(
+        {"source": ".", "rust-channel": rust_channel}
+    )
+    plugin = RustPlugin(properties=properties, part_info=part_info)
+
+    assert plugin.get_pull_commands() == [
+        (
+            f"rustup which --toolchain {rust_channel} rustc > /dev/null 2>&1"
+            f" || rustup update {rust_channel}"
+        ),
+        f"rustup default {rust_channel}",
+    ]
+
+
+@pytest.mark.parametrize("rust_channel", ["stable", "nightly", "1.75"])
+def test_get_pull_commands_floating_channel(part_info, rust_channel):
+    properties = RustPlugin.properties_class.unmarshal(
+        {"source": ".", "rust-channel": rust_channel}
+    )
+    plugin = RustPlugin(properties=properties, part_info=part_info)
+
+    assert plugin.get_pull_commands() == [
+        f"rustup update {rust_channel}",
+        f"rustup default {rust_channel}",
+    ]
+
+
 @pytest.mark.parametrize("after", [["something-else"], []])
 def test_validate_environment_should_have_rustup(
     after, fake_process: pytest_subprocess.FakeProcess, mock_validator
@@ -92,6 +92,34 @@ def test_get_install_commands(
     ]
 
 
+def test_get_build_environment(plugin, new_dir):
+    env = plugin.get_build_environment()
+
+    assert env["UV_CACHE_DIR"] == f"{new_dir}/python/uv"
+    assert "PIP_CACHE_DIR" not in env
+
+
+def test_get_install_commands_reuse_venvs(new_dir):
+    info = ProjectInfo(
+        application_name="test", cache_dir=new_dir, reuse_python_venvs=True
+    )
+    part_info = PartInfo(project_info=info, part=Part("p1", {}))
+    properties = UvPlugin.properties_class.unmarshal(
+        {"source": ".", "uv-extras": ["queso"]}
+    )
+
+    uv_plugin = UvPlugin(part_info=part_info, properties=properties)
+
+    assert uv_plugin._get_dependency_install_commands() == [
+        "uv sync --no-dev --no-editable --reinstall --no-install-project --extra queso"
+    ]
+    assert uv_plugin._get_dependency_files() == ["uv.lock"]
+    assert uv_plugin._get_package_install_commands() == [
+        "uv sync --no-dev --no-editable --extra queso"
+    ]
+    assert "[ -f uv.lock ]" in uv_plugin._get_venv_template_commands()[0]
+
+
 def test_invalid_properties():
     with pytest.raises(ValidationError) as raised:
         UvPlugin.properties_class.unmarshal({"source": ".", "uv-invalid": True})
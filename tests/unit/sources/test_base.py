@@ -20,6 +20,7 @@ from typing import Literal
 import pytest
 import requests
 from craft_parts import ProjectDirs
+from craft_parts.instrumentation import Instrumentation
 from craft_parts.sources import cache, errors
 from craft_parts.sources.base import (
     BaseFileSourceModel,
@@ -141,6 +142,22 @@ class TestFileSourceHandler:
         dest = Path(new_dir, "parts", "foo", "src", "my_file")
         assert dest.is_file()
 
+    def test_pull_file_instrumentation(self, new_dir):
+        self.set_source(source="src/my_file", cache_dir=new_dir)
+        Path("src").mkdir()
+        Path("src/my_file").write_text("content")
+        Path("parts/foo/src").mkdir(parents=True)
+
+        instr = Instrumentation()
+        with instr.activate():
+            self.source.pull()
+
+        extract = next(s for s in instr.spans if s.name == "extract")
+        assert extract.args["source"] == "my_file"
+        assert extract.args["size"] == str(len("content"))
+        assert extract.args["throughput"].endswith(" MiB/s")
+        assert instr.counters["source bytes extracted"] == len("content")
+
     def test_pull_file_error(self):
         self.source.source = "src/my_file"
 
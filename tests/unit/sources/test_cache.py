@@ -14,9 +14,10 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 from pathlib import Path
 
-from craft_parts.sources.cache import FileCache
+from craft_parts.sources.cache import DirectoryCache, FileCache
 from craft_parts.utils import file_utils
 
 
@@ -83,3 +84,91 @@ def test_file_cache_non_existent(new_dir):
 
     result = x.cache(filename="test_file", key=digest)
     assert result is None
+
+
+def test_directory_cache(new_dir):
+    x = DirectoryCache(new_dir)
+
+    # make sure tree is not cached
+    assert x.get(key="key1") is None
+
+    tree = Path("tree")
+    Path(tree, "dir").mkdir(parents=True)
+    Path(tree, "dir", "file").write_text("content")
+
+    # cache it
+    result = x.cache(tree=tree, key="key1")
+    assert result == Path(new_dir, "trees", "key1")
+    assert Path(result, "dir", "file").read_text() == "content"
+
+    # the tree was moved into the cache
+    assert not tree.exists()
+
+    assert x.get(key="key1") == result
+
+
+def test_directory_cache_existing_key(new_dir):
+    x = DirectoryCache(new_dir)
+
+    tree = Path("tree")
+    tree.mkdir()
+    Path(tree, "file").write_text("first")
+    x.cache(tree=tree, key="key1")
+
+    tree.mkdir()
+    Path(tree, "file").write_text("second")
+    result = x.cache(tree=tree, key="key1")
+
+    assert result is not None
+    assert Path(result, "file").read_text() == "first"
+
+
+def test_directory_cache_entries(new_dir):
+    x = DirectoryCache(new_dir)
+    assert x.entries() == []
+
+    for key, size in [("key1", 10), ("key2", 20)]:
+        tree = Path(key)
+        tree.mkdir()
+        Path(tree, "file").write_bytes(b"x" * size)
+        Path(tree, "link").hardlink_to(Path(tree, "file"))
+        x.cache(tree=tree, key=key)
+
+    os.utime(Path(new_dir, "trees", "key1"), (1000, 1000))
+
+    entries = x.entries()
+    assert [(e.key, e.size) for e in entries] == [("key1", 10), ("key2", 20)]
+    assert x.size() == 30
+
+    # retrieving an entry makes it the most recently used
+    x.get(key="key1")
+    assert [e.key for e in x.entries()] == ["key2", "key1"]
+
+
+def test_directory_cache_evict(new_dir):
+    x = DirectoryCache(new_dir)
+
+    for i, key in enumerate(["key1", "key2", "key3"]):
+        tree = Path(key)
+        tree.mkdir()
+        Path(tree, "file").write_bytes(b"x" * 10)
+        x.cache(tree=tree, key=key)
+        os.utime(Path(new_dir, "trees", key), (1000 + i, 1000 + i))
+
+    assert x.evict(max_size=30) == []
+    assert x.evict(max_size=15) == ["key1", "key2"]
+    assert x.get(key="key1") is None
+    assert x.get(key="key2") is None
+    assert x.get(key="key3") is not None
+
+
+def test_directory_cache_clean(new_dir):
+    x = DirectoryCache(new_dir)
+
+    tree = Path("tree")
+    tree.mkdir()
+    result = x.cache(tree=tree, key="key1")
+    assert result is not None
+
+    x.clean()
+    assert not result.exists()
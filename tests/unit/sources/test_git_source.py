@@ -910,6 +910,65 @@ class TestGitSource:
         assert raised.value.source_type == "git"
         assert raised.value.option == "source-checksum"
 
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "https://example.com/org/my-repo.git",
+            "https://example.com/org/my-repo",
+            "https://example.com/org/my-repo/",
+        ],
+    )
+    def test_mirror_dir(self, new_dir, source):
+        git = GitSource(
+            source,
+            Path("source_dir"),
+            cache_dir=new_dir,
+            project_dirs=self._dirs,
+        )
+
+        mirror_dir = git._get_mirror_dir(source)
+        assert mirror_dir.parent == Path(new_dir, "git/mirrors")
+        assert mirror_dir.name.startswith("my-repo-")
+        assert mirror_dir == git._get_mirror_dir("https://example.com/org/my-repo")
+        assert mirror_dir != git._get_mirror_dir("https://example.com/org/other")
+
+    def test_pull_with_mirrors_and_depth(self, fake_run, new_dir):
+        git = GitSource(
+            "git://my-source",
+            Path("source_dir"),
+            cache_dir=new_dir,
+            source_depth=2,
+            project_dirs=self._dirs,
+            use_mirrors=True,
+        )
+        git.pull()
+
+        fake_run.assert_called_once_with(
+            [
+                "git",
+                "-c",
+                "advice.detachedHead=false",
+                "clone",
+                "--recursive",
+                "--depth",
+                "2",
+                "git://my-source",
+                "source_dir",
+            ]
+        )
+
+    def test_check_if_outdated_not_pulled(self, fake_run, new_dir):
+        git = GitSource(
+            "git://my-source",
+            Path("source_dir"),
+            cache_dir=new_dir,
+            project_dirs=self._dirs,
+        )
+
+        assert git.check_if_outdated("pull.state") is False
+        assert git.get_outdated_files() == ([], [])
+        fake_run.assert_not_called()
+
     def test_has_source_handler_entry(self):
         assert sources._get_source_handler_class("", source_type="git") is GitSource
 
@@ -17,6 +17,7 @@
 import pathlib
 import subprocess
 import tarfile
+from unittest.mock import DEFAULT
 
 import pytest
 from craft_parts import ProjectDirs
@@ -163,20 +164,49 @@ def test_tar_error(rpm_source, mock_popen, mock_tarfile_open, tmp_path):
     assert exc_info.value.__cause__ == inner_error
 
 
-def test_correct_command(mocker, rpm_source, tmp_path, mock_popen, mock_tarfile_open):
+@pytest.fixture
+def unsupported_options(mocker):
+    return mocker.patch("craft_parts.sources.rpm_source._unsupported_options", set())
+
+
+def test_correct_command(
+    mocker, rpm_source, tmp_path, mock_popen, mock_tarfile_open, unsupported_options
+):
     src = tmp_path / "some-package.rpm"
     src.touch()
 
     rpm_source.provision(tmp_path, keep=True, src=src)
 
     mock_popen.assert_called_once_with(
-        ["rpm2archive", "-"],
+        ["rpm2archive", "--nocompression", "-"],
         stdin=mocker.ANY,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
 
 
+def test_nocompression_unsupported(
+    mocker, rpm_source, tmp_path, mock_popen, mock_tarfile_open, unsupported_options
+):
+    mock_popen.return_value.__enter__.return_value.stderr.read.return_value = (
+        b"rpm2archive: --nocompression: unknown option"
+    )
+    mock_tarfile_open.side_effect = [tarfile.ReadError("empty file"), DEFAULT, DEFAULT]
+    src = tmp_path / "some-package.rpm"
+    src.touch()
+
+    rpm_source.provision(tmp_path, keep=True, src=src)
+    rpm_source.provision(tmp_path, keep=True, src=src)
+
+    # The option is not used again once it's known to be unsupported
+    assert [c.args[0] for c in mock_popen.call_args_list] == [
+        ["rpm2archive", "--nocompression", "-"],
+        ["rpm2archive", "-"],
+        ["rpm2archive", "-"],
+    ]
+    assert unsupported_options == {"--nocompression"}
+
+
 def test_unlinks(rpm_source, tmp_path, mock_popen, mock_tarfile_open):
     src = tmp_path / "test.rpm"
     src.touch()
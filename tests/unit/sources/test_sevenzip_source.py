@@ -78,6 +78,7 @@ class TestZipSource:
                 [
                     "7z",
                     "x",
+                    "-mmt=on",
                     f"-o{dest_dir}",
                     os.path.join(new_dir, dest_dir, source_file),  # noqa: PTH118
                 ],
@@ -111,6 +112,7 @@ class TestZipSource:
                 [
                     "7z",
                     "x",
+                    "-mmt=on",
                     f"-o{dest_dir}",
                     os.path.join(new_dir, dest_dir, source_file),  # noqa: PTH118
                 ],
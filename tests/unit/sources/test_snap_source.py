@@ -93,12 +93,124 @@ class TestSnapSource:
             source.pull()
 
         assert re.match(
-            f"unsquashfs -force -dest {self._path}/\\w+ "
+            f"unsquashfs -force -processors \\d+ -dest {self._path}/\\w+/snap "
             f"{self._path}/dest_dir/test-snap.snap",
             " ".join([str(s) for s in raised.value.command]),
         )
         assert raised.value.exit_code == 1
 
+    def test_provision_use_cache(self, new_dir, mocker):
+        def fake_extract(snap_file, tree):
+            Path(tree, "meta.basic").mkdir(parents=True)
+            Path(tree, "meta.basic", "snap.yaml").write_text("name: basic")
+
+        mock_extract = mocker.patch.object(
+            sources.SnapSource, "_extract", side_effect=fake_extract
+        )
+        snap_file = Path("test-snap.snap")
+        snap_file.write_bytes(self._test_file.read_bytes())
+        source = sources.SnapSource(
+            str(snap_file),
+            Path(),
+            cache_dir=Path(new_dir, "cache"),
+            project_dirs=self._dirs,
+        )
+
+        source.provision(Path("dest1"), keep=True, use_cache=True)
+        source.provision(Path("dest2"), keep=True, use_cache=True)
+
+        # the snap is extracted only once
+        mock_extract.assert_called_once()
+
+        digest = snap_source.get_snap_digest(snap_file.resolve())
+        cached_file = Path(new_dir, "cache/stage-snaps", digest, "meta.basic/snap.yaml")
+        assert cached_file.is_file()
+        for dest in ["dest1", "dest2"]:
+            dest_file = Path(dest, "meta.basic/snap.yaml")
+            assert dest_file.read_text() == "name: basic"
+            assert dest_file.stat().st_ino != cached_file.stat().st_ino
+
+        # changes to provisioned files don't affect the cache
+        with Path("dest1/meta.basic/snap.yaml").open("a") as dest_file:
+            dest_file.write("version: 1")
+        assert cached_file.read_text() == "name: basic"
+
+    def test_provision_use_cache_evicted(self, new_dir, mocker):
+        def fake_extract(snap_file, tree):
+            Path(tree, "meta.basic").mkdir(parents=True)
+            Path(tree, "meta.basic", "snap.yaml").write_text("name: basic")
+
+        mock_extract = mocker.patch.object(
+            sources.SnapSource, "_extract", side_effect=fake_extract
+        )
+        mocker.patch.object(snap_source, "STAGE_SNAPS_CACHE_MAX_SIZE", 1)
+        snap_file = Path("test-snap.snap")
+        snap_file.write_bytes(self._test_file.read_bytes())
+        source = sources.SnapSource(
+            str(snap_file),
+            Path(),
+            cache_dir=Path(new_dir, "cache"),
+            project_dirs=self._dirs,
+        )
+
+        # snaps larger than the cache are still provisioned
+        source.provision(Path("dest1"), keep=True, use_cache=True)
+        source.provision(Path("dest2"), keep=True, use_cache=True)
+
+        assert mock_extract.call_count == 2
+        assert Path("dest2/meta.basic/snap.yaml").read_text() == "name: basic"
+        assert list(Path(new_dir, "cache/stage-snaps").iterdir()) == []
+
+    def test_provision_no_cache(self, new_dir, mocker):
+        def fake_extract(snap_file, tree):
+            Path(tree, "meta.basic").mkdir(parents=True)
+
+        mock_extract = mocker.patch.object(
+            sources.SnapSource, "_extract", side_effect=fake_extract
+        )
+        snap_file = Path("test-snap.snap")
+        snap_file.write_text("content")
+        source = sources.SnapSource(
+            str(snap_file),
+            Path(),
+            cache_dir=Path(new_dir, "cache"),
+            project_dirs=self._dirs,
+        )
+
+        source.provision(Path("dest1"), keep=True)
+        source.provision(Path("dest2"), keep=True)
+
+        assert mock_extract.call_count == 2
+        assert Path("dest2/meta.basic").is_dir()
+        assert not Path(new_dir, "cache/stage-snaps").exists()
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestGetSnapDigest:
+    """Checks for snap digest retrieval."""
+
+    def test_digest_from_assertion(self):
+        Path("my-snap_42.snap").write_text("content")
+        Path("my-snap_42.assert").write_text(
+            "type: snap-revision\n"
+            "authority-id: canonical\n"
+            "snap-sha3-384: aBcD-_1234\n"
+            "snap-revision: 42\n"
+        )
+
+        assert snap_source.get_snap_digest(Path("my-snap_42.snap")) == "aBcD-_1234"
+
+    @pytest.mark.parametrize("assertion", [None, "type: account-key\n"])
+    def test_digest_from_file(self, assertion):
+        Path("my-snap_42.snap").write_text("content")
+        if assertion:
+            Path("my-snap_42.assert").write_text(assertion)
+
+        # the digest of "content" in unpadded URL-safe base64
+        assert snap_source.get_snap_digest(Path("my-snap_42.snap")) == (
+            "IeQqB1sNe7YXfA6zs6HIxt5tS0-QJ1nq5VVenPO-vSEneicQL9VCbamJvelsDPhI"
+        )
+
 
 @pytest.mark.usefixtures("new_dir")
 class TestGetName:
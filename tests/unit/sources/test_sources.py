@@ -179,6 +179,21 @@ def test_sources_with_branch_errors(
     assert err.value.option == error
 
 
+@pytest.mark.parametrize(
+    ("source", "use_mirrors"),
+    [("https://example.com/repo.git", True), ("https://example.com/a.tar", False)],
+)
+def test_get_source_handler_git_mirrors(new_dir, partitions, source, use_mirrors):
+    handler = sources.get_source_handler(
+        part=Part("p1", {"source": source}),
+        project_dirs=ProjectDirs(partitions=partitions),
+        cache_dir=new_dir,
+        use_git_mirrors=True,
+    )
+
+    assert getattr(handler, "_use_mirrors", False) is use_mirrors
+
+
 @pytest.mark.parametrize("uri", ["a", ".snappy", "some-tar", "a-deb", "git+a"])
 def test_get_registered_source_type_from_uri_success(uri):
     sources.register(FakeSource)
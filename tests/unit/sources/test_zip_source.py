@@ -14,12 +14,14 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import stat
+import zipfile
 from pathlib import Path
 from unittest.mock import call
 
 import pytest
 from craft_parts import ProjectDirs
-from craft_parts.sources import sources
+from craft_parts.sources import sources, zip_source
 
 
 @pytest.mark.http_request_handler("FakeFileHTTPRequestHandler")
@@ -79,3 +81,61 @@ class TestZipSource:
             sources._get_source_handler_class("", source_type="zip")
             is sources.ZipSource
         )
+
+
+def _add_member(zipf: zipfile.ZipFile, name: str, data: str, mode: int) -> None:
+    info = zipfile.ZipInfo(name)
+    info.external_attr = mode << 16
+    zipf.writestr(info, data)
+
+
+@pytest.fixture
+def zip_file(new_dir) -> Path:
+    zip_file = Path("test.zip")
+    with zipfile.ZipFile(zip_file, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
+        _add_member(zipf, "ro/", "", stat.S_IFDIR | 0o555)
+        _add_member(zipf, "ro/file", "read-only", stat.S_IFREG | 0o444)
+        _add_member(zipf, "bin/exec", "#!/bin/sh", stat.S_IFREG | 0o755)
+        _add_member(zipf, "no-mode", "no mode", 0)
+        _add_member(zipf, "link", "bin/exec", stat.S_IFLNK | 0o777)
+        _add_member(zipf, "outside", "../../etc/passwd", stat.S_IFLNK | 0o777)
+        _add_member(zipf, "/abs/../dup", "first", stat.S_IFREG | 0o644)
+        _add_member(zipf, "abs/dup", "second", stat.S_IFREG | 0o600)
+        for i in range(300):
+            _add_member(zipf, f"many/dir{i % 7}/file{i}", str(i) * i, 0o640)
+    return zip_file
+
+
+@pytest.mark.parametrize("cpu_count", [1, 4])
+def test_provision(mocker, new_dir, partitions, zip_file, cpu_count):
+    mocker.patch("os.cpu_count", return_value=cpu_count)
+    spy = mocker.spy(zip_source, "_extract_files_from")
+    dst = Path("dst")
+    source = sources.ZipSource(
+        "test.zip",
+        Path(),
+        cache_dir=new_dir,
+        project_dirs=ProjectDirs(partitions=partitions),
+    )
+
+    source.provision(dst, keep=True, src=zip_file)
+
+    assert spy.call_count == (4 if cpu_count > 1 else 0)
+    assert Path(dst, "ro/file").read_text() == "read-only"
+    assert stat.S_IMODE(Path(dst, "ro").stat().st_mode) == 0o555
+    assert stat.S_IMODE(Path(dst, "ro/file").stat().st_mode) == 0o444
+    assert stat.S_IMODE(Path(dst, "bin/exec").stat().st_mode) == 0o755
+    assert Path(dst, "no-mode").read_text() == "no mode"
+    assert Path(dst, "link").is_symlink()
+    assert Path(dst, "link").readlink() == Path("bin/exec")
+    assert Path(dst, "abs/dup").read_text() == "second"
+    assert stat.S_IMODE(Path(dst, "abs/dup").stat().st_mode) == 0o600
+    for i in range(300):
+        path = Path(dst, f"many/dir{i % 7}/file{i}")
+        assert path.read_text() == str(i) * i
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    # links pointing outside of the destination are extracted as files
+    assert not Path(dst, "outside").is_symlink()
+    assert Path(dst, "outside").read_text() == "../../etc/passwd"
+    assert zip_file.exists()
@@ -0,0 +1,222 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from pathlib import Path
+
+import pytest
+from craft_parts.parts import Part
+from craft_parts.state_manager import MigrationState, StateCache, states
+from craft_parts.state_manager.stage_state import StageState
+from craft_parts.state_manager.state_cache import MigrationIndex
+from craft_parts.steps import Step
+
+
+class TestMigrationIndex:
+    """Verify the reference counting of migrated entries."""
+
+    def test_exclusive_contents(self):
+        index = MigrationIndex.from_states(
+            {
+                "p1": MigrationState(files={"a", "b"}, directories={"d1", "d2"}),
+                "p2": MigrationState(files={"b", "c"}, directories={"d2"}),
+            },
+            overlay_migration_state=MigrationState(files={"c", "e"}),
+        )
+
+        assert index.get_exclusive_contents("p1") == ({"a"}, {"d1"})
+        assert index.get_exclusive_contents("p2") == (set(), set())
+        assert index.get_exclusive_contents(None) == ({"e"}, set())
+        assert index.get_exclusive_contents("missing") == (set(), set())
+
+    def test_remove(self):
+        index = MigrationIndex()
+        index.add("p1", files={"a", "b"}, dirs={"d"})
+        index.add("p2", files={"b"}, dirs={"d"})
+
+        index.remove("p1")
+
+        assert index.get_exclusive_contents("p1") == (set(), set())
+        assert index.get_exclusive_contents("p2") == ({"b"}, {"d"})
+
+    def test_add_replaces_contents(self):
+        index = MigrationIndex()
+        index.add("p1", files={"a"}, dirs=set())
+        index.add("p2", files={"a"}, dirs=set())
+        index.add("p2", files={"b"}, dirs=set())
+
+        assert index.get_exclusive_contents("p1") == ({"a"}, set())
+        assert index.get_exclusive_contents("p2") == ({"b"}, set())
+
+    def test_partition_contents(self):
+        index = MigrationIndex.from_states(
+            {
+                "p1": MigrationState(partition="default", files={"a"}),
+                "p2": MigrationState(
+                    partition="default",
+                    files={"b"},
+                    partitions_contents={"mypart": {"files": {"a"}}},
+                ),
+            },
+            partition="mypart",
+        )
+
+        assert index.get_exclusive_contents("p1") == (set(), set())
+        assert index.get_exclusive_contents("p2") == ({"a"}, set())
+
+    def test_backstage(self):
+        index = MigrationIndex.from_backstage_states(
+            {
+                "p1": StageState(files={"a"}, backstage_files={"x", "y"}),
+                "p2": StageState(files={"a"}, backstage_files={"y"}),
+            }
+        )
+
+        assert index.get_exclusive_contents("p1") == ({"x"}, set())
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestStateCache:
+    """Verify the caching of states loaded from disk."""
+
+    @pytest.fixture
+    def part_list(self):
+        p1 = Part("p1", {})
+        p2 = Part("p2", {})
+        StageState(files={"a", "b"}, backstage_files={"x"}).write(
+            states.get_step_state_path(p1, Step.STAGE)
+        )
+        StageState(files={"b"}).write(states.get_step_state_path(p2, Step.STAGE))
+        return [p1, p2]
+
+    def test_load_step_state(self, mocker, part_list):
+        spy = mocker.spy(states, "load_step_state")
+        cache = StateCache()
+
+        state = cache.load_step_state(part_list[0], Step.STAGE)
+        assert isinstance(state, StageState)
+        assert cache.load_step_state(part_list[0], Step.STAGE) is state
+        assert spy.call_count == 1
+
+        assert cache.load_step_state(part_list[0], Step.PRIME) is None
+
+    def test_load_step_state_modified(self, part_list):
+        cache = StateCache()
+        state = cache.load_step_state(part_list[0], Step.STAGE)
+
+        StageState(files={"c"}).write(
+            states.get_step_state_path(part_list[0], Step.STAGE)
+        )
+
+        new_state = cache.load_step_state(part_list[0], Step.STAGE)
+        assert new_state is not state
+        assert new_state is not None
+        assert new_state.files == {"c"}
+
+    def test_load_step_state_same_mtime_and_size(self, part_list):
+        cache = StateCache()
+        state_file = states.get_step_state_path(part_list[0], Step.STAGE)
+        stat = state_file.stat()
+        state = cache.load_step_state(part_list[0], Step.STAGE)
+
+        # Rewritten with the same size and modification time
+        StageState(files={"a", "c"}, backstage_files={"x"}).write(state_file)
+        os.utime(state_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert state_file.stat().st_size == stat.st_size
+
+        new_state = cache.load_step_state(part_list[0], Step.STAGE)
+        assert new_state is not state
+        assert new_state is not None
+        assert new_state.files == {"a", "c"}
+
+    def test_load_part_states(self, part_list):
+        part_states = StateCache().load_part_states(Step.STAGE, part_list)
+
+        assert list(part_states) == ["p1", "p2"]
+        assert StateCache().load_part_states(Step.PRIME, part_list) == {}
+
+    def test_load_overlay_migration_state(self, mocker):
+        MigrationState(files={"a"}).write(
+            states.get_overlay_migration_state_path(Path("overlay"), Step.STAGE)
+        )
+        spy = mocker.spy(states, "load_overlay_migration_state")
+        cache = StateCache()
+
+        state = cache.load_overlay_migration_state(Path("overlay"), Step.STAGE)
+        assert state == MigrationState(files={"a"})
+        assert cache.load_overlay_migration_state(Path("overlay"), Step.STAGE) is state
+        assert spy.call_count == 1
+
+    def test_migration_index(self, mocker, part_list):
+        spy = mocker.spy(states, "load_step_state")
+        cache = StateCache()
+
+        index = cache.get_migration_index(Step.STAGE, part_list=part_list)
+        assert index.get_exclusive_contents("p1") == ({"a"}, set())
+        assert cache.get_migration_index(Step.STAGE, part_list=part_list) is index
+        assert spy.call_count == 2
+
+        backstage_index = cache.get_migration_index(
+            Step.STAGE, part_list=part_list, backstage=True
+        )
+        assert backstage_index.get_exclusive_contents("p1") == ({"x"}, set())
+        assert spy.call_count == 2
+
+    def test_migration_index_overlay(self, part_list):
+        MigrationState(files={"a"}).write(
+            states.get_overlay_migration_state_path(Path("overlay"), Step.STAGE)
+        )
+        cache = StateCache()
+
+        index = cache.get_migration_index(
+            Step.STAGE, part_list=part_list, overlay_state_dir=Path("overlay")
+        )
+        assert index.get_exclusive_contents("p1") == (set(), set())
+
+        cache.remove_overlay_migration_state(Path("overlay"), Step.STAGE)
+        assert not states.get_overlay_migration_state_path(
+            Path("overlay"), Step.STAGE
+        ).exists()
+        assert index.get_exclusive_contents("p1") == ({"a"}, set())
+        assert (
+            cache.get_migration_index(
+                Step.STAGE, part_list=part_list, overlay_state_dir=Path("overlay")
+            )
+            is index
+        )
+
+    def test_migration_index_remove(self, part_list):
+        cache = StateCache()
+        index = cache.get_migration_index(Step.STAGE, part_list=part_list)
+
+        cache.remove(part_list[0], Step.STAGE)
+
+        assert not states.get_step_state_path(part_list[0], Step.STAGE).exists()
+        assert cache.load_step_state(part_list[0], Step.STAGE) is None
+        assert index.get_exclusive_contents("p2") == ({"b"}, set())
+        assert cache.get_migration_index(Step.STAGE, part_list=part_list) is index
+
+    def test_migration_index_modified(self, part_list):
+        cache = StateCache()
+        index = cache.get_migration_index(Step.STAGE, part_list=part_list)
+
+        StageState(files={"a"}).write(
+            states.get_step_state_path(part_list[1], Step.STAGE)
+        )
+
+        new_index = cache.get_migration_index(Step.STAGE, part_list=part_list)
+        assert new_index is not index
+        assert new_index.get_exclusive_contents("p1") == ({"b"}, set())
@@ -28,30 +28,36 @@ class _FakeSocket:
     def listen(self, n: int):
         pass
 
-    def send(self, data: bytes) -> None:
-        self.data = data
+    def sendall(self, data: bytes) -> None:
+        self.data += data
 
     def recv(self, n: int) -> bytes:
-        return self._buffer
+        data, self._buffer = self._buffer[:n], self._buffer[n:]
+        return data
 
     def connect(self, path: str):
         pass
 
+    def close(self):
+        pass
+
 
 class TestClient:
     """Verify the ctl client."""
 
     def test_call_command(self, new_dir, mocker):
-        fake_socket = _FakeSocket(b"")
+        fake_socket = _FakeSocket(b"OK 0\n")
         mocker.patch("socket.socket", return_value=fake_socket)
         mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
 
         CraftCtl.run("default", ["whatever"])
 
-        assert fake_socket.data == b'{"function": "default", "args": ["whatever"]}'
+        assert fake_socket.data == (
+            b'CRAFTCTL/2\n{"function": "default", "args": ["whatever"]}\n'
+        )
 
     def test_call_command_with_ok_feedback(self, new_dir, mocker):
-        fake_socket = _FakeSocket(b"OK hello there!")
+        fake_socket = _FakeSocket(b"OK 12\nhello there!")
         mocker.patch("socket.socket", return_value=fake_socket)
         mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
 
@@ -59,8 +65,48 @@ class TestClient:
 
         assert retval == "hello there!"
 
+    def test_call_command_with_multiline_feedback(self, new_dir, mocker):
+        fake_socket = _FakeSocket(b"OK 12\nhello\nthere!")
+        mocker.patch("socket.socket", return_value=fake_socket)
+        mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
+
+        retval = CraftCtl.run("get", ["whatever"])
+
+        assert retval == "hello\nthere!"
+
+    def test_call_batch(self, new_dir, mocker):
+        fake_socket = _FakeSocket(b"OK 0\nOK 5\nhelloOK 6\nthere!")
+        mocker.patch("socket.socket", return_value=fake_socket)
+        mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
+
+        retvals = CraftCtl.run_batch([("set", ["a=1"]), ("get", ["b"]), ("get", ["c"])])
+
+        assert retvals == [None, "hello", "there!"]
+        assert fake_socket.data == (
+            b"CRAFTCTL/2\n"
+            b'{"function": "set", "args": ["a=1"]}\n'
+            b'{"function": "get", "args": ["b"]}\n'
+            b'{"function": "get", "args": ["c"]}\n'
+        )
+
+    def test_call_batch_error(self, new_dir, mocker):
+        fake_socket = _FakeSocket(b"ERR 4\noopsOK 5\nhello")
+        mocker.patch("socket.socket", return_value=fake_socket)
+        mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
+
+        with pytest.raises(RuntimeError, match="^oops$"):
+            CraftCtl.run_batch([("set", ["a=1"]), ("get", ["b"])])
+
+    def test_call_command_connection_closed(self, new_dir, mocker):
+        fake_socket = _FakeSocket(b"OK 12\nhello")
+        mocker.patch("socket.socket", return_value=fake_socket)
+        mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
+
+        with pytest.raises(RuntimeError, match="connection closed"):
+            CraftCtl.run("get", ["whatever"])
+
     def test_call_command_with_error_feedback(self, new_dir, mocker):
-        fake_socket = _FakeSocket(b"ERR hello there!")
+        fake_socket = _FakeSocket(b"ERR 12\nhello there!")
         mocker.patch("socket.socket", return_value=fake_socket)
         mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
 
@@ -96,6 +96,14 @@ def test_invalid_architecture():
     assert err.resolution == "Make sure the architecture name is correct."
 
 
+def test_invalid_compiler_cache():
+    err = errors.InvalidCompilerCache("distcc")
+    assert err.compiler_cache == "distcc"
+    assert err.brief == "Compiler cache 'distcc' is not supported."
+    assert err.details is None
+    assert err.resolution == "Use either 'ccache' or 'sccache'."
+
+
 def test_part_specification_error():
     err = errors.PartSpecificationError(part_name="foo", message="something is wrong")
     assert err.part_name == "foo"
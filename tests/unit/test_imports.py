@@ -0,0 +1,82 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Guard against import time regressions."""
+
+import subprocess
+import sys
+
+import craft_parts
+import pytest
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Run an import statement in a clean interpreter and list loaded modules."""
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print('\\n'.join(sys.modules))",
+        ],
+        text=True,
+    )
+    return set(output.splitlines())
+
+
+@pytest.mark.parametrize(
+    ("statement", "unexpected"),
+    [
+        pytest.param(
+            "import craft_parts",
+            {"craft_parts.plugins", "craft_parts.lifecycle_manager", "pydantic"},
+            id="package",
+        ),
+        pytest.param(
+            "import craft_parts.ctl",
+            {"craft_parts.plugins", "craft_parts.executor", "pydantic", "yaml"},
+            id="craftctl",
+        ),
+        pytest.param(
+            "from craft_parts import plugins",
+            {
+                "craft_parts.plugins.maven_plugin",
+                "craft_parts.plugins.npm_plugin",
+                "craft_parts.plugins.python_plugin",
+                "lxml",
+                "requests",
+            },
+            id="plugins",
+        ),
+        pytest.param(
+            "import craft_parts.lifecycle_manager",
+            {"apt", "craft_parts.plugins.maven_plugin", "lxml"},
+            id="lifecycle-manager",
+        ),
+    ],
+)
+def test_import_is_lazy(statement, unexpected):
+    assert not _imported_modules(statement) & unexpected
+
+
+def test_lazy_attributes():
+    for name in craft_parts.__all__:
+        assert getattr(craft_parts, name) is not None
+    assert set(craft_parts.__all__) <= set(dir(craft_parts))
+
+
+def test_invalid_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'Invalid'"):
+        craft_parts.Invalid  # noqa: B018
@@ -101,6 +101,10 @@ def test_project_info(mocker, new_dir, tc_arch, tc_target_arch, tc_triplet, tc_c
     )
     assert x.project_vars_part_name == "adopt"
     assert x.global_environment == {}
+    assert x.compiler_cache is None
+    assert x.compiler_cache_max_size is None
+    assert x.reuse_python_venvs is False
+    assert x.use_git_mirrors is False
 
     assert x.parts_dir == new_dir / "parts"
     assert x.stage_dir == new_dir / "stage"
@@ -178,6 +182,27 @@ def test_project_info_invalid_arch(arch):
         )
 
 
+def test_project_info_compiler_cache():
+    info = ProjectInfo(
+        application_name="test",
+        cache_dir=Path(),
+        compiler_cache="ccache",
+        compiler_cache_max_size="2G",
+    )
+
+    assert info.compiler_cache == "ccache"
+    assert info.compiler_cache_max_size == "2G"
+
+
+def test_project_info_invalid_compiler_cache():
+    with pytest.raises(errors.InvalidCompilerCache):
+        ProjectInfo(
+            application_name="test",
+            cache_dir=Path(),
+            compiler_cache="distcc",
+        )
+
+
 def test_project_info_work_dir(new_dir, partitions):
     info = ProjectInfo(
         application_name="test",
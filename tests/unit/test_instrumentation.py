@@ -0,0 +1,174 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import threading
+
+import pytest
+from craft_parts import instrumentation
+from craft_parts.instrumentation import Instrumentation
+
+
+@instrumentation.timed("work")
+def _work(value: int) -> int:
+    instrumentation.count("work done", value)
+    return value * 2
+
+
+class TestInstrumentation:
+    """Verify the recording of spans and counters."""
+
+    def test_span(self):
+        instr = Instrumentation()
+
+        with instr.activate():
+            with instrumentation.span("op", category="action", part="p1"):
+                pass
+
+        assert len(instr.spans) == 1
+        span = instr.spans[0]
+        assert span.name == "op"
+        assert span.category == "action"
+        assert span.args == {"part": "p1"}
+        assert span.thread_id == threading.get_ident()
+        assert span.start >= 0
+        assert span.duration >= 0
+
+    def test_span_size(self, mocker):
+        mocker.patch("time.perf_counter", side_effect=[0.0, 1.0, 3.0, 3.0, 3.0])
+        instr = Instrumentation()
+
+        with instr.activate():
+            with instrumentation.span("op", size=4 * 1024 * 1024, source="f"):
+                pass
+            with instrumentation.span("empty", size=0):
+                pass
+
+        assert [s.args for s in instr.spans] == [
+            {"source": "f", "size": "4194304", "throughput": "2.0 MiB/s"},
+            {"size": "0", "throughput": "0.0 MiB/s"},
+        ]
+
+    def test_span_error(self):
+        instr = Instrumentation()
+
+        with instr.activate(), pytest.raises(RuntimeError):
+            with instrumentation.span("op"):
+                raise RuntimeError("bummer")
+
+        assert [s.name for s in instr.spans] == ["op"]
+
+    def test_timed(self):
+        instr = Instrumentation()
+
+        with instr.activate():
+            assert _work(2) == 4
+            assert _work(3) == 6
+
+        assert [(s.name, s.category) for s in instr.spans] == [
+            ("work", "phase"),
+            ("work", "phase"),
+        ]
+        assert instr.counters == {"work done": 5}
+
+    def test_inactive(self):
+        instr = Instrumentation()
+
+        with instr.activate():
+            pass
+
+        assert _work(1) == 2
+        assert instr.spans == []
+        assert instr.counters == {}
+
+    def test_nested_activation(self):
+        outer = Instrumentation()
+        inner = Instrumentation()
+
+        with outer.activate():
+            with inner.activate():
+                instrumentation.count("files")
+            instrumentation.count("files", 2)
+
+        assert inner.counters == {"files": 1}
+        assert outer.counters == {"files": 2}
+
+    def test_threads(self):
+        instr = Instrumentation()
+
+        with instr.activate():
+            threads = [threading.Thread(target=_work, args=(1,)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(instr.spans) == 4
+        assert instr.counters == {"work done": 4}
+
+    def test_clear(self):
+        instr = Instrumentation()
+        with instr.activate():
+            _work(1)
+
+        instr.clear()
+
+        assert instr.spans == []
+        assert instr.counters == {}
+
+    def test_chrome_trace(self, tmp_path):
+        instr = Instrumentation()
+        with instr.activate():
+            with instrumentation.span("build", category="action", part="p1"):
+                instrumentation.count("files copied", 3)
+
+        trace_file = tmp_path / "trace.json"
+        instr.write_chrome_trace(trace_file)
+        trace = json.loads(trace_file.read_text())
+
+        assert trace["displayTimeUnit"] == "ms"
+        span_event, counter_event = trace["traceEvents"]
+        assert span_event["name"] == "build"
+        assert span_event["cat"] == "action"
+        assert span_event["ph"] == "X"
+        assert span_event["args"] == {"part": "p1"}
+        assert span_event["dur"] >= 0
+        assert counter_event["name"] == "files copied"
+        assert counter_event["ph"] == "C"
+        assert counter_event["args"] == {"files copied": 3}
+
+    def test_summary(self, mocker):
+        mocker.patch(
+            "time.perf_counter", side_effect=[0.0, 1.0, 2.0, 2.0, 3.25, 4.0, 4.5]
+        )
+        instr = Instrumentation()
+        with instr.activate():
+            with instrumentation.span("build", category="action"):
+                pass
+            with instrumentation.span("pull", category="action"):
+                pass
+            with instrumentation.span("build", category="action"):
+                pass
+            instrumentation.count("state cache hits", 12)
+
+        assert instr.get_summary().splitlines() == [
+            "Category  Operation  Count  Total (s)",
+            "action    build          2      1.500",
+            "action    pull           1      1.250",
+            "",
+            "Counter           Value",
+            "state cache hits     12",
+        ]
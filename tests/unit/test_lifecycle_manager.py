@@ -169,6 +169,7 @@ class TestLifecycleManager:
             project_info=lf.project_info,
             ignore_outdated=["bar.*", "foo.*"],
             base_layer_hash=None,
+            state_cache=ANY,
         )
 
     def test_sequencer_creation(self, new_dir, mocker):
@@ -190,6 +191,7 @@ class TestLifecycleManager:
                 project_info=ANY,
                 ignore_outdated=["ign3", "ign1", "ign2"],
                 base_layer_hash=None,
+                state_cache=ANY,
             )
         ]
 
@@ -219,6 +221,8 @@ class TestLifecycleManager:
                 track_stage_packages=False,
                 base_layer_dir=None,
                 base_layer_hash=None,
+                use_build_cache=False,
+                state_cache=ANY,
             )
         ]
 
@@ -336,6 +340,38 @@ class TestLifecycleManager:
         actual_time = lf.get_prime_state_timestamp()
         assert actual_time is None
 
+    def test_record_timings(self, new_dir):
+        lf = lifecycle_manager.LifecycleManager(
+            self._data,
+            application_name="test_manager",
+            cache_dir=new_dir,
+            record_timings=True,
+            **self._lcm_kwargs,
+        )
+        assert lf.instrumentation is not None
+
+        actions = lf.plan(craft_parts.Step.PRIME)
+        with lf.action_executor() as ctx:
+            ctx.execute(actions)
+
+        spans = [(s.category, s.name) for s in lf.instrumentation.spans]
+        assert ("lifecycle", "plan") in spans
+        assert ("lifecycle", "prologue") in spans
+        assert ("lifecycle", "epilogue") in spans
+        for step in ["pull", "build", "stage", "prime"]:
+            assert ("action", step) in spans
+        assert ("phase", "state write") in spans
+        assert ("phase", "migrate") in spans
+
+    def test_record_timings_disabled(self, new_dir):
+        lf = lifecycle_manager.LifecycleManager(
+            self._data,
+            application_name="test_manager",
+            cache_dir=new_dir,
+            **self._lcm_kwargs,
+        )
+        assert lf.instrumentation is None
+
 
 class TestOverlayDisabled:
     """Overlays only supported in linux and must run as root."""
@@ -19,7 +19,10 @@ import os
 import pydantic
 import pytest
 from craft_parts.permissions import (
+    EffectivePermissions,
     Permissions,
+    PermissionsTable,
+    apply_effective_permissions,
     apply_permissions,
     filter_permissions,
     permissions_are_compatible,
@@ -126,3 +129,73 @@ def test_permissions_are_compatible():
     assert permissions_are_compatible(perm1, perm4)
     assert permissions_are_compatible(perm1, perm5)
     assert permissions_are_compatible(perm4, perm5)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["etc", "etc/file1.txt", "etc/file2.bin", "etc/sub/file1.txt", "usr/bin/foo"],
+)
+def test_permissions_table_filter(path):
+    permissions = [
+        Permissions(mode="755"),
+        Permissions(path="etc/*", mode="644"),
+        Permissions(path="etc/file1.txt", owner=1111, group=2222),
+        Permissions(path="*.txt", mode="600"),
+        Permissions(path="usr/bin/[a-f]*", mode="555"),
+    ]
+    table = PermissionsTable(permissions)
+
+    assert table.filter(path) == filter_permissions(path, permissions)
+
+
+def test_permissions_table_empty():
+    table = PermissionsTable(None)
+
+    assert not table
+    assert table.filter("etc/file1.txt") == []
+    assert table.squash("etc/file1.txt") == EffectivePermissions(None, None, None)
+
+
+def test_permissions_table_cached_subsets():
+    p1 = Permissions(path="etc/*", mode="644")
+    p2 = Permissions(path="usr/*", mode="755")
+    table = PermissionsTable([p1, p2])
+
+    assert table.filter("etc/a") is table.filter("etc/b")
+    assert table.squash("etc/a") is table.squash("etc/b")
+    assert table.filter("usr/a") == [p2]
+
+
+def test_permissions_table_squash():
+    table = PermissionsTable(
+        [
+            Permissions(mode="755"),
+            Permissions(path="etc/*", owner=1111, group=2222),
+            Permissions(path="etc/file1.txt", mode="0o600"),
+        ]
+    )
+
+    assert table.squash("bin") == EffectivePermissions(None, None, 0o755)
+    assert table.squash("etc/file2") == EffectivePermissions(1111, 2222, 0o755)
+    assert table.squash("etc/file1.txt") == EffectivePermissions(1111, 2222, 0o600)
+
+
+def test_apply_effective_permissions(tmp_path, mock_chown):
+    (tmp_path / "bar").mkdir()
+    (tmp_path / "bar/1.txt").touch()
+    (tmp_path / "2.txt").touch()
+
+    apply_effective_permissions(
+        tmp_path,
+        {
+            "bar": EffectivePermissions(None, None, 0o555),
+            "bar/1.txt": EffectivePermissions(1111, 2222, 0o4755),
+            "2.txt": EffectivePermissions(None, None, None),
+        },
+    )
+
+    assert get_mode(tmp_path / "bar") == 0o555
+    assert os.stat(tmp_path / "bar/1.txt").st_mode & 0o7777 == 0o4755  # noqa: PTH116
+    assert mock_chown[str(tmp_path / "bar/1.txt")].owner == 1111
+    assert mock_chown[str(tmp_path / "bar/1.txt")].group == 2222
+    assert str(tmp_path / "2.txt") not in mock_chown
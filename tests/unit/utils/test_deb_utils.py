@@ -0,0 +1,177 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import shutil
+import tarfile
+from pathlib import Path
+
+import pytest
+from craft_parts.utils import deb_utils, os_utils
+
+
+def _ar_member(name: str, data: bytes) -> bytes:
+    header = (
+        f"{name + '/':<16}{0:<12}{0:<6}{0:<6}{100644:<8}{len(data):<10}`\n"
+    ).encode()
+    return header + data + (b"\n" if len(data) % 2 else b"")
+
+
+def _make_deb(path: Path, compression: str) -> None:
+    data = io.BytesIO()
+    mode = f"w:{compression}" if compression else "w"
+    with tarfile.open(fileobj=data, mode=mode) as tar:
+        info = tarfile.TarInfo("./usr/bin/hello")
+        content = b"#!/bin/sh\necho hello\n"
+        info.size = len(content)
+        info.mode = 0o755
+        tar.addfile(info, io.BytesIO(content))
+        link = tarfile.TarInfo("./usr/bin/hi")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "/usr/bin/hello"
+        tar.addfile(link)
+
+    suffix = {"": "", "gz": ".gz", "xz": ".xz", "bz2": ".bz2"}[compression]
+    path.write_bytes(
+        b"!<arch>\n"
+        + _ar_member("debian-binary", b"2.0\n")
+        + _ar_member("control.tar.gz", b"odd")
+        + _ar_member(f"data.tar{suffix}", data.getvalue())
+    )
+
+
+@pytest.fixture
+def mock_process_run(mocker):
+    return mocker.patch.object(os_utils, "process_run", autospec=True)
+
+
+@pytest.mark.parametrize("compression", ["", "gz", "xz", "bz2"])
+@pytest.mark.parametrize("decompressor", [True, False])
+def test_stream_extract_deb(
+    mocker, new_dir, mock_process_run, compression, decompressor
+):
+    if not decompressor:
+        mocker.patch.object(shutil, "which", return_value=None)
+    elif compression == "xz" and not shutil.which("xz"):
+        pytest.skip("xz is not installed")
+    _make_deb(Path("test.deb"), compression)
+
+    deb_utils.stream_extract_deb(Path("test.deb"), Path("dst"), print)
+
+    hello = Path("dst/usr/bin/hello")
+    assert hello.read_text() == "#!/bin/sh\necho hello\n"
+    assert hello.stat().st_mode & 0o777 == 0o755
+    assert Path("dst/usr/bin/hi").readlink() == Path("/usr/bin/hello")
+    mock_process_run.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"not a deb", id="not-ar"),
+        pytest.param(b"!<arch>\n" + _ar_member("control.tar", b""), id="no-data"),
+        pytest.param(b"!<arch>\n" + _ar_member("data.tar.foo", b""), id="unknown"),
+        pytest.param(b"!<arch>\n" + _ar_member("data.tar.gz", b"xx"), id="invalid"),
+    ],
+)
+def test_stream_extract_deb_fallback(new_dir, mock_process_run, content):
+    Path("test.deb").write_bytes(content)
+
+    deb_utils.stream_extract_deb(Path("test.deb"), Path("dst"), print)
+
+    mock_process_run.assert_called_once_with(
+        command=["dpkg-deb", "--extract", "test.deb", "dst"], log_func=print
+    )
+
+
+def _make_tar_deb(path: Path, members: list[tarfile.TarInfo]) -> None:
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w") as tar:
+        for member in members:
+            tar.addfile(member, io.BytesIO(b"x" * member.size))
+
+    path.write_bytes(
+        b"!<arch>\n"
+        + _ar_member("debian-binary", b"2.0\n")
+        + _ar_member("data.tar", data.getvalue())
+    )
+
+
+def _tar_member(name: str, **kwargs) -> tarfile.TarInfo:
+    member = tarfile.TarInfo(name)
+    for key, value in kwargs.items():
+        setattr(member, key, value)
+    return member
+
+
+@pytest.mark.parametrize(
+    "member",
+    [
+        pytest.param(_tar_member("../evil", size=1), id="parent"),
+        pytest.param(_tar_member("./usr/../../evil", size=1), id="nested-parent"),
+        pytest.param(
+            _tar_member("./evil", type=tarfile.LNKTYPE, linkname="../test.deb"),
+            id="hard-link",
+        ),
+        pytest.param(
+            _tar_member("./usr/bin/hello/evil", size=1),
+            id="through-symlink",
+        ),
+    ],
+)
+def test_stream_extract_deb_unsafe_member(new_dir, mock_process_run, member):
+    Path("outside").mkdir()
+    _make_tar_deb(
+        Path("test.deb"),
+        [
+            _tar_member("./usr/bin/hello", type=tarfile.SYMTYPE, linkname="/outside"),
+            _tar_member("./usr/bin/safe", size=1),
+            member,
+        ],
+    )
+
+    deb_utils.stream_extract_deb(Path("test.deb"), Path("dst/extract"), print)
+
+    # Nothing is extracted before falling back to dpkg-deb
+    mock_process_run.assert_called_once_with(
+        command=["dpkg-deb", "--extract", "test.deb", "dst/extract"],
+        log_func=print,
+    )
+    assert Path("test.deb").stat().st_nlink == 1
+    assert list(Path("outside").iterdir()) == []
+    assert list(Path("dst").iterdir()) == [Path("dst/extract")]
+    assert list(Path("dst/extract").iterdir()) == []
+
+
+def test_stream_extract_deb_existing_files(new_dir, mock_process_run):
+    Path("dst/usr/bin").mkdir(parents=True)
+    Path("dst/usr/bin/safe").write_text("old")
+    Path("dst/test.deb").touch()
+    _make_tar_deb(
+        Path("test.deb"),
+        [
+            _tar_member("./usr/bin/safe", size=1),
+            _tar_member("./usr/bin/setuid", size=1, mode=0o4755),
+        ],
+    )
+
+    deb_utils.stream_extract_deb(Path("test.deb"), Path("dst"), print)
+
+    mock_process_run.assert_not_called()
+    assert Path("dst/usr/bin/safe").read_text() == "x"
+    assert Path("dst/usr/bin/setuid").stat().st_mode & 0o7777 == 0o4755
+    assert Path("dst/test.deb").exists()
+    assert sorted(Path().iterdir()) == [Path("dst"), Path("test.deb")]
@@ -0,0 +1,109 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from craft_parts.utils import file_watcher
+from craft_parts.utils.file_watcher import FileWatcher
+
+# Changes are reported well before this, unless they are missed.
+_TIMEOUT = 5.0
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def backend(request, mocker):
+    if request.param == "polling":
+        mocker.patch.object(
+            file_watcher._InotifyBackend, "__init__", side_effect=OSError("no inotify")
+        )
+    elif sys.platform != "linux":
+        pytest.skip("inotify is only available on Linux")
+    return request.param
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    (tmp_path / "src/sub").mkdir(parents=True)
+    (tmp_path / "src/sub/foo").write_text("foo")
+    (tmp_path / "parts.yaml").write_text("parts: {}")
+    return tmp_path.resolve()
+
+
+def _watcher(tree: Path, **kwargs) -> FileWatcher:
+    return FileWatcher(
+        [tree / "src", tree / "parts.yaml"], poll_interval=0.05, **kwargs
+    )
+
+
+@pytest.mark.usefixtures("backend")
+class TestFileWatcher:
+    """Verify the detection of changes in watched paths."""
+
+    def test_modify_file(self, tree):
+        with _watcher(tree) as watcher:
+            (tree / "src/sub/foo").write_text("bar")
+            assert watcher.wait(_TIMEOUT) == {tree / "src/sub/foo"}
+
+    def test_remove_file(self, tree):
+        with _watcher(tree) as watcher:
+            (tree / "src/sub/foo").unlink()
+            assert watcher.wait(_TIMEOUT) == {tree / "src/sub/foo"}
+
+    def test_new_directory(self, tree):
+        with _watcher(tree) as watcher:
+            (tree / "src/new/dir").mkdir(parents=True)
+            (tree / "src/new/dir/bar").write_text("bar")
+
+            changes: set[Path] = set()
+            while tree / "src/new/dir/bar" not in changes:
+                new_changes = watcher.wait(_TIMEOUT)
+                assert new_changes
+                changes |= new_changes
+
+            # Files in the new directory are watched
+            (tree / "src/new/dir/bar").write_text("baz")
+            assert watcher.wait(_TIMEOUT) == {tree / "src/new/dir/bar"}
+
+    def test_replace_file(self, tree):
+        with _watcher(tree) as watcher:
+            (tree / "parts.yaml.new").write_text("parts: {foo: {}}")
+            (tree / "parts.yaml.new").rename(tree / "parts.yaml")
+            assert watcher.wait(_TIMEOUT) == {tree / "parts.yaml"}
+
+    def test_unwatched_files(self, tree):
+        with _watcher(tree) as watcher:
+            (tree / "other").write_text("other")
+            assert watcher.wait(0.5) == set()
+
+    def test_exclude(self, tree):
+        (tree / "src/parts").mkdir()
+        with _watcher(tree, exclude=[tree / "src/parts"]) as watcher:
+            (tree / "src/parts/foo").write_text("foo")
+            assert watcher.wait(0.5) == set()
+
+            os.utime(tree / "src/sub/foo", ns=(0, 0))
+            assert watcher.wait(_TIMEOUT) == {tree / "src/sub/foo"}
+
+
+def test_is_watched(tree):
+    with _watcher(tree, exclude=[tree / "src/sub"]) as watcher:
+        assert watcher.is_watched(tree / "src/foo")
+        assert watcher.is_watched(tree / "parts.yaml")
+        assert not watcher.is_watched(tree / "src/sub/foo")
+        assert not watcher.is_watched(tree / "other")
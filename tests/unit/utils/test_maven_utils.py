@@ -16,6 +16,7 @@
 
 import logging
 import os
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
@@ -25,6 +26,7 @@ from unittest import mock
 import pytest
 from craft_parts import Part
 from craft_parts.infos import PartInfo, ProjectInfo
+from craft_parts.utils.maven import common
 from craft_parts.utils.maven.common import (
     _XML_PARSER,
     GroupDict,
@@ -681,6 +683,40 @@ def test_get_existing_artifacts(
         assert any(a.version == artifact.version for a in art)
 
 
+def _set_old_mtimes(path: Path) -> None:
+    for entry in [path, *path.rglob("*")]:
+        os.utime(entry, ns=(0, 0))
+
+
+def test_get_existing_artifacts_index(
+    part_info: PartInfo, mocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    backstage = cast("Path", part_info.backstage_dir) / "maven-use"
+    backstage.mkdir(parents=True)
+    FakeArtifact("org.starcraft", "test", "1.0.0").to_pom(backstage)
+    FakeArtifact("org.starcraft", "test", "1.0.1").to_pom(backstage)
+    _set_old_mtimes(backstage)
+    from_pom = mocker.spy(MavenArtifact, "from_pom")
+
+    result = _get_existing_artifacts(part_info)
+    assert {a.version for a in result["org.starcraft"]["test"]} == {"1.0.0", "1.0.1"}
+    assert from_pom.call_count == 2
+    assert list(Path(part_info.cache_dir, "maven/index").glob("*.json"))
+
+    # The persisted index is used by new processes without parsing the poms again
+    monkeypatch.setattr(common, "_ARTIFACT_INDEXES", {})
+    assert _get_existing_artifacts(part_info) == result
+    assert from_pom.call_count == 2
+
+    # Only new poms are parsed, and removed poms are dropped from the index
+    FakeArtifact("org.starcraft", "test", "2.0.0").to_pom(backstage)
+    shutil.rmtree(backstage / "org/starcraft/1.0.0")
+
+    result = _get_existing_artifacts(part_info)
+    assert {a.version for a in result["org.starcraft"]["test"]} == {"1.0.1", "2.0.0"}
+    assert from_pom.call_count == 3
+
+
 def test_maven_artifact_from_element() -> None:
     element = etree.fromstring(
         """\